@@ -13,6 +13,8 @@ import threading
 import logging
 from typing import Dict, List, Any, Optional, Callable
 from universal_communicator import UniversalCommunicator, CommunicationSignal
+from ring_log import RingBufferLog
+from bus_dispatcher import DispatcherStopped, PriorityDispatcher
 
 # Configure logging - redirect to diagnostic system's system_logs directory
 import pathlib
@@ -38,8 +40,11 @@ class DKIReportBus:
         self.signal_registry: Dict[str, List[Callable[[Dict[str, Any]], Optional[Any]]]] = {}
         self.module_log: List[str] = []
         self.active_modules: Dict[str, Any] = {}
-        self.event_log: List[Dict[str, Any]] = []
+        # History logs are fixed-size ring buffers (DKI_<NAME>_CAPACITY, spill via DKI_LOG_SPILL_DIR)
+        self.event_log: RingBufferLog = RingBufferLog.from_env("event_log", 5000)
         self.lock = threading.Lock()
+        # Optional async dispatcher for emit(); None keeps the synchronous contract
+        self.dispatcher: Optional[PriorityDispatcher] = None
 
         # Central Command state
         self.current_case_id: Optional[str] = None
@@ -51,12 +56,12 @@ class DKIReportBus:
         self.evidence_manifest: Dict[str, Dict[str, Any]] = {}
         self.section_interests: Dict[str, Dict[str, Any]] = {}
         self.latest_status: Dict[str, Any] = {}
-        self.case_snapshots: List[Dict[str, Any]] = []
+        self.case_snapshots: RingBufferLog = RingBufferLog.from_env("case_snapshots", 500)
 
         # Universal Communication Protocol
         self.communicator = UniversalCommunicator("Bus-1", bus_connection=self)
         self.system_addresses: Dict[str, Dict[str, Any]] = {}
-        self.fault_log: List[Dict[str, Any]] = []
+        self.fault_log: RingBufferLog = RingBufferLog.from_env("fault_log", 1000)
         self.active_faults: Dict[str, Dict[str, Any]] = {}
 
         logger.info("Central Command Bus initialized with Universal Communication Protocol")
@@ -504,10 +509,8 @@ class DKIReportBus:
         log_fn(f"[BUS][{source}] {message}")
 
     def get_event_log(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        with self.lock:
-            if limit is None or limit >= len(self.event_log):
-                return list(self.event_log)
-            return self.event_log[-limit:]
+        """Newest events, oldest first; limits beyond the in-memory window read spilled segments."""
+        return self.event_log.tail(limit)
 
     def send(self, topic: str, data: Dict[str, Any]) -> Dict[str, Any]:
         handlers = self.signal_registry.get(topic)
@@ -534,12 +537,55 @@ class DKIReportBus:
         if not handlers:
             logger.warning(f"[BUS] No handlers for signal: {signal}")
             return
+        dispatcher = self.dispatcher
+        if dispatcher is not None:
+            try:
+                dispatcher.submit(signal, payload, list(handlers))
+                return
+            except DispatcherStopped:
+                # disable_async_dispatch() stopped it after we read it - deliver here instead
+                pass
         for handler in handlers:
             try:
                 handler(payload)
             except Exception as exc:  # pragma: no cover
                 logger.error(f"[BUS] Error running handler '{getattr(handler, '__name__', handler)}': {exc}")
 
+    def enable_async_dispatch(self, workers: int = 4, lane_capacity: Optional[Dict[str, int]] = None,
+                              backpressure_timeout: float = 5.0) -> None:
+        """Deliver emit() on a bounded worker pool with critical/normal/bulk priority lanes.
+
+        send() stays synchronous on the caller's thread so callers that need a
+        return value keep working.
+        """
+        if self.dispatcher is not None:
+            return
+        self.dispatcher = PriorityDispatcher(
+            workers=workers,
+            lane_capacity=lane_capacity,
+            backpressure_timeout=backpressure_timeout,
+            name="Bus-1",
+        )
+        self.log_event('bus.dispatch', f"Async dispatch enabled with {workers} worker(s)")
+
+    def disable_async_dispatch(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        dispatcher, self.dispatcher = self.dispatcher, None
+        if dispatcher is not None:
+            dispatcher.stop(wait=wait, timeout=timeout)
+            self.log_event('bus.dispatch', 'Async dispatch disabled')
+
+    def set_signal_priority(self, signal: str, lane: str) -> None:
+        """Pin a signal to a dispatch lane ('critical', 'normal' or 'bulk')."""
+        if self.dispatcher is None:
+            raise RuntimeError('Async dispatch is not enabled')
+        self.dispatcher.set_signal_lane(signal, lane)
+
+    def flush_dispatch(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued async deliveries; returns immediately in synchronous mode."""
+        if self.dispatcher is None:
+            return True
+        return self.dispatcher.flush(timeout)
+
     def inject_module(self, module: Any) -> None:
         if hasattr(module, 'initialize'):
             module.initialize(self)
@@ -667,6 +713,8 @@ class DKIReportBus:
             'active_modules': list(self.active_modules.keys()),
             'registered_signals': list(self.signal_registry.keys()),
             'event_log_size': len(self.event_log),
+            'dispatch_mode': 'async' if self.dispatcher is not None else 'sync',
+            'dispatch_stats': self.dispatcher.get_stats() if self.dispatcher is not None else {},
             'bus_status': 'online',
         }
 
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+DKI Bus Dispatcher - Opt-in asynchronous delivery for DKIReportBus.emit
+Bounded worker pool with per-signal priority lanes, lane backpressure and
+per-subscriber ordering within each lane. A subscriber has one mailbox per lane
+and always receives its most urgent message next, so a critical signal never
+waits behind that subscriber's bulk backlog.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lanes in dispatch order - workers always drain the first non-empty lane
+LANES: Tuple[str, ...] = ("critical", "normal", "bulk")
+
+DEFAULT_LANE_CAPACITY: Dict[str, int] = {
+    "critical": 10000,
+    "normal": 5000,
+    "bulk": 2000,
+}
+
+# Universal Communication Protocol traffic must never wait behind evidence traffic
+CRITICAL_SIGNALS = {
+    "sos_fault",
+    "gui_error_alert",
+    "rollcall",
+    "rollcall_response",
+    "radio_check",
+    "radio_check_response",
+    "status_request",
+    "status_response",
+}
+
+BULK_SIGNAL_PREFIXES = ("evidence.", "evidence_locker.", "files_", "narrative.")
+
+# Emits from handler threads cannot wait for space (they would block their own pool), so they may
+# overrun a lane by this fraction of its capacity; past that they are dropped
+DEFAULT_REENTRANT_HEADROOM = 0.1
+
+Handler = Callable[[Dict[str, Any]], Optional[Any]]
+Delivery = Tuple[str, Dict[str, Any]]
+
+
+class DispatcherStopped(RuntimeError):
+    """submit() was called after stop(); the caller should deliver another way"""
+
+
+class _Subscriber:
+    """Per-lane mailboxes of one handler plus its scheduling state"""
+    __slots__ = ("boxes", "queued", "running")
+
+    def __init__(self):
+        self.boxes: Dict[str, Deque[Delivery]] = {lane: deque() for lane in LANES}
+        # Lanes whose ready queue holds an entry for this subscriber (entries are removed lazily)
+        self.queued: set = set()
+        self.running = False
+
+    def top_lane(self) -> Optional[str]:
+        for lane in LANES:
+            if self.boxes[lane]:
+                return lane
+        return None
+
+
+class PriorityDispatcher:
+    """Worker pool that delivers bus signals by lane priority, one message per subscriber at a time"""
+
+    def __init__(self, workers: int = 4, lane_capacity: Optional[Dict[str, int]] = None,
+                 backpressure_timeout: float = 5.0, name: str = "bus",
+                 reentrant_headroom: float = DEFAULT_REENTRANT_HEADROOM):
+        self.workers = max(1, int(workers))
+        self.backpressure_timeout = backpressure_timeout
+        self.reentrant_headroom = max(0.0, float(reentrant_headroom))
+        self.lane_capacity = dict(DEFAULT_LANE_CAPACITY)
+        if lane_capacity:
+            self.lane_capacity.update({lane: max(1, int(size)) for lane, size in lane_capacity.items() if lane in LANES})
+        self.lane_overrides: Dict[str, str] = {}
+
+        self._cond = threading.Condition()
+        # Subscribers with a message waiting, queued in the lane of their most urgent one
+        self._ready: Dict[str, Deque[Handler]] = {lane: deque() for lane in LANES}
+        # Per-subscriber, per-lane FIFOs; a subscriber is never run on two workers at once
+        self._mailboxes: Dict[Handler, _Subscriber] = {}
+        self._pending: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._active = 0
+        self._running = True
+        self._local = threading.local()
+        self._stats = {"queued": 0, "dispatched": 0, "dropped": 0, "errors": 0, "workers_replaced": 0}
+        self._dropped_by_lane: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._dropped_by_signal: Dict[str, int] = {}
+        self._last_drop: Optional[Dict[str, Any]] = None
+
+        self._name = name
+        self._threads: List[threading.Thread] = []
+        for index in range(self.workers):
+            self._start_worker(index)
+
+    def _start_worker(self, index: int) -> None:
+        thread = threading.Thread(target=self._worker_main, args=(index,), name=f"{self._name}-dispatch-{index}",
+                                  daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    # ------------------------------------------------------------------
+    # Lane routing
+    # ------------------------------------------------------------------
+    def set_signal_lane(self, signal: str, lane: str) -> None:
+        if lane not in LANES:
+            raise ValueError(f"Unknown dispatch lane '{lane}' (expected one of {', '.join(LANES)})")
+        self.lane_overrides[signal] = lane
+
+    def lane_for(self, signal: str) -> str:
+        override = self.lane_overrides.get(signal)
+        if override:
+            return override
+        if signal in CRITICAL_SIGNALS or "fault" in signal:
+            return "critical"
+        if signal.startswith(BULK_SIGNAL_PREFIXES):
+            return "bulk"
+        return "normal"
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+    def submit(self, signal: str, payload: Dict[str, Any], handlers: Iterable[Handler]) -> int:
+        """Queue one delivery per handler; returns the number queued (0 if dropped under backpressure)."""
+        handlers = list(handlers)
+        if not handlers:
+            return 0
+        lane = self.lane_for(signal)
+        # Handlers that emit from a worker thread must not block on their own pool
+        from_worker = getattr(self._local, "is_worker", False)
+        with self._cond:
+            if not self._running:
+                raise DispatcherStopped("Dispatcher has been stopped")
+            if from_worker:
+                limit = self.lane_capacity[lane] * (1.0 + self.reentrant_headroom)
+                if self._pending[lane] + len(handlers) > limit:
+                    self._record_drop(signal, lane, len(handlers), "reentrant_overflow")
+                    logger.warning(f"[BUS] Dispatch lane '{lane}' over capacity - dropped re-entrant '{signal}' "
+                                   f"for {len(handlers)} handler(s)")
+                    return 0
+            else:
+                deadline = time.monotonic() + self.backpressure_timeout
+                while self._pending[lane] + len(handlers) > self.lane_capacity[lane]:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._record_drop(signal, lane, len(handlers), "backpressure_timeout")
+                        logger.warning(f"[BUS] Dispatch lane '{lane}' full - dropped '{signal}' for {len(handlers)} handler(s)")
+                        return 0
+                    self._cond.wait(remaining)
+            for handler in handlers:
+                subscriber = self._mailboxes.get(handler)
+                if subscriber is None:
+                    subscriber = self._mailboxes[handler] = _Subscriber()
+                subscriber.boxes[lane].append((signal, payload))
+                self._pending[lane] += 1
+                self._schedule(handler, subscriber)
+            self._stats["queued"] += len(handlers)
+            self._cond.notify_all()
+        return len(handlers)
+
+    def _record_drop(self, signal: str, lane: str, count: int, reason: str) -> None:
+        """Count deliveries dropped under backpressure (caller holds the lock)."""
+        self._stats["dropped"] += count
+        self._dropped_by_lane[lane] += count
+        self._dropped_by_signal[signal] = self._dropped_by_signal.get(signal, 0) + count
+        self._last_drop = {"signal": signal, "lane": lane, "handlers": count, "reason": reason,
+                           "timestamp": time.time()}
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+    def _schedule(self, handler: Handler, subscriber: _Subscriber) -> None:
+        """Make an idle subscriber ready in the lane of its most urgent message (caller holds the lock)."""
+        if subscriber.running:
+            return
+        lane = subscriber.top_lane()
+        if lane is not None and lane not in subscriber.queued:
+            # An entry left in a lower lane goes stale and is skipped when reached
+            subscriber.queued.add(lane)
+            self._ready[lane].append(handler)
+
+    def _next_ready(self) -> Optional[Tuple[Handler, _Subscriber]]:
+        for lane in LANES:
+            ready = self._ready[lane]
+            while ready:
+                handler = ready.popleft()
+                subscriber = self._mailboxes.get(handler)
+                if subscriber is None:
+                    continue
+                subscriber.queued.discard(lane)
+                if subscriber.running or subscriber.top_lane() is None:
+                    continue
+                return handler, subscriber
+        return None
+
+    def _worker_main(self, index: int) -> None:
+        try:
+            self._worker_loop()
+        except BaseException as exc:
+            # A handler raised SystemExit or similar; its delivery is already accounted for,
+            # so this thread ends and a fresh worker keeps the pool at full size
+            with self._cond:
+                if not self._running:
+                    raise
+                self._stats["workers_replaced"] += 1
+                self._threads.remove(threading.current_thread())
+                self._start_worker(index)
+            logger.error(f"[BUS] Dispatch worker {index} stopped by {type(exc).__name__} from a handler - replaced")
+
+    def _worker_loop(self) -> None:
+        self._local.is_worker = True
+        while True:
+            with self._cond:
+                picked = self._next_ready()
+                while picked is None:
+                    if not self._running:
+                        return
+                    self._cond.wait()
+                    picked = self._next_ready()
+                handler, subscriber = picked
+                lane = subscriber.top_lane()
+                signal, payload = subscriber.boxes[lane].popleft()
+                subscriber.running = True
+                self._active += 1
+
+            try:
+                handler(payload)
+            except Exception as exc:
+                with self._cond:
+                    self._stats["errors"] += 1
+                logger.error(f"[BUS] Error running handler '{getattr(handler, '__name__', handler)}' for '{signal}': {exc}")
+            finally:
+                # Also on SystemExit and friends, or flush() would wait forever and the subscriber stall
+                with self._cond:
+                    self._active -= 1
+                    self._pending[lane] -= 1
+                    self._stats["dispatched"] += 1
+                    subscriber.running = False
+                    if subscriber.top_lane() is not None:
+                        self._schedule(handler, subscriber)
+                    else:
+                        self._mailboxes.pop(handler, None)
+                    self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Lifecycle and metrics
+    # ------------------------------------------------------------------
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued delivery has run; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._active or any(self._pending.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        if wait:
+            self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        current = threading.current_thread()
+        with self._cond:
+            threads = list(self._threads)
+        for thread in threads:
+            if thread is not current:
+                thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "active": self._active,
+                "pending": dict(self._pending),
+                "lane_capacity": dict(self.lane_capacity),
+                "subscribers_waiting": len(self._mailboxes),
+                **self._stats,
+                "dropped_by_lane": dict(self._dropped_by_lane),
+                "dropped_by_signal": dict(self._dropped_by_signal),
+                "last_drop": dict(self._last_drop) if self._last_drop else None,
+            }
@@ -8,13 +8,23 @@ import json
 import logging
 import mimetypes
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import requests
 
+from result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
+# Analyses held in memory; the on-disk tier keeps the rest (DKI_AI_MEMORY_CACHE_ENTRIES)
+DEFAULT_MEMORY_CACHE_ENTRIES = 256
+# On-disk tier bounds (DKI_AI_CACHE_MAX_ENTRIES / DKI_AI_CACHE_MAX_MB)
+DEFAULT_DISK_CACHE_ENTRIES = 20000
+DEFAULT_DISK_CACHE_BYTES = 128 * 1024 * 1024
+
 try:  # Prefer the modern OpenAI SDK
     from openai import OpenAI  # type: ignore
     HAVE_OPENAI_SDK = True
@@ -28,6 +38,16 @@ except Exception:  # pragma: no cover - fall back to legacy layout
         HAVE_OPENAI_LEGACY = False
 
 
+class _Analysis:
+    """One in-flight analysis: set ``done`` once ``result`` is final."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+
+
 def _default_cache_dir() -> Path:
     env_override = os.getenv("DKI_AI_CACHE")
     if env_override:
@@ -38,9 +58,13 @@ def _default_cache_dir() -> Path:
 class AIOrchestrator:
     """Centralised helper that enriches evidence files using OpenAI models.
 
-    The orchestrator keeps a lightweight cache to avoid duplicate API calls and
-    exposes a single ``enrich_evidence`` entry point that returns a structured
-    payload containing document/image insights plus case-context suggestions.
+    The orchestrator keeps a two-tier cache to avoid duplicate API calls - a
+    bounded in-memory LRU in front of a bounded SQLite LRU in ``cache_dir`` -
+    and analyses each cache key at most once at a time: concurrent callers for
+    the same evidence wait for the first one's result, and share its failure
+    rather than retrying one after another. It exposes a single
+    ``enrich_evidence`` entry point that returns a structured payload
+    containing document/image insights plus case-context suggestions.
     """
 
     document_model: str = "gpt-4o-mini"
@@ -48,13 +72,36 @@ class AIOrchestrator:
 
     def __init__(self, api_manager: Optional[Any] = None, cache_dir: Optional[Path] = None) -> None:
         self.api_manager = api_manager
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.memory_cache_entries = max(1, self._env_int("DKI_AI_MEMORY_CACHE_ENTRIES", DEFAULT_MEMORY_CACHE_ENTRIES))
         self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
         except Exception:  # pragma: no cover - cache dir best-effort only
             logger.debug("AI cache directory %s could not be created", self.cache_dir)
         self.logger = logger.getChild("orchestrator")
+        try:
+            self.disk_cache: Optional[ResultCache] = ResultCache.from_env(
+                "ai", str(self.cache_dir / "ai_cache.sqlite3"),
+                default_entries=DEFAULT_DISK_CACHE_ENTRIES, default_bytes=DEFAULT_DISK_CACHE_BYTES)
+        except Exception as exc:  # pragma: no cover - memory tier still works
+            self.logger.warning("AI disk cache disabled: %s", exc)
+            self.disk_cache = None
+        self._cache_lock = threading.Lock()
+        # Cache key -> analysis in progress for it; waiters take its outcome
+        self._in_progress: Dict[str, _Analysis] = {}
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "waits": 0, "memory_evictions": 0}
+
+    @staticmethod
+    def _env_int(name: str, default: int) -> int:
+        value = os.getenv(name)
+        if not value:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%s", name, value)
+            return default
 
     # ------------------------------------------------------------------
     # Public API
@@ -83,7 +130,36 @@ class AIOrchestrator:
         if cached:
             self.logger.debug("Using cached AI analysis for %s", path.name)
             return cached
+        with self._cache_lock:
+            pending = self._in_progress.get(cache_key)
+            leader = pending is None
+            if leader:
+                pending = self._in_progress[cache_key] = _Analysis()
+                self._stats["misses"] += 1
+            else:
+                self._stats["waits"] += 1
+        if not leader:
+            # Another caller is analysing this evidence; its outcome, even None, is ours
+            pending.done.wait()
+            return pending.result
 
+        try:
+            pending.result = self._analyse_and_cache(path, evidence_record, cache_key)
+            return pending.result
+        finally:
+            with self._cache_lock:
+                self._in_progress.pop(cache_key, None)
+            pending.done.set()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/wait counters for both cache tiers."""
+        with self._cache_lock:
+            stats = {**self._stats, "memory_entries": len(self.cache), "memory_max_entries": self.memory_cache_entries,
+                     "in_progress": len(self._in_progress)}
+        stats["disk"] = self.disk_cache.get_stats() if self.disk_cache is not None else None
+        return stats
+
+    def _analyse_and_cache(self, path: Path, evidence_record: Dict[str, Any], cache_key: str) -> Optional[Dict[str, Any]]:
         extension = path.suffix.lower()
         try:
             if extension in {".txt", ".md", ".rtf", ".json", ".csv", ".log", ".pdf", ".doc", ".docx"}:
@@ -312,25 +388,62 @@ class AIOrchestrator:
         return digest.hexdigest()
 
     def _read_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        with self._cache_lock:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.cache.move_to_end(cache_key)
+                self._stats["memory_hits"] += 1
+                return cached
+        data = None
+        if self.disk_cache is not None:
+            try:
+                data = self.disk_cache.get(cache_key)
+            except Exception as exc:  # pragma: no cover - treated as a miss
+                self.logger.warning("AI disk cache read failed: %s", exc)
+        if data is None:
+            data = self._read_legacy_cache(cache_key)
+        if data is None:
+            return None
+        with self._cache_lock:
+            self._stats["disk_hits"] += 1
+        self._remember(cache_key, data)
+        return data
+
+    def _read_legacy_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Move an entry from the old one-JSON-file-per-key layout into the bounded store."""
         cache_file = self.cache_dir / f"{cache_key}.json"
         if not cache_file.exists():
             return None
         try:
             data = json.loads(cache_file.read_text(encoding="utf-8"))
-            self.cache[cache_key] = data
-            return data
         except Exception:  # pragma: no cover - corrupted cache
             return None
+        if self.disk_cache is not None:
+            self._write_disk(cache_key, data)
+            try:
+                cache_file.unlink()
+            except OSError:  # pragma: no cover - best effort
+                pass
+        return data
+
+    def _remember(self, cache_key: str, payload: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self.cache[cache_key] = payload
+            self.cache.move_to_end(cache_key)
+            while len(self.cache) > self.memory_cache_entries:
+                self.cache.popitem(last=False)
+                self._stats["memory_evictions"] += 1
+
+    def _write_disk(self, cache_key: str, payload: Dict[str, Any]) -> None:
+        try:
+            self.disk_cache.put(cache_key, payload)
+        except Exception as exc:  # pragma: no cover - best effort
+            self.logger.debug("AI disk cache write failed: %s", exc)
 
     def _write_cache(self, cache_key: str, payload: Dict[str, Any]) -> None:
-        self.cache[cache_key] = payload
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        try:
-            cache_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        except Exception:  # pragma: no cover - best effort
-            pass
+        self._remember(cache_key, payload)
+        if self.disk_cache is not None:
+            self._write_disk(cache_key, payload)
 
     def _call_openai_chat(self, prompt: str, *, model: str, max_tokens: int = 600) -> Optional[Dict[str, Any]]:
         api_key = self._get_openai_key()
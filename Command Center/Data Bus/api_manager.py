@@ -4,20 +4,36 @@
 
 import os
 import json
+import hashlib
+import threading
+import time
 import requests
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime
+
+from rate_limiter import RateGovernor
 
 logger = logging.getLogger(__name__)
 
+# Used when api_config.json does not set them
+DEFAULT_CALLS_PER_HOUR = 1000
+DEFAULT_RATE_LIMIT_WAIT_SECONDS = 30
+DEFAULT_CACHE_TTL_SECONDS = 3600
+DEFAULT_CACHE_MAX_SIZE = 1000
+
 class APIManager:
     def __init__(self, config_path="./configs/api_keys.json"):
         self.config_path = config_path
         self.api_registry = {}
         self.rate_limits = {}
-        self.cache = {}
-        self.cache_expiry = {}
+        # Per-provider token buckets, built lazily from api_settings.rate_limits
+        self.rate_governors: Dict[str, RateGovernor] = {}
+        # cache_key -> (monotonic expiry, response), least recently used first
+        self.cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.cache_stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+        self._lock = threading.Lock()
         self.load_keys()
         self.load_config()
 
@@ -231,6 +247,8 @@ class APIManager:
                 "description": config.get("description", "")
             }
         
+        status["rate_limits"] = self.get_rate_limit_status()
+        status["response_cache"] = self.get_cache_stats()
         return status
 
     def get_available_apis(self) -> List[str]:
@@ -241,65 +259,118 @@ class APIManager:
                 available.append(name)
         return available
 
-    def check_rate_limit(self, api_name: str) -> bool:
-        """Check if API is within rate limits"""
-        if api_name not in self.rate_limits:
-            self.rate_limits[api_name] = {
-                "calls": 0,
-                "reset_time": datetime.now()
-            }
-        
-        rate_info = self.rate_limits[api_name]
-        
-        # Reset counter if hour has passed
-        if datetime.now() - rate_info["reset_time"] > timedelta(hours=1):
-            rate_info["calls"] = 0
-            rate_info["reset_time"] = datetime.now()
-        
-        # Get rate limit from config
-        api_settings = self.config.get("api_settings", {})
-        rate_limits = api_settings.get("rate_limits", {})
-        max_calls = rate_limits.get(api_name, {}).get("calls_per_hour", 1000)
-        
-        return rate_info["calls"] < max_calls
+    def _rate_governor(self, api_name: str) -> RateGovernor:
+        """Token buckets for api_name: refill at the sustained hourly rate, burst up to calls_per_minute."""
+        with self._lock:
+            governor = self.rate_governors.get(api_name)
+            if governor is None:
+                limits = self.config.get("api_settings", {}).get("rate_limits", {}).get(api_name, {})
+                per_hour = limits.get("calls_per_hour", DEFAULT_CALLS_PER_HOUR)
+                per_minute = limits.get("calls_per_minute")
+                sustained = min(per_minute, per_hour / 60.0) if per_minute else per_hour / 60.0
+                # Bucket capacity is sustained * burst_seconds / 60; size it to one minute's allowance
+                burst_seconds = 60.0 * per_minute / sustained if per_minute and sustained > 0 else 10.0
+                governor = RateGovernor(requests_per_minute=sustained,
+                                        tokens_per_minute=limits.get("tokens_per_minute"),
+                                        burst_seconds=burst_seconds)
+                self.rate_governors[api_name] = governor
+            return governor
+
+    def set_default_rate_limit(self, api_name: str, **limits: Any) -> None:
+        """Rate limits (calls_per_hour, calls_per_minute, ...) for api_name unless api_config.json sets them"""
+        with self._lock:
+            configured = self.config.setdefault("api_settings", {}).setdefault("rate_limits", {})
+            configured.setdefault(api_name, dict(limits))
+
+    def check_rate_limit(self, api_name: str, tokens: int = 0, timeout: Optional[float] = None) -> bool:
+        """Reserve one call to api_name, waiting for the bucket to refill if needed
+
+        Returns False only when the wait would exceed timeout (api_settings
+        rate_limit_wait_seconds by default). A True result has already been
+        charged against the budget.
+        """
+        if timeout is None:
+            timeout = self.config.get("api_settings", {}).get("rate_limit_wait_seconds", DEFAULT_RATE_LIMIT_WAIT_SECONDS)
+        admitted = self._rate_governor(api_name).acquire(tokens, timeout=timeout)
+        if not admitted:
+            logger.warning(f"Rate limit for {api_name} would not clear within {timeout}s")
+        return admitted
 
     def increment_rate_limit(self, api_name: str):
-        """Increment API call counter"""
-        if api_name not in self.rate_limits:
-            self.rate_limits[api_name] = {
-                "calls": 0,
-                "reset_time": datetime.now()
-            }
-        
-        self.rate_limits[api_name]["calls"] += 1
+        """Record a completed API call (the budget itself is charged by check_rate_limit)"""
+        with self._lock:
+            if api_name not in self.rate_limits:
+                self.rate_limits[api_name] = {
+                    "calls": 0,
+                    "reset_time": datetime.now()
+                }
+            self.rate_limits[api_name]["calls"] += 1
+
+    def get_rate_limit_status(self) -> Dict[str, Any]:
+        """Admissions, waits and configured rates per provider"""
+        with self._lock:
+            governors = dict(self.rate_governors)
+            calls = {name: info["calls"] for name, info in self.rate_limits.items()}
+        return {name: {**governor.get_stats(), "calls": calls.get(name, 0)} for name, governor in governors.items()}
+
+    def _cache_settings(self) -> Dict[str, Any]:
+        return self.config.get("api_settings", {}).get("cache_settings", {})
+
+    def _cache_max_size(self) -> int:
+        return max(1, int(self._cache_settings().get("max_size", DEFAULT_CACHE_MAX_SIZE)))
 
     def get_cache_key(self, api_name: str, request_data: Dict[str, Any]) -> str:
-        """Generate cache key for API request"""
-        import hashlib
-        cache_data = f"{api_name}:{json.dumps(request_data, sort_keys=True)}"
-        return hashlib.md5(cache_data.encode()).hexdigest()
+        """Generate cache key for API request
+
+        The body is normalised first - keys sorted, None-valued fields dropped,
+        compact separators - so equivalent requests share an entry.
+        """
+        def normalise(value):
+            if isinstance(value, dict):
+                return {str(k): normalise(v) for k, v in value.items() if v is not None}
+            if isinstance(value, (list, tuple)):
+                return [normalise(v) for v in value]
+            return value
+
+        body = json.dumps(normalise(request_data), sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(f"{api_name}:{body}".encode("utf-8")).hexdigest()
 
     def get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Get cached API response"""
-        if cache_key in self.cache:
-            if cache_key in self.cache_expiry:
-                if datetime.now() < self.cache_expiry[cache_key]:
-                    return self.cache[cache_key]
-                else:
-                    # Cache expired
-                    del self.cache[cache_key]
-                    del self.cache_expiry[cache_key]
-        return None
-
-    def cache_response(self, cache_key: str, response: Dict[str, Any], ttl_seconds: int = 3600):
-        """Cache API response"""
-        self.cache[cache_key] = response
-        self.cache_expiry[cache_key] = datetime.now() + timedelta(seconds=ttl_seconds)
-
-        url = self.get_endpoint(name)
-        headers = {"Authorization": f"Bearer {self.get_key(name)}"}
-        try:
-            res = requests.get(url, headers=headers, timeout=5)
-            return {"status": res.status_code, "response": res.text[:200]}
-        except Exception as e:
-            return {"status": "error", "error": str(e)}
\ No newline at end of file
+        with self._lock:
+            entry = self.cache.get(cache_key)
+            if entry is None:
+                self.cache_stats["misses"] += 1
+                return None
+            expires, response = entry
+            if time.monotonic() >= expires:
+                # Cache expired
+                del self.cache[cache_key]
+                self.cache_stats["expired"] += 1
+                self.cache_stats["misses"] += 1
+                return None
+            self.cache.move_to_end(cache_key)
+            self.cache_stats["hits"] += 1
+            return response
+
+    def cache_response(self, cache_key: str, response: Dict[str, Any], ttl_seconds: Optional[int] = None):
+        """Cache API response (evicting least-recently-used entries beyond cache_settings max_size)"""
+        settings = self._cache_settings()
+        if not settings.get("enabled", True):
+            return
+        if ttl_seconds is None:
+            ttl_seconds = settings.get("ttl_seconds", DEFAULT_CACHE_TTL_SECONDS)
+        max_size = self._cache_max_size()
+        with self._lock:
+            self.cache[cache_key] = (time.monotonic() + ttl_seconds, response)
+            self.cache.move_to_end(cache_key)
+            now = time.monotonic()
+            while len(self.cache) > max_size:
+                # O(1) per put: only the least-recently-used end is trimmed; an expired entry
+                # anywhere else is dropped when it is next read
+                _, (expires, _) = self.cache.popitem(last=False)
+                self.cache_stats["expired" if expires <= now else "evictions"] += 1
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.cache_stats, "entries": len(self.cache), "max_size": self._cache_max_size()}
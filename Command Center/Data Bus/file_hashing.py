@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+File Hashing - Shared single-pass streaming digests for evidence files
+Every digest a caller needs is computed in one large-buffer read, and results
+are memoized by file identity (path, size, mtime, inode) so the same evidence
+is read once per ingest no matter how many components hash it.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Digests computed on every pass - later callers asking for either one hit the cache
+DEFAULT_ALGORITHMS: Tuple[str, ...] = ("md5", "sha256")
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+DEFAULT_CACHE_ENTRIES = 4096
+
+# (resolved path, size, mtime_ns, inode, device)
+FileKey = Tuple[str, int, int, int, int]
+
+
+def _file_key(path: str) -> FileKey:
+    resolved = os.path.realpath(os.fspath(path))
+    stat = os.stat(resolved)
+    return resolved, stat.st_size, stat.st_mtime_ns, stat.st_ino, stat.st_dev
+
+
+class FileHashService:
+    """Memoizing streaming hasher - one read of the file per identity, constant memory per pass"""
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE, cache_entries: int = DEFAULT_CACHE_ENTRIES,
+                 algorithms: Iterable[str] = DEFAULT_ALGORITHMS):
+        self.buffer_size = max(64 * 1024, int(buffer_size))
+        self.cache_entries = max(1, int(cache_entries))
+        self.algorithms = tuple(algorithms)
+        self._cache: "OrderedDict[FileKey, Dict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Identity -> event set when the pass hashing it finishes; concurrent callers wait instead of re-reading
+        self._in_progress: Dict[FileKey, threading.Event] = {}
+        self._stats = {"hits": 0, "misses": 0, "bytes_read": 0, "waits": 0}
+
+    @classmethod
+    def from_env(cls) -> "FileHashService":
+        """Build a service sized by DKI_HASH_BUFFER_SIZE / DKI_HASH_CACHE_ENTRIES."""
+        options = {}
+        for env_name, option in (("DKI_HASH_BUFFER_SIZE", "buffer_size"), ("DKI_HASH_CACHE_ENTRIES", "cache_entries")):
+            value = os.getenv(env_name)
+            if value:
+                try:
+                    options[option] = int(value)
+                except ValueError:
+                    logger.warning("Ignoring invalid %s=%s", env_name, value)
+        return cls(**options)
+
+    def digests(self, path: Any, algorithms: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Return {algorithm: hexdigest} for path; raises OSError if the file cannot be read."""
+        wanted = tuple(algorithms) if algorithms else self.algorithms
+        while True:
+            key = _file_key(path)
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None and all(name in cached for name in wanted):
+                    self._cache.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return {name: cached[name] for name in wanted}
+                pending = self._in_progress.get(key)
+                if pending is None:
+                    pending = self._in_progress[key] = threading.Event()
+                    self._stats["misses"] += 1
+                    break
+                self._stats["waits"] += 1
+            pending.wait()
+
+        try:
+            # Hash the union so a later caller asking for the default set does not read the file again
+            names = tuple(dict.fromkeys(wanted + self.algorithms + tuple(cached or ())))
+            computed = self._hash_pass(key[0], names)
+            with self._lock:
+                # Only memoize if the file did not change underneath the read
+                try:
+                    unchanged = _file_key(path) == key
+                except OSError:
+                    unchanged = False
+                if unchanged:
+                    self._cache[key] = computed
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.cache_entries:
+                        self._cache.popitem(last=False)
+            return {name: computed[name] for name in wanted}
+        finally:
+            with self._lock:
+                self._in_progress.pop(key, None)
+            pending.set()
+
+    def hexdigest(self, path: Any, algorithm: str = "sha256") -> str:
+        return self.digests(path, (algorithm,))[algorithm]
+
+    def _hash_pass(self, path: str, names: Tuple[str, ...]) -> Dict[str, str]:
+        hashers = {name: hashlib.new(name) for name in names}
+        buffer = bytearray(self.buffer_size)
+        view = memoryview(buffer)
+        read_total = 0
+        with open(path, "rb", buffering=0) as handle:
+            while True:
+                count = handle.readinto(buffer)
+                if not count:
+                    break
+                chunk = view[:count]
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+                read_total += count
+        with self._lock:
+            self._stats["bytes_read"] += read_total
+        return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+    def invalidate(self, path: Optional[Any] = None) -> None:
+        """Forget cached digests for one path (every identity it had) or for everything."""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+            resolved = os.path.realpath(os.fspath(path))
+            for key in [key for key in self._cache if key[0] == resolved]:
+                del self._cache[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cached_files": len(self._cache),
+                "cache_entries": self.cache_entries,
+                "buffer_size": self.buffer_size,
+                **self._stats,
+            }
+
+
+_default_service: Optional[FileHashService] = None
+_default_lock = threading.Lock()
+
+
+def get_hash_service() -> FileHashService:
+    """Process-wide service shared by every caller."""
+    global _default_service
+    if _default_service is None:
+        with _default_lock:
+            if _default_service is None:
+                _default_service = FileHashService.from_env()
+    return _default_service
+
+
+def hash_file_digests(path: Any, algorithms: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """{algorithm: hexdigest} for path from the shared service (md5 and sha256 by default)."""
+    return get_hash_service().digests(path, algorithms)
+
+
+def file_hexdigest(path: Any, algorithm: str = "sha256") -> str:
+    """Single hexdigest for path from the shared service."""
+    return get_hash_service().hexdigest(path, algorithm)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+OCR Cache - Shared on-disk OCR results keyed by content and engine settings
+A page is identified by the content hash of its source file (or of the raster
+itself) plus its page index; the engine, language and preprocessing parameters
+complete the key, so the same page is never OCR'd twice with the same settings
+across processors, section builds and processes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from file_hashing import file_hexdigest
+from result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OCR_CACHE_ENTRIES = 200000
+DEFAULT_OCR_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def image_content_hash(image: Any) -> str:
+    """sha256 over a PIL image's mode, size and pixels - identifies a raster with no source file."""
+    digest = hashlib.sha256(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+class OCRCache:
+    """Get/put OCR output by (content hash, page, engine, language, parameters)"""
+
+    def __init__(self, store: Optional[ResultCache]):
+        # store is None when DKI_OCR_CACHE=0 - every lookup misses and nothing is written
+        self.store = store
+
+    @classmethod
+    def from_env(cls) -> "OCRCache":
+        """Cache under DKI_OCR_CACHE_DIR (system temp by default), bounded by DKI_OCR_CACHE_MAX_ENTRIES / _MAX_MB."""
+        if os.getenv("DKI_OCR_CACHE", "1").strip().lower() in ("0", "false", "off"):
+            return cls(None)
+        directory = os.getenv("DKI_OCR_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "dki_ocr_cache")
+        try:
+            store = ResultCache.from_env("ocr", os.path.join(directory, "ocr_cache.sqlite3"),
+                                         default_entries=DEFAULT_OCR_CACHE_ENTRIES,
+                                         default_bytes=DEFAULT_OCR_CACHE_BYTES)
+        except Exception as exc:
+            logger.warning("OCR cache disabled: %s", exc)
+            store = None
+        return cls(store)
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    @staticmethod
+    def make_key(content_hash: str, page: Any, engine: str, language: Optional[str] = None,
+                 params: Optional[Dict[str, Any]] = None) -> str:
+        material = json.dumps([content_hash, page, engine, language, params or {}], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, content_hash: str, page: Any, engine: str, language: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        if self.store is None or not content_hash:
+            return None
+        try:
+            return self.store.get(self.make_key(content_hash, page, engine, language, params))
+        except Exception as exc:
+            logger.warning("OCR cache read failed: %s", exc)
+            return None
+
+    def put(self, content_hash: str, page: Any, engine: str, result: Any, language: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = None) -> None:
+        if self.store is None or not content_hash or result is None:
+            return
+        try:
+            self.store.put(self.make_key(content_hash, page, engine, language, params), result)
+        except Exception as exc:
+            logger.warning("OCR cache write failed: %s", exc)
+
+    def get_or_compute(self, content_hash: str, page: Any, engine: str, compute: Callable[[], Any],
+                       language: Optional[str] = None, params: Optional[Dict[str, Any]] = None,
+                       expected_type: Optional[type] = None) -> Any:
+        """Cached result, else compute() stored for next time (exceptions propagate and are not cached).
+
+        With expected_type, an entry of another shape is treated as a miss and overwritten.
+        """
+        cached = self.get(content_hash, page, engine, language, params)
+        if cached is not None and (expected_type is None or isinstance(cached, expected_type)):
+            return cached
+        result = compute()
+        self.put(content_hash, page, engine, result, language, params)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        if self.store is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.store.get_stats()}
+
+
+_default_cache: Optional[OCRCache] = None
+_default_lock = threading.Lock()
+
+
+def get_ocr_cache() -> OCRCache:
+    """Process-wide OCR cache shared by every caller."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = OCRCache.from_env()
+    return _default_cache
+
+
+def cached_file_ocr(file_path: str, engine: str, compute: Callable[[], Any], page: Any = 0,
+                    language: Optional[str] = None, params: Optional[Dict[str, Any]] = None,
+                    expected_type: Optional[type] = None) -> Any:
+    """Run compute() for file_path's page once per content hash and engine settings."""
+    cache = get_ocr_cache()
+    if not cache.enabled:
+        return compute()
+    try:
+        content_hash = file_hexdigest(file_path)
+    except OSError:
+        return compute()
+    return cache.get_or_compute(content_hash, page, engine, compute, language, params, expected_type)
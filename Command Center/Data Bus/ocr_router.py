@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+OCR Router - Per-page OCR engine selection instead of a fixed cascade
+Each page is classified from cheap raster features (resolution, contrast, ink
+density, handwriting likelihood). The engine with the best expected quality for
+that class is chosen, preferring the fastest of the near-best, and the latency
+and quality of every run feed back into the estimates. Hard pages can race two
+engines and keep the better result that arrives before a deadline.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PAGE_CLASSES = ('clean', 'degraded', 'handwritten')
+
+# engine: (seconds per page, expected quality per page class) - starting estimates until runs are recorded
+ENGINE_PRIORS: Dict[str, Tuple[float, Dict[str, float]]] = {
+    'tesseract': (1.5, {'clean': 0.90, 'degraded': 0.60, 'handwritten': 0.30}),
+    'paddleocr': (3.0, {'clean': 0.90, 'degraded': 0.85, 'handwritten': 0.65}),
+    'easyocr': (5.0, {'clean': 0.85, 'degraded': 0.80, 'handwritten': 0.70}),
+    'azure': (4.0, {'clean': 0.80, 'degraded': 0.75, 'handwritten': 0.60}),
+}
+DEFAULT_PRIOR = (5.0, {page_class: 0.5 for page_class in PAGE_CLASSES})
+# Observations a prior is worth; later runs blend in at no less than MIN_ALPHA so estimates keep tracking drift
+PRIOR_WEIGHT = 3
+MIN_ALPHA = 0.05
+
+# Engines whose expected quality is within this of the best compete on latency alone
+QUALITY_TOLERANCE = 0.05
+# Below this expected quality the leading engine races the runner-up
+RACE_QUALITY = 0.8
+# A racer result at least this good is taken without waiting for the other engine
+ACCEPT_QUALITY = 0.9
+DEFAULT_RACE_DEADLINE = 8.0
+
+FEATURE_SIZE = 1024
+# Assumed page width in inches when a raster carries no DPI (letter / A4 portrait)
+ASSUMED_PAGE_INCHES = 8.5
+
+
+@dataclass
+class PageFeatures:
+    dpi: float
+    contrast: float
+    ink_density: float
+    handwriting: float
+    page_class: str
+
+
+def classify_page(dpi: float, contrast: float, handwriting: float) -> str:
+    if handwriting >= 0.6:
+        return 'handwritten'
+    if dpi < 150 or contrast < 0.35:
+        return 'degraded'
+    return 'clean'
+
+
+def page_features(image: Any) -> PageFeatures:
+    """Cheap features of a PIL image from a grayscale thumbnail (a few milliseconds per page)."""
+    width, height = image.size
+    dpi = image.info.get('dpi') if hasattr(image, 'info') else None
+    if isinstance(dpi, (tuple, list)):
+        dpi = dpi[0]
+    if not dpi:
+        dpi = min(width, height) / ASSUMED_PAGE_INCHES
+    gray = image if image.mode == 'L' else image.convert('L')
+    scale = min(1.0, FEATURE_SIZE / max(width, height, 1))
+    if scale < 1.0:
+        gray = gray.resize((max(1, int(width * scale)), max(1, int(height * scale))), _resample('BOX'))
+
+    # Contrast is the 5th-95th percentile spread, robust to specks and margins
+    histogram = gray.histogram()
+    total = sum(histogram) or 1
+    low, high = _percentile(histogram, total, 0.05), _percentile(histogram, total, 0.95)
+    contrast = (high - low) / 255.0
+    threshold = (low + high) // 2
+    dark = sum(histogram[:threshold + 1]) / total
+    # Ink is the minority side of the threshold, so light-on-dark scans read the same as dark-on-light
+    inverted = dark > 0.5
+    ink_density = min(dark, 1.0 - dark)
+
+    # Row ink profile: the BOX resize to one column averages each row of the binarized thumbnail
+    if inverted:
+        binary = gray.point(lambda value: 255 if value > threshold else 0)
+    else:
+        binary = gray.point(lambda value: 255 if value <= threshold else 0)
+    rows = [value / 255.0 for value in binary.resize((1, binary.size[1]), _resample('BOX')).getdata()]
+    handwriting = _handwriting_likelihood(rows)
+    return PageFeatures(dpi=float(dpi), contrast=round(contrast, 3), ink_density=round(ink_density, 4),
+                        handwriting=round(handwriting, 3), page_class=classify_page(dpi, contrast, handwriting))
+
+
+def _resample(name: str):
+    return getattr(getattr(Image, 'Resampling', Image), name)
+
+
+def _percentile(histogram: List[int], total: int, fraction: float) -> int:
+    target = total * fraction
+    running = 0
+    for value, count in enumerate(histogram):
+        running += count
+        if running >= target:
+            return value
+    return len(histogram) - 1
+
+
+def _handwriting_likelihood(rows: List[float]) -> float:
+    """0 for ruled lines of print, towards 1 for handwriting or scene text.
+
+    Machine print leaves clean blank rows between text lines. Handwriting slants
+    and overlaps, and photographed scene text has no line structure, so few rows
+    inside the inked span are blank. Scene text scores high too; that is intended,
+    since both favour the neural engines over Tesseract.
+    """
+    peak = max(rows, default=0.0)
+    if peak <= 0.0:
+        return 0.0
+    inked = [index for index, value in enumerate(rows) if value > 0.02 * peak]
+    span = rows[inked[0]:inked[-1] + 1]
+    if len(span) < 8:
+        return 0.0
+    gap_fraction = sum(1 for value in span if value <= 0.1 * peak) / len(span)
+    return max(0.0, 1.0 - gap_fraction / 0.3)
+
+
+def _has_text(result: Optional[Dict[str, Any]]) -> bool:
+    return bool(result) and bool(str(result.get('text', '')).strip())
+
+
+def result_quality(result: Optional[Dict[str, Any]]) -> float:
+    """Quality of one engine run: 0 with no text, else its confidence as a 0-1 fraction."""
+    if not _has_text(result):
+        return 0.0
+    try:
+        confidence = float(result.get('confidence') or 0)
+    except (TypeError, ValueError):
+        confidence = 0.0
+    return max(0.0, min(1.0, confidence / 100.0))
+
+
+class _EngineEstimate:
+    """Running latency and quality of one engine on one page class"""
+
+    __slots__ = ('runs', 'latency', 'quality')
+
+    def __init__(self, latency: float, quality: float):
+        self.runs = 0
+        self.latency = latency
+        self.quality = quality
+
+    def record(self, seconds: float, quality: float) -> None:
+        self.runs += 1
+        alpha = max(MIN_ALPHA, 1.0 / (self.runs + PRIOR_WEIGHT))
+        self.latency += alpha * (seconds - self.latency)
+        self.quality += alpha * (quality - self.quality)
+
+
+class OCRRouter:
+    """Plan and run OCR engines per page from page features and recorded engine history
+
+    Engines are supplied per call as {name: callable(image) -> result dict or None}.
+    The router never raises for an engine: errors and empty results count as
+    quality 0 and the next engine in the plan runs.
+    """
+
+    def __init__(self, race_workers: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._estimates: Dict[Tuple[str, str], _EngineEstimate] = {}
+        self._race_workers = race_workers or max(4, os.cpu_count() or 1)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._stats = {'pages': 0, 'races': 0, 'race_deadlines': 0,
+                       'classes': {page_class: 0 for page_class in PAGE_CLASSES}}
+
+    def _estimate(self, engine: str, page_class: str) -> _EngineEstimate:
+        estimate = self._estimates.get((engine, page_class))
+        if estimate is None:
+            latency, qualities = ENGINE_PRIORS.get(engine, DEFAULT_PRIOR)
+            estimate = _EngineEstimate(latency, qualities.get(page_class, 0.5))
+            self._estimates[(engine, page_class)] = estimate
+        return estimate
+
+    def record(self, engine: str, page_class: str, seconds: float, result: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._estimate(engine, page_class).record(seconds, result_quality(result))
+
+    def plan(self, engines: List[str], page_class: str) -> List[Tuple[str, float]]:
+        """(engine, expected quality) in run order: the fastest near-best engine, then the rest by quality."""
+        with self._lock:
+            estimates = [(engine, self._estimate(engine, page_class)) for engine in engines]
+            ranked = [(engine, estimate.quality, estimate.latency) for engine, estimate in estimates]
+        if not ranked:
+            return []
+        best = max(quality for _, quality, _ in ranked)
+        lead = min((entry for entry in ranked if entry[1] >= best - QUALITY_TOLERANCE), key=lambda entry: entry[2])
+        rest = sorted((entry for entry in ranked if entry is not lead), key=lambda entry: (-entry[1], entry[2]))
+        return [(engine, quality) for engine, quality, _ in [lead] + rest]
+
+    def run(self, image: Any, engines: Dict[str, Callable[[Any], Optional[Dict[str, Any]]]],
+            adaptive: bool = True, race: bool = True,
+            race_deadline: float = DEFAULT_RACE_DEADLINE) -> Tuple[Optional[str], Optional[Dict[str, Any]], List[str], Dict[str, Any]]:
+        """OCR image with the planned engines until one finds text.
+
+        Returns (engine used, its result, fallback attempts, routing details). Without
+        adaptive, engines run in the order given, exactly like the old cascade.
+        """
+        routing: Dict[str, Any] = {'mode': 'adaptive' if adaptive else 'cascade'}
+        page_class = 'clean' if adaptive else 'unclassified'
+        if adaptive and Image is not None:
+            try:
+                features = page_features(image)
+                page_class = features.page_class
+                routing['features'] = asdict(features)
+            except Exception as exc:
+                logger.warning(f"[OCR] Page features unavailable, routing as clean: {exc}")
+        routing['page_class'] = page_class
+
+        if adaptive:
+            plan = self.plan(list(engines), page_class)
+        else:
+            plan = [(engine, 0.0) for engine in engines]
+        routing['plan'] = [engine for engine, _ in plan]
+        with self._lock:
+            self._stats['pages'] += 1
+            self._stats['classes'][page_class] = self._stats['classes'].get(page_class, 0) + 1
+
+        attempts: List[str] = []
+        tried = set()
+        if adaptive and race and len(plan) >= 2 and (page_class != 'clean' or plan[0][1] < RACE_QUALITY):
+            contenders = [plan[0][0], plan[1][0]]
+            tried.update(contenders)
+            routing['raced'] = contenders
+            winner, result = self._race(image, contenders, engines, page_class, race_deadline, attempts)
+            if winner is not None:
+                return winner, result, attempts, routing
+
+        for engine, _ in plan:
+            if engine in tried:
+                continue
+            result, error = self._timed(engine, engines[engine], image, page_class)
+            if _has_text(result):
+                return engine, result, attempts, routing
+            attempts.append(f'{engine}_error' if error is not None else f'{engine}_no_text')
+        return None, None, attempts, routing
+
+    def _timed(self, engine: str, func: Callable[[Any], Optional[Dict[str, Any]]], image: Any,
+               page_class: str) -> Tuple[Optional[Dict[str, Any]], Optional[BaseException]]:
+        started = time.perf_counter()
+        result, error = None, None
+        try:
+            result = func(image)
+        except Exception as exc:
+            logger.warning(f"OCR engine {engine} failed: {str(exc)}")
+            error = exc
+        self.record(engine, page_class, time.perf_counter() - started, result)
+        return result, error
+
+    def _race(self, image: Any, contenders: List[str], engines: Dict[str, Callable], page_class: str,
+              deadline_seconds: float, attempts: List[str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Run contenders in parallel; after the first result with text, wait for a better one until the deadline.
+
+        A contender still running at the deadline is left to finish in the background,
+        where its latency and quality are still recorded. Each contender therefore gets
+        its own copy of the (PIL) image, which it closes itself, so the caller may close
+        the original as soon as this returns.
+        """
+        pool = self._get_pool()
+        futures = {pool.submit(self._race_contender, engine, engines[engine], image.copy(), page_class): engine
+                   for engine in contenders}
+        with self._lock:
+            self._stats['races'] += 1
+        started = time.monotonic()
+        pending = set(futures)
+        winner: Optional[Tuple[str, Dict[str, Any]]] = None
+        while pending:
+            timeout = None if winner is None else max(0.0, started + deadline_seconds - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                engine = futures[future]
+                result, error = future.result()
+                quality = result_quality(result)
+                if _has_text(result):
+                    if winner is None or quality > result_quality(winner[1]):
+                        winner = (engine, result)
+                else:
+                    attempts.append(f'{engine}_error' if error is not None else f'{engine}_no_text')
+            if winner is not None and result_quality(winner[1]) >= ACCEPT_QUALITY:
+                break
+        for future in pending:
+            attempts.append(f'{futures[future]}_deadline')
+        if pending:
+            with self._lock:
+                self._stats['race_deadlines'] += 1
+        return winner if winner is not None else (None, None)
+
+    def _race_contender(self, engine: str, func: Callable[[Any], Optional[Dict[str, Any]]], image: Any,
+                        page_class: str) -> Tuple[Optional[Dict[str, Any]], Optional[BaseException]]:
+        try:
+            return self._timed(engine, func, image, page_class)
+        finally:
+            image.close()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._race_workers, thread_name_prefix="ocr-race")
+            return self._pool
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            engines: Dict[str, Dict[str, Any]] = {}
+            for (engine, page_class), estimate in sorted(self._estimates.items()):
+                engines.setdefault(engine, {})[page_class] = {
+                    'runs': estimate.runs,
+                    'latency_seconds': round(estimate.latency, 3),
+                    'quality': round(estimate.quality, 3)
+                }
+            return {**self._stats, 'classes': dict(self._stats['classes']), 'engines': engines}
+
+
+_default_router: Optional[OCRRouter] = None
+_default_lock = threading.Lock()
+
+
+def get_ocr_router() -> OCRRouter:
+    """Process-wide router, so engine history accumulates across processors."""
+    global _default_router
+    if _default_router is None:
+        with _default_lock:
+            if _default_router is None:
+                _default_router = OCRRouter()
+    return _default_router
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Perceptual Hash - Near-duplicate detection for photos and video frames
+Difference hashes (dHash) are stored as hex strings next to each media result;
+a multi-index Hamming table finds every hash within a radius without
+comparing all pairs, and clusters are formed with union-find. Flat frames
+(fades, blank pages, dark shots) carry no picture information, so they get no
+hash and never make two unrelated files look alike. dedupe_timed_items applies
+the report rules (same bytes, same-size burst, near-duplicate frames) to a list
+of media items.
+"""
+
+import logging
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+DEFAULT_HASH_SIZE = 8
+# Bits that may differ for two 64-bit dHashes to count as the same picture (re-encode, resize, light crop)
+DEFAULT_MAX_DISTANCE = 10
+# Tighter radius for report de-duplication, where a dropped item disappears from the report
+NEAR_DUPLICATE_MAX_DISTANCE = 6
+# Same-size captures this close together are one burst, of which the report keeps the first
+DEFAULT_BURST_WINDOW = timedelta(seconds=2)
+# Grey-level spread below which a reduced frame is treated as flat and left unhashed
+MIN_FRAME_STDDEV = 3.0
+# Hashes with fewer set (or unset) bits than this describe almost no gradient structure
+MIN_INFORMATIVE_BITS = 6
+
+HashValue = Union[int, str]
+
+
+def dhash(image: Any, hash_size: int = DEFAULT_HASH_SIZE) -> Optional[str]:
+    """Difference hash of a PIL image (or image path) as a hex string
+
+    None when PIL is unavailable or the image is too flat to describe.
+    """
+    if Image is None:
+        return None
+    if not hasattr(image, "convert"):
+        with Image.open(image) as opened:
+            # draft() lets JPEG decode straight at a reduced scale instead of full resolution
+            if opened.format == "JPEG":
+                opened.draft("L", (hash_size * 8, hash_size * 8))
+            return dhash(opened, hash_size)
+    resample = getattr(getattr(Image, "Resampling", Image), "LANCZOS")
+    pixels = list(image.convert("L").resize((hash_size + 1, hash_size), resample).getdata())
+    mean = sum(pixels) / len(pixels)
+    if (sum((pixel - mean) ** 2 for pixel in pixels) / len(pixels)) ** 0.5 < MIN_FRAME_STDDEV:
+        return None
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{value:0{hash_size * hash_size // 4}x}"
+
+
+def _as_int(value: HashValue) -> int:
+    return value if isinstance(value, int) else int(value, 16)
+
+
+def hamming_distance(first: HashValue, second: HashValue) -> int:
+    return bin(_as_int(first) ^ _as_int(second)).count("1")
+
+
+def is_informative(value: Optional[HashValue], bits: int = DEFAULT_HASH_SIZE * DEFAULT_HASH_SIZE) -> bool:
+    """False for missing hashes and near-constant ones (e.g. the all-zero hash of a uniform frame)."""
+    if value in (None, ""):
+        return False
+    ones = bin(_as_int(value)).count("1")
+    return MIN_INFORMATIVE_BITS <= ones <= bits - MIN_INFORMATIVE_BITS
+
+
+def informative_hashes(hashes: Union[None, HashValue, Sequence[HashValue]]) -> List[HashValue]:
+    """A photo hash or list of frame hashes, minus the ones that cannot identify a picture."""
+    if not hashes:
+        return []
+    if isinstance(hashes, (str, int)):
+        hashes = [hashes]
+    return [value for value in hashes if is_informative(value)]
+
+
+class HammingIndex:
+    """Multi-index hash table for radius queries over fixed-width hashes
+
+    Hashes are split into chunks, each with its own table. Two hashes within r bits
+    must agree to within r // chunks bits on at least one chunk (pigeonhole), so a
+    query only probes those chunk neighbourhoods and verifies the few candidates.
+    """
+
+    def __init__(self, bits: int = DEFAULT_HASH_SIZE * DEFAULT_HASH_SIZE, chunks: int = 4):
+        self.bits = bits
+        self.chunks = max(1, min(chunks, bits))
+        self._widths = [bits // self.chunks + (1 if index < bits % self.chunks else 0) for index in range(self.chunks)]
+        self._shifts = [sum(self._widths[index + 1:]) for index in range(self.chunks)]
+        self._tables: List[Dict[int, List[Tuple[int, Any]]]] = [{} for _ in range(self.chunks)]
+        self._masks: Dict[Tuple[int, int], List[int]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _chunk_masks(self, width: int, radius: int) -> List[int]:
+        """Every width-bit XOR mask with at most radius bits set."""
+        key = (width, radius)
+        masks = self._masks.get(key)
+        if masks is None:
+            masks = [0]
+            for _ in range(radius):
+                masks = sorted(set(masks) | {mask | (1 << bit) for mask in masks for bit in range(width)})
+            self._masks[key] = masks
+        return masks
+
+    def _split(self, value: int) -> List[int]:
+        return [(value >> shift) & ((1 << width) - 1) for shift, width in zip(self._shifts, self._widths)]
+
+    def add(self, value: HashValue, payload: Any = None) -> None:
+        value = _as_int(value)
+        # One shared entry in every chunk table, so search() can tell repeat candidates apart
+        entry = (value, payload)
+        for table, chunk in zip(self._tables, self._split(value)):
+            table.setdefault(chunk, []).append(entry)
+        self._size += 1
+
+    def search(self, value: HashValue, max_distance: int) -> List[Tuple[int, Any]]:
+        """(distance, payload) for every stored hash within max_distance of value."""
+        value = _as_int(value)
+        chunk_radius = max_distance // self.chunks
+        seen = set()
+        matches: List[Tuple[int, Any]] = []
+        for table, chunk, width in zip(self._tables, self._split(value), self._widths):
+            for mask in self._chunk_masks(width, chunk_radius):
+                for entry in table.get(chunk ^ mask, ()):
+                    marker = id(entry)
+                    if marker in seen:
+                        continue
+                    seen.add(marker)
+                    distance = bin(value ^ entry[0]).count("1")
+                    if distance <= max_distance:
+                        matches.append((distance, entry[1]))
+        return matches
+
+
+class NearDuplicateIndex:
+    """Files indexed by their frame hashes; a file matches an indexed one when most of its frames do
+
+    A photo is one frame. Uninformative hashes are ignored on both sides, so a
+    file whose frames are all flat matches nothing.
+    """
+
+    def __init__(self, max_distance: int = NEAR_DUPLICATE_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._index = HammingIndex()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def match(self, hashes: Union[None, HashValue, Sequence[HashValue]]) -> Optional[Hashable]:
+        """Key of an indexed file that more than half of these frames are near, else None."""
+        return _majority_match(self._index, informative_hashes(hashes), self.max_distance)
+
+    def add(self, key: Hashable, hashes: Union[None, HashValue, Sequence[HashValue]]) -> None:
+        for value in informative_hashes(hashes):
+            self._index.add(value, key)
+
+
+def _majority_counts(index: HammingIndex, hashes: List[HashValue], max_distance: int) -> Dict[Hashable, int]:
+    """Indexed key -> how many of hashes have at least one frame of that key within max_distance."""
+    counts: Dict[Hashable, int] = {}
+    for value in hashes:
+        for other in {key for _, key in index.search(value, max_distance)}:
+            counts[other] = counts.get(other, 0) + 1
+    return counts
+
+
+def _majority_match(index: HammingIndex, hashes: List[HashValue], max_distance: int) -> Optional[Hashable]:
+    if not hashes:
+        return None
+    counts = _majority_counts(index, hashes, max_distance)
+    best = max(counts, key=counts.get, default=None)
+    return best if best is not None and counts[best] * 2 > len(hashes) else None
+
+
+def cluster_near_duplicates(hashed_items: Iterable[Tuple[Hashable, Union[HashValue, Sequence[HashValue]]]],
+                            max_distance: int = DEFAULT_MAX_DISTANCE) -> List[List[Hashable]]:
+    """Group keys where most of one key's frame hashes lie within max_distance of another's.
+
+    Returns clusters of two or more keys, each in input order, ordered by first member.
+    """
+    order: Dict[Hashable, int] = {}
+    parent: Dict[Hashable, Hashable] = {}
+
+    def find(key: Hashable) -> Hashable:
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    index = HammingIndex()
+    for key, hashes in hashed_items:
+        hashes = informative_hashes(hashes)
+        if not hashes:
+            continue
+        if key not in parent:
+            parent[key] = key
+            order[key] = len(order)
+        # Query before insert so each pair is considered once, from the later key's frames
+        for other, matched in _majority_counts(index, hashes, max_distance).items():
+            if other == key or matched * 2 <= len(hashes):
+                continue
+            root_a, root_b = find(key), find(other)
+            if root_a != root_b:
+                if order[root_a] < order[root_b]:
+                    parent[root_b] = root_a
+                else:
+                    parent[root_a] = root_b
+        for value in hashes:
+            index.add(value, key)
+
+    groups: Dict[Hashable, List[Hashable]] = {}
+    for key in order:
+        groups.setdefault(find(key), []).append(key)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def dedupe_timed_items(items: Iterable[Dict[str, Any]], parse_time: Callable[[Any], Optional[datetime]],
+                       burst_window: timedelta = DEFAULT_BURST_WINDOW,
+                       max_distance: int = NEAR_DUPLICATE_MAX_DISTANCE) -> List[Dict[str, Any]]:
+    """Media items in capture order, minus repeats of one already kept
+
+    An item is a repeat when it has a kept item's file_hash, has a kept item's
+    dimensions within burst_window of its capture time, or its perceptual_hash
+    frames near-match a kept item's. parse_time turns the captured_at /
+    processing_timestamp value into a datetime (None if it cannot).
+    """
+    seen_hash = set()
+    # Kept capture times per dimensions, sorted, so the burst check is a bisect not a scan
+    times_by_dims: Dict[Tuple[Any, ...], List[datetime]] = {}
+    near_duplicates = NearDuplicateIndex(max_distance)
+    kept: List[Dict[str, Any]] = []
+    for item in sorted(items, key=lambda x: (x.get('captured_at') or x.get('processing_timestamp') or '')):
+        file_hash = item.get('file_hash')
+        dims = item.get('dimensions')
+        captured = parse_time(item.get('captured_at') or item.get('processing_timestamp'))
+        if file_hash and file_hash in seen_hash:
+            continue
+        if dims and captured:
+            times = times_by_dims.get(tuple(dims)) or []
+            pos = bisect_left(times, captured - burst_window)
+            if pos < len(times) and times[pos] <= captured + burst_window:
+                continue
+        if near_duplicates.match(item.get('perceptual_hash')) is not None:
+            continue
+        if file_hash:
+            seen_hash.add(file_hash)
+        if dims and captured:
+            insort(times_by_dims.setdefault(tuple(dims), []), captured)
+        near_duplicates.add(len(kept), item.get('perceptual_hash'))
+        kept.append(item)
+    return kept
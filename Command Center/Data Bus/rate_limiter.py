@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter - Token buckets for model and API request budgets
+A RateGovernor holds a requests-per-minute bucket and a tokens-per-minute
+bucket and admits a call only when both can pay for it, so concurrent callers
+stay within provider limits instead of discovering them through 429s.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """Classic token bucket: refills at rate per second up to capacity"""
+
+    def __init__(self, rate_per_second: float, capacity: Optional[float] = None):
+        self.rate = float(rate_per_second)
+        self.capacity = float(capacity if capacity is not None else rate_per_second)
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount is available (0 when it is available now). Not thread-safe on its own."""
+        self._refill(now)
+        amount = min(amount, self.capacity)  # an oversized request waits for a full bucket, never forever
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self.rate if self.rate > 0 else float("inf")
+
+    def take(self, amount: float) -> None:
+        self._level -= min(amount, self.capacity)
+
+
+class RateGovernor:
+    """Admit calls against optional request and token budgets per minute"""
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 burst_seconds: float = 10.0):
+        # A bucket holds burst_seconds worth of budget, so idle periods do not bank a full minute at once
+        self.requests = self._bucket(requests_per_minute, burst_seconds)
+        self.tokens = self._bucket(tokens_per_minute, burst_seconds)
+        self._lock = threading.Lock()
+        self._stats = {"admitted": 0, "rejected": 0, "waited_seconds": 0.0, "tokens": 0}
+
+    @staticmethod
+    def _bucket(per_minute: Optional[float], burst_seconds: float) -> Optional[TokenBucket]:
+        if not per_minute or per_minute <= 0:
+            return None
+        rate = per_minute / 60.0
+        return TokenBucket(rate, max(1.0, rate * burst_seconds))
+
+    @property
+    def limited(self) -> bool:
+        return self.requests is not None or self.tokens is not None
+
+    def try_acquire(self, tokens: int = 0) -> float:
+        """Take one request and tokens now and return 0, or return the seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self.requests.wait_time(1, now) if self.requests else 0.0,
+                       self.tokens.wait_time(tokens, now) if self.tokens and tokens else 0.0)
+            if wait > 0:
+                return wait
+            if self.requests:
+                self.requests.take(1)
+            if self.tokens and tokens:
+                self.tokens.take(tokens)
+            self._stats["admitted"] += 1
+            self._stats["tokens"] += tokens
+            return 0.0
+
+    def acquire(self, tokens: int = 0, timeout: Optional[float] = None) -> bool:
+        """Block until the call fits both budgets; False if that would take longer than timeout."""
+        started = time.monotonic()
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                with self._lock:
+                    self._stats["waited_seconds"] += time.monotonic() - started
+                return True
+            if timeout is not None and time.monotonic() - started + wait > timeout:
+                with self._lock:
+                    self._stats["rejected"] += 1
+                return False
+            time.sleep(wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "waited_seconds": round(self._stats["waited_seconds"], 6),
+                "requests_per_minute": self.requests.rate * 60 if self.requests else None,
+                "tokens_per_minute": self.tokens.rate * 60 if self.tokens else None
+            }
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Result Cache - Bounded, persistent LRU store for expensive analysis results
+One SQLite index per cache replaces per-result JSON files: lookups are a keyed
+read, writes are transactional (safe across threads and processes), and the
+store evicts least-recently-used entries to stay within count and size limits.
+Entries may own side files (thumbnails, renders) that are removed on eviction.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 100000
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    files TEXT,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, bytes)
+    SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+class ResultCache:
+    """SQLite-indexed LRU cache of JSON results bounded by entry count, bytes and age"""
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl_seconds: Optional[float] = None, name: str = "cache"):
+        self.path = path
+        self.name = name
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.ttl_seconds = ttl_seconds
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0}
+
+    @classmethod
+    def from_env(cls, name: str, path: str, default_entries: int = DEFAULT_MAX_ENTRIES,
+                 default_bytes: int = DEFAULT_MAX_BYTES, ttl_seconds: Optional[float] = None) -> "ResultCache":
+        """Build a cache bounded by DKI_<NAME>_CACHE_MAX_ENTRIES / DKI_<NAME>_CACHE_MAX_MB."""
+        env_key = name.upper()
+        max_entries, max_bytes = default_entries, default_bytes
+        try:
+            max_entries = int(os.getenv(f"DKI_{env_key}_CACHE_MAX_ENTRIES", default_entries))
+        except ValueError:
+            logger.warning("Ignoring invalid DKI_%s_CACHE_MAX_ENTRIES", env_key)
+        max_mb = os.getenv(f"DKI_{env_key}_CACHE_MAX_MB")
+        if max_mb:
+            try:
+                max_bytes = int(float(max_mb) * 1024 * 1024)
+            except ValueError:
+                logger.warning("Ignoring invalid DKI_%s_CACHE_MAX_MB=%s", env_key, max_mb)
+        return cls(path, max_entries=max_entries, max_bytes=max_bytes, ttl_seconds=ttl_seconds, name=name)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Decoded value for key, or None on miss / expiry."""
+        now = time.time()
+        expired_files: Optional[List[str]] = None
+        with self._lock:
+            row = self._conn.execute("SELECT value, created, files FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            value, created, files = row
+            if self.ttl_seconds is not None and now - created > self.ttl_seconds:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                expired_files = json.loads(files) if files else []
+            else:
+                self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+                self._stats["hits"] += 1
+        if expired_files is not None:
+            self._remove_files(expired_files)
+            return None
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            logger.warning(f"[{self.name.upper()}] Dropping unreadable cache entry {key}")
+            self.delete(key)
+            return None
+
+    def put(self, key: str, value: Any, files: Iterable[str] = ()) -> None:
+        """Store value (JSON-serialisable) under key; files are owned by the entry and deleted with it."""
+        payload = json.dumps(value, default=str)
+        files = [path for path in files if path]
+        size = len(payload.encode("utf-8"))
+        for path in files:
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        now = time.time()
+        with self._lock:
+            with self._transaction():
+                previous = self._conn.execute("SELECT files FROM entries WHERE key = ?", (key,)).fetchone()
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.execute(
+                    "INSERT INTO entries (key, value, size, files, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, payload, size, json.dumps(files) if files else None, now, now))
+                evicted_files = self._evict_locked()
+            self._stats["writes"] += 1
+        if previous and previous[0]:
+            # Files the replaced entry owned but the new one does not
+            evicted_files.extend(path for path in json.loads(previous[0]) if path not in files)
+        self._remove_files(evicted_files)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("DELETE FROM entries WHERE key = ? RETURNING files", (key,)).fetchone()
+        if row and row[0]:
+            self._remove_files(json.loads(row[0]))
+        return row is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            rows = self._conn.execute("DELETE FROM entries RETURNING files").fetchall()
+        self._remove_files(path for row in rows if row[0] for path in json.loads(row[0]))
+
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _evict_locked(self) -> List[str]:
+        """Drop least-recently-used entries until both bounds hold; returns files to unlink."""
+        entries, total_bytes = self._conn.execute("SELECT entries, bytes FROM totals WHERE id = 0").fetchone()
+        files: List[str] = []
+        while entries > self.max_entries or (total_bytes > self.max_bytes and entries > 1):
+            # Batch sized to the overshoot so large trims stay a handful of statements
+            batch = max(1, entries - self.max_entries) if entries > self.max_entries else 16
+            rows = self._conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed LIMIT ?) "
+                "RETURNING size, files", (batch,)).fetchall()
+            if not rows:
+                break
+            for size, owned in rows:
+                entries -= 1
+                total_bytes -= size
+                if owned:
+                    files.extend(json.loads(owned))
+            self._stats["evictions"] += len(rows)
+        return files
+
+    def _remove_files(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning(f"[{self.name.upper()}] Could not remove cached file {path}: {exc}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, total_bytes = self._conn.execute("SELECT entries, bytes FROM totals WHERE id = 0").fetchone()
+            return {
+                "path": self.path,
+                "entries": entries,
+                "bytes": total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                **self._stats,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Ring Log - Fixed-capacity history buffers for long-running Central Command processes
+Keeps the newest records in memory and optionally spills evicted records to
+rotating JSONL segment files that can still be read back by tail(). Spill files
+are per-process scratch, not persistent history: they are not read back by a
+later process.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_RECORDS = 10000
+DEFAULT_MAX_SEGMENTS = 10
+
+
+def _default_serializer(record: Any) -> Any:
+    if is_dataclass(record) and not isinstance(record, type):
+        return asdict(record)
+    return record
+
+
+class SpillSegments:
+    """Rotating JSONL segment files holding records evicted from a RingBufferLog
+
+    Scratch storage for one instance: segments start empty and existing files under
+    prefix are overwritten, so two live instances must not share a directory and
+    prefix; for_instance() gives each its own.
+    """
+
+    def __init__(self, directory: Path, prefix: str, segment_records: int = DEFAULT_SEGMENT_RECORDS,
+                 max_segments: int = DEFAULT_MAX_SEGMENTS,
+                 serializer: Callable[[Any], Any] = _default_serializer):
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.segment_records = max(1, int(segment_records))
+        self.max_segments = max(1, int(max_segments))
+        self.serializer = serializer
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # (segment index, record count) oldest first; counts let tail() skip whole segments
+        self._segments: Deque[List[int]] = deque()
+
+    @classmethod
+    def for_instance(cls, root: Path, prefix: str, **options: Any) -> "SpillSegments":
+        """Segments in a fresh per-instance directory under root, removed again with the instance."""
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        directory = Path(tempfile.mkdtemp(prefix=f"{prefix}.{os.getpid()}.", dir=root))
+        spill = cls(directory, prefix, **options)
+        weakref.finalize(spill, shutil.rmtree, str(directory), True)
+        return spill
+
+    def _path(self, index: int) -> Path:
+        return self.directory / f"{self.prefix}.{index:06d}.jsonl"
+
+    @property
+    def record_count(self) -> int:
+        return sum(count for _, count in self._segments)
+
+    def write(self, record: Any) -> None:
+        if not self._segments or self._segments[-1][1] >= self.segment_records:
+            next_index = self._segments[-1][0] + 1 if self._segments else 0
+            self._segments.append([next_index, 0])
+            while len(self._segments) > self.max_segments:
+                index, _ = self._segments.popleft()
+                self._path(index).unlink(missing_ok=True)
+        segment = self._segments[-1]
+        # A new segment truncates any file left at its path by an earlier process
+        with self._path(segment[0]).open("a" if segment[1] else "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(self.serializer(record), ensure_ascii=False, default=str))
+            handle.write("\n")
+        segment[1] += 1
+
+    def tail(self, limit: int) -> List[Any]:
+        """Return up to limit newest spilled records (oldest first), reading only the segments needed."""
+        collected: List[List[Any]] = []
+        remaining = limit
+        for index, count in reversed(self._segments):
+            if remaining <= 0:
+                break
+            with self._path(index).open("r", encoding="utf-8") as handle:
+                lines = deque(handle, maxlen=min(count, remaining))
+            records = []
+            for line in lines:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+            collected.append(records)
+            remaining -= len(lines)
+        result: List[Any] = []
+        for records in reversed(collected):
+            result.extend(records)
+        return result
+
+    def clear(self) -> None:
+        for index, _ in self._segments:
+            self._path(index).unlink(missing_ok=True)
+        self._segments.clear()
+
+
+class RingBufferLog:
+    """List-like log with fixed capacity; evicted records optionally spill to disk"""
+
+    def __init__(self, capacity: int, spill: Optional[SpillSegments] = None):
+        self.capacity = max(1, int(capacity))
+        self.spill = spill
+        self._buffer: Deque[Any] = deque()
+        self._lock = threading.Lock()
+        # Monotonic count of appended records (len() stops growing once the buffer is full)
+        self.appended = 0
+        self.evicted = 0
+
+    @classmethod
+    def from_env(cls, name: str, default_capacity: int, spill_prefix: Optional[str] = None) -> "RingBufferLog":
+        """Build a log sized by DKI_<NAME>_CAPACITY, spilling under DKI_LOG_SPILL_DIR when set."""
+        env_key = name.upper()
+        try:
+            capacity = int(os.getenv(f"DKI_{env_key}_CAPACITY", default_capacity))
+        except ValueError:
+            capacity = default_capacity
+        spill = None
+        spill_dir = os.getenv("DKI_LOG_SPILL_DIR")
+        if spill_dir:
+            try:
+                # Several lockers or gateways in one process build logs with the same name
+                spill = SpillSegments.for_instance(Path(spill_dir), spill_prefix or name.lower())
+            except OSError as exc:
+                logger.warning("Log spill disabled for %s: %s", name, exc)
+        return cls(capacity, spill=spill)
+
+    def append(self, record: Any) -> None:
+        with self._lock:
+            if len(self._buffer) >= self.capacity:
+                evicted = self._buffer.popleft()
+                self.evicted += 1
+                if self.spill is not None:
+                    try:
+                        self.spill.write(evicted)
+                    except Exception as exc:
+                        logger.warning("Failed to spill log record: %s", exc)
+            self._buffer.append(record)
+            self.appended += 1
+
+    def extend(self, records) -> None:
+        for record in records:
+            self.append(record)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffer.clear()
+            if self.spill is not None:
+                self.spill.clear()
+
+    def tail(self, limit: Optional[int] = None) -> List[Any]:
+        """Newest records, oldest first; limits beyond the in-memory window are served from spill files."""
+        with self._lock:
+            if limit is None:
+                return list(self._buffer)
+            if limit <= 0:
+                return []
+            in_memory = len(self._buffer)
+            if limit <= in_memory:
+                newest = list(islice(reversed(self._buffer), limit))
+                newest.reverse()
+                return newest
+            records = list(self._buffer)
+            if self.spill is not None:
+                records = self.spill.tail(limit - in_memory) + records
+            return records
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __bool__(self) -> bool:
+        return bool(self._buffer)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._buffer))
+
+    def __getitem__(self, key):
+        with self._lock:
+            if isinstance(key, slice):
+                return list(self._buffer)[key]
+            return self._buffer[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "size": len(self._buffer),
+            "appended": self.appended,
+            "evicted": self.evicted,
+            "spilled": self.spill.record_count if self.spill is not None else 0,
+        }
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Signal Queue - Priority lanes with coalescing for queued section signals
+Each lane is a deque, so enqueue and dequeue are O(1) however deep a burst gets.
+Signals that carry a coalescing key replace the queued signal with the same key
+in place (latest payload wins, original queue position and wait clock kept), so
+repeated refresh requests collapse into one dispatch. A more urgent duplicate
+moves the signal to its lane by leaving a tombstone behind, skipped when popped.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# Lanes in drain order - the first non-empty lane is always served first
+LANES: Tuple[str, ...] = ("critical", "normal", "bulk")
+
+# Recent waits kept for the percentile in get_stats
+WAIT_SAMPLES = 1024
+
+
+class _Entry:
+    __slots__ = ("item", "key", "lane", "enqueued", "coalesced", "live")
+
+    def __init__(self, item: Any, key: Optional[Hashable], lane: str, enqueued: float):
+        self.item = item
+        self.key = key
+        self.lane = lane
+        self.enqueued = enqueued
+        self.coalesced = 0
+        self.live = True
+
+
+class CoalescingPriorityQueue:
+    """Thread-safe lane-priority FIFO with O(1) put/pop and same-key coalescing"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lanes: Dict[str, Deque[_Entry]] = {lane: deque() for lane in LANES}
+        # Live entries per lane; a deque may also hold tombstones of promoted entries
+        self._sizes: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._by_key: Dict[Hashable, _Entry] = {}
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self._stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "dequeued": 0,
+            "max_length": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0
+        }
+
+    def put(self, item: Any, lane: str = "normal", key: Optional[Hashable] = None) -> bool:
+        """Queue item; returns False when it was coalesced into an already-queued item with the same key."""
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown signal lane '{lane}' (expected one of {', '.join(LANES)})")
+        with self._lock:
+            if key is not None:
+                queued = self._by_key.get(key)
+                if queued is not None:
+                    queued.item = item
+                    queued.coalesced += 1
+                    self._stats["coalesced"] += 1
+                    if LANES.index(lane) < LANES.index(queued.lane):
+                        # A more urgent duplicate promotes the queued entry to its lane; the old
+                        # slot becomes a tombstone instead of an O(n) deque.remove
+                        promoted = _Entry(item, key, lane, queued.enqueued)
+                        promoted.coalesced = queued.coalesced
+                        queued.live, queued.item = False, None
+                        self._sizes[queued.lane] -= 1
+                        self._sizes[lane] += 1
+                        self._lanes[lane].append(promoted)
+                        self._by_key[key] = promoted
+                    return False
+            entry = _Entry(item, key, lane, time.monotonic())
+            self._lanes[lane].append(entry)
+            self._sizes[lane] += 1
+            if key is not None:
+                self._by_key[key] = entry
+            self._stats["enqueued"] += 1
+            self._stats["max_length"] = max(self._stats["max_length"], self._length_locked())
+            return True
+
+    def pop(self) -> Optional[Any]:
+        """Next item by lane priority, or None when empty."""
+        with self._lock:
+            entry = self._pop_locked(time.monotonic())
+        return entry.item if entry is not None else None
+
+    def drain(self, max_items: Optional[int] = None) -> List[Any]:
+        """Remove and return up to max_items (all when None) in dispatch order under one lock."""
+        drained: List[Any] = []
+        with self._lock:
+            now = time.monotonic()
+            while max_items is None or len(drained) < max_items:
+                entry = self._pop_locked(now)
+                if entry is None:
+                    break
+                drained.append(entry.item)
+        return drained
+
+    def _head_locked(self, lane: str) -> Optional[_Entry]:
+        """First live entry of lane, discarding tombstones in front of it."""
+        queue = self._lanes[lane]
+        while queue and not queue[0].live:
+            queue.popleft()
+        return queue[0] if queue else None
+
+    def _pop_locked(self, now: float) -> Optional[_Entry]:
+        for lane in LANES:
+            if self._head_locked(lane) is not None:
+                entry = self._lanes[lane].popleft()
+                self._sizes[lane] -= 1
+                if entry.key is not None:
+                    self._by_key.pop(entry.key, None)
+                wait = now - entry.enqueued
+                self._waits.append(wait)
+                self._stats["dequeued"] += 1
+                self._stats["total_wait_seconds"] += wait
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait)
+                return entry
+        return None
+
+    def _length_locked(self) -> int:
+        return sum(self._sizes.values())
+
+    def clear(self) -> int:
+        with self._lock:
+            dropped = self._length_locked()
+            for queue in self._lanes.values():
+                queue.clear()
+            self._sizes = {lane: 0 for lane in LANES}
+            self._by_key.clear()
+            return dropped
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._length_locked()
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Snapshot of queued items in dispatch order (the queue is not modified)."""
+        with self._lock:
+            items = [entry.item for lane in LANES for entry in self._lanes[lane] if entry.live]
+        return iter(items)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            waits = sorted(self._waits)
+            heads = [self._head_locked(lane) for lane in LANES]
+            oldest = [now - head.enqueued for head in heads if head is not None]
+            dequeued = self._stats["dequeued"]
+            return {
+                "length": self._length_locked(),
+                "lanes": dict(self._sizes),
+                "enqueued": self._stats["enqueued"],
+                "coalesced": self._stats["coalesced"],
+                "dequeued": dequeued,
+                "max_length": self._stats["max_length"],
+                "mean_wait_seconds": round(self._stats["total_wait_seconds"] / dequeued, 6) if dequeued else 0.0,
+                "p95_wait_seconds": round(waits[int(0.95 * (len(waits) - 1))], 6) if waits else 0.0,
+                "max_wait_seconds": round(self._stats["max_wait_seconds"], 6),
+                "oldest_wait_seconds": round(max(oldest), 6) if oldest else 0.0
+            }
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Staged Pipeline - Overlap the stages of a per-item workflow
+Each stage has its own worker threads and a bounded input queue, so item N+1
+can be in an early stage while item N is in a later one, and a slow stage
+applies backpressure instead of buffering without limit. Throughput then tends
+towards that of the slowest stage rather than the sum of all of them. Results
+are yielded in input order; per-stage throughput and queue depth are recorded.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 8
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+
+@dataclass
+class PipelineStage:
+    """One stage: func(value) -> value for the next stage, run on `workers` threads"""
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = DEFAULT_QUEUE_SIZE
+
+
+class _StageMetrics:
+    __slots__ = ('items', 'errors', 'busy_seconds', 'blocked_seconds', 'first_start', 'last_end',
+                 'depth_samples', 'depth_total', 'max_depth', 'lock')
+
+    def __init__(self):
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.first_start: Optional[float] = None
+        self.last_end: Optional[float] = None
+        self.depth_samples = 0
+        self.depth_total = 0
+        self.max_depth = 0
+        self.lock = threading.Lock()
+
+    def snapshot(self, stage: PipelineStage) -> Dict[str, Any]:
+        with self.lock:
+            active = (self.last_end - self.first_start) if self.first_start is not None and self.last_end else 0.0
+            return {
+                'workers': stage.workers,
+                'queue_size': stage.queue_size,
+                'items': self.items,
+                'errors': self.errors,
+                'busy_seconds': round(self.busy_seconds, 6),
+                'blocked_seconds': round(self.blocked_seconds, 6),
+                'active_seconds': round(active, 6),
+                'throughput_per_second': round(self.items / active, 3) if active > 0 else None,
+                # Rate the stage could sustain if it were never starved by the stage before it
+                'capacity_per_second': round(self.items * stage.workers / self.busy_seconds, 3) if self.busy_seconds > 0 else None,
+                'utilization': round(self.busy_seconds / (active * stage.workers), 3) if active > 0 else None,
+                'max_queue_depth': self.max_depth,
+                'mean_queue_depth': round(self.depth_total / self.depth_samples, 3) if self.depth_samples else 0.0
+            }
+
+
+class StagedPipeline:
+    """Run items through a fixed sequence of stages with bounded queues between them
+
+    A stage that raises marks the item failed; later stages skip it and it is
+    yielded as (item, None, exception). A BaseException that is not an
+    Exception (SystemExit, KeyboardInterrupt) cancels the run and is re-raised
+    from run(). Stopping iteration early cancels the run.
+    """
+
+    def __init__(self, stages: List[PipelineStage], name: str = "pipeline"):
+        if not stages:
+            raise ValueError("StagedPipeline needs at least one stage")
+        for stage in stages:
+            stage.workers = max(1, int(stage.workers))
+        self.stages = stages
+        self.name = name
+        self._metrics = [_StageMetrics() for _ in stages]
+        self._wall_seconds = 0.0
+
+    def run(self, items: Iterable[Any]) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+        """Yield (item, final value, error) for every item, in input order."""
+        self._metrics = [_StageMetrics() for _ in self.stages]
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=max(1, stage.queue_size)) for stage in self.stages]
+        output: queue.Queue = queue.Queue()
+        remaining = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+        last_index = len(self.stages) - 1
+        started = time.perf_counter()
+
+        def put(target: queue.Queue, entry: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    target.put(entry, timeout=_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def feed():
+            try:
+                for seq, item in enumerate(items):
+                    if not put(queues[0], (seq, item, item, None)):
+                        return
+            except BaseException as exc:
+                logger.error(f"[{self.name.upper()}] Input iterator failed: {exc}")
+                output.put(('feed_error', exc))
+            finally:
+                for _ in range(self.stages[0].workers):
+                    put(queues[0], _DONE)
+
+        def serve(index: int):
+            stage, metrics = self.stages[index], self._metrics[index]
+            inbox = queues[index]
+            last = index == len(self.stages) - 1
+            while not stop.is_set():
+                try:
+                    entry = inbox.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+                if entry is _DONE:
+                    return
+                seq, item, value, error = entry
+                with metrics.lock:
+                    depth = inbox.qsize()
+                    metrics.depth_samples += 1
+                    metrics.depth_total += depth
+                    metrics.max_depth = max(metrics.max_depth, depth + 1)
+                if error is None:
+                    began = time.perf_counter()
+                    try:
+                        value = stage.func(value)
+                    except Exception as exc:
+                        logger.warning(f"[{self.name.upper()}] Stage {stage.name} failed: {exc}")
+                        value, error = None, exc
+                    ended = time.perf_counter()
+                    with metrics.lock:
+                        metrics.items += 1
+                        metrics.errors += error is not None
+                        metrics.busy_seconds += ended - began
+                        metrics.first_start = began if metrics.first_start is None else min(metrics.first_start, began)
+                        metrics.last_end = ended if metrics.last_end is None else max(metrics.last_end, ended)
+                if last:
+                    output.put(('result', (seq, item, value, error)))
+                else:
+                    blocked = time.perf_counter()
+                    if not put(queues[index + 1], (seq, item, value, error)):
+                        return
+                    with metrics.lock:
+                        metrics.blocked_seconds += time.perf_counter() - blocked
+
+        def work(index: int):
+            try:
+                serve(index)
+            except BaseException as exc:
+                # SystemExit/KeyboardInterrupt from a stage ends the run; the caller re-raises it
+                logger.error(f"[{self.name.upper()}] Stage {self.stages[index].name} worker stopped: {exc!r}")
+                output.put(('worker_error', exc))
+            finally:
+                # The last worker of a stage to finish closes the next stage
+                with remaining_lock:
+                    remaining[index] -= 1
+                    closing = remaining[index] == 0
+                if closing:
+                    if last_index == index:
+                        output.put(('closed', None))
+                    else:
+                        for _ in range(self.stages[index + 1].workers):
+                            put(queues[index + 1], _DONE)
+
+        threads = [threading.Thread(target=feed, name=f"{self.name}-feed", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            threads.extend(threading.Thread(target=work, args=(index,), name=f"{self.name}-{stage.name}-{worker}",
+                                            daemon=True) for worker in range(stage.workers))
+        for thread in threads:
+            thread.start()
+
+        # Results arrive in completion order; hold them until their turn. 'closed' follows the last result.
+        pending: Dict[int, Tuple[Any, Any, Optional[BaseException]]] = {}
+        next_seq, closed = 0, False
+        try:
+            while not closed:
+                kind, payload = output.get()
+                if kind in ('feed_error', 'worker_error'):
+                    raise payload
+                if kind == 'closed':
+                    closed = True
+                elif kind == 'result':
+                    seq, item, value, error = payload
+                    pending[seq] = (item, value, error)
+                while next_seq in pending:
+                    yield pending.pop(next_seq)
+                    next_seq += 1
+        finally:
+            stop.set()
+            self._wall_seconds = time.perf_counter() - started
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-stage throughput, utilisation and queue depth of the latest run."""
+        stages = {stage.name: metrics.snapshot(stage) for stage, metrics in zip(self.stages, self._metrics)}
+        measured = [name for name, entry in stages.items() if entry['capacity_per_second']]
+        bottleneck = min(measured, key=lambda name: stages[name]['capacity_per_second']) if measured else None
+        return {'wall_seconds': round(self._wall_seconds, 6), 'bottleneck': bottleneck, 'stages': stages}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+AI Orchestrator Individual System Test
+Test the enrichment cache tiers and single-flight analysis without calling a model
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from ai_orchestrator import AIOrchestrator
+
+
+class CountingAnalysis:
+    """Stands in for the model call; slow enough for callers to pile up behind it"""
+
+    def __init__(self, result, delay=0.2):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, file_path, evidence_record):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return dict(self.result) if self.result else self.result
+
+
+def _evidence(directory, name="notes.txt", text="ledger entries"):
+    path = Path(directory) / name
+    path.write_text(text, encoding="utf-8")
+    return {"file_path": str(path)}
+
+
+def _orchestrator(directory, analysis):
+    orchestrator = AIOrchestrator(cache_dir=Path(directory) / "cache")
+    orchestrator._analyse_document = analysis
+    return orchestrator
+
+
+def _concurrently(orchestrator, record, callers=8):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(orchestrator.enrich_evidence(record)))
+               for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+def test_concurrent_callers_share_one_analysis():
+    with tempfile.TemporaryDirectory() as directory:
+        analysis = CountingAnalysis({"status": "ok", "summary": "ledger"})
+        orchestrator = _orchestrator(directory, analysis)
+        results = _concurrently(orchestrator, _evidence(directory))
+        assert analysis.calls == 1
+        assert results == [{"status": "ok", "summary": "ledger"}] * 8
+        stats = orchestrator.get_cache_stats()
+        assert stats["misses"] == 1 and stats["in_progress"] == 0
+        assert stats["waits"] + stats["memory_hits"] == 7
+
+
+def test_failure_is_shared_with_current_waiters_only():
+    with tempfile.TemporaryDirectory() as directory:
+        analysis = CountingAnalysis(None)
+        orchestrator = _orchestrator(directory, analysis)
+        record = _evidence(directory)
+        # Waiters get the failed outcome instead of retrying the model one after another
+        assert _concurrently(orchestrator, record) == [None] * 8
+        assert analysis.calls == 1
+        # Nothing was cached, so a later request tries again
+        assert orchestrator.enrich_evidence(record) is None
+        assert analysis.calls == 2
+
+
+def test_memory_tier_evicts_to_disk():
+    with tempfile.TemporaryDirectory() as directory:
+        analysis = CountingAnalysis({"status": "ok"}, delay=0)
+        orchestrator = _orchestrator(directory, analysis)
+        orchestrator.memory_cache_entries = 2
+        records = [_evidence(directory, f"file{number}.txt", f"text {number}") for number in range(3)]
+        for record in records:
+            orchestrator.enrich_evidence(record)
+        stats = orchestrator.get_cache_stats()
+        assert (stats["memory_entries"], stats["memory_evictions"]) == (2, 1)
+
+        # The evicted analysis comes back from the disk tier without a new call
+        assert orchestrator.enrich_evidence(records[0]) == {"status": "ok"}
+        assert analysis.calls == 3
+        stats = orchestrator.get_cache_stats()
+        assert stats["disk_hits"] == 1 and stats["memory_evictions"] == 2
+
+
+def test_legacy_json_entries_move_into_the_store():
+    with tempfile.TemporaryDirectory() as directory:
+        analysis = CountingAnalysis({"status": "fresh"}, delay=0)
+        orchestrator = _orchestrator(directory, analysis)
+        record = _evidence(directory)
+        cache_key = orchestrator._build_cache_key(Path(record["file_path"]))
+        legacy_file = orchestrator.cache_dir / f"{cache_key}.json"
+        legacy_file.write_text(json.dumps({"status": "legacy"}), encoding="utf-8")
+
+        assert orchestrator.enrich_evidence(record) == {"status": "legacy"}
+        assert not legacy_file.exists()
+        assert analysis.calls == 0
+
+        # A new process finds the migrated entry in the SQLite tier
+        reopened = _orchestrator(directory, analysis)
+        assert reopened.enrich_evidence(record) == {"status": "legacy"}
+        assert reopened.get_cache_stats()["disk_hits"] == 1
+        assert analysis.calls == 0
+
+
+if __name__ == "__main__":
+    test_concurrent_callers_share_one_analysis()
+    test_failure_is_shared_with_current_waiters_only()
+    test_memory_tier_evicts_to_disk()
+    test_legacy_json_entries_move_into_the_store()
+    print("[OK] AI orchestrator tests passed")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Stage 3 AI Concurrency Test
+Run the orchestrator's AI stage against a local stub model server
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add paths for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The Marshall", "Gateway"))
+
+from file_processing_orchestrator import FileProcessingOrchestrator
+
+REPLY_SECONDS = 0.2
+HANG_SECONDS = 2.0
+
+
+class StubModelServer:
+    """Answers POST /analyze after a short delay; a body containing HANG stalls instead"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with stub.lock:
+                    stub.active += 1
+                    stub.calls += 1
+                    stub.peak = max(stub.peak, stub.active)
+                try:
+                    time.sleep(HANG_SECONDS if 'HANG' in body['text'] else REPLY_SECONDS)
+                    reply = json.dumps({'summary': body['text'][:20], 'entities': []}).encode()
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(reply)))
+                    self.end_headers()
+                    self.wfile.write(reply)
+                finally:
+                    with stub.lock:
+                        stub.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/analyze"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StubToolkit:
+    def __init__(self, url):
+        self.url = url
+
+    def analyze_text(self, text):
+        request = urllib.request.Request(self.url, data=json.dumps({'text': text}).encode(),
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=HANG_SECONDS * 2) as response:
+            return json.loads(response.read())
+
+
+def _scanned(texts):
+    return {'extracted_text': {f"doc_{i}": text for i, text in enumerate(texts)}}
+
+
+def _orchestrator(url, concurrency, timeout):
+    orchestrator = FileProcessingOrchestrator(ai_toolkit=StubToolkit(url))
+    orchestrator.ai_config['concurrency'] = concurrency
+    orchestrator.ai_config['request_timeout'] = timeout
+    return orchestrator
+
+
+def test_requests_overlap_up_to_concurrency():
+    stub = StubModelServer()
+    try:
+        texts = [f"document {i} " + "evidence text " * 10 for i in range(8)]
+        orchestrator = _orchestrator(stub.url, concurrency=4, timeout=10)
+        started = time.monotonic()
+        result = orchestrator._stage_3_ai_analysis(_scanned(texts))
+        elapsed = time.monotonic() - started
+        assert list(result['analyses']) == [f"doc_{i}" for i in range(8)]
+        assert stub.peak == 4
+        # Two waves of four rather than eight requests back to back
+        assert elapsed < REPLY_SECONDS * 8 * 0.75
+    finally:
+        stub.close()
+
+
+def test_hung_request_does_not_shrink_concurrency():
+    stub = StubModelServer()
+    try:
+        texts = ["HANG " + "evidence text " * 10] + [f"document {i} " + "evidence text " * 10 for i in range(8)]
+        orchestrator = _orchestrator(stub.url, concurrency=2, timeout=0.5)
+        result = orchestrator._stage_3_ai_analysis(_scanned(texts))
+        assert 'doc_0' not in result['analyses']
+        assert len(result['analyses']) == 8
+        assert orchestrator.processing_stats['ai_timeouts'] == 1
+        # The abandoned request still holds its server slot alongside two live ones
+        assert stub.peak == 3
+    finally:
+        stub.close()
+
+
+def test_serial_mode_applies_deadline():
+    stub = StubModelServer()
+    try:
+        texts = ["HANG " + "evidence text " * 10, "document 1 " + "evidence text " * 10]
+        orchestrator = _orchestrator(stub.url, concurrency=1, timeout=0.5)
+        started = time.monotonic()
+        result = orchestrator._stage_3_ai_analysis(_scanned(texts))
+        assert time.monotonic() - started < HANG_SECONDS
+        assert list(result['analyses']) == ['doc_1']
+        assert orchestrator.processing_stats['ai_timeouts'] == 1
+    finally:
+        stub.close()
+
+
+if __name__ == "__main__":
+    for test in (test_requests_overlap_up_to_concurrency, test_hung_request_does_not_shrink_concurrency,
+                 test_serial_mode_applies_deadline):
+        test()
+        print(f"[OK] {test.__name__}")
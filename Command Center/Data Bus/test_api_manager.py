@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+API Manager Individual System Test
+Test the shared call budgets and response cache, and the OSINT engine's use of them
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The War Room", "Processors"))
+
+from api_manager import APIManager
+
+
+def _manager(directory, api_settings=None):
+    if api_settings is not None:
+        with open(os.path.join(directory, "api_config.json"), "w") as handle:
+            json.dump({"api_settings": api_settings}, handle)
+    return APIManager(config_path=os.path.join(directory, "api_keys.json"))
+
+
+def test_check_rate_limit_spends_the_budget():
+    with tempfile.TemporaryDirectory() as directory:
+        manager = _manager(directory, {"rate_limits": {"maps": {"calls_per_hour": 60, "calls_per_minute": 2}}})
+        assert manager.check_rate_limit("maps", timeout=0)
+        assert manager.check_rate_limit("maps", timeout=0)
+        # Two admissions emptied the burst; the next call would have to wait
+        assert not manager.check_rate_limit("maps", timeout=0)
+        status = manager.get_rate_limit_status()["maps"]
+        assert (status["admitted"], status["rejected"]) == (2, 1)
+
+
+def test_cache_stats_report_the_enforced_size():
+    with tempfile.TemporaryDirectory() as directory:
+        manager = _manager(directory, {"cache_settings": {"enabled": True, "max_size": 0}})
+        manager.cache_response("a", {"n": 1})
+        manager.cache_response("b", {"n": 2})
+        stats = manager.get_cache_stats()
+        assert (stats["entries"], stats["max_size"], stats["evictions"]) == (1, 1, 1)
+        assert manager.get_cached_response("b") == {"n": 2}
+
+
+def test_osint_engine_uses_the_shared_budget_and_cache():
+    from osint_module import OSINTEngine
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = _manager(directory, {"cache_settings": {"enabled": True, "max_size": 2}})
+        # A configured limit wins over the engine's free-tier default; the third call's
+        # wait for a refill is far longer than rate_limit_wait_seconds, so it is refused
+        manager.set_default_rate_limit("google_search", calls_per_hour=2, calls_per_minute=2)
+        engine = OSINTEngine(api_keys_file=None, api_manager=manager)
+
+        outcomes = [engine.google_search("acme") for _ in range(3)]
+        assert [outcome["error"] for outcome in outcomes] == ["Google Search API key not configured"] * 2 + \
+            ["Rate limit exceeded for Google Search"]
+        assert manager.get_rate_limit_status()["google_search"]["calls"] == 2
+        assert manager.config["api_settings"]["rate_limits"]["google_maps"] == {"calls_per_hour": 1000,
+                                                                                "calls_per_minute": 100}
+
+        for number in range(3):
+            engine.cache_result(f"phone_lookup:{number}", {"n": number}, hours=1)
+        # Bounded by the manager's LRU, not an ever-growing dict
+        assert engine.get_cached_result("phone_lookup:0") is None
+        assert engine.get_cached_result("phone_lookup:2") == {"n": 2}
+        status = engine.get_system_status()
+        assert status["cache_size"] == 2 and set(status["rate_limits"]) == {"google_search"}
+
+
+if __name__ == "__main__":
+    test_check_rate_limit_spends_the_budget()
+    test_cache_stats_report_the_enforced_size()
+    test_osint_engine_uses_the_shared_budget_and_cache()
+    print("[OK] API manager tests passed")
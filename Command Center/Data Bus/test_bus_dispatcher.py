@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Bus Dispatcher Individual System Test
+Test priority lanes, backpressure and flush of the async bus dispatcher
+"""
+
+import sys
+import os
+import threading
+
+# Add paths for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "Bus Core Design"))
+
+from bus_dispatcher import DispatcherStopped, PriorityDispatcher
+
+
+def _gate():
+    """Handler that holds its worker until released"""
+    entered, release = threading.Event(), threading.Event()
+
+    def gate(payload):
+        entered.set()
+        release.wait(5.0)
+    return gate, entered, release
+
+
+def test_critical_before_normal_before_bulk():
+    dispatcher = PriorityDispatcher(workers=1)
+    gate, entered, release = _gate()
+    received = []
+    try:
+        dispatcher.submit("warmup", {}, [gate])
+        assert entered.wait(2.0)
+        # One subscriber, queued while the only worker is busy, in reverse priority order
+        recorder = lambda payload: received.append(payload["n"])
+        for signal, name in (("evidence.indexed", "bulk"), ("section_ready", "normal"), ("sos_fault", "critical")):
+            dispatcher.submit(signal, {"n": name}, [recorder])
+        release.set()
+        assert dispatcher.flush(2.0)
+        assert received == ["critical", "normal", "bulk"]
+    finally:
+        release.set()
+        dispatcher.stop()
+
+
+def test_backpressure_drops_and_reports():
+    dispatcher = PriorityDispatcher(workers=1, lane_capacity={"bulk": 1}, backpressure_timeout=0.1)
+    gate, entered, release = _gate()
+    try:
+        assert dispatcher.submit("evidence.stored", {}, [gate]) == 1
+        assert entered.wait(2.0)
+        assert dispatcher.submit("evidence.stored", {}, [lambda payload: None]) == 0
+        stats = dispatcher.get_stats()
+        assert stats["dropped"] == 1
+        assert stats["dropped_by_lane"]["bulk"] == 1
+        assert stats["dropped_by_signal"] == {"evidence.stored": 1}
+        assert stats["last_drop"]["reason"] == "backpressure_timeout"
+        # Other lanes are unaffected
+        assert dispatcher.submit("section_ready", {}, [lambda payload: None]) == 1
+    finally:
+        release.set()
+        dispatcher.stop()
+
+
+def test_flush_waits_and_times_out():
+    dispatcher = PriorityDispatcher(workers=2)
+    gate, entered, release = _gate()
+    try:
+        dispatcher.submit("section_ready", {}, [gate])
+        assert entered.wait(2.0)
+        assert dispatcher.flush(0.1) is False
+        release.set()
+        assert dispatcher.flush(2.0) is True
+        assert dispatcher.get_stats()["pending"] == {"critical": 0, "normal": 0, "bulk": 0}
+    finally:
+        release.set()
+        dispatcher.stop()
+
+
+def test_handler_exit_does_not_wedge_flush():
+    dispatcher = PriorityDispatcher(workers=1)
+    received = []
+
+    def handler(payload):
+        if payload.get("exit"):
+            raise SystemExit(1)
+        received.append(payload["n"])
+    try:
+        dispatcher.submit("section_ready", {"exit": True}, [handler])
+        dispatcher.submit("section_ready", {"n": 1}, [handler])
+        assert dispatcher.flush(2.0)
+        assert received == [1]
+        stats = dispatcher.get_stats()
+        assert stats["workers_replaced"] == 1 and stats["active"] == 0
+    finally:
+        dispatcher.stop()
+
+
+def test_emit_falls_back_when_dispatcher_stops_underneath():
+    from bus_core import DKIReportBus
+
+    bus = DKIReportBus()
+    received = []
+    bus.register_signal("section_ready", lambda payload: received.append(payload["n"]))
+    bus.enable_async_dispatch(workers=1)
+    dispatcher = bus.dispatcher
+    # disable_async_dispatch() racing an emit: the emitter already read the dispatcher it is stopping
+    dispatcher.stop()
+    try:
+        dispatcher.submit("section_ready", {"n": 0}, [received.append])
+    except DispatcherStopped:
+        pass
+    else:
+        raise AssertionError("stopped dispatcher accepted a delivery")
+    bus.emit("section_ready", {"n": 1})
+    assert received == [1]
+    bus.disable_async_dispatch()
+
+
+if __name__ == "__main__":
+    for name in ("test_critical_before_normal_before_bulk", "test_backpressure_drops_and_reports",
+                 "test_flush_waits_and_times_out", "test_handler_exit_does_not_wedge_flush",
+                 "test_emit_falls_back_when_dispatcher_stops_underneath"):
+        globals()[name]()
+        print(f"[OK] {name}")
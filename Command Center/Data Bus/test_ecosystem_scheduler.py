@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Ecosystem Scheduler Individual System Test
+Test concurrent section execution in the ECC with fake section ecosystems
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add paths for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The Warden"))
+
+from ecosystem_controller import EcosystemController
+
+
+class FakeSection:
+    """Section ecosystem that sleeps, logs its start and finish, and can be cancelled"""
+
+    def __init__(self, log, section_id, dependencies=(), seconds=0.05, barrier=None, allowed=True):
+        self.log = log
+        self.section_id = section_id
+        self.dependencies = list(dependencies)
+        self.seconds = seconds
+        self.barrier = barrier
+        self.allowed = allowed
+        self.cancelled = threading.Event()
+
+    def execution_dependencies(self):
+        return self.dependencies
+
+    def can_run(self):
+        return self.allowed
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def execute(self, context):
+        self.log.append(('start', self.section_id))
+        if self.barrier is not None:
+            self.barrier.wait()  # raises BrokenBarrierError unless every party runs at once
+        self.cancelled.wait(self.seconds)
+        self.log.append(('end', self.section_id))
+
+
+def _controller(log, sections):
+    controller = EcosystemController()
+    for section_id, kwargs in sections.items():
+        assert controller.register_ecosystem(section_id, FakeSection(log, section_id, **kwargs))
+    return controller
+
+
+def test_independent_sections_run_concurrently():
+    log = []
+    barrier = threading.Barrier(3, timeout=2.0)
+    controller = _controller(log, {section_id: {'barrier': barrier, 'seconds': 0.0}
+                                   for section_id in ('section_1', 'section_2', 'section_3')})
+    results = controller.execute_all_ecosystems({}, max_workers=3)
+    assert sorted(results['completed']) == ['section_1', 'section_2', 'section_3']
+    assert results['failed'] == []
+
+
+def test_dependent_waits_for_dependencies():
+    log = []
+    controller = _controller(log, {
+        'section_4': {'seconds': 0.2},
+        'section_5': {'seconds': 0.1},
+        'section_dp': {'dependencies': ['section_4', 'section_5']},
+    })
+    results = controller.execute_all_ecosystems({}, max_workers=4)
+    assert sorted(results['completed']) == ['section_4', 'section_5', 'section_dp']
+    started = log.index(('start', 'section_dp'))
+    assert log.index(('end', 'section_4')) < started and log.index(('end', 'section_5')) < started
+
+
+def test_admission_ignores_custom_can_run():
+    # A full pass admits sections on their dependencies alone, as execute_ecosystem always has
+    log = []
+    controller = _controller(log, {'section_1': {'allowed': False}})
+    assert controller.execute_all_ecosystems({}, max_workers=2)['completed'] == ['section_1']
+
+
+def test_reopen_cancels_running_dependent():
+    log = []
+    controller = _controller(log, {
+        'section_cp': {'seconds': 0.0},
+        'section_toc': {'dependencies': ['section_cp'], 'seconds': 5.0},
+    })
+    results = {}
+    runner = threading.Thread(target=lambda: results.update(controller.execute_all_ecosystems({}, max_workers=2)))
+    runner.start()
+    deadline = time.monotonic() + 2.0
+    while ('start', 'section_toc') not in log and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert controller.reopen('section_cp', 'test')
+    runner.join(timeout=3.0)
+    assert not runner.is_alive()
+    assert controller.ecosystems['section_toc']['instance'].cancelled.is_set()
+    assert results['cancelled'] == ['section_toc']
+    assert 'section_toc' not in controller.completed_ecosystems
+
+
+if __name__ == "__main__":
+    for name in ("test_independent_sections_run_concurrently", "test_dependent_waits_for_dependencies",
+                 "test_admission_ignores_custom_can_run", "test_reopen_cancels_running_dependent"):
+        globals()[name]()
+        print(f"[OK] {name}")
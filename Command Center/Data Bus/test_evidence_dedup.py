@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Evidence Dedup Individual System Test
+Test content-addressed evidence ids and ingest-time deduplication in the Evidence Locker
+"""
+
+import sys
+import os
+import hashlib
+import logging
+import shutil
+import tempfile
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "Evidence Locker"))
+
+from evidence_locker_main import EvidenceLocker
+
+logging.disable(logging.CRITICAL)
+
+
+def _locker(directory):
+    previous = os.environ.get("DKI_EVIDENCE_MANIFEST")
+    os.environ["DKI_EVIDENCE_MANIFEST"] = os.path.join(directory, "evidence_manifest.json")
+    try:
+        return EvidenceLocker()
+    finally:
+        if previous is None:
+            os.environ.pop("DKI_EVIDENCE_MANIFEST", None)
+        else:
+            os.environ["DKI_EVIDENCE_MANIFEST"] = previous
+
+
+def _write(directory, name, data):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as handle:
+        handle.write(data)
+    return path
+
+
+def _fail_if_called(*args, **kwargs):
+    raise AssertionError("known content must not be processed again")
+
+
+def test_evidence_id_derives_from_content():
+    with tempfile.TemporaryDirectory() as directory:
+        locker = _locker(directory)
+        path = _write(directory, "note.txt", b"same bytes")
+        content_hash = hashlib.sha256(b"same bytes").hexdigest()
+        evidence_id = locker.index_evidence(path, {"assigned_section": "section_3"})
+        assert evidence_id == f"evidence_{content_hash[:16]}"
+        assert locker.index_evidence(path, {"assigned_section": "section_3"}) == evidence_id
+        copy_path = shutil.copy(path, os.path.join(directory, "copy.txt"))
+        assert locker.index_evidence(copy_path, {"assigned_section": "section_3"}) == f"{evidence_id}_2"
+
+
+def test_prefix_collision_gets_its_own_id():
+    with tempfile.TemporaryDirectory() as directory:
+        locker = _locker(directory)
+        path = _write(directory, "scan.pdf", b"first version")
+        first_hash = "ab" * 8 + "0" * 48
+        colliding_hash = "ab" * 8 + "1" * 48
+        first_id = locker.index_evidence(path, {"assigned_section": "section_3"}, content_hash=first_hash)
+        # Same path, same 16-char prefix, different bytes
+        second_id = locker.index_evidence(path, {"assigned_section": "section_3"}, content_hash=colliding_hash)
+        assert second_id != first_id
+        assert locker.evidence_index[first_id]["content_hash"] == first_hash
+        assert locker.evidence_index[second_id]["content_hash"] == colliding_hash
+
+
+def test_known_bytes_short_circuit_without_artifacts():
+    with tempfile.TemporaryDirectory() as directory:
+        locker = _locker(directory)
+        original = _write(directory, "statement.pdf", b"%PDF statement bytes")
+        # Indexed the way scan_file does: no artifacts are stored
+        original_id = locker.index_evidence(original, {"assigned_section": "section_3"})
+        assert locker._load_content_artifacts(locker.evidence_index[original_id]["content_hash"]) is None
+
+        locker.extract_text_from_image = _fail_if_called
+        locker.extract_structure_from_document = _fail_if_called
+        locker.classify_evidence = _fail_if_called
+        duplicate = shutil.copy(original, os.path.join(directory, "statement_copy.pdf"))
+        result = locker.process_evidence_comprehensive(duplicate)
+        assert "error" not in result
+        assert result["deduplicated"] and not result["artifacts_reused"]
+        assert result["duplicate_of"] == original_id
+        assert locker.evidence_index[result["evidence_id"]]["duplicate_of"] == original_id
+        assert locker.find_duplicate_evidence(duplicate) == original_id
+
+
+def test_stored_artifacts_are_reused():
+    with tempfile.TemporaryDirectory() as directory:
+        locker = _locker(directory)
+        original = _write(directory, "memo.txt", b"memo text")
+        original_id = locker.index_evidence(original, {"assigned_section": "section_3"})
+        content_hash = locker.evidence_index[original_id]["content_hash"]
+        locker._store_content_artifacts(original_id, content_hash, {"ocr_text": "memo text", "tools_used": ["tesseract"]})
+
+        locker.extract_text_from_image = _fail_if_called
+        duplicate = shutil.copy(original, os.path.join(directory, "memo_copy.txt"))
+        result = locker.process_evidence_comprehensive(duplicate)
+        assert result["artifacts_reused"] and result["ocr_text"] == "memo text"
+        assert result["duplicate_of"] == original_id
+
+
+if __name__ == "__main__":
+    test_evidence_id_derives_from_content()
+    test_prefix_collision_gets_its_own_id()
+    test_known_bytes_short_circuit_without_artifacts()
+    test_stored_artifacts_are_reused()
+    print("[OK] Evidence dedup tests passed")
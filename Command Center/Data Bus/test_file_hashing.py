@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+File Hashing Individual System Test
+Test the memoizing single-pass FileHashService in isolation
+"""
+
+import sys
+import os
+import hashlib
+import tempfile
+import threading
+import time
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from file_hashing import FileHashService
+
+
+def _write(directory, name, data):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as handle:
+        handle.write(data)
+    return path
+
+
+def test_one_pass_yields_every_digest():
+    with tempfile.TemporaryDirectory() as directory:
+        data = os.urandom(300 * 1024)
+        path = _write(directory, "evidence.bin", data)
+        service = FileHashService(buffer_size=64 * 1024)
+        digests = service.digests(path, ("md5", "sha256", "sha1"))
+        assert digests == {
+            "md5": hashlib.md5(data).hexdigest(),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "sha1": hashlib.sha1(data).hexdigest(),
+        }
+        # The default md5/sha256 pair came from the same read
+        assert service.hexdigest(path, "md5") == hashlib.md5(data).hexdigest()
+        stats = service.get_stats()
+        assert stats["bytes_read"] == len(data)
+        assert (stats["misses"], stats["hits"]) == (1, 1)
+
+
+def test_concurrent_callers_share_one_read():
+    with tempfile.TemporaryDirectory() as directory:
+        data = os.urandom(128 * 1024)
+        path = _write(directory, "evidence.bin", data)
+        service = FileHashService()
+        original_pass = service._hash_pass
+        started = threading.Event()
+
+        def slow_pass(file_path, names):
+            started.set()
+            time.sleep(0.2)
+            return original_pass(file_path, names)
+
+        service._hash_pass = slow_pass
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(service.hexdigest(path))) for _ in range(6)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        assert results == [hashlib.sha256(data).hexdigest()] * 6
+        stats = service.get_stats()
+        assert stats["bytes_read"] == len(data)
+        assert stats["misses"] == 1 and stats["waits"] >= 1
+
+
+def test_memo_follows_file_identity():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "evidence.bin", b"first")
+        service = FileHashService()
+        assert service.hexdigest(path) == hashlib.sha256(b"first").hexdigest()
+
+        # Size change
+        _write(directory, "evidence.bin", b"second version")
+        assert service.hexdigest(path) == hashlib.sha256(b"second version").hexdigest()
+
+        # Same size, new mtime
+        _write(directory, "evidence.bin", b"third version!")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        assert service.hexdigest(path) == hashlib.sha256(b"third version!").hexdigest()
+
+        # Replaced by another inode with the same size and mtime
+        replacement = _write(directory, "replacement.bin", b"fourth versio!")
+        stat = os.stat(path)
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, path)
+        assert service.hexdigest(path) == hashlib.sha256(b"fourth versio!").hexdigest()
+
+        assert service.get_stats()["misses"] == 4
+
+
+def test_invalidate_and_eviction():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [_write(directory, f"file{number}.bin", bytes([number]) * 10) for number in range(3)]
+        service = FileHashService(cache_entries=2)
+        for path in paths:
+            service.hexdigest(path)
+        assert service.get_stats()["cached_files"] == 2
+        service.invalidate(paths[2])
+        assert service.get_stats()["cached_files"] == 1
+        service.hexdigest(paths[2])
+        assert service.get_stats()["misses"] == 4
+
+
+if __name__ == "__main__":
+    test_one_pass_yields_every_digest()
+    test_concurrent_callers_share_one_read()
+    test_memo_follows_file_identity()
+    test_invalidate_and_eviction()
+    print("[OK] File hashing tests passed")
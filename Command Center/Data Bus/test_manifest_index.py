@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Manifest Index Individual System Test
+Test the Evidence Locker pool indexes against the linear manifest scan they replace
+"""
+
+import sys
+import os
+import random
+import tempfile
+from pathlib import Path
+
+# Add paths for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "Evidence Locker"))
+
+from manifest_index import ManifestQueryIndex
+from manifest_store import SqliteManifestStore, SqliteQueryIndex
+
+SECTIONS = ["section_1", "section_3", "section_4", "section_8", ""]
+TAGS = ["bank", "Statement", "photo", "video", "contract"]
+FILE_TYPES = [".pdf", ".jpg", ".mp4", ".docx"]
+
+
+def linear_scan(pool, section=None, tags=None, include_related=True, file_types=None, limit=None):
+    """The pre-index get_common_pool filter over every manifest entry, in pool order"""
+    results = []
+    for entry in pool.values():
+        if section:
+            primary = str(entry.get("assigned_section") or entry.get("section_hint") or "")
+            related = {str(candidate) for candidate in entry.get("related_sections") or []}
+            if primary != section and not (include_related and section in related):
+                continue
+        if tags:
+            entry_tags = {str(tag).lower() for tag in entry.get("tags") or []}
+            classification = entry.get("classification")
+            if isinstance(classification, dict):
+                entry_tags.update(str(tag).lower() for tag in classification.get("tags") or [])
+            if not entry_tags.intersection(tags):
+                continue
+        if file_types and str(entry.get("file_type") or "").lower() not in file_types:
+            continue
+        results.append(entry)
+        if limit and len(results) >= limit:
+            break
+    return results
+
+
+def _random_entry(rng, evidence_id):
+    entry = {"evidence_id": evidence_id, "file_type": rng.choice(FILE_TYPES)}
+    if rng.random() < 0.8:
+        entry["assigned_section"] = rng.choice(SECTIONS)
+    else:
+        entry["section_hint"] = rng.choice(SECTIONS)
+    if rng.random() < 0.4:
+        entry["related_sections"] = rng.sample(SECTIONS[:-1], rng.randint(1, 2))
+    if rng.random() < 0.5:
+        entry["tags"] = rng.sample(TAGS, rng.randint(1, 2))
+    if rng.random() < 0.5:
+        entry["classification"] = {"tags": rng.sample(TAGS, rng.randint(0, 2))}
+    return entry
+
+
+def _queries():
+    yield {}
+    for section in SECTIONS[:-1]:
+        for include_related in (True, False):
+            yield {"section": section, "include_related": include_related}
+    for tag in TAGS:
+        yield {"tags": {tag.lower()}}
+    yield {"tags": {"bank", "photo"}}
+    yield {"file_types": {".pdf", ".mp4"}}
+    yield {"section": "section_3", "tags": {"bank", "statement"}, "file_types": {".pdf"}}
+    yield {"section": "section_8", "limit": 3}
+    yield {"tags": {"missing"}}
+
+
+def _assert_matches(index, pool):
+    for filters in _queries():
+        expected = [entry["evidence_id"] for entry in linear_scan(pool, **filters)]
+        actual = [entry["evidence_id"] for entry in index.query(**filters)]
+        assert actual == expected, filters
+
+
+def test_query_matches_linear_scan_through_updates_and_removals():
+    rng = random.Random(7)
+    index = ManifestQueryIndex()
+    pool = {}
+    for step in range(600):
+        evidence_id = f"e{rng.randint(0, 120)}"
+        if pool and rng.random() < 0.15:
+            evidence_id = rng.choice(list(pool))
+            pool.pop(evidence_id)
+            index.discard(evidence_id)
+        else:
+            # Replacing an entry keeps its pool position, like the manifest dict
+            pool[evidence_id] = _random_entry(rng, evidence_id)
+            index.upsert(evidence_id, pool[evidence_id])
+        if step % 50 == 0:
+            _assert_matches(index, pool)
+    _assert_matches(index, pool)
+    assert len(index) == len(pool)
+    assert all(index.get(evidence_id) is pool[evidence_id] for evidence_id in pool)
+
+
+def test_re_adding_a_removed_entry_moves_it_to_the_end():
+    index = ManifestQueryIndex()
+    for evidence_id in ("a", "b", "c"):
+        index.upsert(evidence_id, {"evidence_id": evidence_id, "assigned_section": "section_3"})
+    index.discard("a")
+    index.upsert("a", {"evidence_id": "a", "assigned_section": "section_3"})
+    assert [entry["evidence_id"] for entry in index.query(section="section_3")] == ["b", "c", "a"]
+
+
+def test_content_hash_lookup_tracks_originals():
+    index = ManifestQueryIndex()
+    index.upsert("original", {"content_hash": "h1"})
+    index.upsert("copy", {"content_hash": "h1", "duplicate_of": "original"})
+    assert index.find_by_content_hash("h1") == "original"
+    index.discard("copy")
+    assert index.find_by_content_hash("h1") == "original"
+    index.discard("original")
+    assert index.find_by_content_hash("h1") is None
+    index.clear()
+    assert len(index) == 0 and list(index.query()) == []
+
+
+def test_sqlite_index_matches_linear_scan():
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as directory:
+        store = SqliteManifestStore(Path(directory) / "evidence_manifest.json", lambda: [])
+        index = SqliteQueryIndex(store)
+        pool = {}
+        for _ in range(300):
+            evidence_id = f"e{rng.randint(0, 80)}"
+            pool[evidence_id] = _random_entry(rng, evidence_id)
+            index.upsert(evidence_id, pool[evidence_id])
+            store.put(evidence_id, pool[evidence_id])
+        _assert_matches(index, pool)
+        store.close()
+
+
+if __name__ == "__main__":
+    test_query_matches_linear_scan_through_updates_and_removals()
+    test_re_adding_a_removed_entry_moves_it_to_the_end()
+    test_content_hash_lookup_tracks_originals()
+    test_sqlite_index_matches_linear_scan()
+    print("[OK] Manifest index tests passed")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Manifest Store Individual System Test
+Test the Evidence Locker manifest backends in isolation
+"""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+import textwrap
+from pathlib import Path
+
+# Add paths for imports
+LOCKER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Evidence Locker")
+sys.path.append(LOCKER_DIR)
+
+from manifest_store import (SqliteManifestStore, SqliteQueryIndex, SqliteRecordMap,
+                            WalManifestStore, read_manifest_file)
+
+
+def _entry(evidence_id, **fields):
+    entry = {"evidence_id": evidence_id, "file_type": ".pdf", "assigned_section": "section_3"}
+    entry.update(fields)
+    return entry
+
+
+def _sqlite(directory, snapshot=lambda: []):
+    return SqliteManifestStore(Path(directory) / "evidence_manifest.json", snapshot)
+
+
+def test_sqlite_round_trip_reads_by_id():
+    with tempfile.TemporaryDirectory() as directory:
+        store = _sqlite(directory)
+        store.put("e1", _entry("e1", content_hash="aa", tags=["bank"]))
+        store.put("e2", _entry("e2", file_type=".jpg", assigned_section="section_8",
+                               related_sections=["section_3"]))
+        store.put("e1", _entry("e1", content_hash="aa", tags=["bank", "statement"]))
+        store.close()
+
+        store = _sqlite(directory)
+        records = SqliteRecordMap(store)
+        assert len(records) == 2 and list(records) == ["e1", "e2"]
+        assert records["e1"]["tags"] == ["bank", "statement"]
+        assert "e3" not in records
+        index = SqliteQueryIndex(store)
+        assert [e["evidence_id"] for e in index.query(section="section_3")] == ["e1", "e2"]
+        assert [e["evidence_id"] for e in index.query(section="section_3", include_related=False)] == ["e1"]
+        assert [e["evidence_id"] for e in index.query(tags={"statement"})] == ["e1"]
+        assert [e["evidence_id"] for e in index.query(file_types={".jpg"})] == ["e2"]
+        assert index.find_by_content_hash("aa") == "e1"
+        store.close()
+
+
+def test_sqlite_compact_exports_json():
+    with tempfile.TemporaryDirectory() as directory:
+        store = _sqlite(directory)
+        store.put("e2", _entry("e2"))
+        store.put("e1", _entry("e1"))
+        store.compact()
+        records, updated_at = read_manifest_file(store.manifest_path)
+        assert list(records) == ["e1", "e2"] and updated_at == store.updated_at()
+        store.clear()
+        assert SqliteRecordMap(store).get("e1") is None
+        assert read_manifest_file(store.manifest_path)[0] == {}
+        store.close()
+
+
+def test_migrates_json_manifest_and_wal():
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = Path(directory) / "evidence_manifest.json"
+        manifest_path.write_text(json.dumps({
+            "manifest_version": 1,
+            "updated_at": "2025-01-01T00:00:00",
+            "entries": [_entry("e1"), _entry("e2", content_hash="bb")],
+        }), encoding="utf-8")
+        wal_path = Path(str(manifest_path) + ".wal")
+        with wal_path.open("w", encoding="utf-8") as handle:
+            handle.write(json.dumps({"op": "put", "evidence_id": "e3", "entry": _entry("e3"), "ts": "t3"}) + "\n")
+            handle.write(json.dumps({"op": "put", "evidence_id": "e1", "entry": _entry("e1", tags=["moved"]),
+                                     "ts": "t4"}) + "\n")
+            handle.write('{"op": "put", "evidence_id": "e4", "ent')  # torn tail
+
+        store = SqliteManifestStore(manifest_path, lambda: [])
+        records = SqliteRecordMap(store)
+        assert sorted(records) == ["e1", "e2", "e3"]
+        assert records["e1"]["tags"] == ["moved"]
+        assert store.updated_at() == "t4"
+        assert store.find_by_content_hash("bb") == "e2"
+        assert not wal_path.exists()
+        store.close()
+
+        # A later JSON change is not imported twice
+        manifest_path.write_text(json.dumps({"entries": [_entry("e9")]}), encoding="utf-8")
+        store = SqliteManifestStore(manifest_path, lambda: [])
+        assert "e9" not in SqliteRecordMap(store)
+        store.close()
+
+
+def test_sqlite_reopen_after_crash():
+    with tempfile.TemporaryDirectory() as directory:
+        script = textwrap.dedent("""
+            import os, sys
+            sys.path.append(sys.argv[1])
+            from pathlib import Path
+            from manifest_store import SqliteManifestStore
+            store = SqliteManifestStore(Path(sys.argv[2]) / "evidence_manifest.json", lambda: [])
+            for number in range(50):
+                store.put(f"e{number}", {"file_type": ".pdf", "assigned_section": "section_3"})
+            os._exit(1)  # no close(), no checkpoint
+        """)
+        result = subprocess.run([sys.executable, "-c", script, LOCKER_DIR, directory])
+        assert result.returncode == 1
+        store = _sqlite(directory)
+        assert store.count() == 50
+        assert SqliteRecordMap(store)["e49"]["assigned_section"] == "section_3"
+        store.close()
+
+
+def test_wal_replays_after_crash():
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = Path(directory) / "evidence_manifest.json"
+        entries = {}
+        store = WalManifestStore(manifest_path, lambda: sorted(entries.values(), key=lambda e: e["evidence_id"]),
+                                 compact_min_records=100)
+        for evidence_id in ("e1", "e2"):
+            entries[evidence_id] = _entry(evidence_id)
+            store.put(evidence_id, entries[evidence_id])
+        with store.wal_path.open("a", encoding="utf-8") as handle:
+            handle.write('{"op": "put", "evidence_id": "e3"')  # interrupted append
+
+        reopened = WalManifestStore(manifest_path, lambda: [])
+        records, _ = reopened.load()
+        assert sorted(records) == ["e1", "e2"]
+
+
+if __name__ == "__main__":
+    test_sqlite_round_trip_reads_by_id()
+    test_sqlite_compact_exports_json()
+    test_migrates_json_manifest_and_wal()
+    test_sqlite_reopen_after_crash()
+    test_wal_replays_after_crash()
+    print("[OK] Manifest store tests passed")
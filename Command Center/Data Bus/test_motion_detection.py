@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Motion Detection Individual System Test
+Test the coarse/fine motion pass of MediaProcessingEngine against synthetic clips
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The War Room", "Processors"))
+
+from media_processing_engine import MediaProcessingEngine
+
+
+class SyntheticClip:
+    """Black clip with a white square that moves only between motion_start and motion_end"""
+
+    def __init__(self, width, height, duration=20.0, motion_start=5.0, motion_end=7.0, square=None):
+        self.w, self.h = width, height
+        self.duration = duration
+        self.fps = 10.0
+        self.motion_start, self.motion_end = motion_start, motion_end
+        self.square = square or max(8, width // 4)
+        self.decoded = []
+
+    def _x(self, time_point):
+        travel = self.w - self.square
+        if time_point <= self.motion_start:
+            return 0
+        if time_point >= self.motion_end:
+            return travel
+        return int(travel * (time_point - self.motion_start) / (self.motion_end - self.motion_start))
+
+    def get_frame(self, time_point):
+        self.decoded.append(time_point)
+        frame = np.zeros((self.h, self.w, 3), dtype=np.uint8)
+        x, y = self._x(time_point), (self.h - self.square) // 2
+        frame[y:y + self.square, x:x + self.square] = 255
+        return frame
+
+
+def _detect(clip, **options):
+    # Motion detection only uses the static frame helpers, so skip the cache/temp setup
+    engine = MediaProcessingEngine.__new__(MediaProcessingEngine)
+    defaults = {'motion_coarse_interval': 2.0, 'motion_fine_interval': 0.25}
+    defaults.update(options)
+    return engine._detect_motion_in_video(clip, defaults)
+
+
+def test_fine_pass_refines_coarse_span():
+    clip = SyntheticClip(640, 360)
+    result = _detect(clip)
+    assert result['motion_detected'] and not result['partially_refined']
+    assert len(result['motion_intervals']) == 1
+    interval = result['motion_intervals'][0]
+    # The coarse pass only sees the 4-6s and 6-8s pairs; the fine pass narrows that to ~5-7s
+    assert 4.5 <= interval['start'] <= 5.25
+    assert 6.75 <= interval['end'] <= 7.5
+    # Fine samples (off the 2s coarse grid, apart from the final frame) stay inside the flagged span
+    fine_times = [t for t in clip.decoded if t % 2.0 and t != round(clip.duration - 1 / clip.fps, 3)]
+    assert fine_times and all(4.0 <= t <= 8.0 for t in fine_times)
+    assert result['frames_analyzed'] == len(clip.decoded) < clip.duration * clip.fps / 4
+
+
+def test_budget_keeps_coarse_timing_for_unrefined_spans():
+    clip = SyntheticClip(640, 360)
+    result = _detect(clip, motion_max_samples=14)
+    assert result['partially_refined']
+    assert result['motion_intervals'], "an unrefined span must still be reported"
+    # The budget widens the coarse step; the reported span stays on the coarse pairs around 5-7s
+    coarse = result['coarse_interval']
+    interval = result['motion_intervals'][0]
+    assert coarse - 0.01 <= interval['start'] <= 5.0
+    assert 7.0 <= interval['end'] <= 3 * coarse + 0.01
+
+
+def test_regions_in_source_pixels_for_wide_and_narrow_sources():
+    for width, height in ((640, 360), (120, 90)):
+        clip = SyntheticClip(width, height, square=max(12, width // 4))
+        result = _detect(clip)
+        regions = [region for peak in result['motion_regions'] for region in peak['regions']]
+        assert regions, f"no regions for {width}px source"
+        for region in regions:
+            assert region['x'] + region['width'] <= width + 1
+            assert region['y'] + region['height'] <= height + 1
+            # The square is square in source pixels, so is the changed area's height
+            assert clip.square * 0.9 <= region['height'] <= clip.square * 1.3 + 4
+
+
+if __name__ == "__main__":
+    test_fine_pass_refines_coarse_span()
+    test_budget_keeps_coarse_timing_for_unrefined_spans()
+    test_regions_in_source_pixels_for_wide_and_narrow_sources()
+    print("[OK] Motion detection tests passed")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+OCR Cache Individual System Test
+Test the shared OCR result cache keys and its use by the processors
+"""
+
+import sys
+import os
+import tempfile
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The War Room", "Processors"))
+
+import ocr_cache
+from ocr_cache import OCRCache, cached_file_ocr
+from result_cache import ResultCache
+
+
+def _cache(directory):
+    return OCRCache(ResultCache(os.path.join(directory, "ocr_cache.sqlite3")))
+
+
+class SharedObjectStore:
+    """In-memory store that hands back the stored object itself, like a memory tier would"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def put(self, key, value):
+        self.values[key] = value
+
+
+class CountingCompute:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_gateway_entries_stay_apart_from_plain_entries():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _cache(directory)
+        cache.put("hash", 0, "tesseract", "plain text")
+        cache.put("hash", 0, "gateway:tesseract", {"extracted_text": "plain text", "engine_used": "tesseract"})
+        assert cache.get("hash", 0, "tesseract") == "plain text"
+        assert cache.get("hash", 0, "gateway:tesseract")["engine_used"] == "tesseract"
+        # Page, language and parameters are part of the key too
+        assert cache.get("hash", 1, "tesseract") is None
+        assert cache.get("hash", 0, "tesseract", language="deu") is None
+        assert cache.get("hash", 0, "tesseract", params={"psm": 6}) is None
+
+
+def test_expected_type_rejects_other_shapes():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _cache(directory)
+        cache.put("hash", 0, "tesseract", {"text": "stored by another caller"})
+        compute = CountingCompute("fresh text")
+        assert cache.get_or_compute("hash", 0, "tesseract", compute, expected_type=str) == "fresh text"
+        assert cache.get_or_compute("hash", 0, "tesseract", compute, expected_type=str) == "fresh text"
+        assert compute.calls == 1
+
+
+def test_missing_content_hash_falls_through():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _cache(directory)
+        compute = CountingCompute("text")
+        cache.put(None, 0, "tesseract", "never stored")
+        assert cache.get(None, 0, "tesseract") is None
+        assert cache.get_or_compute(None, 0, "tesseract", compute) == "text"
+        assert cache.get_or_compute(None, 0, "tesseract", compute) == "text"
+        assert compute.calls == 2
+        assert cache.get_stats()["entries"] == 0
+
+
+def test_reused_across_processors():
+    with tempfile.TemporaryDirectory() as directory:
+        scan = os.path.join(directory, "scan.png")
+        with open(scan, "wb") as handle:
+            handle.write(b"not really a png")
+        previous = ocr_cache._default_cache
+        ocr_cache._default_cache = _cache(directory)
+        try:
+            compute = CountingCompute("page text")
+            # Section 3 and the locker both OCR the same bytes through the shared cache
+            assert cached_file_ocr(scan, "tesseract", compute, expected_type=str) == "page text"
+            assert cached_file_ocr(scan, "tesseract", compute, expected_type=str) == "page text"
+            assert compute.calls == 1
+        finally:
+            ocr_cache._default_cache = previous
+        # A second process opening the same database sees the entry
+        assert _cache(directory).get_stats()["entries"] == 1
+
+
+def test_document_processor_hit_does_not_mutate_cached_entry():
+    from document_processor import DocumentProcessor
+
+    processor = DocumentProcessor()
+    processor.ocr_cache = OCRCache(SharedObjectStore())
+    processor._ocr_cache_store("hash", 0, {"text": "cached", "processing_methods": ["ocr_tesseract"]})
+    first = processor._ocr_cache_lookup("hash", 0)
+    second = processor._ocr_cache_lookup("hash", 0)
+    assert first["processing_methods"] == ["ocr_tesseract", "ocr_cache"]
+    assert second["processing_methods"] == ["ocr_tesseract", "ocr_cache"]
+    assert processor.processing_stats["ocr_cache_hits"] == 2
+
+
+if __name__ == "__main__":
+    test_gateway_entries_stay_apart_from_plain_entries()
+    test_expected_type_rejects_other_shapes()
+    test_missing_content_hash_falls_through()
+    test_reused_across_processors()
+    test_document_processor_hit_does_not_mutate_cached_entry()
+    print("[OK] OCR cache tests passed")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+OCR Router Individual System Test
+Test engine planning, racing and estimate updates with fake engines
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from ocr_router import OCRRouter, RACE_QUALITY
+
+
+class FakeImage:
+    """Stands in for a PIL image: copy() and close(), and refuses use after close"""
+
+    def __init__(self):
+        self.closed = False
+        self.copies = []
+
+    def copy(self):
+        duplicate = FakeImage()
+        self.copies.append(duplicate)
+        return duplicate
+
+    def close(self):
+        self.closed = True
+
+
+def _engine(text, confidence, seconds=0.0, started=None):
+    def run(image):
+        if started is not None:
+            started.set()
+        time.sleep(seconds)
+        if image.closed:
+            raise ValueError("Operation on closed image")
+        return {'text': text, 'confidence': confidence}
+    return run
+
+
+def test_plan_prefers_fastest_near_best_engine():
+    router = OCRRouter()
+    # tesseract and paddleocr tie on clean pages, tesseract is faster; easyocr trails on quality
+    assert [engine for engine, _ in router.plan(['easyocr', 'paddleocr', 'tesseract'], 'clean')] == \
+        ['tesseract', 'paddleocr', 'easyocr']
+    # On handwriting the neural engines lead and tesseract comes last
+    assert [engine for engine, _ in router.plan(['tesseract', 'paddleocr', 'easyocr'], 'handwritten')][-1] == \
+        'tesseract'
+
+
+def test_recorded_runs_move_estimates_and_plan():
+    router = OCRRouter()
+    for _ in range(20):
+        router.record('tesseract', 'clean', 1.5, {'text': '', 'confidence': 0})
+    estimate = router.get_stats()['engines']['tesseract']['clean']
+    assert estimate['runs'] == 20
+    assert estimate['quality'] < 0.5
+    assert router.plan(['tesseract', 'paddleocr'], 'clean')[0][0] == 'paddleocr'
+
+
+def test_cascade_runs_engines_in_given_order():
+    router = OCRRouter()
+    engines = {'first': _engine('', 0), 'second': _engine('found', 70), 'third': _engine('never', 99)}
+    engine, result, attempts, routing = router.run(FakeImage(), engines, adaptive=False)
+    assert (engine, result['text']) == ('second', 'found')
+    assert attempts == ['first_no_text']
+    assert routing['plan'] == ['first', 'second', 'third']
+
+
+def test_race_takes_accepted_result_and_isolates_images():
+    router = OCRRouter()
+    image = FakeImage()
+    slow_started = threading.Event()
+    # Unknown engines start at 0.5 expected quality, below RACE_QUALITY, so the page is raced
+    assert router.plan(['fast', 'slow'], 'clean')[0][1] < RACE_QUALITY
+    engines = {'fast': _engine('fast text', 95), 'slow': _engine('slow text', 99, seconds=0.3, started=slow_started)}
+    engine, result, attempts, routing = router.run(image, engines, race_deadline=5.0)
+    assert engine == 'fast' and result['text'] == 'fast text'
+    assert routing['raced'] == ['fast', 'slow']
+    # The caller closes its image straight away; the racers work on their own copies
+    image.close()
+    assert slow_started.wait(1.0)
+    time.sleep(0.5)
+    stats = router.get_stats()
+    assert stats['engines']['slow']['clean']['runs'] == 1
+    assert stats['engines']['slow']['clean']['quality'] > 0.5  # recorded as a good run, not a closed-image failure
+    assert all(copy.closed for copy in image.copies) and len(image.copies) == 2
+
+
+def test_race_deadline_keeps_best_result_so_far():
+    router = OCRRouter()
+    engines = {'fast': _engine('fast text', 50), 'slow': _engine('slow text', 99, seconds=1.0)}
+    started = time.monotonic()
+    engine, result, attempts, _ = router.run(FakeImage(), engines, race_deadline=0.2)
+    assert time.monotonic() - started < 0.9
+    assert engine == 'fast'
+    assert attempts == ['slow_deadline']
+    assert router.get_stats()['race_deadlines'] == 1
+
+
+if __name__ == "__main__":
+    for name in ("test_plan_prefers_fastest_near_best_engine", "test_recorded_runs_move_estimates_and_plan",
+                 "test_cascade_runs_engines_in_given_order", "test_race_takes_accepted_result_and_isolates_images",
+                 "test_race_deadline_keeps_best_result_so_far"):
+        globals()[name]()
+        print(f"[OK] {name}")
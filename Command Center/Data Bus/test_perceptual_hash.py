@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Perceptual Hash Individual System Test
+Test Hamming search and near-duplicate matching in isolation
+"""
+
+import sys
+import os
+import random
+from datetime import datetime
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from perceptual_hash import (HammingIndex, NearDuplicateIndex, cluster_near_duplicates, dedupe_timed_items,
+                             hamming_distance, informative_hashes, is_informative)
+
+
+def _flip(value, bits):
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+def test_hamming_distance_accepts_hex_and_int():
+    assert hamming_distance("ff00", 0xff01) == 1
+    assert hamming_distance(0, 0) == 0
+
+
+def test_index_matches_linear_scan():
+    rng = random.Random(7)
+    values = [rng.getrandbits(64) for _ in range(500)]
+    index = HammingIndex()
+    for position, value in enumerate(values):
+        index.add(value, position)
+    for probe in values[:50]:
+        probe = _flip(probe, rng.sample(range(64), 5))
+        expected = sorted((hamming_distance(probe, value), position) for position, value in enumerate(values)
+                          if hamming_distance(probe, value) <= 10)
+        assert sorted(index.search(probe, 10)) == expected
+
+
+def test_flat_hashes_are_not_informative():
+    assert not is_informative("0000000000000000")
+    assert not is_informative("ffffffffffffffff")
+    assert not is_informative(None)
+    assert is_informative("a5a5a5a5a5a5a5a5")
+    assert informative_hashes(["0000000000000000", "a5a5a5a5a5a5a5a5"]) == ["a5a5a5a5a5a5a5a5"]
+
+
+def test_shared_black_frame_is_not_a_duplicate():
+    rng = random.Random(3)
+    first = [0] + [rng.getrandbits(64) for _ in range(4)]
+    second = [0] + [rng.getrandbits(64) for _ in range(4)]
+    index = NearDuplicateIndex()
+    index.add("first", first)
+    assert index.match(second) is None
+    assert cluster_near_duplicates([("first", first), ("second", second)]) == []
+
+
+def test_majority_of_frames_must_match():
+    rng = random.Random(5)
+    frames = [rng.getrandbits(64) for _ in range(4)]
+    index = NearDuplicateIndex()
+    index.add("original", frames)
+    # Three of four frames re-encoded with a couple of bits changed
+    reencoded = [_flip(value, [1, 9]) for value in frames[:3]] + [rng.getrandbits(64)]
+    assert index.match(reencoded) == "original"
+    # Only half the frames match: not a duplicate
+    assert index.match(frames[:2] + [rng.getrandbits(64) for _ in range(2)]) is None
+
+
+def test_cluster_groups_in_input_order():
+    rng = random.Random(11)
+    base, other = rng.getrandbits(64), rng.getrandbits(64)
+    clusters = cluster_near_duplicates([("a", base), ("x", other), ("b", _flip(base, [0, 5, 20]))])
+    assert clusters == [["a", "b"]]
+
+
+def _parse_time(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+def test_dedupe_timed_items_applies_report_rules():
+    rng = random.Random(13)
+    photo, other = rng.getrandbits(64), rng.getrandbits(64)
+    while hamming_distance(photo, other) < 20 or not (is_informative(photo) and is_informative(other)):
+        photo, other = rng.getrandbits(64), rng.getrandbits(64)
+    items = [
+        {"id": "late", "captured_at": "2024-05-01T10:05:00", "dimensions": [800, 600]},
+        {"id": "first", "captured_at": "2024-05-01T10:00:00", "dimensions": [800, 600],
+         "file_hash": "h1", "perceptual_hash": f"{photo:016x}"},
+        {"id": "copy", "captured_at": "2024-05-01T10:01:00", "file_hash": "h1"},
+        {"id": "burst", "captured_at": "2024-05-01T10:00:01", "dimensions": [800, 600]},
+        {"id": "other_size", "captured_at": "2024-05-01T10:00:01", "dimensions": [640, 480],
+         "perceptual_hash": f"{other:016x}"},
+        {"id": "after_burst", "captured_at": "2024-05-01T10:00:03", "dimensions": [800, 600]},
+        {"id": "recompressed", "processing_timestamp": "2024-05-01T10:02:00",
+         "perceptual_hash": f"{_flip(photo, [1, 9, 40]):016x}"},
+        {"id": "untimed", "dimensions": [800, 600]},
+    ]
+    kept = dedupe_timed_items(items, _parse_time)
+    # Capture order; untimed items sort first and are never part of a burst
+    assert [item["id"] for item in kept] == ["untimed", "first", "other_size", "after_burst", "late"]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Individual System Test
+Test token buckets and the request/token governor in isolation
+"""
+
+import sys
+import os
+import time
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from rate_limiter import RateGovernor, TokenBucket
+
+
+def test_bucket_refills_at_rate():
+    bucket = TokenBucket(rate_per_second=10, capacity=5)
+    now = time.monotonic()
+    assert bucket.wait_time(5, now) == 0.0
+    bucket.take(5)
+    assert abs(bucket.wait_time(1, now) - 0.1) < 1e-6
+    assert bucket.wait_time(1, now + 0.11) == 0.0
+
+
+def test_oversized_request_waits_for_full_bucket():
+    bucket = TokenBucket(rate_per_second=1, capacity=2)
+    now = time.monotonic()
+    assert bucket.wait_time(2, now) == 0.0
+    bucket.take(2)
+    assert abs(bucket.wait_time(100, now) - 2.0) < 1e-6
+
+
+def test_unlimited_governor_always_admits():
+    governor = RateGovernor()
+    assert not governor.limited
+    assert all(governor.try_acquire(10000) == 0.0 for _ in range(100))
+    assert governor.get_stats()['admitted'] == 100
+
+
+def test_request_budget_limits_burst():
+    # 60/minute with a 2 second burst: two calls now, the third waits about a second
+    governor = RateGovernor(requests_per_minute=60, burst_seconds=2)
+    assert governor.try_acquire() == 0.0
+    assert governor.try_acquire() == 0.0
+    assert 0.9 < governor.try_acquire() <= 1.0
+    assert governor.get_stats()['admitted'] == 2
+
+
+def test_token_budget_and_timeout():
+    governor = RateGovernor(tokens_per_minute=600, burst_seconds=1)
+    assert governor.acquire(tokens=10)
+    assert not governor.acquire(tokens=10, timeout=0.1)
+    stats = governor.get_stats()
+    assert stats['rejected'] == 1
+    assert stats['tokens'] == 10
+    assert stats['tokens_per_minute'] == 600
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
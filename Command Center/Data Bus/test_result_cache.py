@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Result Cache Individual System Test
+Test the SQLite LRU result cache in isolation
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from result_cache import ResultCache
+
+
+def _cache(directory, **kwargs):
+    return ResultCache(os.path.join(directory, "results.sqlite3"), **kwargs)
+
+
+def test_round_trip_and_stats():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _cache(directory)
+        cache.put("a", {"text": "hello", "pages": [1, 2]})
+        assert cache.get("a") == {"text": "hello", "pages": [1, 2]}
+        assert cache.get("missing") is None
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+        cache.close()
+
+
+def test_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _cache(directory, max_entries=2)
+        cache.put("a", 1)
+        time.sleep(0.01)
+        cache.put("b", 2)
+        time.sleep(0.01)
+        assert cache.get("a") == 1  # a is now more recent than b
+        time.sleep(0.01)
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.get_stats()['evictions'] == 1
+        cache.close()
+
+
+def test_owned_files_removed_with_entry():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _cache(directory, max_entries=1)
+        owned = os.path.join(directory, "frame.png")
+        with open(owned, "wb") as handle:
+            handle.write(b"x" * 10)
+        cache.put("a", "value", files=[owned])
+        assert cache.get_stats()['bytes'] > 10
+        cache.put("b", "value")
+        assert not os.path.exists(owned)
+        cache.close()
+
+
+def test_ttl_expires_entries():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = _cache(directory, ttl_seconds=0.05)
+        cache.put("a", 1)
+        time.sleep(0.1)
+        assert cache.get("a") is None
+        assert cache.get_stats()['expired'] == 1
+        cache.close()
+
+
+def test_from_env_bounds(monkeypatch):
+    monkeypatch.setenv("DKI_PROBE_CACHE_MAX_ENTRIES", "7")
+    monkeypatch.setenv("DKI_PROBE_CACHE_MAX_MB", "2")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResultCache.from_env("probe", os.path.join(directory, "probe.sqlite3"))
+        assert cache.max_entries == 7
+        assert cache.max_bytes == 2 * 1024 * 1024
+        cache.close()
+
+
+if __name__ == "__main__":
+    for name in ("test_round_trip_and_stats", "test_evicts_least_recently_used",
+                 "test_owned_files_removed_with_entry", "test_ttl_expires_entries"):
+        globals()[name]()
+        print(f"[OK] {name}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Ring Log Individual System Test
+Test the bounded log buffer and its disk spill in isolation
+"""
+
+import sys
+import os
+import gc
+import tempfile
+from pathlib import Path
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from ring_log import RingBufferLog, SpillSegments
+
+
+def test_buffer_keeps_newest_records():
+    log = RingBufferLog(3)
+    for value in range(5):
+        log.append(value)
+    assert log.tail() == [2, 3, 4]
+    assert (log.appended, log.evicted) == (5, 2)
+
+
+def test_spilled_records_served_by_tail():
+    with tempfile.TemporaryDirectory() as directory:
+        log = RingBufferLog(2, spill=SpillSegments(directory, "events", segment_records=2))
+        for value in range(7):
+            log.append({"value": value})
+        assert [record["value"] for record in log.tail(6)] == [1, 2, 3, 4, 5, 6]
+
+
+def test_leftover_segments_are_not_read_back():
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "events.000000.jsonl").write_text('{"value": "stale"}\n' * 3, encoding="utf-8")
+        log = RingBufferLog(1, spill=SpillSegments(directory, "events"))
+        assert log.tail(5) == []
+        log.append({"value": 0})
+        log.append({"value": 1})
+        assert log.tail(5) == [{"value": 0}, {"value": 1}]
+
+
+def test_same_named_logs_do_not_share_spill_files(monkeypatch):
+    with tempfile.TemporaryDirectory() as directory:
+        monkeypatch.setenv("DKI_LOG_SPILL_DIR", directory)
+        first = RingBufferLog.from_env("processing_log", 1)
+        second = RingBufferLog.from_env("processing_log", 1)
+        for value in range(4):
+            first.append({"first": value})
+            second.append({"second": value})
+        assert first.tail(4) == [{"first": value} for value in range(4)]
+        assert second.tail(4) == [{"second": value} for value in range(4)]
+        del first, second
+        gc.collect()
+        assert os.listdir(directory) == []
+
+
+if __name__ == "__main__":
+    test_buffer_keeps_newest_records()
+    test_spilled_records_served_by_tail()
+    test_leftover_segments_are_not_read_back()
+    print("[OK] ring log")
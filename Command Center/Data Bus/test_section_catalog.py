@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Section Catalog Individual System Test
+Test the gateway's section-indexed evidence catalog and the manifest memo built on it
+"""
+
+import sys
+import os
+import importlib.util
+import logging
+import time
+
+# Add paths for imports; The Warden goes first so its modules win over same-named ones in The Marshall
+WARDEN_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "The Warden")
+sys.path.append(os.path.dirname(__file__))
+sys.path.insert(0, WARDEN_DIR)
+
+# Load by path: another test may already have imported The Marshall's gateway_controller
+_spec = importlib.util.spec_from_file_location("warden_gateway_controller",
+                                               os.path.join(WARDEN_DIR, "gateway_controller.py"))
+warden_gateway_controller = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(warden_gateway_controller)
+GatewayController = warden_gateway_controller.GatewayController
+SectionIndexedCatalog = warden_gateway_controller.SectionIndexedCatalog
+
+logging.disable(logging.CRITICAL)
+
+
+def test_versions_bump_per_section():
+    catalog = SectionIndexedCatalog()
+    catalog["e1"] = {"assigned_section": "section_3"}
+    assert (catalog.section_version("section_3"), catalog.section_version("section_4")) == (1, 0)
+
+    catalog["e2"] = {"assigned_section": "section_4", "related_sections": ["section_3"]}
+    assert (catalog.section_version("section_3"), catalog.section_version("section_4")) == (2, 1)
+
+    # Moving an entry bumps the section it left and the one it joined
+    catalog["e1"] = {"assigned_section": "section_5"}
+    assert [e["assigned_section"] for e in catalog.section_entries("section_3")] == ["section_4"]
+    assert (catalog.section_version("section_3"), catalog.section_version("section_5")) == (3, 1)
+    assert catalog.section_version("section_4") == 1
+
+    del catalog["e2"]
+    assert catalog.section_entries("section_4") == [] and catalog.section_version("section_4") == 2
+    catalog.clear()
+    assert catalog.section_version("section_5") == 2 and catalog.section_counts() == {}
+
+
+def test_section_entries_keep_catalog_order():
+    catalog = SectionIndexedCatalog()
+    for number in range(5):
+        catalog[f"e{number}"] = {"assigned_section": "section_3", "n": number}
+    catalog["e1"] = {"assigned_section": "section_3", "n": 10}  # replacing keeps the original slot
+    assert [entry["n"] for entry in catalog.section_entries("section_3")] == [0, 10, 2, 3, 4]
+
+
+def test_manifest_memo_follows_section_version():
+    gateway = GatewayController()
+    gathered = []
+    original = gateway._gather_section_evidence
+
+    def counting_gather(section_id):
+        gathered.append(section_id)
+        return original(section_id)
+
+    gateway._gather_section_evidence = counting_gather
+    gateway.evidence_catalog["e1"] = {"assigned_section": "section_3"}
+
+    first = gateway.get_section_inputs("3")
+    first["evidence"][0]["mutated"] = True  # callers get their own copies
+    time.sleep(0.01)
+    second = gateway.get_section_inputs("3")
+    assert gathered == ["section_3"]
+    assert "mutated" not in second["evidence"][0]
+    # last_updated is when the inputs were requested, not when the snapshot was built
+    assert second["manifest_context"]["last_updated"] > first["manifest_context"]["last_updated"]
+
+    gateway.evidence_catalog["e2"] = {"assigned_section": "section_4"}
+    gateway.get_section_inputs("3")
+    assert gathered == ["section_3"]
+
+    gateway.evidence_catalog["e3"] = {"assigned_section": "section_3"}
+    assert gateway.get_section_inputs("3")["manifest_context"]["count"] == 2
+    assert gathered == ["section_3", "section_3"]
+
+
+def test_replaced_catalog_is_reindexed():
+    gateway = GatewayController()
+    gateway.evidence_catalog["e1"] = {"assigned_section": "section_3"}
+    gateway.get_section_inputs("3")
+    gateway.evidence_catalog = {"e9": {"assigned_section": "section_3"}}
+    assert [item["assigned_section"] for item in gateway.get_section_inputs("3")["evidence"]] == ["section_3"]
+    assert isinstance(gateway.evidence_catalog, SectionIndexedCatalog)
+
+
+if __name__ == "__main__":
+    test_versions_bump_per_section()
+    test_section_entries_keep_catalog_order()
+    test_manifest_memo_follows_section_version()
+    test_replaced_catalog_is_reindexed()
+    print("[OK] Section catalog tests passed")
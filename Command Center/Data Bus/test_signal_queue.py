@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Signal Queue Individual System Test
+Test lane priority and coalescing in isolation
+"""
+
+import sys
+import os
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from signal_queue import CoalescingPriorityQueue
+
+
+def test_lanes_drain_in_priority_order():
+    queue = CoalescingPriorityQueue()
+    queue.put("bulk-1", lane="bulk")
+    queue.put("normal-1")
+    queue.put("critical-1", lane="critical")
+    queue.put("normal-2")
+    assert queue.drain() == ["critical-1", "normal-1", "normal-2", "bulk-1"]
+    assert queue.pop() is None
+
+
+def test_same_key_coalesces_in_place():
+    queue = CoalescingPriorityQueue()
+    assert queue.put("status-v1", key="status")
+    queue.put("other")
+    assert not queue.put("status-v2", key="status")
+    assert list(queue) == ["status-v2", "other"]
+    stats = queue.get_stats()
+    assert (stats['enqueued'], stats['coalesced'], stats['length']) == (2, 1, 2)
+
+
+def test_urgent_duplicate_promotes_entry():
+    queue = CoalescingPriorityQueue()
+    queue.put("refresh-v1", lane="bulk", key="refresh")
+    queue.put("bulk-2", lane="bulk")
+    queue.put("normal-1")
+    assert not queue.put("refresh-v2", lane="critical", key="refresh")
+    assert len(queue) == 3
+    assert queue.get_stats()['lanes'] == {"critical": 1, "normal": 1, "bulk": 1}
+    assert queue.drain() == ["refresh-v2", "normal-1", "bulk-2"]
+    assert len(queue) == 0
+
+
+def test_repeated_promotion_keeps_one_live_entry():
+    queue = CoalescingPriorityQueue()
+    queue.put("v1", lane="bulk", key="k")
+    queue.put("v2", lane="normal", key="k")
+    queue.put("v3", lane="critical", key="k")
+    assert list(queue) == ["v3"]
+    assert queue.get_stats()['lanes'] == {"critical": 1, "normal": 0, "bulk": 0}
+    assert queue.pop() == "v3"
+    assert queue.pop() is None and len(queue) == 0
+
+
+def test_key_reusable_after_pop():
+    queue = CoalescingPriorityQueue()
+    queue.put("v1", key="k")
+    assert queue.pop() == "v1"
+    assert queue.put("v2", key="k")
+    assert queue.drain(max_items=5) == ["v2"]
+
+
+def test_unknown_lane_rejected():
+    queue = CoalescingPriorityQueue()
+    try:
+        queue.put("x", lane="urgent")
+    except ValueError:
+        return
+    raise AssertionError("unknown lane accepted")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
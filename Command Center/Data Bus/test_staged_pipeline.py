@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Staged Pipeline Individual System Test
+Test stage overlap, ordering and error handling in isolation
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+
+from staged_pipeline import PipelineStage, StagedPipeline
+
+
+def test_results_in_input_order():
+    def jitter(value):
+        time.sleep(0.001 * (value % 3))
+        return value
+
+    pipeline = StagedPipeline([PipelineStage("double", lambda value: value * 2, workers=3),
+                               PipelineStage("jitter", jitter, workers=3)])
+    results = list(pipeline.run(range(30)))
+    assert [item for item, _, _ in results] == list(range(30))
+    assert [value for _, value, _ in results] == [item * 2 for item in range(30)]
+
+
+def test_stages_overlap():
+    def slow(value):
+        time.sleep(0.05)
+        return value
+
+    pipeline = StagedPipeline([PipelineStage("load", slow), PipelineStage("scan", slow)])
+    started = time.perf_counter()
+    list(pipeline.run(range(8)))
+    # Serial would be 16 * 0.05; overlapped is about 9 * 0.05
+    assert time.perf_counter() - started < 0.05 * 13
+    metrics = pipeline.get_metrics()
+    assert metrics['stages']['load']['items'] == 8
+    assert metrics['bottleneck'] in ("load", "scan")
+
+
+def test_failed_item_skips_later_stages():
+    calls = []
+
+    def fail_on_three(value):
+        if value == 3:
+            raise ValueError("bad item")
+        return value
+
+    def record(value):
+        calls.append(value)
+        return value
+
+    pipeline = StagedPipeline([PipelineStage("check", fail_on_three), PipelineStage("record", record)])
+    results = list(pipeline.run(range(5)))
+    item, value, error = results[3]
+    assert (item, value) == (3, None) and isinstance(error, ValueError)
+    assert sorted(calls) == [0, 1, 2, 4]
+    assert pipeline.get_metrics()['stages']['check']['errors'] == 1
+
+
+def test_stopping_early_cancels_run():
+    pipeline = StagedPipeline([PipelineStage("identity", lambda value: value, queue_size=2)])
+    for item, _, _ in pipeline.run(iter(range(10 ** 9))):
+        if item == 5:
+            break
+    assert pipeline.get_metrics()['stages']['identity']['items'] < 100
+
+
+def test_worker_exit_is_reraised_not_hung():
+    def exit_on_two(value):
+        if value == 2:
+            raise SystemExit(3)
+        return value
+
+    outcome = {}
+
+    def consume():
+        pipeline = StagedPipeline([PipelineStage("exit", exit_on_two, workers=2),
+                                   PipelineStage("identity", lambda value: value)])
+        try:
+            outcome["results"] = list(pipeline.run(range(10)))
+        except SystemExit as exc:
+            outcome["exit"] = exc.code
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive(), "run() blocked after a worker exited"
+    assert outcome == {"exit": 3}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Text Corpus Individual System Test
+Test in-memory and spilled corpora in isolation
+"""
+
+import sys
+import os
+import tempfile
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The Marshall", "Gateway"))
+
+from text_corpus import TextCorpus
+
+
+def _fill(corpus):
+    corpus.add("a", "first document\nline two")
+    corpus.add("b", "second – ünïcode")
+    return corpus.seal()
+
+
+def test_in_memory_corpus():
+    corpus = _fill(TextCorpus())
+    assert not corpus.spilled
+    assert str(corpus.view()) == "first document\nline two\n\nsecond – ünïcode"
+    assert str(corpus.document("b")) == "second – ünïcode"
+    assert "ünïcode" in corpus.document("b")
+    assert corpus.document("a").find("line") == 15
+    assert list(corpus.document("a").iter_lines()) == ["first document", "line two"]
+    corpus.close()
+
+
+def test_spilled_corpus_matches_and_cleans_up():
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = _fill(TextCorpus(spill_bytes=8, directory=directory))
+        assert corpus.spilled
+        assert len(os.listdir(directory)) == 1
+        assert str(corpus.view()) == "first document\nline two\n\nsecond – ünïcode"
+        assert corpus.size_bytes == len(str(corpus.view()).encode("utf-8"))
+        corpus.close()
+        assert os.listdir(directory) == []
+
+
+def test_sealed_corpus_rejects_writes():
+    corpus = _fill(TextCorpus())
+    try:
+        corpus.add("c", "late")
+    except RuntimeError:
+        return
+    finally:
+        corpus.close()
+    raise AssertionError("sealed corpus accepted a document")
+
+
+def test_truncated_read_drops_split_character():
+    corpus = TextCorpus()
+    view = corpus.add("a", "ab–c")
+    corpus.seal()
+    assert view.read(3) == "ab"
+    corpus.close()
+
+
+
+def test_stage_4_shares_views_and_decodes_all_text_on_demand():
+    from file_processing_orchestrator import FileProcessingOrchestrator
+
+    texts = {"doc_0": "ledger entries\nrow two", "doc_1": "", "doc_2": "wire – transfer"}
+    with tempfile.TemporaryDirectory() as directory:
+        orchestrator = FileProcessingOrchestrator()
+        orchestrator.corpus_spill_bytes = 8
+        os.environ["DKI_CORPUS_DIR"] = directory
+        try:
+            context = orchestrator._stage_4_build_context({"extracted_text": texts}, {})
+        finally:
+            del os.environ["DKI_CORPUS_DIR"]
+        assert orchestrator.processing_stats["corpus_spilled"]
+        assert set(context["documents"]) == {"doc_0", "doc_2"}
+        assert "wire" in context["documents"]["doc_2"]
+
+        sections = orchestrator._stage_5_distribute_to_sections(context, ["section_1", "section_fr"])
+        # No section asked for the joined text, so it was never decoded
+        assert not dict.__contains__(context, "all_text")
+        assert all("all_text" not in data for data in sections.values())
+
+        data = orchestrator._extract_section_relevant_data("section_dp", context)
+        assert data["all_text"] == "ledger entries\nrow two\n\nwire – transfer"
+        assert data["documents"] is context["documents"]
+        assert orchestrator._extract_section_relevant_data("section_x", context)["all_text"] is data["all_text"]
+        context["corpus"].close()
+        assert os.listdir(directory) == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Trigger Scheduler Individual System Test
+Test OpenAITriggerDispatcher.run_triggers with fake handlers and a fake analyze_text
+"""
+
+import sys
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Add paths for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The Marshall", "Gateway"))
+
+import openai_trigger_engine
+from openai_trigger_engine import OpenAITriggerDispatcher, _make_result
+
+
+class FakeDispatcher(OpenAITriggerDispatcher):
+    """Counts analyze_text calls instead of reaching an AI engine"""
+
+    def __init__(self, **config):
+        super().__init__(config)
+        self.analysis_calls = 0
+        self._calls_lock = threading.Lock()
+
+    def analyze_text(self, text, analysis_type):
+        with self._calls_lock:
+            self.analysis_calls += 1
+        time.sleep(0.1)
+        return {'summary': f"{analysis_type}: {text[:10]}"}
+
+
+@contextmanager
+def _handlers(**handlers):
+    saved = dict(openai_trigger_engine.TRIGGER_HANDLERS)
+    openai_trigger_engine.TRIGGER_HANDLERS.update(handlers)
+    try:
+        yield
+    finally:
+        openai_trigger_engine.TRIGGER_HANDLERS.clear()
+        openai_trigger_engine.TRIGGER_HANDLERS.update(saved)
+
+
+def _plan(*triggers):
+    return {'openai_triggers': [trigger if isinstance(trigger, dict) else {'id': trigger} for trigger in triggers]}
+
+
+def _completing(log=None, seconds=0.0):
+    def handler(run, section_id, trigger, payload):
+        if log is not None:
+            log.append(('start', trigger['id']))
+        time.sleep(seconds)
+        if log is not None:
+            log.append(('end', trigger['id']))
+        return _make_result(trigger['id'], 'completed')
+    return handler
+
+
+def test_ready_triggers_run_concurrently():
+    barrier = threading.Barrier(4, timeout=2.0)
+
+    def together(run, section_id, trigger, payload):
+        barrier.wait()  # raises unless all four run at once
+        return _make_result(trigger['id'], 'completed')
+    ids = ['t_a', 't_b', 't_c', 't_d']
+    with _handlers(**{trigger_id: together for trigger_id in ids}):
+        results = FakeDispatcher(trigger_concurrency=4).run_triggers('section_1', _plan(*ids), {})
+    assert [result['id'] for result in results] == ids
+    assert all(result['status'] == 'completed' and 'duration_seconds' in result for result in results)
+
+
+def test_same_analysis_is_shared_within_a_run():
+    def analyze(run, section_id, trigger, payload):
+        analysis = run.analyze_text(payload['text'], 'summary')
+        return _make_result(trigger['id'], 'completed', analysis['summary'])
+    dispatcher = FakeDispatcher(trigger_concurrency=3)
+    with _handlers(t_one=analyze, t_two=analyze, t_three=analyze):
+        results = dispatcher.run_triggers('section_1', _plan('t_one', 't_two', 't_three'), {'text': 'case notes'})
+    assert [result['status'] for result in results] == ['completed'] * 3
+    assert dispatcher.analysis_calls == 1
+    stats = dispatcher.get_run_stats()
+    assert (stats['analysis_requests'], stats['analysis_reused']) == (1, 2)
+
+
+def test_dependencies_order_and_skip_on_error():
+    log = []
+
+    def failing(run, section_id, trigger, payload):
+        return _make_result(trigger['id'], 'error', 'boom')
+    with _handlers(t_slow=_completing(log, 0.2), t_after=_completing(log), t_fail=failing,
+                   t_child=_completing(log), t_grandchild=_completing(log), t_loose=_completing(log)):
+        results = FakeDispatcher(trigger_concurrency=4).run_triggers('section_1', _plan(
+            {'id': 't_after', 'depends_on': ['t_slow']},
+            't_slow',
+            't_fail',
+            {'id': 't_child', 'depends_on': ['t_fail']},
+            {'id': 't_grandchild', 'depends_on': ['t_child']},
+            {'id': 't_loose', 'depends_on': ['not_in_this_run']},
+        ), {})
+    status = {result['id']: result['status'] for result in results}
+    assert status == {'t_after': 'completed', 't_slow': 'completed', 't_fail': 'error',
+                      't_child': 'skipped', 't_grandchild': 'skipped', 't_loose': 'completed'}
+    assert log.index(('end', 't_slow')) < log.index(('start', 't_after'))
+    assert ('start', 't_child') not in log
+
+
+def test_dependency_cycle_is_reported():
+    with _handlers(t_x=_completing(), t_y=_completing(), t_free=_completing()):
+        results = FakeDispatcher().run_triggers('section_1', _plan(
+            {'id': 't_x', 'depends_on': ['t_y']}, {'id': 't_y', 'depends_on': ['t_x']}, 't_free'), {})
+    assert [(result['status'], result['notes']) for result in results[:2]] == [('error', 'Dependency cycle')] * 2
+    assert results[2]['status'] == 'completed'
+
+
+def test_cancel_and_timeout_stop_the_run():
+    def blocking(run, section_id, trigger, payload):
+        time.sleep(1.0)  # a stuck request that never looks at the cancel event
+        return _make_result(trigger['id'], 'completed')
+    dispatcher = FakeDispatcher(trigger_concurrency=2)
+    with _handlers(t_block=blocking, t_next=_completing()):
+        plan = _plan('t_block', {'id': 't_next', 'depends_on': ['t_block']})
+        threading.Timer(0.2, dispatcher.cancel).start()
+        started = time.monotonic()
+        results = dispatcher.run_triggers('section_1', plan, {})
+        assert time.monotonic() - started < 0.9
+        assert [result['status'] for result in results] == ['cancelled', 'cancelled']
+        assert dispatcher.get_run_stats()['cancelled'] is True
+
+        started = time.monotonic()
+        results = dispatcher.run_triggers('section_1', plan, {}, timeout=0.2)
+        assert time.monotonic() - started < 0.9
+        assert [result['status'] for result in results] == ['cancelled', 'cancelled']
+
+
+if __name__ == "__main__":
+    for name in ("test_ready_triggers_run_concurrently", "test_same_analysis_is_shared_within_a_run",
+                 "test_dependencies_order_and_skip_on_error", "test_dependency_cycle_is_reported",
+                 "test_cancel_and_timeout_stop_the_run"):
+        globals()[name]()
+        print(f"[OK] {name}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Video Frame Extraction Individual System Test
+Test the single-pass frame and thumbnail sweep of MediaProcessingEngine with a fake clip
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The War Room", "Processors"))
+
+from media_processing_engine import MediaProcessingEngine
+
+
+class FakeClip:
+    """10 s at 5 fps; every frame is a distinct gradient so thumbnails and hashes differ per frame"""
+
+    def __init__(self):
+        self.duration = 10.0
+        self.fps = 5.0
+        self.passes = 0
+        self.decoded = 0
+
+    def _frame(self, index):
+        ramp = np.linspace(0, 255, 64, dtype=np.float64)
+        image = (np.add.outer(ramp * ((index % 7) + 1) / 7, ramp[::-1] * (index % 3) / 3) % 256).astype(np.uint8)
+        return np.stack([image] * 3, axis=-1)
+
+    def iter_frames(self, with_times=False, dtype=None):
+        self.passes += 1
+        for index in range(int(self.duration * self.fps)):
+            self.decoded += 1
+            yield (index / self.fps, self._frame(index)) if with_times else self._frame(index)
+
+    def get_frame(self, time_point):
+        raise AssertionError("frames must come from the single iter_frames pass")
+
+
+def _engine(directory):
+    engine = MediaProcessingEngine.__new__(MediaProcessingEngine)
+    engine.cache_dir = directory
+    return engine
+
+
+def test_single_pass_extracts_every_frame_and_poster():
+    with tempfile.TemporaryDirectory() as directory:
+        clip = FakeClip()
+        frames, poster = _engine(directory)._extract_video_frames(clip, "abc123", frame_count=4)
+        assert clip.passes == 1
+        # The last target is at 7.5 s, so decoding stops well before the end of the clip
+        assert clip.decoded <= 7.5 * clip.fps + 1
+        assert [frame['frame_number'] for frame in frames] == [0, 1, 2, 3]
+        assert [frame['timestamp'] for frame in frames] == [0.0, 2.5, 5.0, 7.5]
+        assert all(os.path.exists(frame['thumbnail']) and frame['perceptual_hash'] for frame in frames)
+        assert poster and os.path.exists(poster)
+
+
+def test_cached_thumbnails_skip_decode_and_hash_identically():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = _engine(directory)
+        fresh, _ = engine._extract_video_frames(FakeClip(), "abc123", frame_count=4)
+        clip = FakeClip()
+        cached, poster = engine._extract_video_frames(clip, "abc123", frame_count=4)
+        assert clip.passes == 0
+        assert poster
+        assert [frame['perceptual_hash'] for frame in cached] == [frame['perceptual_hash'] for frame in fresh]
+
+
+def test_partial_cache_decodes_only_missing_frames():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = _engine(directory)
+        fresh, _ = engine._extract_video_frames(FakeClip(), "abc123", frame_count=4)
+        os.remove(fresh[3]['thumbnail'])
+        clip = FakeClip()
+        again, _ = engine._extract_video_frames(clip, "abc123", frame_count=4)
+        assert clip.passes == 1
+        assert [frame['perceptual_hash'] for frame in again] == [frame['perceptual_hash'] for frame in fresh]
+
+
+if __name__ == "__main__":
+    test_single_pass_extracts_every_frame_and_poster()
+    test_cached_thumbnails_skip_decode_and_hash_identically()
+    test_partial_cache_decodes_only_missing_frames()
+    print("[OK] Video frame extraction tests passed")
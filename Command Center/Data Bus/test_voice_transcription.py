@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Voice Transcription Individual System Test
+Test the chunker, stitcher and ffmpeg block reader of VoiceTranscriber with a fake model
+"""
+
+import sys
+import os
+import stat
+import tempfile
+import threading
+
+import numpy as np
+
+# Add paths for imports
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "The War Room", "Processors"))
+
+from voice_transcription import SAMPLE_RATE, VoiceTranscriber
+
+WORD_SECONDS = 0.5  # every second holds one loud word followed by silence
+
+
+def _speech(words):
+    """One word per second; the word's amplitude encodes its number"""
+
+    audio = np.zeros(int(words * SAMPLE_RATE), dtype=np.float32)
+    for word in range(words):
+        start = word * SAMPLE_RATE
+        audio[start:start + int(WORD_SECONDS * SAMPLE_RATE)] = (word + 1) / 100.0
+    return audio
+
+
+def _blocks(audio, seconds=0.7):
+    size = int(seconds * SAMPLE_RATE)
+    return (audio[start:start + size] for start in range(0, len(audio), size))
+
+
+class FakeWhisper:
+    """Emits one segment per loud run in the samples it is given, with chunk-relative times"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, samples, **options):
+        self.calls.append((len(samples), dict(options)))
+        loud = np.concatenate(([False], samples > 0, [False]))
+        edges = np.flatnonzero(np.diff(loud.astype(np.int8)))
+        segments = [
+            {"start": start / SAMPLE_RATE, "end": end / SAMPLE_RATE,
+             "text": f"w{int(round(samples[start] * 100)) - 1}", "avg_logprob": -0.1}
+            for start, end in zip(edges[::2], edges[1::2])
+        ]
+        return {"text": " ".join(seg["text"] for seg in segments), "language": "en", "segments": segments}
+
+
+def _transcriber(chunk_seconds=4.0):
+    transcriber = VoiceTranscriber(chunk_seconds=chunk_seconds, workers=1)
+    transcriber.available = True
+    transcriber._model = FakeWhisper()
+    return transcriber
+
+
+def test_chunks_cut_in_silence_and_tile_the_audio():
+    audio = _speech(23)
+    transcriber = _transcriber()
+    chunks = list(transcriber._iter_chunks(_blocks(audio)))
+    assert len(chunks) >= 5
+
+    # Compare in samples; the chunker reports seconds
+    target = round(transcriber.chunk_seconds * SAMPLE_RATE)
+    search = round(transcriber.vad_search_seconds * SAMPLE_RATE)
+    overlap = round(transcriber.overlap_seconds * SAMPLE_RATE)
+    keep_from = 0
+    own_audio = []
+    for offset, chunk_keep_from, keep_until, samples in chunks:
+        assert round(chunk_keep_from * SAMPLE_RATE) == keep_from
+        # Each chunk carries a one second lead-in from the previous one
+        start = round(offset * SAMPLE_RATE)
+        assert start == max(0, keep_from - overlap)
+        assert np.array_equal(samples, audio[start:start + len(samples)])
+        if keep_until == float("inf"):
+            keep_until = len(audio)
+            assert start + len(samples) == keep_until
+        else:
+            keep_until = round(keep_until * SAMPLE_RATE)
+            assert keep_from + target - search <= keep_until <= keep_from + target
+            assert audio[keep_until] == 0.0
+            assert start + len(samples) == keep_until + overlap
+        own_audio.append(audio[keep_from:keep_until])
+        keep_from = keep_until
+
+    # The final partial chunk runs to the end of the stream
+    assert chunks[-1][2] == float("inf")
+    assert np.array_equal(np.concatenate(own_audio), audio)
+
+
+def test_stitched_segments_are_absolute_and_deduplicated():
+    transcriber = _transcriber()
+    stream = list(transcriber.iter_transcribe_blocks(_blocks(_speech(23))))
+    segments = [seg for _, chunk_segments in stream for seg in chunk_segments]
+
+    # Words in the overlaps are heard twice but kept once, in order, at their absolute times
+    assert [seg["text"] for seg in segments] == [f"w{word}" for word in range(23)]
+    assert [seg["start"] for seg in segments] == [float(word) for word in range(23)]
+    assert [seg["end"] for seg in segments] == [word + WORD_SECONDS for word in range(23)]
+    # The last word sits in the final, shorter chunk
+    assert stream[-1][1][-1]["text"] == "w22"
+
+
+def test_first_chunk_language_pins_the_rest():
+    transcriber = _transcriber()
+    list(transcriber.iter_transcribe_blocks(_blocks(_speech(12))))
+    calls = transcriber._model.calls
+    assert len(calls) > 1
+    assert "language" not in calls[0][1]
+    assert all(options["language"] == "en" for _, options in calls[1:])
+
+
+def test_short_audio_is_one_final_chunk():
+    transcriber = _transcriber(chunk_seconds=60.0)
+    result = transcriber.transcribe_array(_speech(3), SAMPLE_RATE)
+    assert len(transcriber._model.calls) == 1
+    assert result.text == "w0 w1 w2"
+    assert [seg["start"] for seg in result.segments] == [0.0, 1.0, 2.0]
+
+
+def _fake_ffmpeg(directory, pcm, exit_code):
+    """A stand-in decoder that floods stderr before it writes any audio"""
+
+    pcm_path = os.path.join(directory, "audio.pcm")
+    with open(pcm_path, "wb") as handle:
+        handle.write(pcm)
+    script = os.path.join(directory, "ffmpeg")
+    with open(script, "w") as handle:
+        handle.write(f"#!{sys.executable}\n"
+                     "import sys\n"
+                     "sys.stderr.write('[mp3 @ 0x0] invalid frame header\\n' * 8000)\n"
+                     "sys.stderr.write('decode failed\\n')\n"
+                     "sys.stderr.flush()\n"
+                     f"sys.stdout.buffer.write(open({pcm_path!r}, 'rb').read())\n"
+                     f"sys.exit({exit_code})\n")
+    os.chmod(script, os.stat(script).st_mode | stat.S_IEXEC)
+    return script
+
+
+def _drain(ffmpeg):
+    outcome = {}
+
+    def run():
+        try:
+            outcome["blocks"] = list(VoiceTranscriber._iter_ffmpeg_blocks(ffmpeg, "recording.mp3"))
+        except Exception as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(30)
+    assert not thread.is_alive(), "ffmpeg reader stalled on a full stderr pipe"
+    return outcome
+
+
+def test_ffmpeg_stderr_does_not_block_decoding():
+    with tempfile.TemporaryDirectory() as directory:
+        samples = (np.arange(3 * SAMPLE_RATE) % 200 - 100).astype(np.int16)
+        outcome = _drain(_fake_ffmpeg(directory, samples.tobytes(), 0))
+        decoded = np.concatenate(outcome["blocks"])
+        assert np.allclose(decoded, samples.astype(np.float32) / 32768.0)
+
+
+def test_ffmpeg_failure_reports_stderr():
+    with tempfile.TemporaryDirectory() as directory:
+        outcome = _drain(_fake_ffmpeg(directory, b"", 1))
+        assert isinstance(outcome["error"], RuntimeError)
+        assert str(outcome["error"]).endswith("decode failed")
+
+
+if __name__ == "__main__":
+    test_chunks_cut_in_silence_and_tile_the_audio()
+    test_stitched_segments_are_absolute_and_deduplicated()
+    test_first_chunk_language_pins_the_rest()
+    test_short_audio_is_one_final_chunk()
+    test_ffmpeg_stderr_does_not_block_decoding()
+    test_ffmpeg_failure_reports_stderr()
+    print("[OK] Voice transcription tests passed")
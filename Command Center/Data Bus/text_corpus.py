@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Text Corpus - Append-only document text store read back through views
+Documents are written once, UTF-8 encoded, into a buffer that spills to a
+temporary file past a size threshold and is memory-mapped when sealed. Each
+document is addressed by byte offsets, and readers get CorpusView slices that
+decode only what they read, so building the case-wide text no longer holds a
+second full copy of every document in memory.
+"""
+
+import logging
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPILL_BYTES = 32 * 1024 * 1024
+DEFAULT_SEPARATOR = "\n\n"
+
+
+def _release(state: Dict) -> None:
+    """Close the mapping and remove the spill file (also runs when the corpus is garbage-collected)."""
+    backing = state.pop("mmap", None)
+    if backing is not None:
+        backing.close()
+    handle = state.pop("handle", None)
+    if handle is not None:
+        handle.close()
+    path = state.pop("path", None)
+    if path:
+        try:
+            os.remove(path)
+        except OSError as exc:
+            logger.warning(f"Could not remove corpus spill file {path}: {exc}")
+
+
+class CorpusView:
+    """Read-only window onto a byte range of a sealed TextCorpus
+
+    len() is the size in bytes; str() decodes the range. Substring tests and
+    find() search the mapping directly without decoding.
+    """
+
+    __slots__ = ("_corpus", "start", "end")
+
+    def __init__(self, corpus: "TextCorpus", start: int, end: int):
+        self._corpus = corpus
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __bool__(self) -> bool:
+        return self.end > self.start
+
+    def __str__(self) -> str:
+        return self.read()
+
+    def __repr__(self) -> str:
+        return f"CorpusView(bytes={self.end - self.start})"
+
+    def read(self, limit: Optional[int] = None) -> str:
+        """Decode the range (or its first limit bytes; a split multi-byte character is dropped)."""
+        end = self.end if limit is None else min(self.end, self.start + max(0, limit))
+        return self._corpus._bytes(self.start, end).decode("utf-8", errors="ignore" if limit else "strict")
+
+    def find(self, needle: Union[str, bytes]) -> int:
+        """Byte offset of needle within the view, or -1."""
+        if isinstance(needle, str):
+            needle = needle.encode("utf-8")
+        position = self._corpus._backing().find(needle, self.start, self.end)
+        return position - self.start if position >= 0 else -1
+
+    def __contains__(self, needle: Union[str, bytes]) -> bool:
+        return self.find(needle) >= 0
+
+    def iter_lines(self) -> Iterator[str]:
+        """Decoded lines, one at a time."""
+        backing = self._corpus._backing()
+        position = self.start
+        while position < self.end:
+            newline = backing.find(b"\n", position, self.end)
+            stop = self.end if newline < 0 else newline
+            yield backing[position:stop].decode("utf-8")
+            position = stop + 1
+
+
+class TextCorpus:
+    """Documents appended in order, joined by a separator, addressed by per-document byte offsets"""
+
+    def __init__(self, spill_bytes: int = DEFAULT_SPILL_BYTES, directory: Optional[str] = None,
+                 separator: str = DEFAULT_SEPARATOR):
+        self.spill_bytes = max(0, int(spill_bytes))
+        self.directory = directory or os.getenv("DKI_CORPUS_DIR") or None
+        self._separator = separator.encode("utf-8")
+        self._buffer: Optional[bytearray] = bytearray()
+        self._size = 0
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        self._sealed: Optional[Union[bytes, mmap.mmap]] = None
+        self._state: Dict = {}
+        self._finalizer = weakref.finalize(self, _release, self._state)
+
+    @property
+    def spilled(self) -> bool:
+        return "path" in self._state
+
+    def add(self, doc_id: str, text: str) -> CorpusView:
+        """Append one document; returns a view that is readable once the corpus is sealed."""
+        if self._sealed is not None:
+            raise RuntimeError("TextCorpus is sealed")
+        if self._size:
+            self._write(self._separator)
+        data = text.encode("utf-8")
+        start = self._size
+        self._write(data)
+        self._offsets[doc_id] = (start, self._size)
+        return CorpusView(self, start, self._size)
+
+    def _write(self, data: bytes) -> None:
+        if self._buffer is not None and len(self._buffer) + len(data) > self.spill_bytes:
+            self._spill()
+        if self._buffer is not None:
+            self._buffer.extend(data)
+        else:
+            self._state["handle"].write(data)
+        self._size += len(data)
+
+    def _spill(self) -> None:
+        fd, path = tempfile.mkstemp(prefix="dki_corpus_", suffix=".txt", dir=self.directory)
+        self._state["path"] = path
+        self._state["handle"] = os.fdopen(fd, "w+b")
+        self._state["handle"].write(self._buffer)
+        self._buffer = None
+        logger.debug(f"Text corpus spilled to {path}")
+
+    def seal(self) -> "TextCorpus":
+        """Finish writing: spilled corpora are memory-mapped, small ones stay as one bytes object."""
+        if self._sealed is not None:
+            return self
+        if self._buffer is not None:
+            self._sealed = bytes(self._buffer)
+            self._buffer = None
+        else:
+            handle = self._state["handle"]
+            handle.flush()
+            self._sealed = self._state["mmap"] = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def _backing(self) -> Union[bytes, mmap.mmap]:
+        if self._sealed is None:
+            self.seal()
+        return self._sealed
+
+    def _bytes(self, start: int, end: int) -> bytes:
+        return self._backing()[start:end]
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def view(self) -> CorpusView:
+        """The whole corpus, documents joined by the separator."""
+        return CorpusView(self, 0, self._size)
+
+    def document(self, doc_id: str) -> CorpusView:
+        start, end = self._offsets[doc_id]
+        return CorpusView(self, start, end)
+
+    def documents(self) -> Dict[str, CorpusView]:
+        return {doc_id: CorpusView(self, start, end) for doc_id, (start, end) in self._offsets.items()}
+
+    def offsets(self) -> Dict[str, Tuple[int, int]]:
+        return dict(self._offsets)
+
+    def close(self) -> None:
+        self._sealed = None
+        self._finalizer()
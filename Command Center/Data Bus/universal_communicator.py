@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
+from ring_log import RingBufferLog
 
 
 class RadioCode(Enum):
@@ -71,7 +72,9 @@ class UniversalCommunicator:
         """Initialize Universal Communicator"""
         self.system_address = system_address
         self.bus_connection = bus_connection
-        self.communication_log: List[CommunicationSignal] = []
+        self.communication_log: RingBufferLog = RingBufferLog.from_env(
+            "communication_log", 2000, spill_prefix=f"communication_log_{system_address}"
+        )
         self.registered_systems: Dict[str, Dict[str, Any]] = {}
         self.active_signals: Dict[str, CommunicationSignal] = {}
         self.signal_counter = 0
@@ -16,6 +16,9 @@ from pathlib import Path
 # Add Central Command paths for integration
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "The Warden"))
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "Command Center", "Data Bus", "Bus Core Design"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "Data Bus"))
+
+from file_hashing import file_hexdigest
 
 logger = logging.getLogger(__name__)
 
@@ -508,12 +511,9 @@ class ArchiveManager:
         return self.archive_root / "exports" / f"{case_number}_depositions.json"
 
     def _calculate_file_hash(self, file_path: Path, chunk_size: int = 65536) -> Optional[str]:
+        # chunk_size is kept for callers; the shared hash service sizes its own read buffer
         try:
-            sha256 = hashlib.sha256()
-            with file_path.open('rb') as handle:
-                for chunk in iter(lambda: handle.read(chunk_size), b''):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+            return file_hexdigest(file_path, 'sha256')
         except Exception as exc:
             self.logger.warning("Failed to hash file %s: %s", file_path, exc)
             return None
@@ -9,8 +9,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 PROCESSORS_ROOT = Path(__file__).resolve().parents[3] / "The War Room" / "Processors"
-if str(PROCESSORS_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROCESSORS_ROOT))
+DATA_BUS_ROOT = Path(__file__).resolve().parents[2] / "Data Bus"
+for _root in (PROCESSORS_ROOT, DATA_BUS_ROOT):
+    if str(_root) not in sys.path:
+        sys.path.insert(0, str(_root))
 
 try:  # pragma: no cover - import-time capability check
     from evidence_pipeline import EvidencePipeline  # type: ignore
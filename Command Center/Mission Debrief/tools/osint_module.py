@@ -5,28 +5,28 @@ Handles internet lookups, verification, and data gathering for investigations
 """
 
 import os
+import sys
 import json
 import logging
 import time
 from typing import Dict, List, Any, Optional
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# Shared Data Bus modules (api_manager)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Data Bus"))
+from api_manager import APIManager
 
 logger = logging.getLogger(__name__)
 
 class OSINTEngine:
     """Main OSINT engine for internet-based investigation tools"""
     
-    def __init__(self, api_keys_file="api_keys.json", user_profile_manager=None):
+    def __init__(self, api_keys_file="api_keys.json", user_profile_manager=None, api_manager=None):
         self.api_keys = {}
-        self.cache = {}
-        self.cache_expiry = {}
         self.user_profile_manager = user_profile_manager
-        self.rate_limits = {
-            'google_search': {'calls': 0, 'reset_time': datetime.now()},
-            'google_maps': {'calls': 0, 'reset_time': datetime.now()},
-            'bing_search': {'calls': 0, 'reset_time': datetime.now()}
-        }
+        # Call budgets and the bounded response cache are shared with the other APIManager users
+        self.api_manager = api_manager or APIManager()
         
         # Load API keys (from user profile if available, otherwise from file)
         if user_profile_manager and user_profile_manager.is_authenticated():
@@ -41,6 +41,10 @@ class OSINTEngine:
             'google_maps': 1000,   # Free tier limit
             'bing_search': 1000    # Free tier limit
         }
+        for service, calls_per_hour in self.rate_limits_config.items():
+            # Bursts of up to a tenth of the hour's allowance; the rest refills at the hourly rate
+            self.api_manager.set_default_rate_limit(service, calls_per_hour=calls_per_hour,
+                                                    calls_per_minute=max(1, calls_per_hour // 10))
         
         logger.info("OSINT Engine initialized")
     
@@ -73,41 +77,25 @@ class OSINTEngine:
             self.api_keys = {}
     
     def check_rate_limit(self, service):
-        """Check if we're within rate limits for a service"""
-        now = datetime.now()
-        limit_info = self.rate_limits[service]
-        
-        # Reset counter if an hour has passed
-        if now - limit_info['reset_time'] > timedelta(hours=1):
-            limit_info['calls'] = 0
-            limit_info['reset_time'] = now
-        
-        # Check if we're under the limit
-        if limit_info['calls'] >= self.rate_limits_config[service]:
+        """Spend one call from the service's APIManager budget, waiting up to rate_limit_wait_seconds for it"""
+        if not self.api_manager.check_rate_limit(service):
             logger.warning(f"Rate limit reached for {service}")
             return False
         
-        limit_info['calls'] += 1
+        self.api_manager.increment_rate_limit(service)
         return True
     
     def get_cached_result(self, cache_key):
         """Get cached result if it exists and hasn't expired"""
-        if cache_key in self.cache:
-            expiry_time = self.cache_expiry.get(cache_key, datetime.now())
-            if datetime.now() < expiry_time:
-                logger.debug(f"Using cached result for: {cache_key}")
-                return self.cache[cache_key]
-            else:
-                # Remove expired cache
-                del self.cache[cache_key]
-                del self.cache_expiry[cache_key]
-        
-        return None
+        result = self.api_manager.get_cached_response(self.api_manager.get_cache_key("osint", {"lookup": cache_key}))
+        if result is not None:
+            logger.debug(f"Using cached result for: {cache_key}")
+        return result
     
     def cache_result(self, cache_key, result, hours=24):
         """Cache a result with expiry time"""
-        self.cache[cache_key] = result
-        self.cache_expiry[cache_key] = datetime.now() + timedelta(hours=hours)
+        self.api_manager.cache_response(self.api_manager.get_cache_key("osint", {"lookup": cache_key}), result,
+                                        ttl_seconds=hours * 3600)
         logger.debug(f"Cached result for: {cache_key}")
     
     def google_search(self, query, num_results=5):
@@ -415,8 +403,9 @@ class OSINTEngine:
         status = {
             'osint_engine': 'operational',
             'api_keys_configured': {},
-            'rate_limits': self.rate_limits,
-            'cache_size': len(self.cache),
+            'rate_limits': {service: status for service, status in self.api_manager.get_rate_limit_status().items()
+                            if service in self.rate_limits_config},
+            'cache_size': self.api_manager.get_cache_stats()['entries'],
             'services_available': []
         }
         
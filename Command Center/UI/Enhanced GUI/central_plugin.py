@@ -23,6 +23,7 @@ PATH_CANDIDATES = [
     INSTALL_ROOT / "The Warden",
     INSTALL_ROOT / "Evidence Locker",
     INSTALL_ROOT / "The Marshall",
+    COMMAND_CENTER_ROOT / "Data Bus",
     COMMAND_CENTER_ROOT / "Data Bus" / "Bus Core Design",
     MISSION_DEBRIEF_ROOT,
     MISSION_DEBRIEF_ROOT / "The Librarian",
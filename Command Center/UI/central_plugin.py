@@ -24,6 +24,7 @@ PATH_CANDIDATES = [
     INSTALL_ROOT / "The Warden",
     INSTALL_ROOT / "Evidence Locker",
     INSTALL_ROOT / "The Marshall",
+    COMMAND_CENTER_ROOT / "Data Bus",
     COMMAND_CENTER_ROOT / "Data Bus" / "Bus Core Design",
     COMMAND_CENTER_ROOT / "Start Menu" / "Run Time",
     MISSION_DEBRIEF_ROOT,
@@ -79,11 +79,11 @@ def inject_bus_extensions(cls) -> None:
         original_scan_file = cls.scan_file
 
         def scan_file(self, file_path, section_id: Optional[str] = None):  # type: ignore[override]
-            before_len = len(getattr(self, "processing_log", []) or [])
+            before_len = _log_position(getattr(self, "processing_log", None))
             result = original_scan_file(self, file_path, section_id)
             entry = None
             try:
-                if self.processing_log and len(self.processing_log) > before_len:
+                if self.processing_log and _log_position(self.processing_log) > before_len:
                     entry = self.processing_log[-1]
             except Exception:
                 entry = None
@@ -304,6 +304,14 @@ def inject_bus_extensions(cls) -> None:
         cls.get_evidence_manifest = get_evidence_manifest
 
 
+def _log_position(log: Any) -> int:
+    """Monotonic append count for ring-buffer logs (len() plateaus at capacity), len() otherwise."""
+    if log is None:
+        return 0
+    appended = getattr(log, "appended", None)
+    return appended if isinstance(appended, int) else len(log)
+
+
 def _manifest_matches(entry: Dict[str, Any], filters: Dict[str, Any]) -> bool:
     if not filters:
         return True
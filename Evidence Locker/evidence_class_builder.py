@@ -5,6 +5,7 @@ Creates evidence classes based on file types, content analysis, and section requ
 """
 
 import os
+import sys
 import uuid
 import json
 import logging
@@ -14,6 +15,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 import mimetypes
 
+# Shared Data Bus modules (file_hashing)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Command Center", "Data Bus"))
+from file_hashing import file_hexdigest
+
 logger = logging.getLogger(__name__)
 
 class EvidenceType(Enum):
@@ -478,13 +483,7 @@ class EvidenceClassBuilder:
     def _calculate_checksum(self, file_path: str) -> str:
         """Calculate file checksum for integrity verification"""
         try:
-            import hashlib
-            
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            return file_hexdigest(file_path, "md5")
             
         except Exception as e:
             self.logger.debug(f"Failed to calculate checksum for {file_path}: {e}")
@@ -8,6 +8,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from universal_communicator import UniversalCommunicator
+from ring_log import RingBufferLog
+from file_hashing import file_hexdigest
+from ocr_cache import get_ocr_cache
 
 
 
@@ -264,7 +267,9 @@ from pathlib import Path
 
 
 
+import copy
 import json
+import uuid
 
 
 
@@ -361,6 +366,9 @@ from typing import Dict, List, Any, Optional, Set, Iterable
 
 
 from section_registry import SECTION_REGISTRY, REPORTING_STANDARDS
+from manifest_store import SqliteQueryIndex, SqliteRecordMap, create_manifest_store
+from manifest_index import ManifestQueryIndex
+
 
 
 
@@ -1450,15 +1458,27 @@ class EvidenceLocker:
 
 
 
-        self.processing_log = []
+        self.processing_log = RingBufferLog.from_env("processing_log", 5000)
 
         self._manifest_lock = getattr(self, "_manifest_lock", threading.Lock())
+        self._manifest_load_lock = threading.Lock()
         self.manifest_path = Path(os.getenv("DKI_EVIDENCE_MANIFEST", Path(__file__).with_name("evidence_manifest.json")))
         self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
         self._manifest_meta = {"path": str(self.manifest_path), "updated_at": None}
-        if not hasattr(self, "evidence_manifest"):
-            self.evidence_manifest = {}
-        self._load_persisted_manifest()
+        self._manifest_store = create_manifest_store(self.manifest_path, self._manifest_snapshot)
+        self.artifact_dir = self.manifest_path.with_name("evidence_artifacts")
+        if self._manifest_store.supports_lookup:
+            # Records and pool lookups are read from the store by id; nothing is loaded up front
+            self.evidence_index = SqliteRecordMap(self._manifest_store)
+            self._pool_index = SqliteQueryIndex(self._manifest_store)
+            if not hasattr(self, "evidence_manifest"):
+                self.evidence_manifest = SqliteRecordMap(self._manifest_store)
+            self._manifest_meta["updated_at"] = self._manifest_store.updated_at()
+        else:
+            self._pool_index = ManifestQueryIndex()
+            if not hasattr(self, "evidence_manifest"):
+                self.evidence_manifest = {}
+            self._load_persisted_manifest()
 
 
 
@@ -1685,88 +1705,94 @@ class EvidenceLocker:
         self.logger.info("[EVIDENCE] Evidence Locker initialized with Central Command architecture")
 
 
+    @property
+    def evidence_index(self) -> Dict[str, Dict[str, Any]]:
+        """Evidence records by id; the persisted manifest is read in on first use."""
+        self._hydrate_manifest()
+        return self._evidence_index
+
+    @evidence_index.setter
+    def evidence_index(self, value: Dict[str, Dict[str, Any]]) -> None:
+        self._evidence_index = value
+
+    @property
+    def _pool_index(self) -> ManifestQueryIndex:
+        self._hydrate_manifest()
+        return self._manifest_query_index
+
+    @_pool_index.setter
+    def _pool_index(self, value: ManifestQueryIndex) -> None:
+        self._manifest_query_index = value
+
     def _load_persisted_manifest(self) -> None:
-        """Populate in-memory evidence cache from the persisted manifest (if available)."""
+        """Mark the persisted manifest for loading; opening the store does not read the entries."""
         if not getattr(self, "manifest_path", None):
             return
-        if not self.manifest_path.exists():
-            return
-        try:
-            with self.manifest_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except Exception as exc:
-            self.logger.warning("Failed to load evidence manifest %s: %s", self.manifest_path, exc)
+        with self._manifest_load_lock:
+            self._manifest_pending = True
+
+    def _hydrate_manifest(self) -> None:
+        """Populate the in-memory evidence caches from a file-based manifest store the first time they are used."""
+        if not getattr(self, "_manifest_pending", False):
             return
-        entries = data.get("entries")
-        with self._manifest_lock:
-            self.evidence_index.clear()
-            if hasattr(self, "evidence_manifest"):
-                self.evidence_manifest.clear()
-            if isinstance(entries, list):
-                for entry in entries:
-                    if not isinstance(entry, dict):
-                        continue
-                    evidence_id = entry.get("evidence_id")
-                    if not evidence_id:
-                        continue
-                    record = dict(entry)
-                    record.pop("evidence_id", None)
-                    self.evidence_index[evidence_id] = record
-                    if hasattr(self, "evidence_manifest"):
-                        self.evidence_manifest[evidence_id] = dict(record)
-            else:
-                legacy_index = data.get("evidence_index")
-                if isinstance(legacy_index, dict):
-                    for evidence_id, record in legacy_index.items():
-                        evidence_key = str(evidence_id)
-                        record_dict = dict(record) if isinstance(record, dict) else {}
-                        self.evidence_index[evidence_key] = record_dict
-                        if hasattr(self, "evidence_manifest"):
-                            self.evidence_manifest[evidence_key] = dict(record_dict)
-            self._manifest_meta["updated_at"] = data.get("updated_at")
-        loaded_count = len(self.evidence_index)
-        if loaded_count:
-            self.logger.info("[MANIFEST] Loaded %d evidence entries from %s", loaded_count, self.manifest_path)
+        with self._manifest_load_lock:
+            if not self._manifest_pending:
+                return
+            try:
+                records, updated_at = self._manifest_store.load()
+            except Exception as exc:
+                self.logger.warning("Failed to load evidence manifest %s: %s", self.manifest_path, exc)
+                records, updated_at = {}, None
+            # Filled through the backing attributes - the properties would re-enter this method
+            manifest = getattr(self, "evidence_manifest", None)
+            self._evidence_index.clear()
+            self._manifest_query_index.clear()
+            if manifest is not None:
+                manifest.clear()
+            for evidence_id, record in records.items():
+                self._evidence_index[evidence_id] = record
+                self._manifest_query_index.upsert(evidence_id, self._normalize_manifest_entry(evidence_id, record))
+                if manifest is not None:
+                    manifest[evidence_id] = dict(record)
+            self._manifest_meta["updated_at"] = updated_at
+            self._manifest_pending = False
+        if records:
+            self.logger.info("[MANIFEST] Loaded %d evidence entries from %s", len(records), self.manifest_path)
+
+    def _discard_pending_manifest(self) -> None:
+        """Skip loading persisted entries that are about to be cleared."""
+        with self._manifest_load_lock:
+            self._manifest_pending = False
 
     def start_new_case(self, case_id: str) -> None:
         """Clear evidence pool for new case"""
         with self._manifest_lock:
+            self._discard_pending_manifest()
             # Clear in-memory cache
             self.evidence_index.clear()
+            self._pool_index.clear()
             if hasattr(self, "evidence_manifest"):
                 self.evidence_manifest.clear()
             
             # Clear persistent manifest file
-            empty_manifest = {
-                "manifest_version": 1,
-                "updated_at": datetime.now().isoformat(),
-                "evidence_count": 0,
-                "entries": []
-            }
-            
-            with self.manifest_path.open("w", encoding="utf-8") as handle:
-                json.dump(empty_manifest, handle, indent=2)
+            self._manifest_meta["updated_at"] = self._manifest_store.clear()
+            self._prune_content_artifacts()
             
             self.logger.info(f"[NEW CASE] Evidence pool cleared for case: {case_id}")
 
     def clear_evidence_pool(self) -> None:
         """Clear all evidence from pool"""
         with self._manifest_lock:
+            self._discard_pending_manifest()
             # Clear in-memory cache
             self.evidence_index.clear()
+            self._pool_index.clear()
             if hasattr(self, "evidence_manifest"):
                 self.evidence_manifest.clear()
             
             # Clear persistent manifest
-            empty_manifest = {
-                "manifest_version": 1,
-                "updated_at": datetime.now().isoformat(),
-                "evidence_count": 0,
-                "entries": []
-            }
-            
-            with self.manifest_path.open("w", encoding="utf-8") as handle:
-                json.dump(empty_manifest, handle, indent=2)
+            self._manifest_meta["updated_at"] = self._manifest_store.clear()
+            self._prune_content_artifacts()
             
             self.logger.info("[CLEAR] Evidence pool cleared")
 
@@ -1807,28 +1833,28 @@ class EvidenceLocker:
             normalized["related_sections"] = self._serialize_for_manifest(related_sections)
         return normalized
 
-    def _persist_manifest(self, *, already_locked: bool = False) -> None:
-        """Write the current evidence index to disk for cross-module access."""
+    def _cached_manifest_entry(self, evidence_id: str) -> Dict[str, Any]:
+        """Normalized entry from the pool index, normalizing on a miss (caller must hold _manifest_lock)."""
+        entry = self._pool_index.get(evidence_id)
+        if entry is None:
+            entry = self._normalize_manifest_entry(evidence_id, self.evidence_index.get(evidence_id, {}))
+            self._pool_index.upsert(evidence_id, entry)
+        return entry
+
+    def _manifest_snapshot(self) -> List[Dict[str, Any]]:
+        """Sorted, normalized manifest entries (caller must hold _manifest_lock)."""
+        return [self._cached_manifest_entry(evidence_id) for evidence_id in sorted(self.evidence_index)]
+
+    def _persist_manifest(self, *, already_locked: bool = False, evidence_id: Optional[str] = None) -> None:
+        """Persist one evidence entry (or compact the whole index) for cross-module access."""
         def _write_payload() -> None:
-            payload_entries = [
-                self._normalize_manifest_entry(evidence_id, record)
-                for evidence_id, record in sorted(self.evidence_index.items())
-            ]
-            payload = {
-                "manifest_version": 1,
-                "updated_at": datetime.now().isoformat(),
-                "evidence_count": len(payload_entries),
-                "entries": payload_entries,
-            }
-            temp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + ".tmp")
             try:
-                with temp_path.open("w", encoding="utf-8") as handle:
-                    json.dump(payload, handle, indent=2, ensure_ascii=False)
-                temp_path.replace(self.manifest_path)
-                self._manifest_meta["updated_at"] = payload["updated_at"]
+                if evidence_id and evidence_id in self.evidence_index:
+                    entry = self._cached_manifest_entry(evidence_id)
+                    self._manifest_meta["updated_at"] = self._manifest_store.put(evidence_id, entry)
+                else:
+                    self._manifest_meta["updated_at"] = self._manifest_store.compact()
             except Exception as exc:
-                if temp_path.exists():
-                    temp_path.unlink(missing_ok=True)
                 self.logger.error("Failed to persist evidence manifest %s: %s", self.manifest_path, exc)
 
         if already_locked:
@@ -1837,6 +1863,14 @@ class EvidenceLocker:
             with self._manifest_lock:
                 _write_payload()
 
+    def export_manifest(self, output_path: Optional[str] = None) -> str:
+        """Write the evidence pool in evidence_manifest.json format and return the file path."""
+        with self._manifest_lock:
+            if not output_path or Path(output_path) == self.manifest_path:
+                self._manifest_meta["updated_at"] = self._manifest_store.compact()
+                return str(self.manifest_path)
+            return str(self._manifest_store.export(Path(output_path)))
+
     def _update_common_pool_cache(self, evidence_id: str, record: Dict[str, Any], *, already_locked: bool = False, persist: bool = True) -> None:
         """Merge new evidence details into the in-memory cache and persist if requested."""
         if not evidence_id or not isinstance(record, dict):
@@ -1846,10 +1880,11 @@ class EvidenceLocker:
             current = dict(self.evidence_index.get(evidence_id, {}))
             current.update(record)
             self.evidence_index[evidence_id] = current
+            self._pool_index.upsert(evidence_id, self._normalize_manifest_entry(evidence_id, current))
             if hasattr(self, "evidence_manifest"):
                 self.evidence_manifest[evidence_id] = dict(current)
             if persist:
-                self._persist_manifest(already_locked=True)
+                self._persist_manifest(already_locked=True, evidence_id=evidence_id)
 
         if already_locked:
             _merge()
@@ -1860,43 +1895,183 @@ class EvidenceLocker:
     def get_structured_manifest(self) -> Dict[str, Any]:
         """Return a structured snapshot of the persisted evidence manifest."""
         with self._manifest_lock:
-            entries = [
-                self._normalize_manifest_entry(evidence_id, record)
-                for evidence_id, record in self.evidence_index.items()
-            ]
+            entries = [copy.deepcopy(self._cached_manifest_entry(evidence_id)) for evidence_id in self.evidence_index]
             return {
                 "path": str(self.manifest_path),
                 "updated_at": self._manifest_meta.get("updated_at"),
+                "backend": self._manifest_store.backend_name,
                 "evidence_count": len(entries),
                 "entries": entries,
             }
 
-    def get_common_pool(self, *, section: Optional[str] = None, tags: Optional[Iterable[str]] = None, include_related: bool = True, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_common_pool(self, *, section: Optional[str] = None, tags: Optional[Iterable[str]] = None, include_related: bool = True, limit: Optional[int] = None, file_types: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """Provide filtered view of the evidence pool for downstream controllers."""
         normalized_section = str(section) if section else None
         tag_filter = {str(tag).lower() for tag in tags} if tags else None
-        results: List[Dict[str, Any]] = []
+        if isinstance(file_types, str):
+            file_types = [file_types]
+        type_filter = {str(file_type).lower() for file_type in file_types} if file_types else None
+        with self._manifest_lock:
+            # Deep copies: the nested tags/classification/related_sections belong to the index
+            return [
+                copy.deepcopy(entry)
+                for entry in self._pool_index.query(
+                    section=normalized_section,
+                    tags=tag_filter,
+                    include_related=include_related,
+                    file_types=type_filter,
+                    limit=limit,
+                )
+            ]
+
+    def _compute_content_hash(self, file_path: str) -> Optional[str]:
+        """Streaming sha256 of the file contents (None if the file cannot be read)."""
+        try:
+            return file_hexdigest(file_path, "sha256")
+        except OSError as exc:
+            self.logger.warning("Content hash failed for %s: %s", file_path, exc)
+            return None
+
+    @staticmethod
+    def _same_file_path(left: Any, right: Any) -> bool:
+        if not left or not right:
+            return False
+        return os.path.normcase(os.path.abspath(str(left))) == os.path.normcase(os.path.abspath(str(right)))
+
+    def _content_evidence_id(self, content_hash: Optional[str], file_path: str) -> str:
+        """Evidence id derived from the content hash; the same bytes at another path get a numbered suffix.
+
+        An existing id is only reused when its record holds the full content hash and the
+        same path, so two hashes sharing the 16-character prefix never collapse into one id.
+        """
+        if not content_hash:
+            return f"evidence_{uuid.uuid4().hex[:16]}"
+        base_id = f"evidence_{content_hash[:16]}"
+        candidate, suffix = base_id, 1
+        while candidate in self.evidence_index:
+            existing = self.evidence_index[candidate]
+            if existing.get("content_hash") == content_hash and self._same_file_path(existing.get("file_path"), file_path):
+                return candidate
+            suffix += 1
+            candidate = f"{base_id}_{suffix}"
+        return candidate
+
+    def find_duplicate_evidence(self, file_path: str, content_hash: Optional[str] = None) -> Optional[str]:
+        """Return the evidence id that first ingested the same bytes as file_path, if any."""
+        content_hash = content_hash or self._compute_content_hash(file_path)
+        if not content_hash:
+            return None
+        with self._manifest_lock:
+            return self._pool_index.find_by_content_hash(content_hash)
+
+    def _artifact_path(self, content_hash: str) -> Path:
+        return self.artifact_dir / f"{content_hash}.json"
+
+    def _store_content_artifacts(self, evidence_id: str, content_hash: Optional[str], processing_result: Dict[str, Any]) -> None:
+        """Persist extracted artifacts keyed by content hash so duplicates can reuse them."""
+        if not content_hash:
+            return
+        artifact_path = self._artifact_path(content_hash)
+        artifacts = {
+            key: processing_result.get(key)
+            for key in ("file_type", "ocr_text", "video_analysis", "document_structure", "classification", "tools_used")
+        }
+        artifacts.update({"content_hash": content_hash, "evidence_id": evidence_id, "processed_at": processing_result.get("processed_at")})
+        temp_path = artifact_path.with_suffix(".tmp")
+        try:
+            self.artifact_dir.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("w", encoding="utf-8") as handle:
+                json.dump(self._serialize_for_manifest(artifacts), handle, ensure_ascii=False)
+            temp_path.replace(artifact_path)
+        except Exception as exc:
+            temp_path.unlink(missing_ok=True)
+            self.logger.warning("Failed to store artifacts for %s: %s", evidence_id, exc)
+            return
+        self._update_common_pool_cache(evidence_id, {"artifacts_path": str(artifact_path)})
+
+    def _prune_content_artifacts(self) -> int:
+        """Remove stored artifacts no evidence entry references any more (caller must hold _manifest_lock)."""
+        if not self.artifact_dir.is_dir():
+            return 0
+        live = {str(record.get("content_hash")) for record in self.evidence_index.values() if record.get("content_hash")}
+        removed = 0
+        for path in self.artifact_dir.iterdir():
+            # Leftover .tmp files from interrupted writes go too
+            if path.is_file() and (path.suffix != ".json" or path.stem not in live):
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            self.logger.info("[DEDUP] Pruned %d unreferenced artifact files from %s", removed, self.artifact_dir)
+        return removed
+
+    def _load_content_artifacts(self, content_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not content_hash:
+            return None
+        artifact_path = self._artifact_path(content_hash)
+        if not artifact_path.exists():
+            return None
+        try:
+            with artifact_path.open("r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except Exception as exc:
+            self.logger.warning("Failed to read artifacts %s: %s", artifact_path, exc)
+            return None
+
+    @staticmethod
+    def _handed_off_sections(record: Dict[str, Any]) -> List[str]:
+        """Sections an evidence record has been handed off to (its scan-time hint plus later requests)."""
+        classification = record.get("classification") or {}
+        # scan_file hands off with the user's section when given, else the classifier's
+        hint = classification.get("user_assigned_section") or record.get("assigned_section")
+        sections = [hint, *(record.get("requested_sections") or [])]
+        return [str(section) for section in sections if section]
+
+    def _register_duplicate(self, file_path: str, original_id: str, content_hash: str, section_id: Optional[str] = None) -> str:
+        """Index file_path as a duplicate of original_id, pointing back at the original's artifacts.
+
+        A section the original has not been handed off to yet is recorded on the original
+        (requested_sections, and related_sections for pool queries) and the original is
+        handed off to that section.
+        """
         with self._manifest_lock:
-            for evidence_id, record in self.evidence_index.items():
-                entry = self._normalize_manifest_entry(evidence_id, record)
-                if normalized_section:
-                    primary = str(entry.get("assigned_section") or entry.get("section_hint") or "")
-                    related = {str(candidate) for candidate in entry.get("related_sections") or []}
-                    if primary != normalized_section and not (include_related and normalized_section in related):
-                        continue
-                if tag_filter:
-                    entry_tags = {str(tag).lower() for tag in entry.get("tags") or []}
-                    classification_tags = []
-                    classification = entry.get("classification")
-                    if isinstance(classification, dict):
-                        classification_tags = classification.get("tags") or []
-                    entry_tags.update(str(tag).lower() for tag in classification_tags or [])
-                    if not entry_tags.intersection(tag_filter):
-                        continue
-                results.append(entry)
-                if limit and len(results) >= limit:
-                    break
-        return results
+            evidence_id = self._content_evidence_id(content_hash, file_path)
+            original = copy.deepcopy(self.evidence_index.get(original_id, {}))
+            new_section = bool(section_id) and section_id not in self._handed_off_sections(original)
+            if new_section:
+                classification = original.get("classification") or {}
+                related = list(original.get("related_sections") or classification.get("related_sections") or [])
+                update = {"requested_sections": list(original.get("requested_sections") or []) + [section_id]}
+                if section_id not in related:
+                    update["related_sections"] = related + [section_id]
+                self._update_common_pool_cache(original_id, update, already_locked=True)
+        if new_section:
+            handoff_classification = dict(original.get("classification") or {})
+            handoff_classification["user_assigned_section"] = section_id
+            self.logger.info(f"[DEDUP] {original_id} also requested for {section_id}, handing off")
+            self._handoff_to_gateway(original.get("file_path") or file_path, original_id, section_id, handoff_classification)
+        if evidence_id == original_id:
+            return original_id
+        classification = dict(original.get("classification") or {})
+        if section_id:
+            classification["user_assigned_section"] = section_id
+        artifact_path = self._artifact_path(content_hash)
+        record = {
+            "file_path": file_path,
+            "classification": classification,
+            "assigned_section": original.get("assigned_section", "unassigned"),
+            "section_title": original.get("section_title"),
+            "section_tags": original.get("section_tags", []),
+            "timestamp": datetime.now().isoformat(),
+            "status": "duplicate",
+            "file_size": os.path.getsize(file_path) if os.path.exists(file_path) else 0,
+            "file_type": Path(file_path).suffix.lower(),
+            "content_hash": content_hash,
+            "duplicate_of": original_id,
+            "artifacts_path": str(artifact_path) if artifact_path.exists() else original.get("artifacts_path"),
+        }
+        self._update_common_pool_cache(evidence_id, record)
+        self.logger.info(f"[DEDUP] {file_path} matches {original_id}, indexed as {evidence_id}")
+        return evidence_id
 
 
 
@@ -6497,6 +6672,22 @@ class EvidenceLocker:
 
 
 
+            # Content-addressed dedup: known bytes skip classification, OCR and handoff
+            content_hash = self._compute_content_hash(file_path)
+            original_id = self.find_duplicate_evidence(file_path, content_hash) if content_hash else None
+            if original_id:
+                evidence_id = self._register_duplicate(file_path, original_id, content_hash, section_id)
+                record = self.evidence_index.get(evidence_id, {})
+                self.processing_log.append({
+                    "timestamp": datetime.now().isoformat(),
+                    "file_path": file_path,
+                    "section_hint": section_id or record.get("assigned_section", "unassigned"),
+                    "evidence_id": evidence_id,
+                    "classification": record.get("classification", {}),
+                    "dependencies_cleared": enforcement_passed,
+                    "duplicate_of": original_id if original_id != evidence_id else None,
+                })
+                return evidence_id
             # Classify evidence (only labeling/tagging, not section assignment)
 
 
@@ -7009,7 +7200,7 @@ class EvidenceLocker:
 
 
 
-            evidence_id = self.index_evidence(file_path, classification)
+            evidence_id = self.index_evidence(file_path, classification, content_hash=content_hash)
 
 
 
@@ -8689,7 +8880,7 @@ class EvidenceLocker:
         add_related('section_5')
         return finalize('section_cp', 'other', reason='Unclassified artifact', confidence=0.4)
 
-    def index_evidence(self, file_path, classification):
+    def index_evidence(self, file_path, classification, content_hash: Optional[str] = None):
 
 
 
@@ -8753,7 +8944,9 @@ class EvidenceLocker:
 
 
 
-        evidence_id = f"evidence_{len(self.evidence_index) + 1:04d}"
+        if content_hash is None:
+            content_hash = self._compute_content_hash(file_path)
+        evidence_id = self._content_evidence_id(content_hash, file_path)
 
 
 
@@ -9041,7 +9234,7 @@ class EvidenceLocker:
 
 
 
-        self.evidence_index[evidence_id] = {
+        record = {
 
 
 
@@ -9329,7 +9522,8 @@ class EvidenceLocker:
 
 
 
-            "file_type": Path(file_path).suffix.lower()
+            "file_type": Path(file_path).suffix.lower(),
+            "content_hash": content_hash
 
 
 
@@ -9393,7 +9587,7 @@ class EvidenceLocker:
 
 
 
-        self._update_common_pool_cache(evidence_id, self.evidence_index[evidence_id])
+        self._update_common_pool_cache(evidence_id, record)
         self.logger.info(f"[INDEX] Evidence {evidence_id} indexed to {assigned_section} - {section_metadata.get('title', 'Unknown')}")
 
 
@@ -9938,7 +10132,15 @@ class EvidenceLocker:
 
 
 
+            # Shared OCR cache: the same bytes are only OCR'd once across locker runs and processes
+            ocr_cache = get_ocr_cache()
+            content_hash = self._compute_content_hash(file_path)
+            cached_text = ocr_cache.get(content_hash, 0, "tesseract")
+            if isinstance(cached_text, str):
+                self.logger.info(f"[OCR] Reused cached text for {file_path}")
+                return cached_text
             text = pytesseract.image_to_string(file_path)
+            ocr_cache.put(content_hash, 0, "tesseract", text)
 
 
 
@@ -11122,7 +11324,7 @@ class EvidenceLocker:
 
 
 
-            "evidence_index": self.evidence_index,
+            "evidence_index": dict(self.evidence_index.items()),
 
 
 
@@ -11154,7 +11356,7 @@ class EvidenceLocker:
 
 
 
-            "processing_log": self.processing_log,
+            "processing_log": list(self.processing_log),
 
 
 
@@ -11763,6 +11965,48 @@ class EvidenceLocker:
 
 
             file_ext = os.path.splitext(file_path)[1].lower()
+            # Bytes already in the pool (or with stored artifacts) skip OCR/analysis entirely;
+            # stored artifacts are reused when the first ingest produced any
+            content_hash = self._compute_content_hash(file_path)
+            original_id = self.find_duplicate_evidence(file_path, content_hash) if content_hash else None
+            artifacts = self._load_content_artifacts(content_hash)
+            if original_id or artifacts is not None:
+                if original_id:
+                    evidence_id = self._register_duplicate(file_path, original_id, content_hash)
+                else:
+                    evidence_id = self.index_evidence(file_path, self.classify_evidence(file_path), content_hash=content_hash)
+                    self._update_common_pool_cache(evidence_id, {"artifacts_path": str(self._artifact_path(content_hash))})
+                processing_result = {
+                    'ocr_text': '',
+                    'video_analysis': {},
+                    'document_structure': [],
+                }
+                processing_result.update(artifacts or {})
+                processing_result.update({
+                    'file_path': file_path,
+                    'file_type': file_ext,
+                    'processed_at': datetime.now().isoformat(),
+                    'classification': self.evidence_index.get(evidence_id, {}).get('classification', (artifacts or {}).get('classification') or {}),
+                    'evidence_id': evidence_id,
+                    'content_hash': content_hash,
+                    'tools_used': [],
+                    'deduplicated': True,
+                    'artifacts_reused': artifacts is not None,
+                })
+                if original_id and original_id != evidence_id:
+                    processing_result['duplicate_of'] = original_id
+                self.processing_log.append({
+                    'timestamp': datetime.now().isoformat(),
+                    'file_path': file_path,
+                    'evidence_id': evidence_id,
+                    'tools_used': [],
+                    'status': 'deduplicated'
+                })
+                if artifacts is not None:
+                    self.logger.info(f"[DEDUP] Reused artifacts for {file_path} ({evidence_id})")
+                else:
+                    self.logger.info(f"[DEDUP] {file_path} is already in the pool as {original_id}, no stored artifacts to reuse")
+                return processing_result
 
 
 
@@ -12914,7 +13158,7 @@ class EvidenceLocker:
 
 
 
-            evidence_id = self.index_evidence(file_path, classification)
+            evidence_id = self.index_evidence(file_path, classification, content_hash=content_hash)
 
 
 
@@ -12947,6 +13191,7 @@ class EvidenceLocker:
 
 
             processing_result['evidence_id'] = evidence_id
+            self._store_content_artifacts(evidence_id, content_hash, processing_result)
 
 
 
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Manifest Index - In-memory secondary indexes over the Evidence Locker common pool
+Caches normalized manifest entries and keeps section / tag / file type lookups
+so pool queries cost O(result size) instead of a full manifest scan, plus a
+content hash lookup used for ingest-time deduplication.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+# (primary section, related sections, lowercased tags, file type)
+EntryKeys = Tuple[str, FrozenSet[str], FrozenSet[str], str]
+
+
+def extract_entry_keys(entry: Dict[str, Any]) -> EntryKeys:
+    """Derive the lookup keys for a normalized manifest entry."""
+    primary = str(entry.get("assigned_section") or entry.get("section_hint") or "")
+    related = frozenset(str(candidate) for candidate in entry.get("related_sections") or [])
+    tags: Set[str] = {str(tag).lower() for tag in entry.get("tags") or []}
+    classification = entry.get("classification")
+    if isinstance(classification, dict):
+        tags.update(str(tag).lower() for tag in classification.get("tags") or [])
+    file_type = str(entry.get("file_type") or "").lower()
+    return primary, related, frozenset(tags), file_type
+
+
+class ManifestQueryIndex:
+    """Normalized entry cache with inverted section/tag/file type indexes"""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, EntryKeys] = {}
+        # Insertion sequence per evidence id keeps query results in pool order
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self._by_section: Dict[str, Dict[str, int]] = {}
+        self._by_related: Dict[str, Dict[str, int]] = {}
+        self._by_tag: Dict[str, Dict[str, int]] = {}
+        self._by_file_type: Dict[str, Dict[str, int]] = {}
+        # content hash -> evidence id of the first (non-duplicate) ingest of those bytes
+        self._by_content_hash: Dict[str, str] = {}
+        self._dirty_buckets: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, evidence_id: object) -> bool:
+        return evidence_id in self._entries
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys.clear()
+        self._seq.clear()
+        self._next_seq = 0
+        self._by_section.clear()
+        self._by_related.clear()
+        self._by_tag.clear()
+        self._by_file_type.clear()
+        self._by_content_hash.clear()
+        self._dirty_buckets.clear()
+
+    def get(self, evidence_id: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(evidence_id)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return list(self._entries.values())
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[str]:
+        """Evidence id of the original ingest of content_hash, if known."""
+        return self._by_content_hash.get(content_hash) if content_hash else None
+
+    def _add_to_bucket(self, index: Dict[str, Dict[str, int]], key: str, evidence_id: str, seq: int) -> None:
+        bucket = index.setdefault(key, {})
+        if bucket and next(reversed(bucket.values())) > seq:
+            self._dirty_buckets.add(id(bucket))
+        bucket[evidence_id] = seq
+
+    @staticmethod
+    def _remove_from_bucket(index: Dict[str, Dict[str, int]], key: str, evidence_id: str) -> None:
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.pop(evidence_id, None)
+        if not bucket:
+            index.pop(key, None)
+
+    def _unlink(self, evidence_id: str, keys: EntryKeys) -> None:
+        primary, related, tags, file_type = keys
+        self._remove_from_bucket(self._by_section, primary, evidence_id)
+        for section in related:
+            self._remove_from_bucket(self._by_related, section, evidence_id)
+        for tag in tags:
+            self._remove_from_bucket(self._by_tag, tag, evidence_id)
+        self._remove_from_bucket(self._by_file_type, file_type, evidence_id)
+
+    def upsert(self, evidence_id: str, entry: Dict[str, Any]) -> None:
+        """Replace the cached entry for evidence_id and re-link only the keys that changed."""
+        new_keys = extract_entry_keys(entry)
+        old_keys = self._keys.get(evidence_id)
+        seq = self._seq.get(evidence_id)
+        if seq is None:
+            seq = self._seq[evidence_id] = self._next_seq
+            self._next_seq += 1
+        self._entries[evidence_id] = entry
+        self._keys[evidence_id] = new_keys
+        content_hash = entry.get("content_hash")
+        if content_hash and not entry.get("duplicate_of"):
+            self._by_content_hash.setdefault(str(content_hash), evidence_id)
+        if old_keys == new_keys:
+            return
+        if old_keys is not None:
+            self._unlink(evidence_id, old_keys)
+        primary, related, tags, file_type = new_keys
+        self._add_to_bucket(self._by_section, primary, evidence_id, seq)
+        for section in related:
+            self._add_to_bucket(self._by_related, section, evidence_id, seq)
+        for tag in tags:
+            self._add_to_bucket(self._by_tag, tag, evidence_id, seq)
+        self._add_to_bucket(self._by_file_type, file_type, evidence_id, seq)
+
+    def discard(self, evidence_id: str) -> None:
+        keys = self._keys.pop(evidence_id, None)
+        entry = self._entries.pop(evidence_id, None) or {}
+        self._seq.pop(evidence_id, None)
+        content_hash = entry.get("content_hash")
+        if content_hash and self._by_content_hash.get(content_hash) == evidence_id:
+            self._by_content_hash.pop(content_hash, None)
+        if keys is not None:
+            self._unlink(evidence_id, keys)
+
+    def _ordered(self, bucket: Dict[str, int]) -> Iterable[Tuple[str, int]]:
+        if id(bucket) in self._dirty_buckets:
+            ordered = sorted(bucket.items(), key=lambda item: item[1])
+            bucket.clear()
+            bucket.update(ordered)
+            self._dirty_buckets.discard(id(bucket))
+        return bucket.items()
+
+    def _stream(self, buckets: List[Dict[str, int]]) -> Iterator[str]:
+        """Merge ordered buckets lazily, yielding each evidence id once."""
+        if len(buckets) == 1:
+            for evidence_id, _ in self._ordered(buckets[0]):
+                yield evidence_id
+            return
+        last_seq = -1
+        merged = heapq.merge(*(self._ordered(bucket) for bucket in buckets), key=lambda item: item[1])
+        for evidence_id, seq in merged:
+            if seq != last_seq:
+                last_seq = seq
+                yield evidence_id
+
+    def query(self, *, section: Optional[str] = None, tags: Optional[Set[str]] = None,
+              include_related: bool = True, file_types: Optional[Set[str]] = None,
+              limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield cached entries matching every filter, in pool order, stopping at limit."""
+        candidates: List[Tuple[int, List[Dict[str, int]]]] = []
+        if section:
+            buckets = [self._by_section.get(section) or {}]
+            if include_related:
+                buckets.append(self._by_related.get(section) or {})
+            candidates.append((sum(len(b) for b in buckets), buckets))
+        if tags:
+            buckets = [self._by_tag[tag] for tag in tags if tag in self._by_tag]
+            candidates.append((sum(len(b) for b in buckets), buckets))
+        if file_types:
+            buckets = [self._by_file_type[ft] for ft in file_types if ft in self._by_file_type]
+            candidates.append((sum(len(b) for b in buckets), buckets))
+
+        if candidates:
+            # Drive the scan from the most selective filter and test the rest per entry
+            _, driver = min(candidates, key=lambda candidate: candidate[0])
+            driver = [bucket for bucket in driver if bucket]
+            if not driver:
+                return
+            id_stream: Iterable[str] = self._stream(driver)
+        else:
+            id_stream = iter(self._entries)
+
+        produced = 0
+        for evidence_id in id_stream:
+            primary, related, entry_tags, file_type = self._keys[evidence_id]
+            if section and primary != section and not (include_related and section in related):
+                continue
+            if tags and not entry_tags.intersection(tags):
+                continue
+            if file_types and file_type not in file_types:
+                continue
+            yield self._entries[evidence_id]
+            produced += 1
+            if limit and produced >= limit:
+                return
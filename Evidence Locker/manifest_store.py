@@ -0,0 +1,667 @@
+#!/usr/bin/env python3
+"""
+Manifest Store - Persistence backends for the Evidence Locker manifest
+Keeps evidence_manifest.json as the exported format while letting writes
+persist one entry at a time instead of rewriting the whole manifest.
+
+With the default SQLite backend the database is the live manifest: records and
+pool lookups are read from it on demand, and evidence_manifest.json is only
+rewritten by compact()/export(). Readers outside the locker should go through
+EvidenceLocker.get_structured_manifest() or call export_manifest() first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from manifest_index import extract_entry_keys
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Backend selection (override with DKI_MANIFEST_BACKEND=wal or json for the file-based stores)
+DEFAULT_BACKEND = "sqlite"
+# Minimum number of WAL records before a compaction is considered
+DEFAULT_COMPACT_MIN_RECORDS = 500
+# Records kept in memory by the SQLite-backed views
+DEFAULT_RECORD_CACHE_SIZE = 1024
+
+SnapshotProvider = Callable[[], List[Dict[str, Any]]]
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    evidence_id TEXT PRIMARY KEY,
+    entry TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS entry_keys (
+    evidence_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entry_keys_lookup ON entry_keys (kind, key);
+CREATE INDEX IF NOT EXISTS entry_keys_owner ON entry_keys (evidence_id);
+"""
+
+
+
+def build_manifest_payload(entries: List[Dict[str, Any]], updated_at: Optional[str] = None) -> Dict[str, Any]:
+    """Build the evidence_manifest.json payload for a list of normalized entries."""
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "updated_at": updated_at or datetime.now().isoformat(),
+        "evidence_count": len(entries),
+        "entries": entries,
+    }
+
+
+def write_manifest_file(path: Path, payload: Dict[str, Any]) -> None:
+    """Atomically write a manifest payload (temp file + replace)."""
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, ensure_ascii=False)
+        temp_path.replace(path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_manifest_file(path: Path) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+    """Read a manifest file into {evidence_id: record}; supports the legacy evidence_index layout."""
+    records: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return records, None
+    with path.open("r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    entries = data.get("entries")
+    if isinstance(entries, list):
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            evidence_id = entry.get("evidence_id")
+            if not evidence_id:
+                continue
+            record = dict(entry)
+            record.pop("evidence_id", None)
+            records[str(evidence_id)] = record
+    else:
+        legacy_index = data.get("evidence_index")
+        if isinstance(legacy_index, dict):
+            for evidence_id, record in legacy_index.items():
+                records[str(evidence_id)] = dict(record) if isinstance(record, dict) else {}
+    return records, data.get("updated_at")
+
+
+def replay_wal(wal_path: Path, records: Dict[str, Dict[str, Any]],
+               updated_at: Optional[str] = None) -> Tuple[Optional[str], int]:
+    """Apply the put/clear records of a WAL file to records in place; returns (updated_at, records replayed)."""
+    replayed = 0
+    if not wal_path.exists():
+        return updated_at, replayed
+    with wal_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn tail from an interrupted append - everything before it is intact
+                logger.warning("Skipping unreadable WAL record in %s", wal_path)
+                continue
+            op = record.get("op")
+            if op == "put" and record.get("evidence_id"):
+                entry = dict(record.get("entry") or {})
+                entry.pop("evidence_id", None)
+                records[str(record["evidence_id"])] = entry
+            elif op == "clear":
+                records.clear()
+            updated_at = record.get("ts") or updated_at
+            replayed += 1
+    return updated_at, replayed
+
+
+class ManifestStore(ABC):
+    """Base manifest backend - subclasses decide how individual writes reach disk"""
+
+    backend_name = "base"
+    # True when records can be read one at a time (see SqliteRecordMap / SqliteQueryIndex)
+    supports_lookup = False
+
+    def __init__(self, manifest_path: Path, snapshot_provider: SnapshotProvider):
+        self.manifest_path = Path(manifest_path)
+        self.snapshot_provider = snapshot_provider
+        self.logger = logging.getLogger(__name__)
+
+    def load(self) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+        """Return ({evidence_id: record}, updated_at) for the persisted manifest."""
+        return read_manifest_file(self.manifest_path)
+
+    @abstractmethod
+    def put(self, evidence_id: str, entry: Dict[str, Any]) -> str:
+        """Persist a single normalized entry; returns the write timestamp."""
+
+    def clear(self) -> str:
+        """Drop every persisted entry; returns the write timestamp."""
+        updated_at = datetime.now().isoformat()
+        write_manifest_file(self.manifest_path, build_manifest_payload([], updated_at))
+        return updated_at
+
+    def compact(self) -> str:
+        """Rewrite the manifest file from the live snapshot."""
+        updated_at = datetime.now().isoformat()
+        write_manifest_file(self.manifest_path, build_manifest_payload(self._export_entries(), updated_at))
+        return updated_at
+
+    def _export_entries(self) -> List[Dict[str, Any]]:
+        """Normalized entries, sorted by evidence id, for evidence_manifest.json."""
+        return self.snapshot_provider()
+
+    def export(self, output_path: Optional[Path] = None) -> Path:
+        """Write the current manifest in evidence_manifest.json format."""
+        target = Path(output_path) if output_path else self.manifest_path
+        if target == self.manifest_path:
+            self.compact()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            write_manifest_file(target, build_manifest_payload(self._export_entries()))
+        return target
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend_name, "path": str(self.manifest_path)}
+
+    def close(self) -> None:
+        """Release any handles the backend keeps open."""
+
+
+class JsonManifestStore(ManifestStore):
+    """Legacy backend - every write rewrites the full sorted manifest"""
+
+    backend_name = "json"
+
+    def put(self, evidence_id: str, entry: Dict[str, Any]) -> str:
+        return self.compact()
+
+
+class WalManifestStore(ManifestStore):
+    """Write-ahead log backend - one appended line per write, periodic compaction into the manifest"""
+
+    backend_name = "wal"
+
+    def __init__(self, manifest_path: Path, snapshot_provider: SnapshotProvider, *,
+                 compact_min_records: int = DEFAULT_COMPACT_MIN_RECORDS, fsync: bool = False):
+        super().__init__(manifest_path, snapshot_provider)
+        self.wal_path = self.manifest_path.with_suffix(self.manifest_path.suffix + ".wal")
+        self.compact_min_records = max(1, int(compact_min_records))
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._known_ids: set = set()
+        self._pending_records = 0
+        self._compactions = 0
+
+    def load(self) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+        records, updated_at = read_manifest_file(self.manifest_path)
+        updated_at, replayed = replay_wal(self.wal_path, records, updated_at)
+        with self._lock:
+            self._known_ids = set(records)
+            self._pending_records = replayed
+        if replayed:
+            self.logger.info("[MANIFEST] Replayed %d WAL records from %s", replayed, self.wal_path)
+        return records, updated_at
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self.wal_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            handle.write("\n")
+            if self.fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def _should_compact(self) -> bool:
+        # Compacting once the log outgrows the live entry count keeps writes amortized O(1)
+        return self._pending_records >= max(self.compact_min_records, len(self._known_ids))
+
+    def put(self, evidence_id: str, entry: Dict[str, Any]) -> str:
+        updated_at = datetime.now().isoformat()
+        with self._lock:
+            self._append({"op": "put", "evidence_id": evidence_id, "entry": entry, "ts": updated_at})
+            self._known_ids.add(evidence_id)
+            self._pending_records += 1
+            should_compact = self._should_compact()
+        if should_compact:
+            return self.compact()
+        return updated_at
+
+    def clear(self) -> str:
+        with self._lock:
+            updated_at = super().clear()
+            self.wal_path.unlink(missing_ok=True)
+            self._known_ids.clear()
+            self._pending_records = 0
+        return updated_at
+
+    def compact(self) -> str:
+        with self._lock:
+            entries = self.snapshot_provider()
+            updated_at = datetime.now().isoformat()
+            write_manifest_file(self.manifest_path, build_manifest_payload(entries, updated_at))
+            # A crash before this truncate only replays idempotent puts over the new snapshot
+            self.wal_path.unlink(missing_ok=True)
+            self._known_ids = {str(entry.get("evidence_id")) for entry in entries if entry.get("evidence_id")}
+            self._pending_records = 0
+            self._compactions += 1
+        return updated_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        with self._lock:
+            stats.update({
+                "wal_path": str(self.wal_path),
+                "pending_records": self._pending_records,
+                "entry_count": len(self._known_ids),
+                "compactions": self._compactions,
+            })
+        return stats
+
+
+class SqliteManifestStore(ManifestStore):
+    """Embedded SQLite backend - one upserted row per write, read one record at a time
+
+    The database is the live manifest: records, the section/tag/file type keys and the
+    content hash lookup are queried by evidence id instead of being loaded up front.
+    evidence_manifest.json is only written on compact()/export(). A manifest (and WAL)
+    left by the file-based backends is imported once, the first time the database is opened.
+    """
+
+    backend_name = "sqlite"
+    supports_lookup = True
+
+    def __init__(self, manifest_path: Path, snapshot_provider: SnapshotProvider, *,
+                 database_path: Optional[Path] = None):
+        super().__init__(manifest_path, snapshot_provider)
+        self.database_path = Path(database_path) if database_path else self.manifest_path.with_suffix(".sqlite3")
+        self._lock = threading.Lock()
+        self._exports = 0
+        self._conn = sqlite3.connect(str(self.database_path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+        if self._meta("imported") is None:
+            self._import_file_manifest()
+        elif self._meta("keys_built") is None:
+            self._rebuild_keys()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        self._conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                           "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, value))
+
+    def _transaction(self, work: Callable[[], None]) -> None:
+        """Run work inside BEGIN IMMEDIATE/COMMIT (caller must hold _lock)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            work()
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _key_rows(evidence_id: str, entry: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+        """entry_keys rows for a normalized entry (mirrors ManifestQueryIndex)."""
+        primary, related, tags, file_type = extract_entry_keys(entry)
+        rows = [(evidence_id, "section", primary), (evidence_id, "file_type", file_type)]
+        rows.extend((evidence_id, "related", section) for section in related)
+        rows.extend((evidence_id, "tag", tag) for tag in tags)
+        content_hash = entry.get("content_hash")
+        if content_hash and not entry.get("duplicate_of"):
+            rows.append((evidence_id, "content_hash", str(content_hash)))
+        return rows
+
+    def _write_entry(self, evidence_id: str, entry: Dict[str, Any]) -> None:
+        # Upsert keeps the rowid, so an updated entry keeps its place in pool order
+        self._conn.execute("INSERT INTO entries (evidence_id, entry) VALUES (?, ?) "
+                           "ON CONFLICT(evidence_id) DO UPDATE SET entry = excluded.entry",
+                           (evidence_id, self._encode(evidence_id, entry)))
+        self._conn.execute("DELETE FROM entry_keys WHERE evidence_id = ?", (evidence_id,))
+        self._conn.executemany("INSERT INTO entry_keys (evidence_id, kind, key) VALUES (?, ?, ?)",
+                               self._key_rows(evidence_id, entry))
+
+    def _import_file_manifest(self) -> None:
+        wal_path = self.manifest_path.with_suffix(self.manifest_path.suffix + ".wal")
+        records, updated_at = read_manifest_file(self.manifest_path)
+        updated_at, _ = replay_wal(wal_path, records, updated_at)
+
+        def _import() -> None:
+            for evidence_id, record in records.items():
+                self._write_entry(evidence_id, record)
+            self._set_meta("updated_at", updated_at)
+            self._set_meta("imported", datetime.now().isoformat())
+            self._set_meta("keys_built", datetime.now().isoformat())
+
+        with self._lock:
+            self._transaction(_import)
+        # The log is now part of the database; the manifest file stays as the last export
+        wal_path.unlink(missing_ok=True)
+        if records:
+            self.logger.info("[MANIFEST] Imported %d entries from %s into %s", len(records),
+                             self.manifest_path, self.database_path)
+
+    def _rebuild_keys(self) -> None:
+        """One-time key table build for databases written before the lookup keys existed."""
+        def _rebuild() -> None:
+            self._conn.execute("DELETE FROM entry_keys")
+            for evidence_id, payload in self._conn.execute("SELECT evidence_id, entry FROM entries").fetchall():
+                self._conn.executemany("INSERT INTO entry_keys (evidence_id, kind, key) VALUES (?, ?, ?)",
+                                       self._key_rows(evidence_id, json.loads(payload)))
+            self._set_meta("keys_built", datetime.now().isoformat())
+
+        with self._lock:
+            self._transaction(_rebuild)
+
+    @staticmethod
+    def _encode(evidence_id: str, entry: Dict[str, Any]) -> str:
+        record = {"evidence_id": evidence_id}
+        record.update(entry)
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+    def load(self) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+        records: Dict[str, Dict[str, Any]] = {}
+        for entry in self.iter_entries():
+            evidence_id = entry.pop("evidence_id")
+            records[evidence_id] = entry
+        return records, self.updated_at()
+
+    def updated_at(self) -> Optional[str]:
+        with self._lock:
+            return self._meta("updated_at")
+
+    def get_entry(self, evidence_id: str) -> Optional[Dict[str, Any]]:
+        """Normalized entry (including evidence_id) for one id, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT entry FROM entries WHERE evidence_id = ?", (evidence_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def contains(self, evidence_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM entries WHERE evidence_id = ?", (evidence_id,)).fetchone() is not None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def iter_ids(self) -> Iterator[str]:
+        """Evidence ids in pool (insertion) order."""
+        with self._lock:
+            rows = self._conn.execute("SELECT evidence_id FROM entries ORDER BY rowid").fetchall()
+        return (row[0] for row in rows)
+
+    def iter_entries(self, order_by: str = "rowid") -> Iterator[Dict[str, Any]]:
+        """Stream normalized entries in pool order (or by evidence_id), decoding one row at a time."""
+        if order_by not in ("rowid", "evidence_id"):
+            raise ValueError(f"Unsupported order: {order_by}")
+        with self._lock:
+            rows = self._conn.execute(f"SELECT entry FROM entries ORDER BY {order_by}").fetchall()
+        return (json.loads(payload) for (payload,) in rows)
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[str]:
+        """Evidence id of the first non-duplicate entry with content_hash, if any."""
+        if not content_hash:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT k.evidence_id FROM entry_keys k JOIN entries e ON e.evidence_id = k.evidence_id "
+                "WHERE k.kind = 'content_hash' AND k.key = ? ORDER BY e.rowid LIMIT 1", (content_hash,)).fetchone()
+        return row[0] if row else None
+
+    def query(self, *, section: Optional[str] = None, tags: Optional[Set[str]] = None,
+              include_related: bool = True, file_types: Optional[Set[str]] = None,
+              limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Entries matching every filter, in pool order - same semantics as ManifestQueryIndex.query."""
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        def _key_clause(kinds: List[str], keys: List[str]) -> None:
+            clauses.append("e.evidence_id IN (SELECT evidence_id FROM entry_keys WHERE kind IN (%s) AND key IN (%s))"
+                           % (",".join("?" * len(kinds)), ",".join("?" * len(keys))))
+            params.extend(kinds)
+            params.extend(keys)
+
+        if section:
+            _key_clause(["section", "related"] if include_related else ["section"], [section])
+        if tags:
+            _key_clause(["tag"], sorted(tags))
+        if file_types:
+            _key_clause(["file_type"], sorted(file_types))
+        sql = "SELECT e.entry FROM entries e"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY e.rowid"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return (json.loads(payload) for (payload,) in rows)
+
+    def put(self, evidence_id: str, entry: Dict[str, Any]) -> str:
+        updated_at = datetime.now().isoformat()
+
+        def _put() -> None:
+            self._write_entry(evidence_id, entry)
+            self._set_meta("updated_at", updated_at)
+
+        with self._lock:
+            self._transaction(_put)
+        return updated_at
+
+    def clear(self) -> str:
+        with self._lock:
+            updated_at = super().clear()
+
+            def _clear() -> None:
+                self._conn.execute("DELETE FROM entries")
+                self._conn.execute("DELETE FROM entry_keys")
+                self._set_meta("updated_at", updated_at)
+
+            self._transaction(_clear)
+        return updated_at
+
+    def _export_entries(self) -> List[Dict[str, Any]]:
+        # Every write already reached the table, so it is the snapshot
+        return list(self.iter_entries(order_by="evidence_id"))
+
+    def compact(self) -> str:
+        """Export the stored entries to the manifest file; the table itself needs no rewrite."""
+        entries = self._export_entries()
+        with self._lock:
+            updated_at = datetime.now().isoformat()
+            write_manifest_file(self.manifest_path, build_manifest_payload(entries, updated_at))
+            self._set_meta("updated_at", updated_at)
+            self._exports += 1
+        return updated_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        with self._lock:
+            stats.update({
+                "database_path": str(self.database_path),
+                "entry_count": self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0],
+                "exports": self._exports,
+            })
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _EntryCache:
+    """Thread-safe LRU of decoded records for the SQLite-backed views"""
+
+    def __init__(self, size: int):
+        self._size = max(1, int(size))
+        self._items: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, evidence_id: object) -> bool:
+        with self._lock:
+            return evidence_id in self._items
+
+    def get(self, evidence_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._items.get(evidence_id)
+            if record is not None:
+                self._items.move_to_end(evidence_id)
+            return record
+
+    def put(self, evidence_id: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._items[evidence_id] = record
+            self._items.move_to_end(evidence_id)
+            while len(self._items) > self._size:
+                self._items.popitem(last=False)
+
+    def pop(self, evidence_id: str) -> None:
+        with self._lock:
+            self._items.pop(evidence_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+class SqliteRecordMap(MutableMapping):
+    """evidence_index view over a SqliteManifestStore - records are fetched by id and kept in a small LRU
+
+    Writes only update the cache; the locker persists every write through the store right
+    after, so iteration and len() come from the database.
+    """
+
+    def __init__(self, store: SqliteManifestStore, cache_size: int = DEFAULT_RECORD_CACHE_SIZE):
+        self._store = store
+        self._cache = _EntryCache(cache_size)
+
+    def __getitem__(self, evidence_id: str) -> Dict[str, Any]:
+        record = self._cache.get(evidence_id)
+        if record is not None:
+            return record
+        record = self._store.get_entry(evidence_id)
+        if record is None:
+            raise KeyError(evidence_id)
+        record.pop("evidence_id", None)
+        self._cache.put(evidence_id, record)
+        return record
+
+    def __setitem__(self, evidence_id: str, record: Dict[str, Any]) -> None:
+        self._cache.put(evidence_id, record)
+
+    def __delitem__(self, evidence_id: str) -> None:
+        raise TypeError("Evidence records are removed by clearing the manifest store")
+
+    def __contains__(self, evidence_id: object) -> bool:
+        if evidence_id in self._cache:
+            return True
+        return isinstance(evidence_id, str) and self._store.contains(evidence_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._store.iter_ids()
+
+    def __len__(self) -> int:
+        return self._store.count()
+
+    def values(self) -> Iterator[Dict[str, Any]]:  # type: ignore[override]
+        # Streamed from the table without filling the cache
+        for record in self._store.iter_entries():
+            record.pop("evidence_id", None)
+            yield record
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:  # type: ignore[override]
+        for record in self._store.iter_entries():
+            yield record.pop("evidence_id"), record
+
+    def clear(self) -> None:
+        """Drop cached records; the caller clears the store itself."""
+        self._cache.clear()
+
+
+class SqliteQueryIndex:
+    """ManifestQueryIndex counterpart that answers pool queries from the SQLite key table"""
+
+    def __init__(self, store: SqliteManifestStore, cache_size: int = DEFAULT_RECORD_CACHE_SIZE):
+        self._store = store
+        self._cache = _EntryCache(cache_size)
+
+    def __len__(self) -> int:
+        return self._store.count()
+
+    def __contains__(self, evidence_id: object) -> bool:
+        if evidence_id in self._cache:
+            return True
+        return isinstance(evidence_id, str) and self._store.contains(evidence_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def get(self, evidence_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(evidence_id)
+        if entry is None:
+            entry = self._store.get_entry(evidence_id)
+            if entry is not None:
+                self._cache.put(evidence_id, entry)
+        return entry
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return list(self._store.iter_entries())
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[str]:
+        return self._store.find_by_content_hash(content_hash)
+
+    def upsert(self, evidence_id: str, entry: Dict[str, Any]) -> None:
+        # The key table is updated by the store.put() that follows every upsert
+        self._cache.put(evidence_id, entry)
+
+    def discard(self, evidence_id: str) -> None:
+        self._cache.pop(evidence_id)
+
+    def query(self, **filters: Any) -> Iterator[Dict[str, Any]]:
+        return self._store.query(**filters)
+
+
+MANIFEST_BACKENDS = {
+    JsonManifestStore.backend_name: JsonManifestStore,
+    WalManifestStore.backend_name: WalManifestStore,
+    SqliteManifestStore.backend_name: SqliteManifestStore,
+}
+
+
+def create_manifest_store(manifest_path: Path, snapshot_provider: SnapshotProvider,
+                          backend: Optional[str] = None, **options: Any) -> ManifestStore:
+    """Instantiate the configured manifest backend (DKI_MANIFEST_BACKEND, default 'sqlite')."""
+    backend_name = (backend or os.getenv("DKI_MANIFEST_BACKEND") or DEFAULT_BACKEND).strip().lower()
+    store_cls = MANIFEST_BACKENDS.get(backend_name)
+    if store_cls is None:
+        logger.warning("Unknown manifest backend '%s', falling back to '%s'", backend_name, DEFAULT_BACKEND)
+        store_cls = MANIFEST_BACKENDS[DEFAULT_BACKEND]
+    if store_cls is not JsonManifestStore:
+        return store_cls(manifest_path, snapshot_provider, **options)
+    return store_cls(manifest_path, snapshot_provider)
@@ -6,8 +6,8 @@ import json
 import logging
 import os
 import re
+import sys
 import zipfile
-import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
@@ -23,6 +23,11 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
+# Shared Data Bus modules (file_hashing, ocr_cache)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from file_hashing import hash_file_digests
+from ocr_cache import cached_file_ocr
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -337,9 +342,8 @@ class MetadataToolV5:
 
     @staticmethod
     def hash_file(path: str) -> Tuple[str, str]:
-        with open(path, "rb") as handle:
-            data = handle.read()
-        return hashlib.md5(data).hexdigest(), hashlib.sha256(data).hexdigest()
+        digests = hash_file_digests(path, ("md5", "sha256"))
+        return digests["md5"], digests["sha256"]
 
     @classmethod
     def process_zip(cls, zip_path: str, output_dir: str) -> Dict[str, Any]:
@@ -856,13 +860,14 @@ def get_report_config(contract_history):
     }
 
 # === OCR Processing Functions ===
+# Successful extractions go through the shared OCR cache, so section rebuilds reuse them
 def extract_text_from_pdf(path):
     """Extract text from PDF using Unstructured"""
     if not OCR_AVAILABLE:
         return "OCR not available"
     try:
-        elements = partition_pdf(filename=path)
-        return "\n".join([e.text for e in elements if hasattr(e, 'text')])
+        return cached_file_ocr(path, "unstructured_pdf", lambda: "\n".join(
+            [e.text for e in partition_pdf(filename=path) if hasattr(e, 'text')]), expected_type=str)
     except Exception as e:
         return f"PDF extraction failed: {str(e)}"
 
@@ -871,8 +876,10 @@ def extract_text_from_image(img_path):
     if not OCR_AVAILABLE:
         return "OCR not available"
     try:
-        image = Image.open(img_path)
-        return pytesseract.image_to_string(image)
+        def run():
+            with Image.open(img_path) as image:
+                return pytesseract.image_to_string(image)
+        return cached_file_ocr(img_path, "tesseract", run, expected_type=str)
     except Exception as e:
         return f"Image OCR failed: {str(e)}"
 
@@ -881,9 +888,8 @@ def easyocr_text(img_path):
     if not OCR_AVAILABLE:
         return "OCR not available"
     try:
-        reader = easyocr.Reader(['en'])
-        result = reader.readtext(img_path, detail=0)
-        return " ".join(result)
+        return cached_file_ocr(img_path, "easyocr", lambda: " ".join(
+            easyocr.Reader(['en']).readtext(img_path, detail=0)), language="en", expected_type=str)
     except Exception as e:
         return f"EasyOCR failed: {str(e)}"
 
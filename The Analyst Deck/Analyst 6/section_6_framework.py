@@ -6,8 +6,8 @@ import json
 import logging
 import os
 import re
+import sys
 import zipfile
-import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Set
@@ -23,6 +23,10 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
+# Shared Data Bus modules (file_hashing)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from file_hashing import hash_file_digests
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -389,9 +393,8 @@ class MetadataToolV5:
 
     @staticmethod
     def hash_file(path: str) -> Tuple[str, str]:
-        with open(path, "rb") as handle:
-            data = handle.read()
-        return hashlib.md5(data).hexdigest(), hashlib.sha256(data).hexdigest()
+        digests = hash_file_digests(path, ("md5", "sha256"))
+        return digests["md5"], digests["sha256"]
 
     @classmethod
     def process_zip(cls, zip_path: str, output_dir: str) -> Dict[str, Any]:
@@ -6,8 +6,8 @@ import json
 import logging
 import os
 import re
+import sys
 import zipfile
-import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
@@ -22,6 +22,11 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
+# Shared Data Bus modules (file_hashing, perceptual_hash)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from file_hashing import hash_file_digests
+from perceptual_hash import dedupe_timed_items
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -459,9 +464,8 @@ class MetadataToolV5:
 
     @staticmethod
     def hash_file(path: str) -> Tuple[str, str]:
-        with open(path, "rb") as handle:
-            data = handle.read()
-        return hashlib.md5(data).hexdigest(), hashlib.sha256(data).hexdigest()
+        digests = hash_file_digests(path, ("md5", "sha256"))
+        return digests["md5"], digests["sha256"]
 
     @classmethod
     def process_zip(cls, zip_path: str, output_dir: str) -> Dict[str, Any]:
@@ -787,6 +791,7 @@ class Section8Renderer:
                     'kind': kind,
                     'path': fi.get('path'),
                     'file_hash': data.get('file_hash'),
+                    'perceptual_hash': data.get('frame_hashes') or data.get('perceptual_hash'),
                     'dimensions': (w, h) if w and h else None,
                     'captured_at': ts,
                     'processing_timestamp': data.get('processing_timestamp'),
@@ -822,27 +827,7 @@ class Section8Renderer:
         return ok
 
     def _dedupe_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        seen_hash = set()
-        kept: List[Dict[str, Any]] = []
-        for it in sorted(items, key=lambda x: (x.get('captured_at') or x.get('processing_timestamp') or '')):
-            fh = it.get('file_hash')
-            dims = it.get('dimensions')
-            ts = self._to_dt(it.get('captured_at') or it.get('processing_timestamp'))
-            if fh and fh in seen_hash:
-                continue
-            near_dup = False
-            for prev in kept:
-                if dims and prev.get('dimensions') == dims:
-                    pts = self._to_dt(prev.get('captured_at') or prev.get('processing_timestamp'))
-                    if ts and pts and abs((ts - pts).total_seconds()) <= 2:
-                        near_dup = True
-                        break
-            if near_dup:
-                continue
-            if fh:
-                seen_hash.add(fh)
-            kept.append(it)
-        return kept
+        return dedupe_timed_items(items, self._to_dt)
 
     def _is_relevant(self, item: Dict[str, Any], sec3: Dict[str, Any], sec4: Dict[str, Any]) -> bool:
         # Heuristic continuity: if capture time falls within any session/log window extracted from text
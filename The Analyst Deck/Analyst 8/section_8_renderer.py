@@ -18,6 +18,11 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import logging
 import os
+import sys
+
+# Shared Data Bus modules (perceptual_hash)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from perceptual_hash import dedupe_timed_items
 
 logger = logging.getLogger(__name__)
 
@@ -165,6 +170,7 @@ class Section8Renderer:
                     'kind': kind,
                     'path': fi.get('path'),
                     'file_hash': data.get('file_hash'),
+                    'perceptual_hash': data.get('frame_hashes') or data.get('perceptual_hash'),
                     'dimensions': (w, h) if w and h else None,
                     'captured_at': ts,
                     'processing_timestamp': data.get('processing_timestamp'),
@@ -200,27 +206,7 @@ class Section8Renderer:
         return ok
 
     def _dedupe_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        seen_hash = set()
-        kept: List[Dict[str, Any]] = []
-        for it in sorted(items, key=lambda x: (x.get('captured_at') or x.get('processing_timestamp') or '')):
-            fh = it.get('file_hash')
-            dims = it.get('dimensions')
-            ts = self._to_dt(it.get('captured_at') or it.get('processing_timestamp'))
-            if fh and fh in seen_hash:
-                continue
-            near_dup = False
-            for prev in kept:
-                if dims and prev.get('dimensions') == dims:
-                    pts = self._to_dt(prev.get('captured_at') or prev.get('processing_timestamp'))
-                    if ts and pts and abs((ts - pts).total_seconds()) <= 2:
-                        near_dup = True
-                        break
-            if near_dup:
-                continue
-            if fh:
-                seen_hash.add(fh)
-            kept.append(it)
-        return kept
+        return dedupe_timed_items(items, self._to_dt)
 
     def _is_relevant(self, item: Dict[str, Any], sec3: Dict[str, Any], sec4: Dict[str, Any]) -> bool:
         # Heuristic continuity: if capture time falls within any session/log window extracted from text
@@ -10,7 +10,8 @@ import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 import time
 
@@ -25,14 +26,52 @@ ADDITIONAL_PATHS = [
     REPO_ROOT / 'Processors',
     REPO_ROOT / 'Gateway',
     REPO_ROOT / 'Tools',
+    REPO_ROOT.parent / 'Command Center' / 'Data Bus',
 ]
 for candidate in ADDITIONAL_PATHS:
     candidate_str = str(candidate)
     if candidate.exists() and candidate_str not in sys.path:
         sys.path.insert(0, candidate_str)
 
+from rate_limiter import RateGovernor
+from text_corpus import TextCorpus
+
 logger = logging.getLogger(__name__)
 
+# Concurrent stage-3 model requests (override with DKI_AI_CONCURRENCY; 1 keeps the serial loop)
+DEFAULT_AI_CONCURRENCY = 4
+# Seconds a single analysis may run before its result is abandoned (DKI_AI_REQUEST_TIMEOUT)
+DEFAULT_AI_REQUEST_TIMEOUT = 120.0
+# Stage 4 case text held in memory up to this many MB before spilling to a memory-mapped file (DKI_CORPUS_SPILL_MB)
+DEFAULT_CORPUS_SPILL_MB = 32
+
+
+def _env_number(name: str, default, cast=float):
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value}")
+        return default
+
+
+class UnifiedContext(dict):
+    """Stage 4 context; all_text is decoded from the corpus the first time someone reads it"""
+    
+    def __missing__(self, key):
+        if key != 'all_text':
+            raise KeyError(key)
+        corpus = dict.get(self, 'corpus')
+        self['all_text'] = str(corpus.view()) if corpus is not None else ''
+        return self['all_text']
+    
+    def get(self, key, default=None):
+        if key == 'all_text':
+            return self['all_text']
+        return super().get(key, default)
+
 class FileProcessingOrchestrator:
     """
     Orchestrates the complete file processing pipeline:
@@ -51,10 +90,23 @@ class FileProcessingOrchestrator:
             'files_scanned': 0,
             'ai_analyses': 0,
             'sections_populated': 0,
+            'ai_timeouts': 0,
             'start_time': None,
             'stage_times': {}
         }
         
+        # Stage 3 execution: bounded concurrency, per-request deadline and a request/token budget
+        self.ai_config = {
+            'concurrency': max(1, _env_number('DKI_AI_CONCURRENCY', DEFAULT_AI_CONCURRENCY, int)),
+            'request_timeout': _env_number('DKI_AI_REQUEST_TIMEOUT', DEFAULT_AI_REQUEST_TIMEOUT),
+            'requests_per_minute': _env_number('DKI_AI_REQUESTS_PER_MINUTE', None),
+            'tokens_per_minute': _env_number('DKI_AI_TOKENS_PER_MINUTE', None),
+            'max_output_tokens': 512  # Added to each request's estimated prompt tokens
+        }
+        self.rate_governor = RateGovernor(self.ai_config['requests_per_minute'], self.ai_config['tokens_per_minute'])
+        
+        self.corpus_spill_bytes = int(_env_number('DKI_CORPUS_SPILL_MB', DEFAULT_CORPUS_SPILL_MB) * 1024 * 1024)
+        
     def process_file_batch(self, file_list: List[Dict[str, Any]], report_sections: List[str]) -> Dict[str, Any]:
         """
         Main orchestration method - processes files through all stages
@@ -165,27 +217,129 @@ class FileProcessingOrchestrator:
         
         # Analyze each file's extracted text
         extracted_texts = scanned_data.get('extracted_text', {})
+        pending = [(file_id, text) for file_id, text in extracted_texts.items()
+                   if text and len(text.strip()) > 50]  # Only analyze substantial content
+        
+        if self.ai_config['concurrency'] > 1 and len(pending) > 1:
+            analyses = self._run_ai_analyses_concurrently(pending)
+        else:
+            analyses = self._run_ai_analyses_serially(pending)
         
-        for file_id, text in extracted_texts.items():
-            if text and len(text.strip()) > 50:  # Only analyze substantial content
+        # Results in extraction order whatever order the requests finished in
+        for file_id, _ in pending:
+            if file_id in analyses:
+                ai_results['analyses'][file_id] = analyses[file_id]
+                self.processing_stats['ai_analyses'] += 1
+        self.processing_stats['ai_rate_governor'] = self.rate_governor.get_stats()
+        
+        logger.info(f"✅ Stage 3 Complete: {self.processing_stats['ai_analyses']} AI analyses")
+        return ai_results
+    
+    def _run_ai_analyses_serially(self, pending: List[tuple]) -> Dict[str, Any]:
+        analyses = {}
+        timeout = self.ai_config.get('request_timeout')
+        # With a deadline each request runs on a single worker so a hung one can be abandoned.
+        # The abandoned request keeps that worker, so the next one gets a fresh single-worker
+        # pool: one live thread plus one per abandoned request, as in the concurrent path
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-analysis") if timeout else None
+        try:
+            for file_id, text in pending:
                 try:
+                    self.rate_governor.acquire(self._estimate_ai_tokens(text))
                     # AI analysis using your existing toolkit
-                    analysis = self._analyze_text_with_ai(text, file_id)
-                    ai_results['analyses'][file_id] = analysis
-                    self.processing_stats['ai_analyses'] += 1
-                    
+                    if pool is None:
+                        analyses[file_id] = self._analyze_text_with_ai(text, file_id)
+                    else:
+                        analyses[file_id] = pool.submit(self._analyze_text_with_ai, text, file_id).result(timeout=timeout)
+                except FutureTimeoutError:
+                    self.processing_stats['ai_timeouts'] += 1
+                    logger.error(f"AI analysis timed out for {file_id} after {timeout:.0f}s")
+                    pool.shutdown(wait=False)
+                    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-analysis")
                 except Exception as e:
                     logger.error(f"AI analysis failed for {file_id}: {e}")
+        finally:
+            if pool is not None:
+                # Do not block on abandoned requests
+                pool.shutdown(wait=False)
+        return analyses
+    
+    def _run_ai_analyses_concurrently(self, pending: List[tuple]) -> Dict[str, Any]:
+        """Analyze with at most ai_config['concurrency'] requests in flight
         
-        logger.info(f"✅ Stage 3 Complete: {self.processing_stats['ai_analyses']} AI analyses")
-        return ai_results
+        Each request is admitted by the rate governor before it is submitted and is
+        abandoned once it has run longer than request_timeout. An abandoned request keeps
+        its worker until it returns, so the pool has room for concurrency plus every
+        abandoned request and a hang never eats into the live request slots.
+        """
+        concurrency = self.ai_config['concurrency']
+        timeout = self.ai_config.get('request_timeout')
+        analyses: Dict[str, Any] = {}
+        started: Dict[str, float] = {}
+        
+        def analyze(file_id: str, text: str):
+            started[file_id] = time.monotonic()
+            return self._analyze_text_with_ai(text, file_id)
+        
+        def collect(done) -> None:
+            for future in done:
+                file_id = in_flight.pop(future)
+                try:
+                    analyses[file_id] = future.result()
+                except Exception as e:
+                    logger.error(f"AI analysis failed for {file_id}: {e}")
+        
+        def expire() -> None:
+            # Abandon requests past their deadline; the worker finishes in the background
+            if not timeout:
+                return
+            now = time.monotonic()
+            for future, file_id in list(in_flight.items()):
+                if file_id in started and now - started[file_id] > timeout and not future.done():
+                    in_flight.pop(future)
+                    future.cancel()
+                    self.processing_stats['ai_timeouts'] += 1
+                    logger.error(f"AI analysis timed out for {file_id} after {timeout:.0f}s")
+        
+        def next_wait_timeout() -> Optional[float]:
+            if not timeout:
+                return None
+            now = time.monotonic()
+            remaining = [started[file_id] + timeout - now for file_id in in_flight.values() if file_id in started]
+            # Requests not yet started get re-checked shortly so their clock is picked up
+            return max(0.0, min(remaining)) if len(remaining) == len(in_flight) else min([0.5] + remaining)
+        
+        # Threads are only started on demand: at most concurrency live plus the abandoned ones
+        pool = ThreadPoolExecutor(max_workers=concurrency + len(pending), thread_name_prefix="ai-analysis")
+        in_flight: Dict[Any, str] = {}
+        try:
+            for file_id, text in pending:
+                while len(in_flight) >= concurrency:
+                    done, _ = wait(in_flight, timeout=next_wait_timeout(), return_when=FIRST_COMPLETED)
+                    collect(done)
+                    expire()
+                self.rate_governor.acquire(self._estimate_ai_tokens(text))
+                in_flight[pool.submit(analyze, file_id, text)] = file_id
+            while in_flight:
+                done, _ = wait(in_flight, timeout=next_wait_timeout(), return_when=FIRST_COMPLETED)
+                collect(done)
+                expire()
+        finally:
+            # Do not block on abandoned requests
+            pool.shutdown(wait=False)
+        return analyses
+    
+    def _estimate_ai_tokens(self, text: str) -> int:
+        """Rough request size for the token budget: ~4 characters per prompt token plus the reply"""
+        return len(text) // 4 + int(self.ai_config.get('max_output_tokens', 0))
     
     def _stage_4_build_context(self, scanned_data: Dict[str, Any], ai_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Stage 4: Build unified context from all sources"""
         logger.info("🧠 Stage 4: Building unified context...")
         
-        unified_context = {
-            'all_text': '',
+        unified_context = UnifiedContext({
+            'corpus': None,
+            'documents': {},
             'key_entities': [],
             'important_dates': [],
             'locations': [],
@@ -195,14 +349,18 @@ class FileProcessingOrchestrator:
             'tables_summary': [],
             'document_types': [],
             'cross_references': {}
-        }
+        })
         
-        # Combine all extracted text
-        all_texts = []
-        for text in scanned_data.get('extracted_text', {}).values():
+        # Combine all extracted text into a corpus that spills to disk instead of one joined string.
+        # documents holds a view per file; all_text is decoded from the corpus only for sections that ask for it
+        corpus = TextCorpus(spill_bytes=self.corpus_spill_bytes)
+        for file_id, text in scanned_data.get('extracted_text', {}).items():
             if text:
-                all_texts.append(text)
-        unified_context['all_text'] = '\n\n'.join(all_texts)
+                corpus.add(file_id, text)
+        unified_context['corpus'] = corpus.seal()
+        unified_context['documents'] = corpus.documents()
+        self.processing_stats['corpus_bytes'] = corpus.size_bytes
+        self.processing_stats['corpus_spilled'] = corpus.spilled
         
         # Extract key information from AI analyses
         for file_id, analysis in ai_analysis.get('analyses', {}).items():
@@ -268,7 +426,7 @@ class FileProcessingOrchestrator:
         section_rules = {
             'section_1': ['people', 'organizations', 'locations'],  # Client info
             'section_cp': ['people', 'locations', 'important_dates'],  # Case participants  
-            'section_dp': ['all_text', 'tables_summary', 'financial_data'],  # Data processing
+            'section_dp': ['all_text', 'documents', 'tables_summary', 'financial_data'],  # Data processing
             'section_fr': ['financial_data', 'tables_summary', 'organizations'],  # Financial records
             'section_summary': ['key_entities', 'important_dates', 'cross_references']
         }
@@ -277,12 +435,18 @@ class FileProcessingOrchestrator:
         section_specific_data = {}
         
         for key in relevant_keys:
-            if key in unified_context:
+            if key == 'all_text':
+                # Decoded once, then the same string is shared by every section that asks for it
+                section_specific_data[key] = unified_context['all_text']
+            elif key in unified_context:
+                # Shared references; documents are corpus views, not per-section copies
                 section_specific_data[key] = unified_context[key]
         
         # Add the full context for reference
         section_specific_data['full_context_available'] = True
         section_specific_data['context_keys'] = list(unified_context.keys())
+        if 'all_text' not in section_specific_data['context_keys']:
+            section_specific_data['context_keys'].append('all_text')
         
         return section_specific_data
     
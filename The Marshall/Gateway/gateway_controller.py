@@ -18,6 +18,7 @@ import time
 # Add Tools directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Tools'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Processors'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'Command Center', 'Data Bus'))
 
 # Import section renderers
 from section_1_gateway import Section1Renderer
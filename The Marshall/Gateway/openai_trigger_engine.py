@@ -1,12 +1,16 @@
 """OpenAI trigger dispatcher for section parsing plans."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,65 @@ except Exception as e:
     AIAnalysisEngine = None  # type: ignore
     HAVE_AI_ENGINE = False
 
+# Triggers run at the same time (override with DKI_TRIGGER_CONCURRENCY; 1 runs them one by one)
+DEFAULT_TRIGGER_CONCURRENCY = 8
+
+# Outcomes of a trigger named in another's "depends_on" that stop the dependent from running
+_BLOCKING_STATUSES = {'error', 'cancelled'}
+
+
+def _env_number(name: str, default, cast=float):
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value}")
+        return default
+
+
+class _TriggerRun:
+    """Per-run view of the dispatcher handed to trigger handlers
+
+    analyze_text is memoized by (text hash, analysis type) for the length of the
+    run, and concurrent callers with the same key wait on the first one instead
+    of making their own request. Other attributes fall through to the dispatcher.
+    """
+
+    def __init__(self, dispatcher: 'OpenAITriggerDispatcher', cancel_event: threading.Event):
+        self._dispatcher = dispatcher
+        self.cancel_event = cancel_event
+        self.trigger_results: Dict[str, Dict[str, Any]] = {}
+        self._analyses: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self.analysis_hits = 0
+        self.analysis_misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._dispatcher, name)
+
+    def analyze_text(self, text: str, analysis_type: str) -> Dict[str, Any]:
+        if self.cancel_event.is_set():
+            return {'error': 'cancelled'}
+        key = (hashlib.sha256((text or '').encode('utf-8')).hexdigest(), analysis_type)
+        with self._lock:
+            shared = self._analyses.get(key)
+            owner = shared is None
+            if owner:
+                shared = self._analyses[key] = Future()
+                self.analysis_misses += 1
+            else:
+                self.analysis_hits += 1
+        if owner:
+            try:
+                shared.set_result(self._dispatcher.analyze_text(text, analysis_type))
+            except Exception as exc:  # pragma: no cover - analyze_text already catches
+                shared.set_result({'error': str(exc)})
+        # Handlers annotate their own results, so each gets its own top-level copy
+        return dict(shared.result())
+
+
 class OpenAITriggerDispatcher:
     """Runs OpenAI (and other AI) validations described in parsing plans."""
 
@@ -35,6 +98,13 @@ class OpenAITriggerDispatcher:
         self.base_config = base_config or {}
         self.api_keys: Dict[str, Any] = {}
         self.ai_engine: Optional[AIAnalysisEngine] = None  # type: ignore
+        self.concurrency = max(1, int(self.base_config.get('trigger_concurrency')
+                                      or _env_number('DKI_TRIGGER_CONCURRENCY', DEFAULT_TRIGGER_CONCURRENCY, int)))
+        self.trigger_timeout = self.base_config.get('trigger_timeout') or _env_number('DKI_TRIGGER_TIMEOUT', None)
+        self._engine_lock = threading.Lock()
+        self._cancel_events: List[threading.Event] = []
+        self._cancel_lock = threading.Lock()
+        self.last_run_stats: Dict[str, Any] = {}
 
     def configure(self, *, api_keys: Optional[Dict[str, Any]] = None, case_data: Optional[Dict[str, Any]] = None):
         """Refresh API keys / config before running triggers."""
@@ -63,26 +133,134 @@ class OpenAITriggerDispatcher:
         section_id: str,
         plan: Dict[str, Any],
         payload: Dict[str, Any],
+        timeout: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
-        """Execute triggers defined in the parsing plan."""
+        """Execute triggers defined in the parsing plan.
+
+        A plan entry may list trigger ids in "depends_on"; it starts once those
+        have finished (dependencies on triggers absent from the run are ignored).
+        Triggers that are ready run concurrently (at most self.concurrency at once);
+        results come back in plan order, each with its duration_seconds. A trigger
+        whose declared dependency errored or was cancelled is skipped. cancel() or the run timeout (timeout, else self.trigger_timeout)
+        marks every trigger that has not finished as cancelled and returns at once.
+        """
 
-        results: List[Dict[str, Any]] = []
         triggers = plan.get('openai_triggers') or []
-        for trigger in triggers:
-            trigger_id = trigger.get('id') or 'unknown_trigger'
-            handler = TRIGGER_HANDLERS.get(trigger_id, _default_handler)
-            try:
-                result = handler(self, section_id, trigger, payload)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning(f"Trigger {trigger_id} failed: {exc}")
-                result = {
-                    'id': trigger_id,
-                    'status': 'error',
-                    'notes': str(exc),
-                    'timestamp': datetime.now().isoformat(),
-                }
-            results.append(result)
-        return results
+        if not triggers:
+            return []
+        started = time.perf_counter()
+        cancel_event = threading.Event()
+        with self._cancel_lock:
+            self._cancel_events.append(cancel_event)
+        run = _TriggerRun(self, cancel_event)
+        timeout = timeout if timeout is not None else self.trigger_timeout
+        deadline = started + timeout if timeout else None
+
+        trigger_ids = [trigger.get('id') or 'unknown_trigger' for trigger in triggers]
+        present = set(trigger_ids)
+        waiting_on: Dict[int, set] = {}
+        for index, trigger in enumerate(triggers):
+            declared = trigger.get('depends_on') or ()
+            waiting_on[index] = {dep for dep in declared if dep in present and dep != trigger_ids[index]}
+
+        results: Dict[int, Dict[str, Any]] = {}
+        finished_status: Dict[str, str] = {}
+        # Triggers skipped for a failed dependency block their own dependents too (a plain skip does not)
+        dependency_skipped: set = set()
+        running: Dict[Future, int] = {}
+        pool = ThreadPoolExecutor(max_workers=min(self.concurrency, len(triggers)), thread_name_prefix="openai-trigger")
+
+        def submit_ready():
+            for index in list(waiting_on):
+                deps = waiting_on.get(index)
+                if deps is None or any(dep not in finished_status for dep in deps):
+                    continue
+                del waiting_on[index]
+                blocked = [dep for dep in deps if finished_status[dep] in _BLOCKING_STATUSES or dep in dependency_skipped]
+                if blocked:
+                    dependency_skipped.add(trigger_ids[index])
+                    record(index, _make_result(trigger_ids[index], 'skipped',
+                                               f"Dependency {', '.join(sorted(blocked))} did not complete"), 0.0)
+                else:
+                    running[pool.submit(self._run_handler, run, section_id, triggers[index], trigger_ids[index], payload)] = index
+
+        def record(index: int, result: Dict[str, Any], duration: float):
+            result.setdefault('duration_seconds', round(duration, 6))
+            results[index] = result
+            finished_status[trigger_ids[index]] = result.get('status')
+            run.trigger_results[trigger_ids[index]] = result
+            # Skips cascade to their own dependents on the next pass
+            submit_ready()
+
+        try:
+            submit_ready()
+            while running:
+                remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                done, _ = wait(list(running), timeout=min(remaining, 0.25) if remaining is not None else 0.25,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    result, duration = future.result()
+                    record(index, result, duration)
+                if cancel_event.is_set() or (deadline is not None and time.perf_counter() >= deadline):
+                    cancel_event.set()
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            with self._cancel_lock:
+                self._cancel_events.remove(cancel_event)
+
+        # Whatever has not finished by now - running, queued or never ready (a dependency cycle) - gets a result
+        elapsed = time.perf_counter() - started
+        for index, trigger_id in enumerate(trigger_ids):
+            if index in results:
+                continue
+            if cancel_event.is_set():
+                results[index] = _make_result(trigger_id, 'cancelled', 'Trigger run cancelled before completion',
+                                              {'duration_seconds': round(elapsed, 6) if index in running.values() else 0.0})
+            else:
+                results[index] = _make_result(trigger_id, 'error', 'Dependency cycle', {'duration_seconds': 0.0})
+
+        ordered = [results[index] for index in range(len(triggers))]
+        self.last_run_stats = {
+            'section_id': section_id,
+            'triggers': len(triggers),
+            'wall_seconds': round(time.perf_counter() - started, 6),
+            'handler_seconds': round(sum(result.get('duration_seconds', 0.0) for result in ordered), 6),
+            'cancelled': cancel_event.is_set(),
+            'analysis_requests': run.analysis_misses,
+            'analysis_reused': run.analysis_hits,
+            'timings': {result['id']: result.get('duration_seconds', 0.0) for result in ordered},
+        }
+        return ordered
+
+    def _run_handler(self, run: _TriggerRun, section_id: str, trigger: Dict[str, Any], trigger_id: str,
+                     payload: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        began = time.perf_counter()
+        if run.cancel_event.is_set():
+            return _make_result(trigger_id, 'cancelled', 'Trigger run cancelled before start'), 0.0
+        handler = TRIGGER_HANDLERS.get(trigger_id, _default_handler)
+        try:
+            result = handler(run, section_id, trigger, payload)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning(f"Trigger {trigger_id} failed: {exc}")
+            result = {
+                'id': trigger_id,
+                'status': 'error',
+                'notes': str(exc),
+                'timestamp': datetime.now().isoformat(),
+            }
+        return result, time.perf_counter() - began
+
+    def cancel(self) -> None:
+        """Stop every run in progress: nothing new starts and running triggers are abandoned."""
+        with self._cancel_lock:
+            for event in self._cancel_events:
+                event.set()
+
+    def get_run_stats(self) -> Dict[str, Any]:
+        """Timing and analysis reuse of the latest run_triggers call."""
+        return dict(self.last_run_stats)
 
     # ------------------------------------------------------------------
     def analyze_text(self, text: str, analysis_type: str) -> Dict[str, Any]:
@@ -91,7 +269,9 @@ class OpenAITriggerDispatcher:
         if not HAVE_AI_ENGINE:
             return {'error': 'ai_engine_unavailable'}
         if self.ai_engine is None:
-            self.configure()
+            with self._engine_lock:
+                if self.ai_engine is None:
+                    self.configure()
         if self.ai_engine is None:
             return {'error': 'ai_engine_unavailable'}
         try:
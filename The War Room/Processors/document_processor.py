@@ -10,9 +10,17 @@ import json
 import logging
 import hashlib
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 import mimetypes
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+
+# Shared Data Bus modules (file_hashing, ocr_cache, ocr_router)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from file_hashing import hash_file_digests
+from ocr_cache import get_ocr_cache, image_content_hash
+from ocr_router import get_ocr_router
 
 # Lazy loading for heavy dependencies
 def _load_cv2():
@@ -31,6 +39,22 @@ def _load_numpy():
     except ImportError:
         return None
 
+def _load_av():
+    """Lazy load PyAV - only needed for keyframe-driven video sampling"""
+    try:
+        import av
+        return av
+    except ImportError:
+        return None
+
+def _load_pdf2image():
+    """Lazy load pdf2image (Poppler) for PDF page rasterization"""
+    try:
+        import pdf2image
+        return pdf2image
+    except ImportError:
+        return None
+
 # OCR and PDF processing - Multiple OCR Engine Support (Lazy Loading)
 PIL_AVAILABLE = False
 HAVE_TESSERACT = False
@@ -44,11 +68,15 @@ _paddleocr = None
 _Image = None
 _ImageEnhance = None
 _ImageFilter = None
+# Set once the imports below have been tried, so missing engines are not re-probed on every page
+_OCR_MODULES_ATTEMPTED = False
 
 def _load_ocr_modules():
     """Lazy load OCR modules to reduce import time"""
-    global PIL_AVAILABLE, HAVE_TESSERACT, HAVE_EASYOCR, HAVE_PADDLEOCR
+    global PIL_AVAILABLE, HAVE_TESSERACT, HAVE_EASYOCR, HAVE_PADDLEOCR, _OCR_MODULES_ATTEMPTED
     global _pytesseract, _easyocr, _paddleocr, _Image, _ImageEnhance, _ImageFilter
+    if _OCR_MODULES_ATTEMPTED:
+        return
     
     # OCR and PDF processing - Multiple OCR Engine Support
     if not PIL_AVAILABLE:
@@ -82,6 +110,8 @@ def _load_ocr_modules():
         except ImportError:
             pass
 
+    _OCR_MODULES_ATTEMPTED = True
+
 # Cloud OCR: Azure Computer Vision
 try:
     from azure.cognitiveservices.vision.computervision import ComputerVisionClient
@@ -94,6 +124,11 @@ except ImportError:
 # Determine overall OCR availability
 HAVE_OCR = HAVE_TESSERACT or HAVE_EASYOCR or HAVE_PADDLEOCR or HAVE_AZURE_OCR
 
+def _have_ocr() -> bool:
+    """OCR availability after lazy loading (HAVE_OCR is fixed at import, before the engines load)"""
+    _load_ocr_modules()
+    return HAVE_TESSERACT or HAVE_EASYOCR or HAVE_PADDLEOCR or HAVE_AZURE_OCR
+
 try:
     import PyPDF2
     import pdfplumber
@@ -122,19 +157,22 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Worker processes for process_files (override with DKI_DOC_WORKERS; "auto" uses every core)
+DEFAULT_PROCESS_WORKERS = 1
+
 class DocumentProcessor:
     """Comprehensive document processing engine with OCR, metadata extraction, and AI integration"""
     
     # Class-level OCR reader cache for reuse across instances
     _shared_easyocr_reader = None
     _shared_paddle_ocr = None
-    _ocr_cache_lock = None
+    _ocr_cache_lock = threading.Lock()
+    # Neither reader is documented as thread-safe: page and race threads share one instance
+    # of each, so calls into a reader are serialized (different engines still run in parallel)
+    _easyocr_call_lock = threading.Lock()
+    _paddle_call_lock = threading.Lock()
     
     def __init__(self):
-        # Initialize thread lock for OCR cache if not already done
-        if DocumentProcessor._ocr_cache_lock is None:
-            import threading
-            DocumentProcessor._ocr_cache_lock = threading.Lock()
         self.supported_formats = {
             'pdf': ['.pdf'],
             'image': ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.heic', '.heif'],
@@ -151,17 +189,40 @@ class DocumentProcessor:
             'oem': 3,  # Default OCR Engine Mode
             'psm': 6,  # Page Segmentation Mode - uniform block of text
             'dpi': 300,
-            'preprocessing': True
+            'preprocessing': True,
+            'pdf_min_text_chars': 25,  # Pages with a thinner text layer than this are rasterized and OCR'd
+            'pdf_ocr_workers': min(4, os.cpu_count() or 1),
+            'engine_routing': 'adaptive',  # adaptive (per-page engine choice) | cascade (fixed order)
+            'race_engines': True,          # Race the two best engines on hard pages
+            'race_deadline': 8.0           # Seconds to wait for the slower racer once one has text
+        }
+        
+        self.video_config = {
+            'sampling': 'interval',      # interval | scene | keyframe
+            'sample_interval': 30,       # Seconds between samples in interval mode
+            'scene_probe_interval': 2,   # Seconds between probe frames when looking for scene changes
+            'scene_threshold': 0.35,     # Histogram distance (Bhattacharyya) that counts as a new scene
+            'min_sample_gap': 5,         # Minimum seconds between scene / keyframe samples
+            'max_samples': 360,
+            'ocr_workers': min(4, os.cpu_count() or 1)
         }
         
+        # OCR counters are bumped from page and frame OCR threads
+        self._stats_lock = threading.Lock()
         self.processing_stats = {
             'total_files': 0,
             'successful': 0,
             'failed': 0,
             'ocr_processed': 0,
+            'ocr_cache_hits': 0,
             'metadata_extracted': 0
         }
         
+        # Shared on-disk OCR results keyed by content hash, page and engine settings
+        self.ocr_cache = get_ocr_cache()
+        # Per-page engine choice from page features and recorded engine latency/quality
+        self.ocr_router = get_ocr_router()
+        
         logger.info("Document Processor initialized")
         self._check_dependencies()
     
@@ -181,7 +242,8 @@ class DocumentProcessor:
             status = "Available" if available else "Missing"
             logger.info(f"{dep}: {status}")
     
-    def process_files(self, file_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_files(self, file_list: List[Dict[str, Any]], workers: Optional[int] = None,
+                      progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """Process a list of uploaded files and extract all relevant information"""
         
         logger.info(f"Starting processing of {len(file_list)} files")
@@ -200,53 +262,16 @@ class DocumentProcessor:
             'summary': {}
         }
         
-        for file_info in file_list:
-            try:
-                result = self._process_single_file(file_info)
-                file_id = self._generate_file_id(file_info)
-                
-                processed_data['files'][file_id] = result
-                
-                # Categorize by type
-                file_type = file_info.get('type', 'unknown')
-                if file_type == 'contract':
-                    processed_data['contracts'][file_id] = result
-                elif file_type == 'form':
-                    processed_data['forms'][file_id] = result
-                elif file_type == 'image':
-                    processed_data['images'][file_id] = result
-                elif file_type == 'video':
-                    processed_data['videos'][file_id] = result
-                elif file_type == 'audio':
-                    processed_data['audio'][file_id] = result
-                
-                # Store extracted text
-                if result.get('text'):
-                    processed_data['extracted_text'][file_id] = result['text']
-                
-                # Store metadata
-                if result.get('metadata'):
-                    processed_data['metadata'][file_id] = result['metadata']
-                
-                processed_data['processing_log'].append({
-                    'file': file_info['name'],
-                    'status': 'success',
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                self.processing_stats['successful'] += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to process {file_info['name']}: {str(e)}")
-                
-                processed_data['processing_log'].append({
-                    'file': file_info['name'],
-                    'status': 'failed',
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                self.processing_stats['failed'] += 1
+        completed = 0
+        for outcome in self.iter_process_files(file_list, workers=workers):
+            self._merge_file_outcome(processed_data, outcome)
+            completed += 1
+            logger.debug(f"[DOC] {completed}/{len(file_list)} {outcome['file_info'].get('name')}: {outcome['status']}")
+            if progress_callback:
+                try:
+                    progress_callback(completed, len(file_list), outcome)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {str(e)}")
         
         # Generate summary
         processed_data['summary'] = self._generate_processing_summary(processed_data)
@@ -266,6 +291,142 @@ class DocumentProcessor:
 
         return processed_data
     
+    def iter_process_files(self, file_list: List[Dict[str, Any]], workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield one outcome per file as soon as it finishes; workers > 1 fans files out to worker processes"""
+        workers = self._resolve_process_workers(workers)
+        items = list(enumerate(file_list))
+        if workers <= 1 or len(items) <= 1:
+            for index, file_info in items:
+                yield self._process_file_outcome(index, file_info)
+            return
+        
+        workers = min(workers, len(items))
+        logger.info(f"[DOC] Fanning {len(items)} files out to {workers} worker processes")
+        yield from self._iter_process_pool(items, workers)
+    
+    def _resolve_process_workers(self, workers: Optional[int]) -> int:
+        if workers is None:
+            workers = os.getenv("DKI_DOC_WORKERS", DEFAULT_PROCESS_WORKERS)
+        if str(workers).strip().lower() in ('auto', '0'):
+            return os.cpu_count() or 1
+        try:
+            return max(1, int(workers))
+        except (TypeError, ValueError):
+            return DEFAULT_PROCESS_WORKERS
+    
+    def _process_file_outcome(self, index: int, file_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single file with failure isolation - errors become a failed outcome instead of raising"""
+        try:
+            return {'index': index, 'file_info': file_info, 'status': 'success',
+                    'result': self._process_single_file(file_info)}
+        except Exception as e:
+            return self._failed_outcome(index, file_info, str(e))
+    
+    @staticmethod
+    def _failed_outcome(index: int, file_info: Dict[str, Any], error: str) -> Dict[str, Any]:
+        return {'index': index, 'file_info': file_info, 'status': 'failed', 'error': error}
+    
+    def _create_process_pool(self, workers: int):
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_process_worker,
+                                   initargs=(dict(self.ocr_config), dict(self.video_config)))
+    
+    def _iter_process_pool(self, items: List[Tuple[int, Dict[str, Any]]], workers: int) -> Iterator[Dict[str, Any]]:
+        from concurrent.futures.process import BrokenProcessPool
+        
+        unfinished = []
+        with self._create_process_pool(workers) as pool:
+            futures = {pool.submit(_process_file_in_worker, index, file_info): (index, file_info)
+                       for index, file_info in items}
+            for future in as_completed(futures):
+                index, file_info = futures[future]
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    unfinished.append((index, file_info))
+                except Exception as e:
+                    # e.g. a result that cannot be pickled back to the parent
+                    yield self._failed_outcome(index, file_info, str(e))
+        
+        if unfinished:
+            # A worker died (native OCR crash, OOM); rerun the survivors one at a time to find the culprit
+            logger.warning(f"[DOC] Worker process crashed - retrying {len(unfinished)} files in isolation")
+            yield from self._iter_isolated(sorted(unfinished, key=lambda item: item[0]))
+    
+    def _iter_isolated(self, items: List[Tuple[int, Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        from concurrent.futures.process import BrokenProcessPool
+        
+        pool = None
+        try:
+            for index, file_info in items:
+                if pool is None:
+                    pool = self._create_process_pool(1)
+                try:
+                    yield pool.submit(_process_file_in_worker, index, file_info).result()
+                except BrokenProcessPool:
+                    pool.shutdown(wait=False)
+                    pool = None
+                    logger.error(f"Worker process crashed on {file_info.get('name')}")
+                    yield self._failed_outcome(index, file_info, "Worker process crashed")
+                except Exception as e:
+                    yield self._failed_outcome(index, file_info, str(e))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    
+    def _merge_file_outcome(self, processed_data: Dict[str, Any], outcome: Dict[str, Any]) -> None:
+        """Fold one file outcome into the process_files result and statistics"""
+        file_info = outcome['file_info']
+        for key, delta in (outcome.get('stats_delta') or {}).items():
+            self.processing_stats[key] = self.processing_stats.get(key, 0) + delta
+        
+        if outcome['status'] != 'success':
+            logger.error(f"Failed to process {file_info['name']}: {outcome.get('error')}")
+            
+            processed_data['processing_log'].append({
+                'file': file_info['name'],
+                'status': 'failed',
+                'error': outcome.get('error'),
+                'timestamp': datetime.now().isoformat()
+            })
+            
+            self.processing_stats['failed'] += 1
+            return
+        
+        result = outcome['result']
+        file_id = self._generate_file_id(file_info)
+        
+        processed_data['files'][file_id] = result
+        
+        # Categorize by type
+        file_type = file_info.get('type', 'unknown')
+        if file_type == 'contract':
+            processed_data['contracts'][file_id] = result
+        elif file_type == 'form':
+            processed_data['forms'][file_id] = result
+        elif file_type == 'image':
+            processed_data['images'][file_id] = result
+        elif file_type == 'video':
+            processed_data['videos'][file_id] = result
+        elif file_type == 'audio':
+            processed_data['audio'][file_id] = result
+        
+        # Store extracted text
+        if result.get('text'):
+            processed_data['extracted_text'][file_id] = result['text']
+        
+        # Store metadata
+        if result.get('metadata'):
+            processed_data['metadata'][file_id] = result['metadata']
+        
+        processed_data['processing_log'].append({
+            'file': file_info['name'],
+            'status': 'success',
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        self.processing_stats['successful'] += 1
+    
     def _process_single_file(self, file_info: Dict[str, Any]) -> Dict[str, Any]:
         """Process a single file based on its type and format"""
         
@@ -320,8 +481,12 @@ class DocumentProcessor:
             'processing_methods': ['pdf_text_extraction']
         }
         
+        page_texts: Dict[int, str] = {}
+        
         if not HAVE_PDF:
             logger.warning("PDF processing libraries not available")
+            if _have_ocr():
+                self._apply_pdf_ocr(file_path, result, page_texts)
             return result
         
         try:
@@ -332,6 +497,7 @@ class DocumentProcessor:
                 
                 for page_num, page in enumerate(pdf.pages):
                     page_text = page.extract_text()
+                    page_texts[page_num + 1] = page_text or ''
                     if page_text:
                         text_content.append(f"--- Page {page_num + 1} ---\n{page_text}")
                     
@@ -358,8 +524,10 @@ class DocumentProcessor:
                     result['pages'] = len(pdf_reader.pages)
                     
                     text_content = []
+                    page_texts.clear()
                     for page_num, page in enumerate(pdf_reader.pages):
                         page_text = page.extract_text()
+                        page_texts[page_num + 1] = page_text or ''
                         if page_text:
                             text_content.append(f"--- Page {page_num + 1} ---\n{page_text}")
                     
@@ -370,13 +538,40 @@ class DocumentProcessor:
                 logger.error(f"All PDF processing methods failed for {file_path}: {str(e2)}")
                 result['processing_methods'].append('failed')
         
-        # If no text extracted, try OCR on PDF pages
-        if not result['text'].strip() and HAVE_OCR:
-            logger.info(f"Attempting OCR on PDF: {file_path}")
-            result.update(self._ocr_pdf(file_path))
+        # OCR pages whose text layer is missing or too sparse (scanned records)
+        if _have_ocr():
+            self._apply_pdf_ocr(file_path, result, page_texts)
         
         return result
     
+    def _apply_pdf_ocr(self, file_path: str, result: Dict[str, Any], page_texts: Dict[int, str]) -> None:
+        """OCR the pages below the text density threshold and merge their text back in page order"""
+        threshold = self.ocr_config.get('pdf_min_text_chars', 0)
+        if result.get('pages'):
+            sparse_pages = [page_num for page_num in range(1, result['pages'] + 1)
+                            if not (page_texts.get(page_num) or '').strip()
+                            or len(page_texts[page_num].strip()) < threshold]
+            if not sparse_pages:
+                return
+        else:
+            # Page count unknown (text extraction failed) - rasterize every page
+            sparse_pages = None
+        
+        logger.info(f"Attempting OCR on {len(sparse_pages) if sparse_pages is not None else 'all'} PDF pages: {file_path}")
+        ocr_result = self._ocr_pdf(file_path, pages=sparse_pages)
+        
+        for page_num, page_text in ocr_result['ocr_pages'].items():
+            if len(page_text.strip()) > len((page_texts.get(page_num) or '').strip()):
+                page_texts[page_num] = page_text
+        if ocr_result['ocr_pages']:
+            result['text'] = '\n\n'.join(f"--- Page {page_num} ---\n{page_text}"
+                                         for page_num, page_text in sorted(page_texts.items()) if page_text)
+        
+        result['pages'] = result.get('pages') or ocr_result['pages']
+        result['processing_methods'].extend(ocr_result['processing_methods'])
+        result['ocr_pages'] = sorted(ocr_result['ocr_pages'])
+        result['ocr_confidence'] = ocr_result['confidence']
+    
     def _process_image(self, file_path: str) -> Dict[str, Any]:
         """Process image files - OCR and metadata extraction"""
         
@@ -401,8 +596,8 @@ class DocumentProcessor:
                         result['exif'] = {TAGS.get(k, k): v for k, v in exif_data.items()}
                 
                 # Perform OCR if available
-                if HAVE_OCR:
-                    result.update(self._perform_ocr(img))
+                if _have_ocr():
+                    result.update(self._perform_ocr(img, source_key=(self._content_hash(file_path), 0)))
                     result['processing_methods'].append('tesseract_ocr')
         
         except Exception as e:
@@ -423,61 +618,136 @@ class DocumentProcessor:
             'processing_methods': ['video_metadata']
         }
         
-        if not HAVE_VIDEO:
+        cv2 = _load_cv2()
+        if cv2 is None:
             logger.warning("Video processing libraries not available")
             return result
         
         try:
-            cv2 = _load_cv2()
-            if cv2 is None:
-                return None
             cap = cv2.VideoCapture(file_path)
-            
-            # Get video properties
-            result['fps'] = cap.get(cv2.CAP_PROP_FPS)
-            result['duration'] = cap.get(cv2.CAP_PROP_FRAME_COUNT) / result['fps'] if result['fps'] > 0 else 0
-            result['resolution'] = (
-                int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            )
-            
-            # Extract frames for OCR (sample every 30 seconds)
-            if HAVE_OCR and result['fps'] > 0:
-                frame_interval = int(result['fps'] * 30)  # Every 30 seconds
-                frame_count = 0
-                extracted_text = []
+            try:
+                # Get video properties
+                result['fps'] = cap.get(cv2.CAP_PROP_FPS)
+                frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                result['duration'] = frame_count / result['fps'] if result['fps'] > 0 else 0
+                result['resolution'] = (
+                    int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                )
                 
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
+                # OCR sampled frames - cost follows the number of samples, not the file length
+                if _have_ocr() and result['fps'] > 0 and frame_count > 0:
+                    sampling = self.video_config.get('sampling', 'interval')
+                    samples = self._iter_video_samples(cap, cv2, file_path, result['fps'], frame_count, sampling)
+                    workers = max(1, int(self.video_config.get('ocr_workers', 1)))
                     
-                    if frame_count % frame_interval == 0:
-                        # Convert frame to PIL Image and perform OCR
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        _load_ocr_modules()
-                        pil_image = _Image.fromarray(frame_rgb)
-                        
-                        ocr_result = self._perform_ocr(pil_image)
+                    extracted = {}
+                    sampled_timestamps = []
+                    source_hash = self._content_hash(file_path)
+                    for timestamp, ocr_result in self._ocr_image_stream(samples, workers, file_path, source_hash):
+                        sampled_timestamps.append(timestamp)
                         if ocr_result.get('text', '').strip():
-                            timestamp = frame_count / result['fps']
-                            extracted_text.append(f"[{timestamp:.1f}s] {ocr_result['text']}")
-                        
-                        result['frames_extracted'] += 1
+                            extracted[timestamp] = ocr_result['text']
                     
-                    frame_count += 1
-                
-                result['text'] = '\n\n'.join(extracted_text)
-                result['processing_methods'].append('frame_ocr')
-            
-            cap.release()
+                    result['frames_extracted'] = len(sampled_timestamps)
+                    result['sampled_timestamps'] = sorted(sampled_timestamps)
+                    result['text'] = '\n\n'.join(f"[{timestamp:.1f}s] {text}" for timestamp, text in sorted(extracted.items()))
+                    result['processing_methods'].extend(['frame_ocr', f'sampling_{sampling}'])
+            finally:
+                cap.release()
         
         except Exception as e:
             logger.error(f"Failed to process video {file_path}: {str(e)}")
             result['processing_methods'].append('failed')
         
         return result
-
+    
+    def _iter_video_samples(self, cap, cv2, file_path: str, fps: float, frame_count: int,
+                            sampling: str) -> Iterator[Tuple[float, Any]]:
+        """Yield (timestamp, PIL image) for the frames selected by the sampling mode"""
+        max_samples = max(1, int(self.video_config.get('max_samples', 360)))
+        
+        if sampling == 'keyframe':
+            if _load_av() is not None:
+                frames = self._iter_video_keyframes(file_path, fps)
+            else:
+                logger.warning("PyAV not available - falling back to interval sampling")
+                frames = self._read_video_frames(cap, cv2, self._interval_frame_indices(fps, frame_count), fps)
+        elif sampling == 'scene':
+            frames = self._iter_scene_changes(cap, cv2, fps, frame_count)
+        else:
+            frames = self._read_video_frames(cap, cv2, self._interval_frame_indices(fps, frame_count), fps)
+        
+        _load_ocr_modules()
+        for produced, (timestamp, frame_bgr) in enumerate(frames):
+            if produced >= max_samples:
+                logger.info(f"Video sample cap ({max_samples}) reached for {file_path}")
+                break
+            yield timestamp, _Image.fromarray(cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB))
+    
+    def _interval_frame_indices(self, fps: float, frame_count: int) -> range:
+        step = max(1, int(round(fps * float(self.video_config.get('sample_interval', 30)))))
+        return range(0, frame_count, step)
+    
+    def _read_video_frames(self, cap, cv2, frame_indices, fps: float) -> Iterator[Tuple[float, Any]]:
+        """Read only the requested frames: seek for long hops, grab() without retrieving for short ones"""
+        # Seeking lands on the previous keyframe and decodes forward, so it only pays off past ~1s
+        grab_limit = max(1, int(fps))
+        position = 0
+        for index in frame_indices:
+            gap = index - position
+            if 0 <= gap <= grab_limit:
+                skipped = 0
+                while skipped < gap and cap.grab():
+                    skipped += 1
+                if skipped < gap:
+                    break
+            else:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+            ret, frame = cap.read()
+            if not ret:
+                position = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+                continue
+            position = index + 1
+            yield index / fps, frame
+    
+    def _iter_scene_changes(self, cap, cv2, fps: float, frame_count: int) -> Iterator[Tuple[float, Any]]:
+        """Probe frames at a short interval and keep the ones whose histogram departs from the last scene"""
+        probe_step = max(1, int(round(fps * float(self.video_config.get('scene_probe_interval', 2)))))
+        threshold = float(self.video_config.get('scene_threshold', 0.35))
+        min_gap = float(self.video_config.get('min_sample_gap', 5))
+        scene_hist = None
+        last_sample = None
+        
+        for timestamp, frame in self._read_video_frames(cap, cv2, range(0, frame_count, probe_step), fps):
+            small = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), (64, 36))
+            hist = cv2.calcHist([small], [0], None, [32], [0, 256])
+            cv2.normalize(hist, hist)
+            if scene_hist is not None and cv2.compareHist(scene_hist, hist, cv2.HISTCMP_BHATTACHARYYA) < threshold:
+                continue
+            scene_hist = hist
+            if last_sample is not None and timestamp - last_sample < min_gap:
+                continue
+            last_sample = timestamp
+            yield timestamp, frame
+    
+    def _iter_video_keyframes(self, file_path: str, fps: float) -> Iterator[Tuple[float, Any]]:
+        """Decode keyframes only (PyAV skip_frame), spaced at least min_sample_gap apart"""
+        av = _load_av()
+        min_gap = float(self.video_config.get('min_sample_gap', 5))
+        last_sample = None
+        with av.open(file_path) as container:
+            stream = container.streams.video[0]
+            stream.codec_context.skip_frame = "NONKEY"
+            for frame in container.decode(stream):
+                if frame.pts is None:
+                    continue
+                timestamp = float(frame.pts * stream.time_base)
+                if last_sample is not None and timestamp - last_sample < min_gap:
+                    continue
+                last_sample = timestamp
+                yield timestamp, frame.to_ndarray(format='bgr24')
+    
     def _process_audio_placeholder(self, file_path: str) -> Dict[str, Any]:
         """Placeholder entry for audio files; detailed analysis handled by media processing engine"""
         return {
@@ -603,8 +873,12 @@ class DocumentProcessor:
         
         return result
     
-    def _perform_ocr(self, image) -> Dict[str, Any]:
-        """Perform OCR using multiple engines with fallback support"""
+    def _perform_ocr(self, image, source_key: Optional[Tuple[Optional[str], Any]] = None) -> Dict[str, Any]:
+        """Perform OCR with the engine routed for this page, falling back through the others
+        
+        source_key is (content hash of the source file, page or frame) when known; otherwise
+        the raster itself is hashed to key the OCR cache.
+        """
         
         result = {
             'text': '',
@@ -614,40 +888,97 @@ class DocumentProcessor:
             'fallback_attempts': []
         }
         
-        if not HAVE_OCR:
+        if not _have_ocr():
             logger.warning("No OCR engines available")
             return result
         
-        # Try OCR engines in order of preference
-        ocr_engines = [
-            ('easyocr', self._ocr_with_easyocr),
-            ('paddleocr', self._ocr_with_paddleocr),
-            ('tesseract', self._ocr_with_tesseract),
-            ('azure', self._ocr_with_azure)
-        ]
-        
-        for engine_name, engine_func in ocr_engines:
-            try:
-                engine_result = engine_func(image)
-                if engine_result and engine_result.get('text', '').strip():
-                    result.update(engine_result)
-                    result['engine_used'] = engine_name
-                    result['processing_methods'].append(f'ocr_{engine_name}')
-                    self.processing_stats['ocr_processed'] += 1
-                    logger.info(f"OCR successful with {engine_name} engine")
-                    return result
-                else:
-                    result['fallback_attempts'].append(f'{engine_name}_no_text')
-            except Exception as e:
-                logger.warning(f"OCR engine {engine_name} failed: {str(e)}")
-                result['fallback_attempts'].append(f'{engine_name}_error')
-                continue
+        content_hash, page = source_key if source_key else (None, 0)
+        if self.ocr_cache.enabled:
+            if not content_hash:
+                content_hash = image_content_hash(image)
+            cached = self._ocr_cache_lookup(content_hash, page)
+            if cached is not None:
+                return cached
+        
+        adaptive = self.ocr_config.get('engine_routing', 'adaptive') == 'adaptive'
+        engine_name, engine_result, attempts, routing = self.ocr_router.run(
+            image, self._ocr_engines(), adaptive=adaptive,
+            race=bool(self.ocr_config.get('race_engines', True)),
+            race_deadline=float(self.ocr_config.get('race_deadline', 8.0)))
+        result['fallback_attempts'].extend(attempts)
+        result['ocr_routing'] = routing
+        if engine_name is not None:
+            result.update(engine_result)
+            result['engine_used'] = engine_name
+            result['processing_methods'].append(f'ocr_{engine_name}')
+            with self._stats_lock:
+                self.processing_stats['ocr_processed'] += 1
+            logger.info(f"OCR successful with {engine_name} engine ({routing['page_class']} page)")
+            self._ocr_cache_store(content_hash, page, result)
+            return result
         
         # If all engines failed
         result['processing_methods'].append('ocr_all_failed')
         logger.error("All OCR engines failed to extract text")
+        if result['fallback_attempts'] and all(attempt.endswith('_no_text') for attempt in result['fallback_attempts']):
+            # Every engine ran cleanly and found nothing - a blank page, worth remembering
+            self._ocr_cache_store(content_hash, page, result)
+        return result
+    
+    def _ocr_engines(self) -> Dict[str, Callable[[Any], Optional[Dict[str, Any]]]]:
+        """Available OCR engines in the legacy cascade order (the order used when routing is off)"""
+        _load_ocr_modules()
+        engines = {}
+        for engine_name, available, engine_func in (
+                ('easyocr', HAVE_EASYOCR, self._ocr_with_easyocr),
+                ('paddleocr', HAVE_PADDLEOCR, self._ocr_with_paddleocr),
+                ('tesseract', HAVE_TESSERACT, self._ocr_with_tesseract),
+                ('azure', HAVE_AZURE_OCR, self._ocr_with_azure)):
+            if available:
+                engines[engine_name] = engine_func
+        return engines
+    
+    def _ocr_cache_args(self) -> Tuple[str, str, Dict[str, Any]]:
+        """(engine, language, parameters) that, with content hash and page, identify an OCR result"""
+        _load_ocr_modules()
+        engines = [name for name, available in (('easyocr', HAVE_EASYOCR), ('paddleocr', HAVE_PADDLEOCR),
+                                                 ('tesseract', HAVE_TESSERACT)) if available]
+        routing = self.ocr_config.get('engine_routing', 'adaptive')
+        params = {
+            'preprocessing': bool(self.ocr_config['preprocessing']),
+            'oem': self.ocr_config['oem'],
+            'psm': self.ocr_config['psm'],
+            'dpi': self.ocr_config.get('dpi', 300)
+        }
+        return f"{routing}:" + ','.join(engines), self.ocr_config['language'], params
+    
+    def _ocr_cache_lookup(self, content_hash: Optional[str], page: Any) -> Optional[Dict[str, Any]]:
+        if not content_hash or not self.ocr_cache.enabled:
+            return None
+        engine, language, params = self._ocr_cache_args()
+        cached = self.ocr_cache.get(content_hash, page, engine, language, params)
+        if not isinstance(cached, dict):
+            return None
+        with self._stats_lock:
+            self.processing_stats['ocr_cache_hits'] += 1
+        # Annotate a copy - the cached entry itself is shared with every later hit
+        result = dict(cached)
+        result['processing_methods'] = list(cached.get('processing_methods') or []) + ['ocr_cache']
         return result
     
+    def _ocr_cache_store(self, content_hash: Optional[str], page: Any, result: Dict[str, Any]):
+        if not content_hash or not self.ocr_cache.enabled:
+            return
+        engine, language, params = self._ocr_cache_args()
+        self.ocr_cache.put(content_hash, page, engine, result, language, params)
+    
+    def _content_hash(self, file_path: str) -> Optional[str]:
+        try:
+            return hash_file_digests(file_path, ('sha256',))['sha256']
+        except OSError as e:
+            logger.warning(f"Could not hash {file_path} for the OCR cache: {str(e)}")
+            return None
+    
     def _preprocess_image_for_ocr(self, image):
         """Preprocess image to improve OCR accuracy"""
         
@@ -676,6 +1007,37 @@ class DocumentProcessor:
         
         return image
     
+    @staticmethod
+    def _get_easyocr_reader():
+        with DocumentProcessor._ocr_cache_lock:
+            if DocumentProcessor._shared_easyocr_reader is None:
+                _load_ocr_modules()
+                DocumentProcessor._shared_easyocr_reader = _easyocr.Reader(['en', 'es'], gpu=False)
+            return DocumentProcessor._shared_easyocr_reader
+    
+    @staticmethod
+    def _get_paddle_ocr():
+        with DocumentProcessor._ocr_cache_lock:
+            if DocumentProcessor._shared_paddle_ocr is None:
+                _load_ocr_modules()
+                DocumentProcessor._shared_paddle_ocr = _paddleocr.PaddleOCR(use_angle_cls=True, lang='en', use_gpu=False)
+            return DocumentProcessor._shared_paddle_ocr
+    
+    def warm_ocr_engines(self) -> List[str]:
+        """Build the shared OCR readers up front instead of on the first page"""
+        _load_ocr_modules()
+        warmed = []
+        for engine_name, available, loader in (('easyocr', HAVE_EASYOCR, self._get_easyocr_reader),
+                                               ('paddleocr', HAVE_PADDLEOCR, self._get_paddle_ocr)):
+            if not available:
+                continue
+            try:
+                loader()
+                warmed.append(engine_name)
+            except Exception as e:
+                logger.warning(f"Failed to warm {engine_name} engine: {str(e)}")
+        return warmed
+    
     def _ocr_with_easyocr(self, image) -> Optional[Dict[str, Any]]:
         """Perform OCR using EasyOCR engine"""
         if not HAVE_EASYOCR:
@@ -686,17 +1048,14 @@ class DocumentProcessor:
             if np is None:
                 return None
             # Use shared EasyOCR reader (cached across instances)
-            with DocumentProcessor._ocr_cache_lock:
-                if DocumentProcessor._shared_easyocr_reader is None:
-                    _load_ocr_modules()
-                    DocumentProcessor._shared_easyocr_reader = _easyocr.Reader(['en', 'es'], gpu=False)
-                reader = DocumentProcessor._shared_easyocr_reader
+            reader = self._get_easyocr_reader()
             
             # Convert PIL image to numpy array
             img_array = np.array(image)
             
             # Perform OCR
-            results = reader.readtext(img_array)
+            with DocumentProcessor._easyocr_call_lock:
+                results = reader.readtext(img_array)
             
             # Extract text and confidence
             text_parts = []
@@ -728,17 +1087,14 @@ class DocumentProcessor:
             if np is None:
                 return None
             # Use shared PaddleOCR (cached across instances)
-            with DocumentProcessor._ocr_cache_lock:
-                if DocumentProcessor._shared_paddle_ocr is None:
-                    _load_ocr_modules()
-                    DocumentProcessor._shared_paddle_ocr = _paddleocr.PaddleOCR(use_angle_cls=True, lang='en', use_gpu=False)
-                paddle_reader = DocumentProcessor._shared_paddle_ocr
+            paddle_reader = self._get_paddle_ocr()
             
             # Convert PIL image to numpy array
             img_array = np.array(image)
             
             # Perform OCR
-            results = paddle_reader.ocr(img_array, cls=True)
+            with DocumentProcessor._paddle_call_lock:
+                results = paddle_reader.ocr(img_array, cls=True)
             
             # Extract text and confidence
             text_parts = []
@@ -783,26 +1139,29 @@ class DocumentProcessor:
                         _pytesseract.pytesseract.tesseract_cmd = path
                         break
             
-            # Preprocess image for better OCR
-            if self.ocr_config['preprocessing']:
-                image = self._preprocess_image_for_ocr(image)
+            # Preprocess image for better OCR (Tesseract only; the neural engines want the raw page)
+            prepared = self._preprocess_image_for_ocr(image) if self.ocr_config['preprocessing'] else image
             
             # Configure tesseract
             config = f"--oem {self.ocr_config['oem']} --psm {self.ocr_config['psm']}"
             
-            # Perform OCR
-            _load_ocr_modules()
-            text = _pytesseract.image_to_string(image, lang=self.ocr_config['language'], config=config)
-            
-            # Get confidence data if available
-            confidence = 0
             try:
-                data = _pytesseract.image_to_data(image, output_type=_pytesseract.Output.DICT)
-                confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-                if confidences:
-                    confidence = sum(confidences) / len(confidences)
-            except:
-                confidence = 85  # Default confidence for Tesseract
+                # Perform OCR
+                _load_ocr_modules()
+                text = _pytesseract.image_to_string(prepared, lang=self.ocr_config['language'], config=config)
+                
+                # Get confidence data if available
+                confidence = 0
+                try:
+                    data = _pytesseract.image_to_data(prepared, output_type=_pytesseract.Output.DICT)
+                    confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
+                    if confidences:
+                        confidence = sum(confidences) / len(confidences)
+                except:
+                    confidence = 85  # Default confidence for Tesseract
+            finally:
+                if prepared is not image:
+                    prepared.close()
             
             return {
                 'text': text.strip(),
@@ -830,20 +1189,147 @@ class DocumentProcessor:
             logger.error(f"Azure OCR failed: {e}")
             return None
     
-    def _ocr_pdf(self, file_path: str) -> Dict[str, Any]:
-        """Perform OCR on PDF pages"""
+    def _ocr_pdf(self, file_path: str, pages: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Perform OCR on PDF pages (1-based; every page when None), one rasterized page at a time"""
         
         result = {
             'text': '',
-            'processing_methods': ['pdf_ocr']
+            'processing_methods': ['pdf_ocr'],
+            'ocr_pages': {},
+            'pages': 0,
+            'confidence': 0
         }
         
-        # This would require converting PDF pages to images first
-        # Implementation depends on additional libraries like pdf2image
-        logger.info(f"PDF OCR not fully implemented for {file_path}")
+        if pages is None:
+            result['pages'] = self._pdf_page_count(file_path)
+            pages = list(range(1, result['pages'] + 1))
+        if not pages:
+            logger.info(f"No pages to OCR for {file_path}")
+            return result
+        
+        dpi = self.ocr_config.get('dpi', 300)
+        workers = max(1, int(self.ocr_config.get('pdf_ocr_workers', 1)))
+        confidences = []
+        
+        def record(page_num, ocr_result):
+            if ocr_result.get('text', '').strip():
+                result['ocr_pages'][page_num] = ocr_result['text']
+                confidences.append(ocr_result.get('confidence', 0))
+        
+        # Pages already OCR'd with these settings are not even rasterized
+        source_hash = self._content_hash(file_path)
+        to_rasterize = []
+        for page_num in pages:
+            cached = self._ocr_cache_lookup(source_hash, page_num)
+            if cached is None:
+                to_rasterize.append(page_num)
+            else:
+                record(page_num, cached)
+        
+        if to_rasterize:
+            page_images = self._iter_pdf_page_images(file_path, to_rasterize, dpi)
+            for page_num, ocr_result in self._ocr_image_stream(page_images, workers, file_path, source_hash):
+                record(page_num, ocr_result)
+        
+        result['text'] = '\n\n'.join(f"--- Page {page_num} ---\n{text}"
+                                     for page_num, text in sorted(result['ocr_pages'].items()))
+        result['confidence'] = sum(confidences) / len(confidences) if confidences else 0
+        logger.info(f"PDF OCR recovered text on {len(result['ocr_pages'])}/{len(pages)} pages of {file_path}")
         
         return result
     
+    def _ocr_image_stream(self, images: Iterator[Tuple[Any, Any]], workers: int, source: str,
+                          source_hash: Optional[str] = None) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """OCR (key, image) pairs on a thread pool as they are produced, holding at most 2 x workers bitmaps
+        
+        With source_hash, (source_hash, key) identifies each image in the OCR cache.
+        """
+        
+        def finished(future, key):
+            try:
+                return key, future.result()
+            except Exception as e:
+                logger.warning(f"OCR failed on {key} of {source}: {str(e)}")
+                return key, {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="ocr-stream") as pool:
+            in_flight = {}
+            for key, image in images:
+                source_key = (source_hash, key) if source_hash else None
+                in_flight[pool.submit(self._ocr_stream_image, image, source_key)] = key
+                del image
+                if len(in_flight) >= workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield finished(future, in_flight.pop(future))
+            for future in as_completed(in_flight):
+                yield finished(future, in_flight[future])
+    
+    def _ocr_stream_image(self, image, source_key: Optional[Tuple[str, Any]] = None) -> Dict[str, Any]:
+        """OCR one rasterized page or video frame and release its bitmap"""
+        try:
+            return self._perform_ocr(image, source_key=source_key)
+        finally:
+            image.close()
+    
+    def _iter_pdf_page_images(self, file_path: str, pages: List[int], dpi: int) -> Iterator[Tuple[int, Any]]:
+        """Rasterize the requested pages one at a time (pdf2image/Poppler, pdfplumber as fallback)"""
+        remaining = list(pages)
+        pdf2image = _load_pdf2image()
+        if pdf2image is not None:
+            while remaining:
+                page_num = remaining[0]
+                try:
+                    images = pdf2image.convert_from_path(file_path, dpi=dpi, first_page=page_num,
+                                                         last_page=page_num, grayscale=True)
+                except Exception as e:
+                    if len(remaining) == len(pages):
+                        # Nothing rasterized yet - most likely Poppler is missing
+                        logger.warning(f"pdf2image unavailable for {file_path}: {str(e)}")
+                        break
+                    logger.warning(f"Failed to rasterize page {page_num} of {file_path}: {str(e)}")
+                    remaining.pop(0)
+                    continue
+                remaining.pop(0)
+                if images:
+                    yield page_num, images[0]
+        
+        if not remaining:
+            return
+        if not HAVE_PDF:
+            logger.warning(f"No PDF rasterizer available for {file_path}")
+            return
+        
+        with pdfplumber.open(file_path) as pdf:
+            for page_num in remaining:
+                if page_num > len(pdf.pages):
+                    break
+                page = pdf.pages[page_num - 1]
+                try:
+                    image = page.to_image(resolution=dpi).original.convert('L')
+                except Exception as e:
+                    logger.warning(f"Failed to rasterize page {page_num} of {file_path}: {str(e)}")
+                    continue
+                finally:
+                    if hasattr(page, 'close'):
+                        page.close()
+                yield page_num, image
+    
+    def _pdf_page_count(self, file_path: str) -> int:
+        pdf2image = _load_pdf2image()
+        if pdf2image is not None:
+            try:
+                return int(pdf2image.pdfinfo_from_path(file_path).get('Pages', 0))
+            except Exception:
+                pass
+        if HAVE_PDF:
+            try:
+                with pdfplumber.open(file_path) as pdf:
+                    return len(pdf.pages)
+            except Exception as e:
+                logger.warning(f"Failed to count pages in {file_path}: {str(e)}")
+        return 0
+    
     def _extract_file_metadata(self, file_path: str) -> Dict[str, Any]:
         """Extract file system and format-specific metadata"""
         
@@ -871,10 +1357,8 @@ class DocumentProcessor:
         hashes = {}
         
         try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
-                hashes['md5'] = hashlib.md5(data).hexdigest()
-                hashes['sha256'] = hashlib.sha256(data).hexdigest()
+            # Shared single-pass streaming hash, memoized per file identity
+            hashes = hash_file_digests(file_path, ('md5', 'sha256'))
         
         except Exception as e:
             logger.error(f"Failed to calculate hash for {file_path}: {str(e)}")
@@ -912,7 +1396,9 @@ class DocumentProcessor:
     
     def get_processing_stats(self) -> Dict[str, Any]:
         """Get current processing statistics"""
-        return self.processing_stats.copy()
+        stats = self.processing_stats.copy()
+        stats['ocr_routing'] = self.ocr_router.get_stats()
+        return stats
     
     def configure_ocr(self, **kwargs):
         """Configure OCR settings"""
@@ -921,7 +1407,43 @@ class DocumentProcessor:
                 self.ocr_config[key] = value
                 logger.info(f"OCR config updated: {key} = {value}")
     
+    def configure_video(self, **kwargs):
+        """Configure video frame sampling"""
+        for key, value in kwargs.items():
+            if key in self.video_config:
+                self.video_config[key] = value
+                logger.info(f"Video config updated: {key} = {value}")
+    
     def is_supported_format(self, file_path: str) -> bool:
         """Check if file format is supported"""
         ext = Path(file_path).suffix.lower()
         return any(ext in formats for formats in self.supported_formats.values())
+
+
+# ----------------------------------------------------------------------
+# Process pool workers (module level so they pickle under spawn as well as fork)
+# ----------------------------------------------------------------------
+_worker_processor: Optional[DocumentProcessor] = None
+
+# Per-file counters a worker accumulates that the parent folds into its own stats
+_WORKER_STAT_KEYS = ('ocr_processed', 'ocr_cache_hits', 'metadata_extracted')
+
+
+def _init_process_worker(ocr_config: Dict[str, Any], video_config: Optional[Dict[str, Any]] = None) -> None:
+    """Pool initializer - one DocumentProcessor per worker, configured like the parent, with its OCR engines loaded once"""
+    global _worker_processor
+    _worker_processor = DocumentProcessor()
+    _worker_processor.ocr_config.update(ocr_config)
+    _worker_processor.video_config.update(video_config or {})
+    warmed = _worker_processor.warm_ocr_engines()
+    logger.debug(f"[DOC] Worker {os.getpid()} ready (warmed: {', '.join(warmed) or 'none'})")
+
+
+def _process_file_in_worker(index: int, file_info: Dict[str, Any]) -> Dict[str, Any]:
+    if _worker_processor is None:
+        _init_process_worker({})
+    processor = _worker_processor
+    before = {key: processor.processing_stats.get(key, 0) for key in _WORKER_STAT_KEYS}
+    outcome = processor._process_file_outcome(index, file_info)
+    outcome['stats_delta'] = {key: processor.processing_stats.get(key, 0) - before[key] for key in _WORKER_STAT_KEYS}
+    return outcome
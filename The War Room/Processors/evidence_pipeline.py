@@ -3,16 +3,20 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from document_processor import DocumentProcessor
 
+# Shared Data Bus modules (file_hashing)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from file_hashing import hash_file_digests
+
 logger = logging.getLogger(__name__)
 
 
@@ -204,14 +208,7 @@ class EvidencePipeline:
     def _calculate_hashes(file_path: Path) -> Dict[str, str]:
         hashes = {'md5': '', 'sha256': ''}
         try:
-            md5 = hashlib.md5()
-            sha256 = hashlib.sha256()
-            with file_path.open('rb') as handle:
-                for chunk in iter(lambda: handle.read(8192), b''):
-                    md5.update(chunk)
-                    sha256.update(chunk)
-            hashes['md5'] = md5.hexdigest()
-            hashes['sha256'] = sha256.hexdigest()
+            hashes.update(hash_file_digests(file_path, ('md5', 'sha256')))
         except Exception as exc:  # pragma: no cover - IO/permission issues
             hashes['error'] = str(exc)
         return hashes
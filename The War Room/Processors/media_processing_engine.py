@@ -8,9 +8,8 @@ import os
 import sys
 import json
 import logging
-import hashlib
 import tempfile
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 import threading
@@ -18,6 +17,17 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from voice_transcription import VoiceTranscriber
 
+# Shared Data Bus modules (file_hashing, perceptual_hash, result_cache)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from file_hashing import file_hexdigest
+from perceptual_hash import DEFAULT_MAX_DISTANCE, cluster_near_duplicates, dhash
+from result_cache import ResultCache
+
+# Cached analysis results (and the thumbnails they own) expire after a day
+MEDIA_CACHE_TTL_SECONDS = 24 * 3600
+MEDIA_CACHE_MAX_ENTRIES = 100000
+MEDIA_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
 # Image and Video Processing
 try:
     import cv2
@@ -97,6 +107,15 @@ class MediaProcessingEngine:
         self.temp_dir = tempfile.mkdtemp(prefix='dki_media_')
         self.cache_dir = os.path.join(tempfile.gettempdir(), 'dki_media_cache')
         self._ensure_cache_dir()
+        # Single LRU index bounded by DKI_MEDIA_CACHE_MAX_ENTRIES / DKI_MEDIA_CACHE_MAX_MB
+        self.result_cache = ResultCache.from_env(
+            'media',
+            os.path.join(self.cache_dir, 'media_cache.sqlite3'),
+            default_entries=self.config.get('cache_max_entries', MEDIA_CACHE_MAX_ENTRIES),
+            default_bytes=self.config.get('cache_max_bytes', MEDIA_CACHE_MAX_BYTES),
+            ttl_seconds=self.config.get('cache_ttl_seconds', MEDIA_CACHE_TTL_SECONDS)
+        )
+        self._purge_legacy_cache_files()
         
         self.voice_transcriber = VoiceTranscriber()
         # Processing capabilities
@@ -168,7 +187,7 @@ class MediaProcessingEngine:
             if file_type == 'image':
                 result.update(self._process_image(file_path, analysis_options))
             elif file_type == 'video':
-                result.update(self._process_video(file_path, analysis_options))
+                result.update(self._process_video(file_path, analysis_options, file_hash=file_hash))
             elif file_type == 'audio':
                 result.update(self._process_audio(file_path, analysis_options))
             
@@ -226,33 +245,33 @@ class MediaProcessingEngine:
     
     def _generate_file_hash(self, file_path: str) -> str:
         """Generate SHA256 hash of file for caching"""
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+        return file_hexdigest(file_path, 'sha256')
+    
+    def _purge_legacy_cache_files(self):
+        """Remove per-result JSON files left by the previous cache layout"""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext == '.json' and len(stem) == 64 and entry.is_file():
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Error purging legacy cache files: {e}")
     
     def _get_cached_result(self, file_hash: str) -> Optional[Dict]:
         """Get cached processing result"""
-        cache_file = os.path.join(self.cache_dir, f"{file_hash}.json")
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                # Check if cache is still valid (24 hours)
-                cached_time = datetime.fromisoformat(cached_data['processed_at'])
-                if datetime.now() - cached_time < timedelta(hours=24):
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"Error reading cache file {cache_file}: {e}")
-        return None
+        try:
+            return self.result_cache.get(file_hash)
+        except Exception as e:
+            logger.warning(f"Error reading cached result {file_hash}: {e}")
+            return None
     
     def _cache_result(self, file_hash: str, result: Dict):
-        """Cache processing result"""
-        cache_file = os.path.join(self.cache_dir, f"{file_hash}.json")
+        """Cache processing result; thumbnails it references are evicted with it"""
+        files = [result.get('thumbnail')]
+        files.extend(frame.get('thumbnail') for frame in result.get('frames') or [])
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(result, f, indent=2, default=str)
+            self.result_cache.put(file_hash, result, files=[path for path in files if path])
         except Exception as e:
             logger.warning(f"Error caching result: {e}")
     
@@ -289,6 +308,11 @@ class MediaProcessingEngine:
             if exif_data:
                 result['exif'] = exif_data
             
+            # Perceptual hash for near-duplicate detection (before the thumbnail shrinks the image)
+            perceptual_hash = self._perceptual_hash(image)
+            if perceptual_hash:
+                result['perceptual_hash'] = perceptual_hash
+            
             # Generate thumbnail
             thumbnail_path = self._generate_thumbnail(image, file_path)
             if thumbnail_path:
@@ -318,7 +342,7 @@ class MediaProcessingEngine:
         
         return result
     
-    def _process_video(self, file_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_video(self, file_path: str, options: Dict[str, Any], file_hash: Optional[str] = None) -> Dict[str, Any]:
         """Process video file"""
         result = {}
         
@@ -338,14 +362,15 @@ class MediaProcessingEngine:
                 'aspect_ratio': round(video.w / video.h, 2)
             }
             
-            # Extract frames for analysis
-            if options.get('extract_frames', True):
-                frames = self._extract_video_frames(video, file_path, options.get('frame_count', 10))
-                if frames:
-                    result['frames'] = frames
-            
-            # Generate thumbnail
-            thumbnail_path = self._generate_video_thumbnail(video, file_path)
+            # Extract frames for analysis and the poster thumbnail in a single decode sweep
+            file_hash = file_hash or self._generate_file_hash(file_path)
+            frame_count = options.get('frame_count', 10) if options.get('extract_frames', True) else 0
+            frames, thumbnail_path = self._extract_video_frames(video, file_hash, frame_count)
+            if frames:
+                result['frames'] = frames
+                frame_hashes = [frame['perceptual_hash'] for frame in frames if frame.get('perceptual_hash')]
+                if frame_hashes:
+                    result['frame_hashes'] = frame_hashes
             if thumbnail_path:
                 result['thumbnail'] = thumbnail_path
             
@@ -357,7 +382,7 @@ class MediaProcessingEngine:
             
             # Motion detection if enabled
             if options.get('detect_motion', False) and HAS_CV2:
-                motion_data = self._detect_motion_in_video(video)
+                motion_data = self._detect_motion_in_video(video, options)
                 if motion_data:
                     result['motion'] = motion_data
             
@@ -606,7 +631,7 @@ class MediaProcessingEngine:
         d, m, s = value
         return d + (m / 60.0) + (s / 3600.0)
     
-    def _generate_thumbnail(self, image, file_path: str) -> Optional[str]:
+    def _generate_thumbnail(self, image, file_path: str, file_hash: Optional[str] = None) -> Optional[str]:
         """Generate thumbnail for image"""
         try:
             # Create thumbnail
@@ -614,16 +639,9 @@ class MediaProcessingEngine:
             image.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
             
             # Save thumbnail
-            file_hash = self._generate_file_hash(file_path)
+            file_hash = file_hash or self._generate_file_hash(file_path)
             thumbnail_path = os.path.join(self.cache_dir, f"{file_hash}_thumb.jpg")
-            
-            # Convert to RGB if necessary
-            if image.mode in ('RGBA', 'LA', 'P'):
-                rgb_image = Image.new('RGB', image.size, (255, 255, 255))
-                rgb_image.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                rgb_image.save(thumbnail_path, 'JPEG', quality=85)
-            else:
-                image.save(thumbnail_path, 'JPEG', quality=85)
+            self._save_thumbnail(image, thumbnail_path)
             
             return thumbnail_path
             
@@ -631,24 +649,15 @@ class MediaProcessingEngine:
             logger.warning(f"Error generating thumbnail: {e}")
             return None
     
-    def _generate_video_thumbnail(self, video, file_path: str) -> Optional[str]:
-        """Generate thumbnail for video"""
-        try:
-            # Get frame at 10% of video duration
-            frame_time = video.duration * 0.1
-            frame = video.get_frame(frame_time)
-            
-            # Convert to PIL Image
-            image = Image.fromarray(frame)
-            
-            # Generate thumbnail
-            thumbnail_path = self._generate_thumbnail(image, file_path)
-            
-            return thumbnail_path
-            
-        except Exception as e:
-            logger.warning(f"Error generating video thumbnail: {e}")
-            return None
+    def _save_thumbnail(self, image, thumbnail_path: str):
+        """Save a thumbnail as JPEG, flattening transparency onto white"""
+        # Convert to RGB if necessary
+        if image.mode in ('RGBA', 'LA', 'P'):
+            rgb_image = Image.new('RGB', image.size, (255, 255, 255))
+            rgb_image.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
+            rgb_image.save(thumbnail_path, 'JPEG', quality=85)
+        else:
+            image.save(thumbnail_path, 'JPEG', quality=85)
     
     def _extract_text_from_image(self, image) -> Optional[str]:
         """Extract text from image using OCR"""
@@ -739,36 +748,98 @@ class MediaProcessingEngine:
             logger.warning(f"Error detecting objects: {e}")
             return None
     
-    def _extract_video_frames(self, video, file_path: str, frame_count: int = 10) -> Optional[List[Dict[str, Any]]]:
-        """Extract representative frames from video"""
+    def _extract_video_frames(self, video, file_hash: str, frame_count: int = 10) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Extract representative frames and the poster thumbnail (10% mark) in one sequential decode pass
+
+        Frame perceptual hashes are always taken from the saved frame thumbnail, so a cached
+        and a freshly decoded frame hash identically across runs.
+        """
+        frames: List[Dict[str, Any]] = []
+        poster_path = os.path.join(self.cache_dir, f"{file_hash}_thumb.jpg")
+        poster_thumbnail = None
+        
+        def add_frame(role: int, time_point: float, thumbnail_path: Optional[str]) -> None:
+            frames.append({
+                'frame_number': role,
+                'timestamp': time_point,
+                'thumbnail': thumbnail_path,
+                'perceptual_hash': self._perceptual_hash(thumbnail_path) if thumbnail_path else None
+            })
+        
         try:
-            frames = []
             duration = video.duration
             
-            # Extract frames at regular intervals
+            # timestamp -> what to produce from that frame; thumbnails are keyed by video hash + timestamp
+            requests: Dict[float, List[Any]] = {}
             for i in range(frame_count):
-                time_point = (duration / frame_count) * i
-                frame = video.get_frame(time_point)
-                
-                # Convert to PIL Image
+                time_point = round((duration / frame_count) * i, 3)
+                requests.setdefault(time_point, []).append(i)
+            requests.setdefault(round(duration * 0.1, 3), []).append('poster')
+            
+            # Serve cached thumbnails first; only timestamps with something missing need decoding
+            pending: Dict[float, List[Any]] = {}
+            for time_point, roles in requests.items():
+                for role in roles:
+                    if role == 'poster':
+                        if os.path.exists(poster_path):
+                            poster_thumbnail = poster_path
+                            continue
+                    else:
+                        thumbnail_path = self._frame_thumbnail_path(file_hash, time_point)
+                        if os.path.exists(thumbnail_path):
+                            add_frame(role, time_point, thumbnail_path)
+                            continue
+                    pending.setdefault(time_point, []).append(role)
+            
+            def produce(time_point: float, frame) -> None:
+                nonlocal poster_thumbnail
                 image = Image.fromarray(frame)
-                
-                # Generate thumbnail for frame
-                thumbnail_path = self._generate_frame_thumbnail(image, file_path, i)
-                
-                frames.append({
-                    'frame_number': i,
-                    'timestamp': time_point,
-                    'thumbnail': thumbnail_path
-                })
-            
-            return frames
+                for role in pending[time_point]:
+                    if role == 'poster':
+                        poster_thumbnail = self._generate_thumbnail(image.copy(), '', file_hash=file_hash)
+                    else:
+                        add_frame(role, time_point, self._generate_frame_thumbnail(image.copy(), file_hash, time_point))
+            
+            targets = sorted(pending)
+            if targets:
+                # One pass through the stream: each target takes the frame that covers its timestamp,
+                # and decoding stops after the last one
+                frame_period = 1.0 / (float(getattr(video, 'fps', 0) or 0) or 30.0)
+                next_target = 0
+                last_frame = None
+                for frame_time, frame in video.iter_frames(with_times=True, dtype='uint8'):
+                    last_frame = frame
+                    while next_target < len(targets) and frame_time + frame_period > targets[next_target]:
+                        produce(targets[next_target], frame)
+                        next_target += 1
+                    if next_target >= len(targets):
+                        break
+                # Targets past the final decoded frame (duration rounding) take that frame
+                if last_frame is not None:
+                    for time_point in targets[next_target:]:
+                        produce(time_point, last_frame)
+            
+            frames.sort(key=lambda frame: frame['frame_number'])
+            return frames, poster_thumbnail
             
         except Exception as e:
             logger.warning(f"Error extracting video frames: {e}")
+            frames.sort(key=lambda frame: frame['frame_number'])
+            return frames, poster_thumbnail
+    
+    @staticmethod
+    def _perceptual_hash(image) -> Optional[str]:
+        """dHash of an image or image path; None if it cannot be computed"""
+        try:
+            return dhash(image)
+        except Exception as e:
+            logger.warning(f"Error computing perceptual hash: {e}")
             return None
     
-    def _generate_frame_thumbnail(self, image, file_path: str, frame_number: int) -> Optional[str]:
+    def _frame_thumbnail_path(self, file_hash: str, timestamp: float) -> str:
+        return os.path.join(self.cache_dir, f"{file_hash}_frame_{int(round(timestamp * 1000))}ms.jpg")
+    
+    def _generate_frame_thumbnail(self, image, file_hash: str, timestamp: float) -> Optional[str]:
         """Generate thumbnail for video frame"""
         try:
             # Create thumbnail
@@ -776,16 +847,8 @@ class MediaProcessingEngine:
             image.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
             
             # Save thumbnail
-            file_hash = self._generate_file_hash(file_path)
-            thumbnail_path = os.path.join(self.cache_dir, f"{file_hash}_frame_{frame_number}.jpg")
-            
-            # Convert to RGB if necessary
-            if image.mode in ('RGBA', 'LA', 'P'):
-                rgb_image = Image.new('RGB', image.size, (255, 255, 255))
-                rgb_image.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                rgb_image.save(thumbnail_path, 'JPEG', quality=85)
-            else:
-                image.save(thumbnail_path, 'JPEG', quality=85)
+            thumbnail_path = self._frame_thumbnail_path(file_hash, timestamp)
+            self._save_thumbnail(image, thumbnail_path)
             
             return thumbnail_path
             
@@ -918,92 +981,155 @@ class MediaProcessingEngine:
             logger.warning(f"Error detecting speech segments: {e}")
             return None
     
-    def _detect_motion_in_video(self, video) -> Optional[Dict[str, Any]]:
-        """Detect motion in video using OpenCV frame differencing"""
+    def _detect_motion_in_video(self, video, options: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Detect motion segments across the whole clip using sampled grayscale frame differencing
+
+        A coarse pass differences downscaled frames at a wide, duration-scaled interval;
+        only spans where that pass sees change are re-sampled at the fine interval to
+        pin down start/end times. If the decode budget runs out first, the spans it did
+        not reach keep their coarse timing and score and the result is flagged
+        partially_refined.
+        """
         try:
             if not HAS_CV2:
                 logger.info("OpenCV not available for motion detection")
                 return {
                     'motion_detected': False,
                     'motion_regions': [],
+                    'motion_intervals': [],
                     'motion_intensity': 0.0,
                     'error': 'OpenCV not available'
                 }
             
-            import cv2
-            import numpy as np
-            
-            # Extract frames for motion analysis
-            frames = []
-            frame_count = 0
-            max_frames = 30  # Limit analysis to first 30 frames for performance
-            
-            while frame_count < max_frames:
-                ret, frame = video.read()
-                if not ret:
-                    break
-                    
-                # Convert to grayscale for motion detection
-                gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                frames.append(gray_frame)
-                frame_count += 1
+            options = options or {}
+            duration = float(video.duration or 0.0)
+            fps = float(getattr(video, 'fps', 0) or 0) or 30.0
+            threshold = float(options.get('motion_threshold', 0.05))  # fraction of changed pixels
+            max_samples = max(4, int(options.get('motion_max_samples', 2000)))
+            fine_interval = max(1.0 / fps, float(options.get('motion_fine_interval', 0.25)))
+            coarse_interval = float(options.get('motion_coarse_interval', 0) or 0)
+            if coarse_interval <= 0:
+                # ~300 coarse samples regardless of length, never finer than half a second
+                coarse_interval = max(0.5, duration / 300.0)
+            # Keep the coarse pass within half of the decode budget
+            coarse_interval = max(coarse_interval, fine_interval, duration / (max_samples / 2))
+            width = max(32, int(options.get('motion_frame_width', 160)))
+            budget = {'decoded': 0}
+            # Source pixels per differenced pixel, from the frames actually sampled
+            geometry = {'scale': 1.0}
+            
+            def sample(time_point: float):
+                budget['decoded'] += 1
+                frame, geometry['scale'] = self._motion_frame(video.get_frame(time_point), width)
+                return frame
+            
+            if duration <= 0:
+                return {
+                    'motion_detected': False,
+                    'motion_regions': [],
+                    'motion_intervals': [],
+                    'motion_intensity': 0.0,
+                    'error': 'Insufficient frames for motion analysis'
+                }
             
-            if len(frames) < 2:
+            # Coarse pass over the full duration, one decoded frame held at a time
+            last_time = max(0.0, duration - 1.0 / fps)
+            coarse_times = self._sample_times(0.0, last_time, coarse_interval)
+            coarse_scores = []
+            previous = None
+            for time_point in coarse_times:
+                current = sample(time_point)
+                if previous is not None:
+                    coarse_scores.append((previous[0], time_point, self._motion_score(previous[1], current)))
+                previous = (time_point, current)
+            
+            if not coarse_scores:
                 return {
                     'motion_detected': False,
                     'motion_regions': [],
+                    'motion_intervals': [],
                     'motion_intensity': 0.0,
                     'error': 'Insufficient frames for motion analysis'
                 }
             
-            # Calculate frame differences
-            motion_scores = []
+            # Spans worth refining; the lower trigger catches motion that mostly settled between samples
+            trigger = threshold * float(options.get('motion_refine_ratio', 0.5))
+            spans: List[List[float]] = []
+            for start, end, score in coarse_scores:
+                if score < trigger:
+                    continue
+                if spans and start <= spans[-1][1]:
+                    spans[-1][1] = end
+                else:
+                    spans.append([start, end])
+            
+            # Fine pass only inside active spans, ascending so the reader keeps moving forward
+            fine_scores = []
+            unrefined: List[Tuple[float, float]] = []  # span remainders the budget did not cover
+            for start, end in spans:
+                previous = None
+                for time_point in self._sample_times(start, end, fine_interval):
+                    if budget['decoded'] >= max_samples:
+                        break
+                    current = sample(time_point)
+                    if previous is not None:
+                        fine_scores.append((previous[0], time_point, self._motion_score(previous[1], current), previous[1], current))
+                    previous = (time_point, current)
+                reached = previous[0] if previous is not None else start
+                if reached < round(end, 3):
+                    unrefined.append((reached, end))
+            if unrefined:
+                logger.info(f"Motion refinement stopped at {max_samples} sampled frames; "
+                            f"{len(unrefined)} span(s) keep coarse timing")
+            
+            # Unrefined remainders fall back to the coarse pairs that flagged them
+            coarse_fallback = [
+                (max(start, span_start), min(end, span_end), score)
+                for span_start, span_end in unrefined
+                for start, end, score in coarse_scores
+                if score >= trigger and start < span_end and end > span_start
+            ]
+            intervals = self._merge_motion_intervals(
+                [(start, end, score) for start, end, score, _, _ in fine_scores if score >= threshold] + coarse_fallback,
+                float(options.get('motion_merge_gap', 1.0))
+            )
+            
+            # Bounding boxes for the strongest change in the first few intervals, in source pixels
             motion_regions = []
-            
-            for i in range(1, len(frames)):
-                # Calculate absolute difference between consecutive frames
-                diff = cv2.absdiff(frames[i-1], frames[i])
-                
-                # Apply threshold to get binary motion mask
-                _, thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)
-                
-                # Calculate motion intensity (percentage of changed pixels)
-                motion_pixels = np.sum(thresh > 0)
-                total_pixels = thresh.shape[0] * thresh.shape[1]
-                motion_intensity = motion_pixels / total_pixels
-                motion_scores.append(motion_intensity)
-                
-                # Find contours for motion regions
-                contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                frame_regions = []
-                
-                for contour in contours:
-                    if cv2.contourArea(contour) > 100:  # Filter small noise
-                        x, y, w, h = cv2.boundingRect(contour)
-                        frame_regions.append({
-                            'x': int(x), 'y': int(y), 
-                            'width': int(w), 'height': int(h),
-                            'area': int(cv2.contourArea(contour))
-                        })
-                
-                if frame_regions:
+            scale = geometry['scale']
+            for interval in intervals[:5]:
+                peak = max(
+                    (pair for pair in fine_scores if interval['start'] <= pair[0] and pair[1] <= interval['end']),
+                    key=lambda pair: pair[2],
+                    default=None
+                )
+                if peak is None:
+                    continue  # coarse-only interval: its frames were not kept
+                regions = self._motion_regions(peak[3], peak[4], scale)
+                if regions:
                     motion_regions.append({
-                        'frame': i,
-                        'regions': frame_regions
+                        'frame': int(peak[1] * fps),
+                        'timestamp': round(peak[1], 3),
+                        'regions': regions
                     })
             
-            # Calculate overall motion metrics
-            avg_motion_intensity = np.mean(motion_scores) if motion_scores else 0.0
-            max_motion_intensity = np.max(motion_scores) if motion_scores else 0.0
-            motion_detected = max_motion_intensity > 0.05  # 5% threshold
+            all_scores = [score for _, _, score in coarse_scores]
+            motion_seconds = sum(interval['end'] - interval['start'] for interval in intervals)
             
             return {
-                'motion_detected': motion_detected,
-                'motion_regions': motion_regions[:5],  # Limit to first 5 frames with motion
-                'motion_intensity': float(avg_motion_intensity),
-                'max_motion_intensity': float(max_motion_intensity),
-                'frames_analyzed': len(frames),
-                'motion_frames': len([score for score in motion_scores if score > 0.05])
+                'motion_detected': bool(intervals),
+                'motion_intervals': intervals,
+                'motion_regions': motion_regions,
+                'motion_intensity': float(sum(all_scores) / len(all_scores)),
+                'max_motion_intensity': float(max([score for _, _, score, _, _ in fine_scores] + all_scores)),
+                'motion_seconds': round(motion_seconds, 3),
+                'static_seconds': round(max(0.0, duration - motion_seconds), 3),
+                'frames_analyzed': budget['decoded'],
+                'motion_frames': len([pair for pair in fine_scores if pair[2] >= threshold]) + len(coarse_fallback),
+                'partially_refined': bool(unrefined),
+                'unrefined_seconds': round(sum(end - start for start, end in unrefined), 3),
+                'coarse_interval': round(coarse_interval, 3),
+                'fine_interval': round(fine_interval, 3)
             }
             
         except Exception as e:
@@ -1011,10 +1137,71 @@ class MediaProcessingEngine:
             return {
                 'motion_detected': False,
                 'motion_regions': [],
+                'motion_intervals': [],
                 'motion_intensity': 0.0,
                 'error': str(e)
             }
     
+    @staticmethod
+    def _sample_times(start: float, end: float, interval: float) -> List[float]:
+        """Evenly spaced timestamps from start to end inclusive"""
+        steps = int((end - start) / interval) if interval > 0 else 0
+        times = [round(start + interval * step, 3) for step in range(steps + 1)]
+        if times[-1] < round(end, 3):
+            times.append(round(end, 3))
+        return times
+    
+    @staticmethod
+    def _motion_frame(frame, width: int):
+        """Downscaled, blurred grayscale copy of an RGB frame for differencing, plus the scale back to source pixels"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        height, source_width = gray.shape[:2]
+        if source_width > width:
+            gray = cv2.resize(gray, (width, max(1, int(height * width / source_width))), interpolation=cv2.INTER_AREA)
+        return cv2.GaussianBlur(gray, (5, 5), 0), source_width / gray.shape[1]
+    
+    @staticmethod
+    def _motion_score(previous, current) -> float:
+        """Fraction of pixels whose intensity changed by more than the noise floor"""
+        diff = cv2.absdiff(previous, current)
+        _, thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)
+        total_pixels = thresh.shape[0] * thresh.shape[1]
+        return cv2.countNonZero(thresh) / total_pixels if total_pixels else 0.0
+    
+    @staticmethod
+    def _motion_regions(previous, current, scale: float) -> List[Dict[str, int]]:
+        diff = cv2.absdiff(previous, current)
+        _, thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)
+        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        regions = []
+        min_area = 100 / (scale * scale)  # Filter small noise (100 source pixels)
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area > min_area:
+                x, y, w, h = cv2.boundingRect(contour)
+                regions.append({
+                    'x': int(x * scale), 'y': int(y * scale),
+                    'width': int(w * scale), 'height': int(h * scale),
+                    'area': int(area * scale * scale)
+                })
+        return regions
+    
+    @staticmethod
+    def _merge_motion_intervals(pairs: List[Tuple[float, float, float]], merge_gap: float) -> List[Dict[str, float]]:
+        """Collapse active sample pairs into start/end intervals, bridging gaps up to merge_gap seconds"""
+        intervals: List[Dict[str, float]] = []
+        for start, end, score in sorted(pairs):
+            if intervals and start - intervals[-1]['end'] <= merge_gap:
+                intervals[-1]['end'] = max(intervals[-1]['end'], end)
+                intervals[-1]['peak_intensity'] = max(intervals[-1]['peak_intensity'], score)
+            else:
+                intervals.append({'start': start, 'end': end, 'peak_intensity': score})
+        for interval in intervals:
+            interval['start'] = round(interval['start'], 3)
+            interval['end'] = round(interval['end'], 3)
+            interval['peak_intensity'] = round(float(interval['peak_intensity']), 4)
+        return intervals
+    
     def cleanup_temp_files(self):
         """Clean up temporary files"""
         try:
@@ -1029,6 +1216,7 @@ class MediaProcessingEngine:
             'capabilities': self.capabilities,
             'supported_formats': self.supported_formats,
             'cache_dir': self.cache_dir,
+            'cache': self.result_cache.get_stats(),
             'temp_dir': self.temp_dir
         }
 
@@ -1079,31 +1267,45 @@ class MediaAnalysisTool:
             }
         }
     
-    def detect_duplicate_media(self, media_files: List[str]) -> Dict[str, Any]:
-        """Detect duplicate or similar media files"""
+    def detect_duplicate_media(self, media_files: List[str], max_distance: int = DEFAULT_MAX_DISTANCE) -> Dict[str, Any]:
+        """Detect duplicate or similar media files
+        
+        Exact duplicates share a file hash; near duplicates are clustered by perceptual
+        hash (images, and any sampled frame of a video) within max_distance bits.
+        """
+        results = self.media_engine.process_media_batch(media_files)
         file_hashes = {}
         duplicates = []
+        hashed_files = []
         
         for file_path in media_files:
-            try:
-                result = self.media_engine.process_media_file(file_path)
-                file_hash = result.get('file_hash')
-                
-                if file_hash:
-                    if file_hash in file_hashes:
-                        duplicates.append({
-                            'original': file_hashes[file_hash],
-                            'duplicate': file_path,
-                            'hash': file_hash
-                        })
-                    else:
-                        file_hashes[file_hash] = file_path
-                        
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {e}")
+            result = results.get(file_path) or {}
+            if 'error' in result and 'file_hash' not in result:
+                continue
+            file_hash = result.get('file_hash')
+            
+            if file_hash:
+                if file_hash in file_hashes:
+                    duplicates.append({
+                        'original': file_hashes[file_hash],
+                        'duplicate': file_path,
+                        'hash': file_hash
+                    })
+                    continue
+                file_hashes[file_hash] = file_path
+            
+            perceptual_hashes = result.get('frame_hashes') or result.get('perceptual_hash')
+            if perceptual_hashes:
+                hashed_files.append((file_path, perceptual_hashes))
+        
+        near_duplicates = [
+            {'original': cluster[0], 'similar': cluster[1:]}
+            for cluster in cluster_near_duplicates(hashed_files, max_distance)
+        ]
         
         return {
             'duplicates': duplicates,
+            'near_duplicates': near_duplicates,
             'unique_files': len(file_hashes),
             'total_files': len(media_files)
         }
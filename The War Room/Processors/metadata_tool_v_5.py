@@ -3,10 +3,14 @@
 
 import zipfile
 import os
+import sys
 import json
-import hashlib
 from datetime import datetime
 
+# Shared Data Bus modules (file_hashing)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Command Center", "Data Bus"))
+from file_hashing import hash_file_digests
+
 # --- Simulated Tool Functions (Replace with real libraries/tools later) ---
 def run_pillow(file): return {"tool": "Pillow", "metadata": {"DateTimeOriginal": "2021:06:01 12:00:00"}}
 def run_piexif(file): return {"tool": "piexif", "metadata": {}}
@@ -38,9 +42,8 @@ FILE_CATEGORIES = {
 }
 
 def hash_file(path):
-    with open(path, "rb") as f:
-        data = f.read()
-        return hashlib.md5(data).hexdigest(), hashlib.sha256(data).hexdigest()
+    digests = hash_file_digests(path, ("md5", "sha256"))
+    return digests["md5"], digests["sha256"]
 
 def process_zip(zip_path, output_dir):
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
-"""Utility wrapper for voice transcription services used by the media engine."""
+"""Utility wrapper for voice transcription services used by the media engine.
+
+Long recordings are decoded as a 16 kHz mono stream, cut into chunks at the
+quietest point near each chunk boundary (energy VAD), transcribed chunk by
+chunk (optionally across a CPU process pool) and stitched back in order using
+absolute timestamps, so memory stays bounded by the chunk size.
+"""
 
 from __future__ import annotations
 
 import logging
 import os
+import shutil
+import subprocess
 import tempfile
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import whisper  # type: ignore
@@ -16,15 +24,34 @@ except Exception:  # pragma: no cover - library optional
     whisper = None  # type: ignore
     _HAS_WHISPER = False
 
-try:  # Prefer soundfile for reliable WAV writes
+try:  # Block-wise decoding when ffmpeg is not on PATH
     import soundfile as sf  # type: ignore
     _HAS_SOUNDFILE = True
 except Exception:  # pragma: no cover - optional dependency
     sf = None  # type: ignore
     _HAS_SOUNDFILE = False
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - installed alongside whisper
+    np = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Whisper models consume 16 kHz mono float32
+SAMPLE_RATE = 16000
+DEFAULT_CHUNK_SECONDS = 60.0
+DEFAULT_OVERLAP_SECONDS = 1.0
+# Boundaries are placed at the quietest 30 ms frame within this many seconds before the target
+DEFAULT_VAD_SEARCH_SECONDS = 10.0
+VAD_FRAME_SAMPLES = 480
+DEFAULT_TRANSCRIBE_WORKERS = 1
+DECODE_BLOCK_SECONDS = 5.0
+
+SegmentCallback = Callable[[List[Dict[str, Any]]], None]
+# (audio start seconds, keep from seconds, keep until seconds, samples)
+AudioChunk = Tuple[float, float, float, Any]
+
 
 @dataclass
 class TranscriptionResult:
@@ -39,9 +66,14 @@ class TranscriptionResult:
 class VoiceTranscriber:
     """High-level fa?ade around the configured speech-to-text backend."""
 
-    def __init__(self, model_name: Optional[str] = None, device: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, device: Optional[str] = None,
+                 chunk_seconds: Optional[float] = None, workers: Optional[int] = None):
         self.model_name = model_name or os.getenv("DKI_VOICE_MODEL", "tiny")
         self.device = device or os.getenv("DKI_VOICE_DEVICE")
+        self.chunk_seconds = float(chunk_seconds or os.getenv("DKI_VOICE_CHUNK_SECONDS", DEFAULT_CHUNK_SECONDS))
+        self.overlap_seconds = DEFAULT_OVERLAP_SECONDS
+        self.vad_search_seconds = min(DEFAULT_VAD_SEARCH_SECONDS, self.chunk_seconds / 2)
+        self.workers = self._resolve_workers(workers)
         self.available = _HAS_WHISPER
         self._model = None
 
@@ -55,12 +87,76 @@ class VoiceTranscriber:
         return self.available
 
     # ------------------------------------------------------------------
-    def transcribe_file(self, file_path: str, **kwargs: Any) -> Optional[TranscriptionResult]:
-        """Transcribe an audio file located on disk."""
+    def transcribe_file(self, file_path: str, segment_callback: Optional[SegmentCallback] = None,
+                        **kwargs: Any) -> Optional[TranscriptionResult]:
+        """Transcribe an audio file located on disk, streaming it through the chunker."""
 
         if not self.available:
             return None
 
+        blocks = self._iter_file_blocks(file_path)
+        if blocks is None:
+            # No streaming decoder available - let whisper load the whole file
+            return self._transcribe_whole(file_path, **kwargs)
+        return self._collect(self.iter_transcribe_blocks(blocks, **kwargs), segment_callback, file_path)
+
+    # ------------------------------------------------------------------
+    def transcribe_array(self, audio_array: Any, sample_rate: int, segment_callback: Optional[SegmentCallback] = None,
+                         **kwargs: Any) -> Optional[TranscriptionResult]:
+        """Transcribe an in-memory audio array without writing it to disk."""
+
+        if not self.available or np is None:
+            return None
+
+        samples = self._to_model_input(audio_array, sample_rate)
+        blocks = (samples[start:start + SAMPLE_RATE * 60] for start in range(0, len(samples), SAMPLE_RATE * 60))
+        return self._collect(self.iter_transcribe_blocks(blocks, **kwargs), segment_callback, "audio array")
+
+    # ------------------------------------------------------------------
+    def iter_transcribe_blocks(self, blocks: Iterable[Any], **kwargs: Any) -> Iterator[Tuple[Optional[str], List[Dict[str, Any]]]]:
+        """Yield (language, stitched segments) per chunk, in audio order, as chunks finish."""
+
+        options = {"verbose": False, "temperature": 0.0}
+        options.update(kwargs)
+        chunks = self._iter_chunks(blocks)
+
+        # The first chunk runs alone so its detected language can pin the rest
+        first = next(chunks, None)
+        if first is None:
+            return
+        raw = self._transcribe_chunk(first[3], options)
+        if not options.get("language") and raw.get("language"):
+            options["language"] = raw["language"]
+        yield raw.get("language"), self._stitch(first, raw)
+
+        if self.workers > 1 and self._cpu_only():
+            yield from self._iter_pool(chunks, options)
+            return
+        for chunk in chunks:
+            raw = self._transcribe_chunk(chunk[3], options)
+            yield raw.get("language"), self._stitch(chunk, raw)
+
+    # ------------------------------------------------------------------
+    def _collect(self, stream: Iterator[Tuple[Optional[str], List[Dict[str, Any]]]],
+                 segment_callback: Optional[SegmentCallback], source: str) -> Optional[TranscriptionResult]:
+        language = None
+        segments: List[Dict[str, Any]] = []
+        try:
+            for chunk_language, chunk_segments in stream:
+                language = language or chunk_language
+                segments.extend(chunk_segments)
+                if segment_callback and chunk_segments:
+                    try:
+                        segment_callback(chunk_segments)
+                    except Exception as exc:
+                        logger.warning("Transcription segment callback failed: %s", exc)
+        except Exception as exc:  # pragma: no cover - backend failure logging
+            logger.warning("Voice transcription failed for %s: %s", source, exc)
+            return None
+        text = " ".join(seg["text"] for seg in segments if seg["text"])
+        return TranscriptionResult(text=text, language=language, segments=segments, model=self.model_name)
+
+    def _transcribe_whole(self, file_path: str, **kwargs: Any) -> Optional[TranscriptionResult]:
         model = self._ensure_model_loaded()
         if model is None:
             return None
@@ -74,23 +170,175 @@ class VoiceTranscriber:
             logger.warning("Voice transcription failed for %s: %s", file_path, exc)
             return None
 
+    def _transcribe_chunk(self, samples: Any, options: Dict[str, Any]) -> Dict[str, Any]:
+        model = self._ensure_model_loaded()
+        if model is None:
+            raise RuntimeError(f"whisper model '{self.model_name}' could not be loaded")
+        return _compact_raw(model.transcribe(samples, **options))
+
+    # ------------------------------------------------------------------
+    def _resolve_workers(self, workers: Optional[int]) -> int:
+        if workers is None:
+            workers = os.getenv("DKI_VOICE_WORKERS", DEFAULT_TRANSCRIBE_WORKERS)
+        if str(workers).strip().lower() in ("auto", "0"):
+            # Each worker runs its own torch threads; half the cores avoids oversubscription
+            return max(1, (os.cpu_count() or 2) // 2)
+        try:
+            return max(1, int(workers))
+        except (TypeError, ValueError):
+            return DEFAULT_TRANSCRIBE_WORKERS
+
+    def _cpu_only(self) -> bool:
+        if self.device:
+            return str(self.device).lower() == "cpu"
+        try:
+            import torch  # type: ignore
+            return not torch.cuda.is_available()
+        except Exception:
+            return True
+
+    def _iter_pool(self, chunks: Iterator[AudioChunk], options: Dict[str, Any]) -> Iterator[Tuple[Optional[str], List[Dict[str, Any]]]]:
+        """Fan chunks out to worker processes, keeping at most two per worker in flight."""
+
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        threads = max(1, (os.cpu_count() or 1) // self.workers)
+        logger.info("Transcribing chunks across %d worker processes", self.workers)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_transcription_worker,
+                                 initargs=(self.model_name, self.device, threads)) as pool:
+            for chunk in chunks:
+                pending.append((chunk, pool.submit(_transcribe_chunk_in_worker, chunk[3], options)))
+                if len(pending) >= self.workers * 2:
+                    done, future = pending.popleft()
+                    raw = future.result()
+                    yield raw.get("language"), self._stitch(done, raw)
+            while pending:
+                done, future = pending.popleft()
+                raw = future.result()
+                yield raw.get("language"), self._stitch(done, raw)
+
     # ------------------------------------------------------------------
-    def transcribe_array(self, audio_array: Any, sample_rate: int, **kwargs: Any) -> Optional[TranscriptionResult]:
-        """Transcribe an in-memory audio array using a temporary WAV container."""
+    def _iter_file_blocks(self, file_path: str) -> Optional[Iterator[Any]]:
+        """16 kHz mono float32 blocks of file_path, or None if nothing can stream it."""
 
-        if not self.available or not _HAS_SOUNDFILE:
+        if np is None:
             return None
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg:
+            return self._iter_ffmpeg_blocks(ffmpeg, file_path)
+        if _HAS_SOUNDFILE:
+            return self._iter_soundfile_blocks(file_path)
+        return None
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            temp_path = tmp.name
+    @staticmethod
+    def _iter_ffmpeg_blocks(ffmpeg: str, file_path: str) -> Iterator[Any]:
+        command = [ffmpeg, "-nostdin", "-loglevel", "error", "-i", file_path,
+                   "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"]
+        block_bytes = int(SAMPLE_RATE * DECODE_BLOCK_SECONDS) * 2
+        # stderr goes to a file: an undrained pipe would stall ffmpeg once it fills
+        errors = tempfile.TemporaryFile()
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=errors)
+        carry = b""
         try:
-            sf.write(temp_path, audio_array, sample_rate)  # type: ignore[arg-type]
-            return self.transcribe_file(temp_path, **kwargs)
+            while True:
+                data = process.stdout.read(block_bytes)
+                if not data:
+                    break
+                data = carry + data
+                usable = len(data) - (len(data) % 2)
+                carry = data[usable:]
+                yield np.frombuffer(data[:usable], np.int16).astype(np.float32) / 32768.0
+            if process.wait() != 0:
+                errors.seek(0)
+                error = errors.read().decode("utf-8", "replace").strip()
+                raise RuntimeError(f"ffmpeg could not decode {file_path}: {error}")
         finally:
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            errors.close()
+
+    def _iter_soundfile_blocks(self, file_path: str) -> Iterator[Any]:
+        rate = sf.info(file_path).samplerate
+        for block in sf.blocks(file_path, blocksize=int(rate * DECODE_BLOCK_SECONDS), dtype="float32", always_2d=True):
+            yield self._resample(block.mean(axis=1), rate)
+
+    def _to_model_input(self, audio_array: Any, sample_rate: int) -> Any:
+        samples = np.asarray(audio_array, dtype=np.float32)
+        if samples.ndim > 1:
+            # librosa gives (channels, samples), soundfile/moviepy give (samples, channels)
+            samples = samples.mean(axis=0 if samples.shape[0] < samples.shape[-1] else -1)
+        return self._resample(samples, sample_rate or SAMPLE_RATE)
+
+    @staticmethod
+    def _resample(samples: Any, rate: int) -> Any:
+        samples = np.asarray(samples, dtype=np.float32)
+        if rate == SAMPLE_RATE or not len(samples):
+            return samples
+        target = int(round(len(samples) * SAMPLE_RATE / float(rate)))
+        positions = np.arange(target, dtype=np.float64) * (rate / float(SAMPLE_RATE))
+        return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+    # ------------------------------------------------------------------
+    def _iter_chunks(self, blocks: Iterable[Any]) -> Iterator[AudioChunk]:
+        """Cut a block stream into overlapping chunks at low-energy points."""
+
+        target = int(self.chunk_seconds * SAMPLE_RATE)
+        search = int(self.vad_search_seconds * SAMPLE_RATE)
+        overlap = int(self.overlap_seconds * SAMPLE_RATE)
+        pieces: List[Any] = []
+        buffered = 0
+        buffer_start = 0  # absolute sample index of the first buffered sample
+        keep_start = 0  # absolute sample index where the next chunk's own audio begins
+
+        for block in blocks:
+            if not len(block):
+                continue
+            pieces.append(block)
+            buffered += len(block)
+            while buffer_start + buffered >= keep_start + target + overlap:
+                buffer = np.concatenate(pieces) if len(pieces) > 1 else pieces[0]
+                cut = self._quietest_point(buffer, buffer_start, keep_start + target - search, keep_start + target)
+                chunk_from = max(0, keep_start - overlap)
+                samples = buffer[chunk_from - buffer_start:cut + overlap - buffer_start]
+                yield chunk_from / SAMPLE_RATE, keep_start / SAMPLE_RATE, cut / SAMPLE_RATE, samples
+                keep_start = cut
+                # Retain only what the next chunk's leading overlap needs
+                drop = max(0, keep_start - overlap - buffer_start)
+                pieces = [buffer[drop:].copy()]
+                buffer_start += drop
+                buffered = len(pieces[0])
+
+        if buffered and buffer_start + buffered > keep_start:
+            buffer = np.concatenate(pieces) if len(pieces) > 1 else pieces[0]
+            chunk_from = max(buffer_start, keep_start - overlap)
+            yield chunk_from / SAMPLE_RATE, keep_start / SAMPLE_RATE, float("inf"), buffer[chunk_from - buffer_start:]
+
+    @staticmethod
+    def _quietest_point(buffer: Any, buffer_start: int, window_from: int, window_to: int) -> int:
+        window = buffer[window_from - buffer_start:window_to - buffer_start]
+        frames = len(window) // VAD_FRAME_SAMPLES
+        if frames < 1:
+            return window_to
+        energy = np.square(window[:frames * VAD_FRAME_SAMPLES].reshape(frames, VAD_FRAME_SAMPLES)).mean(axis=1)
+        return window_from + int(np.argmin(energy)) * VAD_FRAME_SAMPLES + VAD_FRAME_SAMPLES // 2
+
+    def _stitch(self, chunk: AudioChunk, raw: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Shift chunk segments to absolute time and keep those centred in the chunk's own span."""
+
+        offset, keep_from, keep_until, _ = chunk
+        normalized = self._normalize_output(raw)
+        stitched = []
+        for seg in normalized.segments if normalized else []:
+            seg["start"] = round(seg["start"] + offset, 3)
+            seg["end"] = round(seg["end"] + offset, 3)
+            midpoint = (seg["start"] + seg["end"]) / 2
+            if keep_from <= midpoint < keep_until and seg["text"]:
+                stitched.append(seg)
+        return stitched
 
     # ------------------------------------------------------------------
     def _ensure_model_loaded(self):
@@ -125,4 +373,39 @@ class VoiceTranscriber:
         return TranscriptionResult(text=text, language=language, segments=segments, model=self.model_name)
 
 
+def _compact_raw(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the whisper fields the stitcher reads (smaller to ship back from workers)."""
+
+    return {
+        "text": raw.get("text") or "",
+        "language": raw.get("language"),
+        "segments": [
+            {key: seg.get(key) for key in ("start", "end", "text", "avg_logprob")}
+            for seg in raw.get("segments", []) or []
+        ],
+    }
+
+
+_worker_transcriber: Optional[VoiceTranscriber] = None
+
+
+def _init_transcription_worker(model_name: str, device: Optional[str], threads: int) -> None:
+    """Pool initializer - one whisper model per worker process, loaded once."""
+
+    global _worker_transcriber
+    try:
+        import torch  # type: ignore
+        torch.set_num_threads(threads)
+    except Exception:
+        pass
+    _worker_transcriber = VoiceTranscriber(model_name=model_name, device=device, workers=1)
+    _worker_transcriber._ensure_model_loaded()
+
+
+def _transcribe_chunk_in_worker(samples: Any, options: Dict[str, Any]) -> Dict[str, Any]:
+    if _worker_transcriber is None:
+        raise RuntimeError("transcription worker was not initialised")
+    return _worker_transcriber._transcribe_chunk(samples, options)
+
+
 __all__ = ["VoiceTranscriber", "TranscriptionResult"]
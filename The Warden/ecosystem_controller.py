@@ -7,15 +7,21 @@ Manages section lifecycle, execution order, and inter-ecosystem communication
 import os
 import uuid
 import json
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from pathlib import Path
 
 DEFAULT_REQUIRED = False
 
+# Concurrent section workers for execute_all_ecosystems (override with DKI_ECC_WORKERS)
+DEFAULT_SECTION_WORKERS = 4
+
 SECTION_CONTRACTS = {
     "section_1": True,
     "section_2": True,
@@ -114,6 +120,11 @@ class EcosystemController:
         # State management
         self.downstream_dependencies = {}  # Track which sections depend on each section
         
+        # Scheduler state - sections currently executing and their cancel flags
+        self._state_lock = threading.RLock()
+        self._state_changed = threading.Condition(self._state_lock)
+        self._in_flight: Dict[str, threading.Event] = {}
+        
         # Section registration tracking
         self.registration_log = []
         self.active_sections = set()
@@ -537,88 +548,207 @@ class EcosystemController:
     
     def execute_ecosystem(self, ecosystem_id: str, context: Dict[str, Any]) -> bool:
         """Execute a single ecosystem"""
+        return self._run_ecosystem(ecosystem_id, context) == 'completed'
+    
+    def _record_execution(self, ecosystem_id: str, status: str, started_at: str, started: float, **extra) -> None:
+        """Append an execution record with the section's wall time"""
+        record = {
+            'ecosystem_id': ecosystem_id,
+            'timestamp': datetime.now().isoformat(),
+            'status': status,
+            'started_at': started_at,
+            'duration_seconds': round(time.perf_counter() - started, 6),
+            'worker': threading.current_thread().name
+        }
+        record.update(extra)
+        self.execution_history.append(record)
+    
+    def _run_ecosystem(self, ecosystem_id: str, context: Dict[str, Any]) -> str:
+        """Execute one ecosystem; returns 'completed', 'failed', 'blocked' or 'cancelled'"""
+        cancel_event = threading.Event()
+        started_at = datetime.now().isoformat()
+        started = time.perf_counter()
+        ecosystem_data = None
         try:
-            if ecosystem_id not in self.ecosystems:
-                self.logger.error(f"Ecosystem {ecosystem_id} not registered")
-                return False
-            
-            ecosystem_data = self.ecosystems[ecosystem_id]
-            ecosystem_instance = ecosystem_data['instance']
-            
-            # Check dependencies
-            dependencies = ecosystem_data['dependencies']
-            for dep in dependencies:
-                if dep not in self.completed_ecosystems:
-                    if self.is_section_required(dep):
-                        self.logger.warning(f" Dependency {dep} not completed for {ecosystem_id}")
-                        return False
-                    self.logger.info(f" Dependency {dep} marked optional - skipping requirement for {ecosystem_id}.")
-            
-            # Update state
-            ecosystem_data['state'] = EcosystemState.EXECUTING
-            self.current_ecosystem = ecosystem_id
+            with self._state_lock:
+                if ecosystem_id not in self.ecosystems:
+                    self.logger.error(f"Ecosystem {ecosystem_id} not registered")
+                    return 'blocked'
+                
+                ecosystem_data = self.ecosystems[ecosystem_id]
+                ecosystem_instance = ecosystem_data['instance']
+                
+                # Check dependencies
+                dependencies = ecosystem_data['dependencies']
+                for dep in dependencies:
+                    if dep not in self.completed_ecosystems:
+                        if self.is_section_required(dep):
+                            self.logger.warning(f" Dependency {dep} not completed for {ecosystem_id}")
+                            return 'blocked'
+                        self.logger.info(f" Dependency {dep} marked optional - skipping requirement for {ecosystem_id}.")
+                
+                if ecosystem_id in self._in_flight:
+                    self.logger.warning(f" Ecosystem {ecosystem_id} is already executing")
+                    return 'blocked'
+                
+                # Update state
+                self._in_flight[ecosystem_id] = cancel_event
+                ecosystem_data['state'] = EcosystemState.EXECUTING
+                self.section_states[ecosystem_id] = EcosystemState.EXECUTING
+                self.current_ecosystem = ecosystem_id
             
             self.logger.debug(f" Executing ecosystem: {ecosystem_id}")
             self.logger.info(f"Executing ecosystem: {ecosystem_id}")
             
-            # Execute ecosystem pipeline
+            # Execute ecosystem pipeline (outside the lock so independent sections overlap)
+            started_at = datetime.now().isoformat()
+            started = time.perf_counter()
             if hasattr(ecosystem_instance, 'run_pipeline'):
                 ecosystem_instance.run_pipeline()
             elif hasattr(ecosystem_instance, 'execute'):
                 ecosystem_instance.execute(context)
             else:
                 self.logger.warning(f"No execution method found for {ecosystem_id}")
-                return False
-            
-            # Mark as completed
-            ecosystem_data['state'] = EcosystemState.COMPLETED
-            self.completed_ecosystems.add(ecosystem_id)
-            
-            # Record execution
-            self.execution_history.append({
-                'ecosystem_id': ecosystem_id,
-                'timestamp': datetime.now().isoformat(),
-                'status': 'completed'
-            })
+                return 'failed'
+            
+            with self._state_lock:
+                # An upstream reopen while we ran invalidates this result
+                if cancel_event.is_set():
+                    ecosystem_data['state'] = EcosystemState.IDLE
+                    self.section_states[ecosystem_id] = EcosystemState.IDLE
+                    self._record_execution(ecosystem_id, 'cancelled', started_at, started)
+                    self.logger.info(f"Ecosystem {ecosystem_id} cancelled - upstream section reopened")
+                    return 'cancelled'
+                
+                # Mark as completed
+                ecosystem_data['state'] = EcosystemState.COMPLETED
+                self.section_states[ecosystem_id] = EcosystemState.COMPLETED
+                self.completed_ecosystems.add(ecosystem_id)
+                self.failed_ecosystems.discard(ecosystem_id)
+                
+                # Record execution
+                self._record_execution(ecosystem_id, 'completed', started_at, started)
             
             self.logger.debug(f"Ecosystem {ecosystem_id} completed successfully")
             self.logger.info(f"Ecosystem {ecosystem_id} completed successfully")
-            return True
+            return 'completed'
             
         except Exception as e:
             self.logger.error(f"Failed to execute ecosystem {ecosystem_id}: {e}")
-            ecosystem_data['state'] = EcosystemState.FAILED
-            self.failed_ecosystems.add(ecosystem_id)
-            return False
+            with self._state_lock:
+                if ecosystem_data is not None:
+                    ecosystem_data['state'] = EcosystemState.FAILED
+                    self.section_states[ecosystem_id] = EcosystemState.FAILED
+                    self.failed_ecosystems.add(ecosystem_id)
+                    self._record_execution(ecosystem_id, 'failed', started_at, started, error=str(e))
+            return 'failed'
+        
+        finally:
+            with self._state_changed:
+                if self._in_flight.get(ecosystem_id) is cancel_event:
+                    del self._in_flight[ecosystem_id]
+                self._state_changed.notify_all()
+    
+    def _resolve_section_workers(self, max_workers: Optional[int]) -> int:
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv("DKI_ECC_WORKERS", DEFAULT_SECTION_WORKERS))
+            except ValueError:
+                max_workers = DEFAULT_SECTION_WORKERS
+        return max(1, int(max_workers))
+    
+    def _schedule_readiness(self, ecosystem_id: str, waiting: Set[str]) -> str:
+        """'ready' once required dependencies are complete, 'wait' while a dependency is still queued or running, else 'blocked'
+
+        This is the admission rule execute_ecosystem has always applied; can_run's
+        revision and custom checks still gate manual progression, not a full pass.
+        """
+        for dep in self.ecosystems[ecosystem_id]['dependencies']:
+            if dep in self.completed_ecosystems:
+                continue
+            # Optional dependencies still run first when they are part of this pass
+            if dep in waiting:
+                return 'wait'
+            if self.is_section_required(dep):
+                return 'blocked'
+        return 'ready'
     
-    def execute_all_ecosystems(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute all ecosystems in dependency order"""
+    def execute_all_ecosystems(self, context: Dict[str, Any], max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Execute all ecosystems, running independent sections concurrently as their dependencies complete"""
         try:
             execution_order = self.build_execution_order()
             results = {
                 'completed': [],
                 'failed': [],
-                'skipped': []
+                'skipped': [],
+                'cancelled': []
             }
+            workers = self._resolve_section_workers(max_workers)
+            outcomes: Dict[str, str] = {}
+            in_flight: Set[str] = set()
+            pending: List[str] = []
             
-            for ecosystem_id in execution_order:
-                if ecosystem_id in self.completed_ecosystems:
-                    results['skipped'].append(ecosystem_id)
-                    continue
-                
-                success = self.execute_ecosystem(ecosystem_id, context)
-                if success:
-                    results['completed'].append(ecosystem_id)
-                else:
-                    results['failed'].append(ecosystem_id)
+            def run_section(ecosystem_id: str) -> None:
+                outcome = 'failed'
+                try:
+                    outcome = self._run_ecosystem(ecosystem_id, context)
+                finally:
+                    with self._state_changed:
+                        outcomes[ecosystem_id] = outcome
+                        self._state_changed.notify_all()
+            
+            with self._state_changed:
+                for ecosystem_id in execution_order:
+                    if ecosystem_id in self.completed_ecosystems:
+                        results['skipped'].append(ecosystem_id)
+                        continue
+                    if ecosystem_id in self.failed_ecosystems:
+                        # A new pass is a fresh attempt for previously failed sections
+                        self.logger.info(f"Retrying previously failed ecosystem: {ecosystem_id}")
+                        self.failed_ecosystems.discard(ecosystem_id)
+                    pending.append(ecosystem_id)
+            
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ecc-section") as pool:
+                with self._state_changed:
+                    while pending or in_flight:
+                        for ecosystem_id in [eid for eid in in_flight if eid in outcomes]:
+                            in_flight.discard(ecosystem_id)
+                            outcome = outcomes.pop(ecosystem_id)
+                            results['failed' if outcome == 'blocked' else outcome].append(ecosystem_id)
+                        
+                        # Launch everything that became ready, in dependency order
+                        waiting = set(pending) | in_flight
+                        for ecosystem_id in list(pending):
+                            if len(in_flight) >= workers:
+                                break
+                            if ecosystem_id in self.completed_ecosystems:
+                                # Completed elsewhere (e.g. mark_complete) while queued
+                                pending.remove(ecosystem_id)
+                                results['skipped'].append(ecosystem_id)
+                                continue
+                            readiness = self._schedule_readiness(ecosystem_id, waiting)
+                            if readiness == 'wait':
+                                continue
+                            pending.remove(ecosystem_id)
+                            if readiness == 'blocked':
+                                waiting.discard(ecosystem_id)
+                                self.logger.warning(f" Ecosystem {ecosystem_id} blocked - dependencies not satisfied")
+                                results['failed'].append(ecosystem_id)
+                                continue
+                            in_flight.add(ecosystem_id)
+                            pool.submit(run_section, ecosystem_id)
+                        
+                        if in_flight and not any(eid in outcomes for eid in in_flight):
+                            # Woken by a finished section or an external mark_complete
+                            self._state_changed.wait(timeout=1.0)
             
             self.logger.debug(f" Execution complete: {len(results['completed'])} completed, {len(results['failed'])} failed")
-            self.logger.info(f"Execution complete: {len(results['completed'])} completed, {len(results['failed'])} failed")
+            self.logger.info(f"Execution complete: {len(results['completed'])} completed, {len(results['failed'])} failed, {len(results['cancelled'])} cancelled ({workers} workers)")
             return results
             
         except Exception as e:
             self.logger.error(f"Failed to execute ecosystems: {e}")
-            return {'completed': [], 'failed': [], 'skipped': []}
+            return {'completed': [], 'failed': [], 'skipped': [], 'cancelled': []}
     
     def request_revision(self, ecosystem_id: str, reason: str, requester: str) -> bool:
         """Request revision of a completed ecosystem"""
@@ -745,35 +875,37 @@ class EcosystemController:
                 self.logger.error(f"Section {section_id} not registered")
                 return False
             
-            # Update ecosystem state
-            ecosystem_data = self.ecosystems[section_id]
-            ecosystem_data['state'] = EcosystemState.COMPLETED
-            self.section_states[section_id] = EcosystemState.COMPLETED
-            
-            # Add to completed set
-            self.completed_ecosystems.add(section_id)
-            
-            # Remove from failed if it was there
-            if section_id in self.failed_ecosystems:
-                self.failed_ecosystems.remove(section_id)
-            
-            # Freeze section data to prevent mutation
-            frozen_data = FrozenSectionData(
-                data=ecosystem_data.get('data', {}),
-                completed_at=datetime.now().isoformat(),
-                completed_by=by_user,
-                revision_count=ecosystem_data['revision_count']
-            )
-            self.frozen_sections[section_id] = frozen_data
-            
-            # Record completion
-            completion_record = {
-                'section_id': section_id,
-                'completed_by': by_user,
-                'timestamp': datetime.now().isoformat(),
-                'completion_method': 'manual_mark_complete'
-            }
-            self.execution_history.append(completion_record)
+            with self._state_changed:
+                # Update ecosystem state
+                ecosystem_data = self.ecosystems[section_id]
+                ecosystem_data['state'] = EcosystemState.COMPLETED
+                self.section_states[section_id] = EcosystemState.COMPLETED
+            
+                # Add to completed set
+                self.completed_ecosystems.add(section_id)
+            
+                # Remove from failed if it was there
+                if section_id in self.failed_ecosystems:
+                    self.failed_ecosystems.remove(section_id)
+            
+                # Freeze section data to prevent mutation
+                frozen_data = FrozenSectionData(
+                    data=ecosystem_data.get('data', {}),
+                    completed_at=datetime.now().isoformat(),
+                    completed_by=by_user,
+                    revision_count=ecosystem_data['revision_count']
+                )
+                self.frozen_sections[section_id] = frozen_data
+            
+                # Record completion
+                completion_record = {
+                    'section_id': section_id,
+                    'completed_by': by_user,
+                    'timestamp': datetime.now().isoformat(),
+                    'completion_method': 'manual_mark_complete'
+                }
+                self.execution_history.append(completion_record)
+                self._state_changed.notify_all()
             
             # Notify downstream dependencies
             self._notify_downstream_completion(section_id)
@@ -788,6 +920,19 @@ class EcosystemController:
     
     def reopen(self, section_id: str, reason: str = "manual_reopen", by_user: str = "system") -> bool:
         """Drops status, resets downstream"""
+        # Instances of in-flight dependents to cancel; cancel() may wait on a worker that needs the
+        # state lock to report back, so it only runs once the lock is released
+        to_cancel: List[Tuple[str, Any]] = []
+        try:
+            return self._reopen(section_id, reason, by_user, to_cancel)
+        finally:
+            for downstream_section, ecosystem_instance in to_cancel:
+                try:
+                    ecosystem_instance.cancel()
+                except Exception as e:
+                    self.logger.error(f"Failed to cancel {downstream_section}: {e}")
+    
+    def _reopen(self, section_id: str, reason: str, by_user: str, to_cancel: List[Tuple[str, Any]]) -> bool:
         try:
             # Gateway validation check
             self.enforce_gateway_check(section_id, f"Gateway.reopen({by_user})")
@@ -796,38 +941,40 @@ class EcosystemController:
                 self.logger.error(f"Section {section_id} not registered")
                 return False
             
-            # Check if section was completed
-            if section_id not in self.completed_ecosystems:
-                self.logger.warning(f"Section {section_id} was not completed, nothing to reopen")
-                return False
+            with self._state_changed:
+                # Check if section was completed
+                if section_id not in self.completed_ecosystems:
+                    self.logger.warning(f"Section {section_id} was not completed, nothing to reopen")
+                    return False
             
-            # Reset section state
-            ecosystem_data = self.ecosystems[section_id]
-            ecosystem_data['state'] = EcosystemState.IDLE
-            self.section_states[section_id] = EcosystemState.IDLE
+                # Reset section state
+                ecosystem_data = self.ecosystems[section_id]
+                ecosystem_data['state'] = EcosystemState.IDLE
+                self.section_states[section_id] = EcosystemState.IDLE
             
-            # Remove from completed
-            self.completed_ecosystems.remove(section_id)
+                # Remove from completed
+                self.completed_ecosystems.remove(section_id)
             
-            # Unfreeze section data to allow mutation
-            if section_id in self.frozen_sections:
-                del self.frozen_sections[section_id]
+                # Unfreeze section data to allow mutation
+                if section_id in self.frozen_sections:
+                    del self.frozen_sections[section_id]
             
-            # Increment revision count
-            ecosystem_data['revision_count'] += 1
+                # Increment revision count
+                ecosystem_data['revision_count'] += 1
             
-            # Record reopen action
-            reopen_record = {
-                'section_id': section_id,
-                'reopened_by': by_user,
-                'reason': reason,
-                'timestamp': datetime.now().isoformat(),
-                'revision_count': ecosystem_data['revision_count']
-            }
-            self.execution_history.append(reopen_record)
+                # Record reopen action
+                reopen_record = {
+                    'section_id': section_id,
+                    'reopened_by': by_user,
+                    'reason': reason,
+                    'timestamp': datetime.now().isoformat(),
+                    'revision_count': ecosystem_data['revision_count']
+                }
+                self.execution_history.append(reopen_record)
             
-            # Reset downstream dependencies
-            self._reset_downstream_dependencies(section_id)
+                # Reset downstream dependencies
+                self._reset_downstream_dependencies(section_id, to_cancel)
+                self._state_changed.notify_all()
             
             self.logger.debug(f" Section {section_id} reopened by {by_user} - reason: {reason} - DATA UNFROZEN")
             self.logger.info(f"Section {section_id} reopened by {by_user} - reason: {reason}")
@@ -859,8 +1006,8 @@ class EcosystemController:
         except Exception as e:
             self.logger.error(f"Failed to notify downstream completion: {e}")
     
-    def _reset_downstream_dependencies(self, reopened_section_id: str):
-        """Reset downstream sections that depend on the reopened section"""
+    def _reset_downstream_dependencies(self, reopened_section_id: str, to_cancel: List[Tuple[str, Any]]):
+        """Reset downstream sections that depend on the reopened section (called with the state lock held)"""
         try:
             if reopened_section_id not in self.downstream_dependencies:
                 return
@@ -868,11 +1015,20 @@ class EcosystemController:
             downstream_sections = self.downstream_dependencies[reopened_section_id]
             
             for downstream_section in downstream_sections:
+                # A dependent still executing was fed stale inputs - flag it so its result is discarded
+                cancel_event = self._in_flight.get(downstream_section)
+                if cancel_event is not None and not cancel_event.is_set():
+                    cancel_event.set()
+                    self.logger.info(f"Cancelling in-flight downstream section {downstream_section}")
+                    ecosystem_instance = self.ecosystems[downstream_section]['instance']
+                    if hasattr(ecosystem_instance, 'cancel'):
+                        to_cancel.append((downstream_section, ecosystem_instance))
+                
                 # If downstream section was completed, reopen it too
                 if downstream_section in self.completed_ecosystems:
                     self.logger.debug(f" Auto-reopening downstream section {downstream_section}")
                     self.logger.info(f"Auto-reopening downstream section {downstream_section}")
-                    self.reopen(downstream_section, f"dependency_{reopened_section_id}_reopened", "system")
+                    self._reopen(downstream_section, f"dependency_{reopened_section_id}_reopened", "system", to_cancel)
             
         except Exception as e:
             self.logger.error(f"Failed to reset downstream dependencies: {e}")
@@ -893,6 +1049,7 @@ class EcosystemController:
             'pending_revisions': len(self.revision_queue),
             'execution_order': self.execution_order,
             'current_ecosystem': self.current_ecosystem,
+            'in_flight_sections': sorted(self._in_flight),
             'execution_history_count': len(self.execution_history),
             'registration_log_count': len(self.registration_log),
             'section_states': self.get_section_states(),
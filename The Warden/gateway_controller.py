@@ -10,13 +10,19 @@ import sys
 import uuid
 import json
 import logging
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set, Iterable
+from functools import partial
+from typing import Dict, List, Any, Optional, Set, Iterable, Iterator, Tuple
 from enum import Enum
 
 # Universal Communication Protocol
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "Command Center", "Data Bus"))
 from universal_communicator import UniversalCommunicator
+from file_hashing import file_hexdigest
+from ocr_cache import get_ocr_cache
+from staged_pipeline import PipelineStage, StagedPipeline
+from signal_queue import CoalescingPriorityQueue
 
 # Ensure parsing dispatcher is reachable for section context building
 marshall_gateway_path = os.path.join(
@@ -85,6 +91,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Worker threads per document pipeline stage (override with DKI_GATEWAY_<STAGE>_WORKERS)
+DEFAULT_PIPELINE_WORKERS = {
+    'intake': 1,
+    'extraction': min(4, os.cpu_count() or 1),
+    'media': 2,
+    'enrichment': 1  # single writer for the case bundle
+}
+
 NORMALIZE_TAGS = {
     "supporting_documents": "supporting-documents",
     "evidence_index": "media-photo",
@@ -119,6 +133,25 @@ class SignalType(Enum):
     PROCESS = "PROCESS"
     HANDOFF = "HANDOFF"
 
+# Queue lane per signal type - control signals jump evidence bursts
+SIGNAL_LANES = {
+    SignalType.EXECUTE: "critical",
+    SignalType.FINALIZE: "critical",
+    SignalType.VALIDATE: "critical",
+    SignalType.STATUS: "normal",
+    SignalType.NARRATE: "normal",
+    SignalType.HANDOFF: "normal",
+    SignalType.CLASSIFY: "bulk",
+    SignalType.PROCESS: "bulk"
+}
+
+# Idempotent refresh signals: a queued one per (type, target, case) is enough. VALIDATE is
+# not coalesced - each validation carries its own payload
+COALESCED_SIGNAL_TYPES = {SignalType.STATUS}
+
+# Signals dispatched per queue drain batch
+SIGNAL_BATCH_SIZE = 256
+
 class Signal:
     """Signal for inter-section communication"""
     def __init__(self, signal_type: SignalType, target: str, source: str, payload: Dict[str, Any], case_id: str):
@@ -142,6 +175,115 @@ class Signal:
             "timestamp": self.timestamp
         }
 
+def _catalog_entry_sections(entry: Any) -> Set[str]:
+    """Sections a catalog entry belongs to: its hinted/assigned section plus any related sections"""
+    if not isinstance(entry, dict):
+        return set()
+    sections: Set[str] = set()
+    candidate = entry.get('section_hint') or entry.get('assigned_section')
+    if candidate:
+        sections.add(str(candidate))
+    classification = entry.get('classification')
+    related = entry.get('related_sections') or (
+        classification.get('related_sections') if isinstance(classification, dict) else None) or []
+    if isinstance(related, (list, tuple, set)):
+        sections.update(str(item) for item in related if item)
+    return sections
+
+
+class SectionIndexedCatalog(dict):
+    """Evidence catalog (evidence_id -> entry) that keeps a section -> evidence index in step with every write
+
+    Each section also carries a version number bumped whenever one of its entries is
+    added, replaced or removed, so per-section views can be memoized against it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._sections: Dict[str, Dict[Any, None]] = {}
+        self._entry_sections: Dict[Any, Set[str]] = {}
+        self._order: Dict[Any, int] = {}
+        self._next_order = 0
+        self._versions: Dict[str, int] = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, evidence_id, entry):
+        if evidence_id not in self._order:
+            self._order[evidence_id] = self._next_order
+            self._next_order += 1
+        super().__setitem__(evidence_id, entry)
+        self._reindex(evidence_id, _catalog_entry_sections(entry))
+
+    def __delitem__(self, evidence_id):
+        super().__delitem__(evidence_id)
+        self._order.pop(evidence_id, None)
+        self._reindex(evidence_id, set())
+
+    def pop(self, evidence_id, *default):
+        if evidence_id in self:
+            entry = super().__getitem__(evidence_id)
+            del self[evidence_id]
+            return entry
+        if default:
+            return default[0]
+        raise KeyError(evidence_id)
+
+    def popitem(self):
+        evidence_id, entry = super().popitem()
+        self._order.pop(evidence_id, None)
+        self._reindex(evidence_id, set())
+        return evidence_id, entry
+
+    def setdefault(self, evidence_id, default=None):
+        if evidence_id not in self:
+            self[evidence_id] = default
+        return super().__getitem__(evidence_id)
+
+    def update(self, *args, **kwargs):
+        for evidence_id, entry in dict(*args, **kwargs).items():
+            self[evidence_id] = entry
+
+    def clear(self):
+        super().clear()
+        for section in self._sections:
+            self._versions[section] = self._versions.get(section, 0) + 1
+        self._sections.clear()
+        self._entry_sections.clear()
+        self._order.clear()
+
+    def _reindex(self, evidence_id, sections: Set[str]) -> None:
+        previous = self._entry_sections.get(evidence_id, set())
+        for section in previous - sections:
+            members = self._sections.get(section)
+            if members is not None:
+                members.pop(evidence_id, None)
+                if not members:
+                    del self._sections[section]
+        for section in sections - previous:
+            self._sections.setdefault(section, {})[evidence_id] = None
+        # The entry itself changed, so every section it is (or was) in sees a new version
+        for section in previous | sections:
+            self._versions[section] = self._versions.get(section, 0) + 1
+        if sections:
+            self._entry_sections[evidence_id] = sections
+        else:
+            self._entry_sections.pop(evidence_id, None)
+
+    def section_version(self, section_id: str) -> int:
+        return self._versions.get(section_id, 0)
+
+    def section_entries(self, section_id: str) -> List[Dict[str, Any]]:
+        """Entries for one section in catalog order - O(section evidence), not O(catalog)"""
+        members = self._sections.get(section_id)
+        if not members:
+            return []
+        return [super(SectionIndexedCatalog, self).__getitem__(evidence_id)
+                for evidence_id in sorted(members, key=self._order.__getitem__)]
+
+    def section_counts(self) -> Dict[str, int]:
+        return {section: len(members) for section, members in self._sections.items()}
+
+
 class GatewayController:
     """Core Gateway Controller - owns master evidence index and mediates section communication
     DEFERS ALL SECTION EXECUTION PERMISSION TO ECOSYSTEM CONTROLLER"""
@@ -181,6 +323,8 @@ class GatewayController:
         if UNSTRUCTURED_AVAILABLE:
             self.ocr_engines['unstructured'] = unstructured
         self.processed_content = {}
+        # Extraction runs on several pipeline workers; they all write processed_content
+        self._content_lock = threading.Lock()
         self.content_classification = {}
         
         # Case bundle for architectural integration
@@ -189,7 +333,7 @@ class GatewayController:
         self.processing_log = []
         
         # Signal-based communication system
-        self.signal_queue = []
+        self.signal_queue = CoalescingPriorityQueue()
         self.signal_history = []
         self.section_handlers = {}
         self.signal_routing_table = {}
@@ -211,8 +355,11 @@ class GatewayController:
             'max_reruns': 3,
             'revision_depth_limit': 5,
             'auto_persistence': True,
-            'persistence_path': 'gateway_data.json'
+            'persistence_path': 'gateway_data.json',
+            'pipeline_workers': self._pipeline_workers_from_env(),
+            'pipeline_queue_size': 8
         }
+        self.pipeline_metrics = {}
 
         self.bus = bus
         self._bus_handlers_registered = False
@@ -221,7 +368,9 @@ class GatewayController:
         self.section_drafts = {}
         self.section_needs_registry = {}
         self.pending_evidence_requests = {}
-        self.evidence_catalog = {}
+        self.evidence_catalog = SectionIndexedCatalog()
+        # section_id -> (catalog section version, manifest snapshot) for get_section_inputs
+        self._manifest_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         self.case_snapshots = []
         self.delivery_queue = []
         self._pending_section_outputs = {}
@@ -294,29 +443,41 @@ class GatewayController:
             return section_id
         return f'section_{section_id}'
 
+    def _indexed_catalog(self) -> SectionIndexedCatalog:
+        if not isinstance(self.evidence_catalog, SectionIndexedCatalog):
+            # Catalog replaced wholesale (e.g. restored state) - re-wrap it so it is indexed again
+            self.evidence_catalog = SectionIndexedCatalog(self.evidence_catalog)
+            self._manifest_cache.clear()
+        return self.evidence_catalog
+
     def _gather_section_evidence(self, section_id: str) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
-        for entry in self.evidence_catalog.values():
-            if not isinstance(entry, dict):
-                continue
-            candidate = entry.get('section_hint') or entry.get('assigned_section')
-            related = entry.get('related_sections') or entry.get('classification', {}).get('related_sections') or []
-            normalized_related = {str(item) for item in related if item}
-            if str(candidate) != section_id and section_id not in normalized_related:
-                continue
-            results.append(dict(entry))
-        return results
+        return [dict(entry) for entry in self._indexed_catalog().section_entries(section_id)]
 
     def _build_manifest_snapshot(self, section_id: str) -> Dict[str, Any]:
-        evidence = self._gather_section_evidence(section_id)
-        return {
-            'section_id': section_id,
-            'count': len(evidence),
-            'items': evidence,
-            'last_updated': datetime.now().isoformat(),
-        }
+        """Section manifest; the evidence list is only regathered when that section's catalog entries change"""
+        version = self._indexed_catalog().section_version(section_id)
+        cached = self._manifest_cache.get(section_id)
+        if cached is None or cached[0] != version:
+            evidence = self._gather_section_evidence(section_id)
+            cached = (version, {
+                'section_id': section_id,
+                'count': len(evidence),
+                'items': evidence,
+            })
+            self._manifest_cache[section_id] = cached
+        snapshot = cached[1]
+        # Fresh item copies per caller, as before - O(section evidence); last_updated is the request time, as before
+        return dict(snapshot, items=[dict(item) for item in snapshot['items']],
+                    last_updated=datetime.now().isoformat())
 
     def get_section_inputs(self, section_id: str) -> Dict[str, Any]:
+        """Context a section framework runs with
+
+        Only the manifest part is memoized (per catalog section version). The needs registry,
+        section outputs, toolkit cache and case data are plain dicts updated in place all over
+        the gateway with no version to check against, and copying them is cheap next to
+        regathering evidence, so they are read fresh on every call.
+        """
         normalized = self._normalize_section_id(section_id)
         if not normalized:
             raise ValueError('section_id is required')
@@ -1410,41 +1571,107 @@ class GatewayController:
     def process_document_pipeline(self, file_path: str, section_id: str = None) -> Dict[str, Any]:
         """Complete document processing pipeline following OCR Flow SOP - ENFORCES SECTION-AWARE EXECUTION"""
         try:
-            if section_id and self.ecosystem_controller:
-                if not self.ecosystem_controller.can_run(section_id):
-                    raise Exception(f"Section {section_id} not active for document processing")
-            
-            # Stage 1: Intake & Classification
-            file_info = self._classify_file_intake(file_path)
-            
-            # Stage 2: Primary Extraction (Tesseract & Unstructured)
-            primary_result = self._run_primary_extraction(file_path, file_info)
-            
-            # Stage 3: Fallback if needed
-            if not primary_result.get('extracted_text') or primary_result.get('confidence', 0) < 0.5:
-                fallback_result = self._run_fallback_extraction(file_path, file_info)
-                primary_result.update(fallback_result)
-            
-            # Stage 4: Media-specific processing
-            media_result = self._run_media_processing(file_path, file_info, primary_result)
-            primary_result.update(media_result)
-            
-            # Stage 5: Enrichment & Validation
-            enrichment_result = self._run_enrichment_validation(file_path, primary_result)
-            primary_result.update(enrichment_result)
-            
-            # Store in case bundle
-            self._store_in_case_bundle(file_path, primary_result, section_id)
-            
-            self.logger.debug(f"ðŸ“„ Complete pipeline processed {file_path}")
-            self.logger.info(f"Complete pipeline processed {file_path}")
-            
-            return primary_result
+            job = self._pipeline_intake(file_path, section_id)
+            job = self._pipeline_extraction(job)
+            job = self._pipeline_media(job)
+            return self._pipeline_enrichment(job, section_id)
             
         except Exception as e:
             self.logger.error(f"Document pipeline failed for {file_path}: {e}")
             return {'error': str(e), 'file_path': file_path}
     
+    def process_documents_pipelined(self, file_paths: Iterable[str], section_id: str = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Run many files through the pipeline with the stages overlapped; yields (file_path, result) in input order
+        
+        Each stage has its own workers and a bounded queue, so classification of file N+1
+        overlaps extraction of file N and media work runs on its own threads. Failed files
+        yield {'error', 'file_path'} exactly like process_document_pipeline.
+        """
+        workers = self.gateway_config.get('pipeline_workers') or DEFAULT_PIPELINE_WORKERS
+        queue_size = self.gateway_config.get('pipeline_queue_size', 8)
+        pipeline = StagedPipeline([
+            PipelineStage('intake', partial(self._pipeline_intake, section_id=section_id),
+                          workers.get('intake', 1), queue_size),
+            PipelineStage('extraction', self._pipeline_extraction, workers.get('extraction', 1), queue_size),
+            PipelineStage('media', self._pipeline_media, workers.get('media', 1), queue_size),
+            PipelineStage('enrichment', partial(self._pipeline_enrichment, section_id=section_id),
+                          workers.get('enrichment', 1), queue_size)
+        ], name="gateway-pipeline")
+        
+        try:
+            for file_path, result, error in pipeline.run(file_paths):
+                if error is not None:
+                    self.logger.error(f"Document pipeline failed for {file_path}: {error}")
+                    result = {'error': str(error), 'file_path': file_path}
+                yield file_path, result
+        finally:
+            self.pipeline_metrics = pipeline.get_metrics()
+            self.pipeline_metrics['section_id'] = section_id
+            self.logger.info(f"Document pipeline finished in {self.pipeline_metrics['wall_seconds']:.2f}s "
+                             f"(bottleneck: {self.pipeline_metrics['bottleneck']})")
+    
+    @staticmethod
+    def _pipeline_workers_from_env() -> Dict[str, int]:
+        workers = dict(DEFAULT_PIPELINE_WORKERS)
+        for stage in workers:
+            override = os.getenv(f"DKI_GATEWAY_{stage.upper()}_WORKERS")
+            if override:
+                try:
+                    workers[stage] = max(1, int(override))
+                except ValueError:
+                    logger.warning(f"Ignoring invalid DKI_GATEWAY_{stage.upper()}_WORKERS={override}")
+        return workers
+    
+    def get_pipeline_metrics(self) -> Dict[str, Any]:
+        """Per-stage throughput and queue depth of the latest pipelined run"""
+        return dict(self.pipeline_metrics)
+    
+    def _pipeline_intake(self, file_path: str, section_id: str = None) -> Dict[str, Any]:
+        """Pipeline stage: section gate, then Stage 1 intake & classification"""
+        if section_id and self.ecosystem_controller:
+            if not self.ecosystem_controller.can_run(section_id):
+                raise Exception(f"Section {section_id} not active for document processing")
+        
+        # Stage 1: Intake & Classification
+        return {'file_path': file_path, 'file_info': self._classify_file_intake(file_path), 'section_id': section_id}
+    
+    def _pipeline_extraction(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Pipeline stage: Stage 2 primary extraction with the Stage 3 fallback"""
+        file_path, file_info = job['file_path'], job['file_info']
+        
+        # Stage 2: Primary Extraction (Tesseract & Unstructured)
+        primary_result = self._run_primary_extraction(file_path, file_info, job.get('section_id'))
+        
+        # Stage 3: Fallback if needed
+        if not primary_result.get('extracted_text') or primary_result.get('confidence', 0) < 0.5:
+            fallback_result = self._run_fallback_extraction(file_path, file_info)
+            primary_result.update(fallback_result)
+        
+        job['result'] = primary_result
+        return job
+    
+    def _pipeline_media(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Pipeline stage: Stage 4 media-specific processing"""
+        media_result = self._run_media_processing(job['file_path'], job['file_info'], job['result'])
+        job['result'].update(media_result)
+        return job
+    
+    def _pipeline_enrichment(self, job: Dict[str, Any], section_id: str = None) -> Dict[str, Any]:
+        """Pipeline stage: Stage 5 enrichment & validation, then the case bundle"""
+        file_path, primary_result = job['file_path'], job['result']
+        
+        # Stage 5: Enrichment & Validation
+        enrichment_result = self._run_enrichment_validation(file_path, primary_result)
+        primary_result.update(enrichment_result)
+        
+        # Store in case bundle
+        self._store_in_case_bundle(file_path, primary_result, section_id)
+        
+        self.logger.debug(f"ðŸ“„ Complete pipeline processed {file_path}")
+        self.logger.info(f"Complete pipeline processed {file_path}")
+        
+        return primary_result
+    
     def _classify_file_intake(self, file_path: str) -> Dict[str, Any]:
         """Stage 1: Intake & Classification"""
         file_ext = os.path.splitext(file_path)[1].lower()
@@ -1480,7 +1707,7 @@ class GatewayController:
         
         return file_info
     
-    def _run_primary_extraction(self, file_path: str, file_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _run_primary_extraction(self, file_path: str, file_info: Dict[str, Any], section_id: str = None) -> Dict[str, Any]:
         """Stage 2: Primary Extraction (Tesseract & Unstructured)"""
         result = {
             'extracted_text': '',
@@ -1497,20 +1724,58 @@ class GatewayController:
         
         # Tesseract for images and scanned PDFs
         if file_ext in ['.png', '.jpg', '.jpeg', '.tiff', '.bmp']:
-            tesseract_result = self.process_with_tesseract(file_path)
+            tesseract_result = self._cached_extraction(file_path, 'tesseract', self.process_with_tesseract, section_id)
             if tesseract_result.get('extracted_text'):
                 result.update(tesseract_result)
                 result['engine_used'] = 'tesseract'
         
         # Unstructured for native PDFs and documents
         elif file_ext in ['.pdf', '.docx', '.doc']:
-            unstructured_result = self.process_with_unstructured(file_path)
+            unstructured_result = self._cached_extraction(file_path, 'unstructured', self.process_with_unstructured, section_id)
             if unstructured_result.get('extracted_text'):
                 result.update(unstructured_result)
                 result['engine_used'] = 'unstructured'
         
         return result
     
+    def _cached_extraction(self, file_path: str, engine: str, extract, section_id: str = None) -> Dict[str, Any]:
+        """Run an extraction engine once per file content; later runs read the shared OCR cache
+        
+        Entries hold the engine's whole result dict, so they are tagged 'gateway:<engine>' to keep
+        them apart from the plain-text entries other components cache for the same bytes. The
+        section gate is checked first, so a cache hit never bypasses it.
+        """
+        if section_id and self.ecosystem_controller:
+            if not self.ecosystem_controller.can_run(section_id):
+                self.logger.error(f"Section {section_id} not active for {engine} processing")
+                return {'error': f"Section {section_id} not active for {engine} processing",
+                        'file_path': file_path, 'engine': engine}
+        
+        ocr_cache = get_ocr_cache()
+        cache_engine = f"gateway:{engine}"
+        try:
+            content_hash = file_hexdigest(file_path) if ocr_cache.enabled else None
+        except OSError:
+            content_hash = None
+        
+        cached = ocr_cache.get(content_hash, 0, cache_engine) if content_hash else None
+        if isinstance(cached, dict):
+            result = dict(cached)
+            result.update({'file_path': file_path, 'section_id': section_id,
+                           'processing_time': datetime.now().isoformat(), 'cache_hit': True})
+            with self._content_lock:
+                self.processed_content[file_path] = result
+            self.logger.info(f"Reused cached {engine} extraction for {file_path}")
+            return result
+        
+        result = extract(file_path, section_id)
+        if content_hash and result.get('extracted_text') and 'error' not in result:
+            # Per-call metadata is re-stamped on every hit rather than replayed from the first run
+            payload = {key: value for key, value in result.items()
+                       if key not in ('file_path', 'section_id', 'processing_time', 'cache_hit')}
+            ocr_cache.put(content_hash, 0, cache_engine, payload)
+        return result
+    
     def _run_fallback_extraction(self, file_path: str, file_info: Dict[str, Any]) -> Dict[str, Any]:
         """Stage 3: Fallback Extraction"""
         fallback_result = {
@@ -1589,7 +1854,8 @@ class GatewayController:
         self.case_bundle[file_path] = bundle_entry
         
         # Also store in processed_content for backward compatibility
-        self.processed_content[file_path] = result
+        with self._content_lock:
+            self.processed_content[file_path] = result
     
     def process_with_tesseract(self, file_path: str, section_id: str = None) -> Dict[str, Any]:
         """Process file with Tesseract OCR - ENFORCES SECTION-AWARE EXECUTION"""
@@ -1642,7 +1908,8 @@ class GatewayController:
                 raise Exception(f"Unsupported file type: {file_ext}")
             
             # Store processed content
-            self.processed_content[file_path] = result
+            with self._content_lock:
+                self.processed_content[file_path] = result
             self.logger.debug(f"ðŸ” Tesseract processed {file_path}")
             self.logger.info(f"Tesseract processed {file_path}")
             
@@ -1676,10 +1943,12 @@ class GatewayController:
             full_text = ""
             
             for element in elements:
+                # Plain dict metadata, so the result survives the JSON round trip of the extraction cache
+                metadata = getattr(element, 'metadata', None) or {}
                 element_data = {
                     'type': str(type(element).__name__),
                     'text': str(element),
-                    'metadata': element.metadata if hasattr(element, 'metadata') else {}
+                    'metadata': metadata.to_dict() if hasattr(metadata, 'to_dict') else metadata
                 }
                 structured_data.append(element_data)
                 full_text += str(element) + "\n"
@@ -1695,7 +1964,8 @@ class GatewayController:
             }
             
             # Store processed content
-            self.processed_content[file_path] = result
+            with self._content_lock:
+                self.processed_content[file_path] = result
             self.logger.debug(f"ðŸ“„ Unstructured processed {file_path}")
             self.logger.info(f"Unstructured processed {file_path}")
             
@@ -1825,13 +2095,15 @@ class GatewayController:
     
     def get_ocr_status(self) -> Dict[str, Any]:
         """Get OCR processing status"""
+        with self._content_lock:
+            processed = list(self.processed_content.values())
         return {
-            'processed_files': len(self.processed_content),
+            'processed_files': len(processed),
             'classified_files': len(self.content_classification),
             'available_engines': list(self.ocr_engines.keys()),
             'processing_stats': {
-                'tesseract_processed': len([f for f in self.processed_content.values() if f.get('engine') == 'tesseract']),
-                'unstructured_processed': len([f for f in self.processed_content.values() if f.get('engine') == 'unstructured']),
+                'tesseract_processed': len([f for f in processed if f.get('engine') == 'tesseract']),
+                'unstructured_processed': len([f for f in processed if f.get('engine') == 'unstructured']),
                 'total_classifications': len(self.content_classification)
             }
         }
@@ -1855,13 +2127,9 @@ class GatewayController:
                 'status': 'in_progress'
             }
             
-            # Process each file through the pipeline
-            for file_path in file_paths:
-                self.logger.debug(f"ðŸ”„ Processing {file_path} for {section_id}")
-                
-                # Run complete document pipeline
-                pipeline_result = self.process_document_pipeline(file_path, section_id)
-                
+            # Process the files through the staged pipeline (stages overlap across files)
+            self.logger.debug(f"ðŸ”„ Processing {len(file_paths)} files for {section_id}")
+            for file_path, pipeline_result in self.process_documents_pipelined(file_paths, section_id):
                 if pipeline_result.get('error'):
                     self.logger.error(f"Pipeline failed for {file_path}: {pipeline_result['error']}")
                     continue
@@ -1882,6 +2150,7 @@ class GatewayController:
                 section_outputs.update(handler_result)
             
             orchestration_result['section_outputs'] = section_outputs
+            orchestration_result['pipeline_metrics'] = self.get_pipeline_metrics()
             
             orchestration_result['status'] = 'completed'
             
@@ -2025,34 +2294,54 @@ class GatewayController:
                 "timestamp": signal.timestamp
             }
     
-    def queue_signal(self, signal: Signal) -> bool:
-        """Queue signal for processing"""
+    def queue_signal(self, signal: Signal, lane: Optional[str] = None, coalesce_key: Optional[Any] = None) -> bool:
+        """Queue signal for processing
+        
+        lane overrides the signal type's priority lane (critical, normal, bulk). Signals with
+        the same coalesce_key - by default (type, target, case) for refresh-style types - are
+        merged while queued, the newest payload replacing the older one.
+        """
         try:
-            self.signal_queue.append(signal)
-            self.logger.debug(f"ðŸ“¥ Signal queued: {signal.type.value} -> {signal.target}")
+            if coalesce_key is None and signal.type in COALESCED_SIGNAL_TYPES:
+                coalesce_key = (signal.type.value, signal.target, signal.case_id)
+            queued = self.signal_queue.put(signal, lane or SIGNAL_LANES.get(signal.type, "normal"), coalesce_key)
+            if queued:
+                self.logger.debug(f"ðŸ“¥ Signal queued: {signal.type.value} -> {signal.target}")
+            else:
+                self.logger.debug(f"Signal coalesced: {signal.type.value} -> {signal.target}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to queue signal: {e}")
             return False
     
-    def process_signal_queue(self) -> Dict[str, Any]:
-        """Process all queued signals"""
+    def drain_signal_batch(self, max_signals: int = SIGNAL_BATCH_SIZE) -> List[Signal]:
+        """Remove up to max_signals queued signals in priority order without dispatching them"""
+        return self.signal_queue.drain(max_signals)
+    
+    def process_signal_queue(self, max_signals: Optional[int] = None) -> Dict[str, Any]:
+        """Process queued signals (all of them, or up to max_signals) in priority batches"""
         try:
             results = []
             processed_count = 0
             
-            while self.signal_queue:
-                signal = self.signal_queue.pop(0)
-                result = self.dispatch_signal(signal)
-                results.append(result)
-                processed_count += 1
+            # Batches rather than one full drain, so signals queued by handlers still get their priority
+            while max_signals is None or processed_count < max_signals:
+                batch_size = SIGNAL_BATCH_SIZE if max_signals is None else min(SIGNAL_BATCH_SIZE, max_signals - processed_count)
+                batch = self.drain_signal_batch(batch_size)
+                if not batch:
+                    break
+                for signal in batch:
+                    results.append(self.dispatch_signal(signal))
+                    processed_count += 1
             
             self.logger.debug(f"ðŸ“¤ Processed {processed_count} signals from queue")
             self.logger.info(f"Processed {processed_count} signals from queue")
             
             return {
                 "processed_count": processed_count,
+                "remaining": len(self.signal_queue),
                 "results": results,
+                "queue_stats": self.signal_queue.get_stats(),
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -2144,6 +2433,7 @@ class GatewayController:
         """Get signal processing status"""
         return {
             'queued_signals': len(self.signal_queue),
+            'signal_queue': self.signal_queue.get_stats(),
             'processed_signals': len(self.signal_history),
             'registered_handlers': list(self.section_handlers.keys()),
             'routing_table_entries': len(self.signal_routing_table),
@@ -2334,9 +2624,11 @@ class GatewayController:
             'ecc_connected': bool(self.ecosystem_controller),
             'orchestration_status': self.get_orchestration_status(),
             'ocr_status': self.get_ocr_status(),
+            'pipeline_metrics': self.get_pipeline_metrics(),
             'case_bundle_status': self.get_case_bundle_status(),
             'bus_connected': bool(self.bus),
             'evidence_catalog_size': len(self.evidence_catalog),
+            'evidence_catalog_sections': self._indexed_catalog().section_counts(),
             'pending_section_drafts': len(self._pending_section_outputs),
             'pending_evidence_requests': list(self.pending_evidence_requests.keys()),
             'section_needs': list(self.section_needs_registry.keys()),